@@ -0,0 +1,98 @@
+"""
+Benchmark the derivation of workload status fields from Kueue conditions.
+
+Compares scanning the workload conditions on every status query (with
+``filter_conditions``) against the precomputed condition index, and measures
+the full workload to metadata conversion used by the listing endpoint.
+
+usage: python -m benchmarks.conditions [--workloads N] [--repeat R]
+"""
+
+import argparse
+from typing import Any
+from unittest import mock
+
+from benchmarks.data import make_workloads
+from benchmarks.utils import format_table, measure, percentiles
+from jobq_server.models import WorkloadMetadata
+from jobq_server.utils.k8s import filter_conditions
+from jobq_server.utils.kueue import KueueWorkload
+
+CACHED_FIELDS = [
+    "execution_status",
+    "last_admission_timestamp",
+    "termination_timestamp",
+    "was_evicted",
+    "was_inadmissible",
+]
+
+
+def _scan_status(wl: KueueWorkload) -> tuple[Any, ...]:
+    """Derive the status fields by scanning the conditions for each of them."""
+    return (
+        bool(filter_conditions(wl, reason="Succeeded"))
+        or bool(filter_conditions(wl, reason="Failed"))
+        or bool(filter_conditions(wl, typ="Admitted", status=True)),
+        filter_conditions(wl, typ="Admitted", status=True),
+        filter_conditions(wl, typ="Finished"),
+        filter_conditions(wl, reason="Preempted"),
+        filter_conditions(wl, typ="QuotaReserved", status=False, reason="Inadmissible"),
+    )
+
+
+def _indexed_status(wl: KueueWorkload) -> tuple[Any, ...]:
+    return (
+        wl.execution_status,
+        wl.last_admission_timestamp,
+        wl.termination_timestamp,
+        wl.was_evicted,
+        wl.was_inadmissible,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--workloads", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = make_workloads(args.workloads)
+    print(
+        f"Deriving status for {args.workloads} workloads, {args.repeat} repetitions\n"
+    )
+
+    def scan() -> None:
+        for wl in workloads:
+            _scan_status(wl)
+
+    def indexed() -> None:
+        for wl in workloads:
+            # Drop the cached values, so that the index and fields are recomputed
+            for name in CACHED_FIELDS:
+                wl.__dict__.pop(name, None)
+            wl.status.__dict__.pop("condition_index", None)
+            _indexed_status(wl)
+
+    def metadata() -> None:
+        for wl in workloads:
+            WorkloadMetadata.from_kueue_workload(wl)
+
+    workloads = [KueueWorkload.model_validate(wl) for wl in raw]
+    rows = []
+    with mock.patch.object(KueueWorkload, "has_failed_pods", False):
+        for name, fn in [
+            ("scan", scan),
+            ("index", indexed),
+            ("metadata (cached)", metadata),
+        ]:
+            p = percentiles(measure(fn, args.repeat))
+            rows.append([
+                name,
+                f"{p['p50'] / args.workloads * 1e6:.2f} µs",
+                f"{p['p90'] / args.workloads * 1e6:.2f} µs",
+            ])
+    print(format_table(rows, ["derivation", "p50 / workload", "p90 / workload"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Synthetic Kubernetes and Kueue resources for benchmarks."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+EPOCH = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _timestamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _condition(
+    typ: str, status: bool, reason: str, message: str, at: datetime
+) -> dict[str, Any]:
+    return {
+        "type": typ,
+        "status": "True" if status else "False",
+        "reason": reason,
+        "message": message,
+        "lastTransitionTime": _timestamp(at),
+        "observedGeneration": 1,
+    }
+
+
+def make_job_uid(i: int) -> str:
+    """Deterministic UID of the i-th synthetic job."""
+    return str(uuid.UUID(int=i, version=4))
+
+
+def make_job_name(i: int) -> str:
+    return f"job-{i}"
+
+
+def make_workload(
+    i: int,
+    namespace: str = "default",
+    queue_name: str = "user-queue",
+    cluster_queue: str = "cluster-queue",
+    kind: str = "Job",
+    job_name: str | None = None,
+    job_uid: str | None = None,
+    phase: int | None = None,
+) -> dict[str, Any]:
+    """Create a Kueue ``Workload`` for the i-th synthetic job, as returned by the API server.
+
+    Workloads cycle through the pending, executing, succeeded, and failed states
+    (phases 0 to 3), depending on their index, unless a phase is given.
+    """
+
+    job_name = job_name or make_job_name(i)
+    job_uid = job_uid or make_job_uid(i)
+    created = EPOCH + timedelta(minutes=i)
+    admitted = created + timedelta(minutes=5)
+    finished = admitted + timedelta(minutes=30)
+    api_version = "batch/v1" if kind == "Job" else "ray.io/v1"
+
+    conditions = []
+    phase = i % 4 if phase is None else phase
+    if phase >= 1:
+        conditions += [
+            _condition(
+                "QuotaReserved",
+                True,
+                "QuotaReserved",
+                f"Quota reserved in ClusterQueue {cluster_queue}",
+                admitted,
+            ),
+            _condition(
+                "Admitted",
+                True,
+                "Admitted",
+                "The workload is admitted",
+                admitted,
+            ),
+        ]
+    if phase >= 2:
+        reason = "Succeeded" if phase == 2 else "Failed"
+        conditions.append(
+            _condition("Finished", True, reason, f"Job {reason.lower()}", finished)
+        )
+
+    status: dict[str, Any] = {"conditions": conditions}
+    if phase >= 1:
+        status["admission"] = {
+            "clusterQueue": cluster_queue,
+            "podSetAssignments": [
+                {
+                    "name": "main",
+                    "count": 1,
+                    "flavors": {"cpu": "default-flavor", "memory": "default-flavor"},
+                    "resourceUsage": {"cpu": "4", "memory": "16Gi"},
+                }
+            ],
+        }
+
+    return {
+        "apiVersion": "kueue.x-k8s.io/v1beta1",
+        "kind": "Workload",
+        "metadata": {
+            "name": f"{kind.lower()}-{job_name}-{job_uid[:5]}",
+            "namespace": namespace,
+            "uid": str(uuid.UUID(int=i + 2**64, version=4)),
+            "resourceVersion": str(1000 + i),
+            "generation": 1,
+            "creationTimestamp": _timestamp(created),
+            "labels": {
+                "kueue.x-k8s.io/job-uid": job_uid,
+                "kueue.x-k8s.io/queue-name": queue_name,
+            },
+            "ownerReferences": [
+                {
+                    "apiVersion": api_version,
+                    "kind": kind,
+                    "name": job_name,
+                    "uid": job_uid,
+                    "controller": True,
+                    "blockOwnerDeletion": True,
+                }
+            ],
+            "managedFields": [
+                {
+                    "manager": "kueue",
+                    "operation": "Update",
+                    "apiVersion": "kueue.x-k8s.io/v1beta1",
+                    "time": _timestamp(created),
+                    "fieldsType": "FieldsV1",
+                    "fieldsV1": {"f:status": {"f:conditions": {}}},
+                },
+                {
+                    "manager": "kueue-admission",
+                    "operation": "Apply",
+                    "apiVersion": "kueue.x-k8s.io/v1beta1",
+                    "time": _timestamp(admitted),
+                    "fieldsType": "FieldsV1",
+                    "subresource": "status",
+                    "fieldsV1": {"f:status": {"f:admission": {}}},
+                },
+            ],
+        },
+        "spec": {
+            "active": True,
+            "queueName": queue_name,
+            "priority": 0,
+            "priorityClassSource": "",
+            "podSets": [
+                {
+                    "name": "main",
+                    "count": 1,
+                    "template": {
+                        "metadata": {},
+                        "spec": {
+                            "restartPolicy": "Never",
+                            "containers": [
+                                {
+                                    "name": "workload",
+                                    "image": f"registry.example.com/team/{job_name}:latest",
+                                    "imagePullPolicy": "IfNotPresent",
+                                    "command": [
+                                        "jobs_execute",
+                                        "examples/train.py",
+                                        "train",
+                                    ],
+                                    "resources": {
+                                        "requests": {"cpu": "4", "memory": "16Gi"},
+                                        "limits": {"cpu": "4", "memory": "16Gi"},
+                                    },
+                                    "terminationMessagePath": "/dev/termination-log",
+                                    "terminationMessagePolicy": "File",
+                                }
+                            ],
+                            "dnsPolicy": "ClusterFirst",
+                            "schedulerName": "default-scheduler",
+                            "securityContext": {},
+                            "terminationGracePeriodSeconds": 30,
+                        },
+                    },
+                }
+            ],
+        },
+        "status": status,
+    }
+
+
+def make_workloads(n: int, **kwargs: Any) -> list[dict[str, Any]]:
+    return [make_workload(i, **kwargs) for i in range(n)]
+
+
+def _container(name: str, image: str) -> dict[str, Any]:
+    return {
+        "name": name,
+        "image": image,
+        "imagePullPolicy": "IfNotPresent",
+        "command": ["jobs_execute", "examples/train.py", "train"],
+        "resources": {
+            "requests": {"cpu": "4", "memory": "16Gi"},
+            "limits": {"cpu": "4", "memory": "16Gi"},
+        },
+    }
+
+
+def make_job(
+    i: int,
+    namespace: str = "default",
+    queue_name: str = "user-queue",
+    labels: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Create the batch ``Job`` of the i-th synthetic job."""
+    name = make_job_name(i)
+    return {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": make_job_uid(i),
+            "creationTimestamp": _timestamp(EPOCH + timedelta(minutes=i)),
+            "labels": {"kueue.x-k8s.io/queue-name": queue_name, **(labels or {})},
+        },
+        "spec": {
+            "parallelism": 1,
+            "completions": 1,
+            "backoffLimit": 6,
+            "suspend": False,
+            "template": {
+                "metadata": {},
+                "spec": {
+                    "restartPolicy": "Never",
+                    "containers": [
+                        _container(
+                            "workload", f"registry.example.com/team/{name}:latest"
+                        )
+                    ],
+                },
+            },
+        },
+        "status": {},
+    }
+
+
+def make_rayjob(
+    i: int, namespace: str = "default", queue_name: str = "user-queue"
+) -> dict[str, Any]:
+    """Create the ``RayJob`` of the i-th synthetic job."""
+    name = make_job_name(i)
+    return {
+        "apiVersion": "ray.io/v1",
+        "kind": "RayJob",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": make_job_uid(i),
+            "creationTimestamp": _timestamp(EPOCH + timedelta(minutes=i)),
+            "labels": {"kueue.x-k8s.io/queue-name": queue_name},
+        },
+        "spec": {
+            "entrypoint": "jobs_execute examples/train.py train",
+            "shutdownAfterJobFinishes": True,
+            "rayClusterSpec": {
+                "headGroupSpec": {
+                    "rayStartParams": {},
+                    "template": {
+                        "spec": {
+                            "containers": [
+                                _container(
+                                    "ray-head",
+                                    f"registry.example.com/team/{name}:latest",
+                                )
+                            ]
+                        }
+                    },
+                },
+            },
+        },
+        "status": {},
+    }
+
+
+def make_pod(
+    i: int, j: int, controller_uid: str, phase: str, namespace: str = "default"
+) -> dict[str, Any]:
+    """Create the j-th pod of the i-th synthetic job, controlled by the given job UID."""
+    name = f"{make_job_name(i)}-{j}-{controller_uid[-5:]}"
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": str(uuid.UUID(int=(i << 16) + j + 2**65, version=4)),
+            "creationTimestamp": _timestamp(EPOCH + timedelta(minutes=i + 5)),
+            "labels": {
+                "controller-uid": controller_uid,
+                "batch.kubernetes.io/controller-uid": controller_uid,
+                "job-name": make_job_name(i),
+            },
+        },
+        "spec": {
+            "restartPolicy": "Never",
+            "containers": [
+                _container(
+                    "workload", f"registry.example.com/team/{make_job_name(i)}:latest"
+                )
+            ],
+        },
+        "status": {"phase": phase},
+    }
+
+
+POD_PHASES = ["Pending", "Running", "Succeeded", "Failed"]
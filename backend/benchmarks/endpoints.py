@@ -0,0 +1,194 @@
+"""
+Benchmark the backend API endpoints against a fake Kubernetes API server.
+
+Serves a synthetic cluster of Kueue workloads, jobs, RayJobs and pods from
+:mod:`benchmarks.fake_apiserver`, and measures the latency of the ``list_jobs``,
+``status``, ``logs`` and ``submit_job`` endpoints, as well as the number of
+Kubernetes API calls made per request.
+
+The fake API server runs in a background thread of the benchmark process, so
+latencies include its (small) overhead. API call counts are exact.
+
+usage: python -m benchmarks.endpoints [--workloads N] [--pods-per-workload P] [--repeat R] [--json FILE]
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+from fastapi.testclient import TestClient
+
+from benchmarks.fake_apiserver import PODS, FakeApiServer, FakeCluster
+from benchmarks.utils import fmt_ms, format_table, percentiles
+from jobq_server import app
+
+
+def _submit_body(i: int) -> dict:
+    return {
+        "name": f"bench-{i}",
+        "file": "train.py",
+        "image_ref": "registry.example.com/team/bench:latest",
+        "mode": "kueue",
+        "options": {"scheduling": {"queue_name": "user-queue"}},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--workloads", type=int, default=1000)
+    parser.add_argument("--pods-per-workload", type=int, default=5)
+    parser.add_argument(
+        "--rayjob-every", type=int, default=10, help="Every n-th job is a RayJob"
+    )
+    parser.add_argument(
+        "--namespaces",
+        type=int,
+        default=4,
+        help="Number of namespaces to distribute the jobs over",
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--list-repeat",
+        type=int,
+        default=5,
+        help="Repetitions of the (expensive) listing scenarios",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Artificial latency of each Kubernetes API call",
+    )
+    parser.add_argument("--json", type=Path, help="Write the results to a JSON file")
+    args = parser.parse_args()
+
+    # The backend logs a warning for each request when running outside a cluster
+    logging.disable(logging.WARNING)
+
+    namespaces = ["default"] + [f"team-{i}" for i in range(1, args.namespaces)]
+    cluster = FakeCluster.populate(
+        args.workloads,
+        args.pods_per_workload,
+        namespace=namespaces,
+        rayjob_every=args.rayjob_every,
+    )
+    uids = cluster.job_uids()
+    # Jobs are pending, running, succeeded and failed in turn, only pending ones have no pods
+    admitted = [uid for i, uid in enumerate(uids) if i % 4 != 0]
+
+    scenarios: list[tuple[str, int, Callable[[TestClient, int], httpx.Response]]] = [
+        (
+            "list_jobs",
+            args.list_repeat,
+            lambda c, i: c.get("/jobs"),
+        ),
+        (
+            "list_jobs (metadata)",
+            args.list_repeat,
+            lambda c, i: c.get("/jobs", params={"include_metadata": True}),
+        ),
+        (
+            "list_jobs (metadata, summary fields)",
+            args.list_repeat,
+            lambda c, i: c.get(
+                "/jobs",
+                params={
+                    "include_metadata": True,
+                    "fields": "execution_status,submission_timestamp",
+                },
+            ),
+        ),
+        (
+            "list_jobs (namespaces)",
+            args.list_repeat,
+            lambda c, i: c.get("/jobs", params={"namespace": ",".join(namespaces)}),
+        ),
+        (
+            "list_jobs (all namespaces)",
+            args.list_repeat,
+            lambda c, i: c.get("/jobs", params={"namespace": "*"}),
+        ),
+        (
+            "status",
+            args.repeat,
+            lambda c, i: c.get(
+                f"/jobs/{uids[i % len(uids)]}/status", params={"namespace": "*"}
+            ),
+        ),
+        (
+            "logs (tail 100)",
+            args.repeat,
+            lambda c, i: c.get(
+                f"/jobs/{admitted[i % len(admitted)]}/logs",
+                params={"tail": 100, "namespace": "*"},
+            ),
+        ),
+        (
+            "submit_job",
+            args.repeat,
+            lambda c, i: c.post("/jobs", json=_submit_body(i)),
+        ),
+    ]
+
+    print(
+        f"Benchmarking against {len(uids)} workloads "
+        f"and {len(cluster.list(PODS, None))} pods\n"
+    )
+
+    rows = []
+    results = {}
+    with (
+        tempfile.TemporaryDirectory() as tmpdir,
+        FakeApiServer(cluster, latency=args.latency_ms / 1000) as server,
+    ):
+        server.use_kubeconfig(Path(tmpdir) / "kubeconfig")
+        client = TestClient(app)
+        for name, repeat, request in scenarios:
+            # Warm up (API discovery, imports)
+            request(client, 0).raise_for_status()
+            server.reset_calls()
+
+            durations = []
+            for i in range(repeat):
+                start = time.perf_counter()
+                request(client, i + 1).raise_for_status()
+                durations.append(time.perf_counter() - start)
+
+            p = percentiles(durations)
+            calls = {
+                f"{verb} {resource}": n / repeat
+                for (verb, resource), n in server.calls.most_common()
+            }
+            results[name] = {
+                "repeat": repeat,
+                **p,
+                "api_calls": sum(calls.values()),
+                "api_calls_by_type": calls,
+            }
+            rows.append([
+                name,
+                fmt_ms(p["p50"]),
+                fmt_ms(p["p90"]),
+                fmt_ms(p["p99"]),
+                f"{sum(calls.values()):.1f}",
+                ", ".join(f"{k}: {v:g}" for k, v in list(calls.items())[:3]),
+            ])
+            print(f"  {name}: done", flush=True)
+
+    print()
+    print(
+        format_table(
+            rows, ["endpoint", "p50", "p90", "p99", "API calls", "most frequent calls"]
+        )
+    )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,869 @@
+"""
+Lightweight stand-in for the Kubernetes API server, serving synthetic Kueue workloads.
+
+Serves the subset of the Kubernetes API used by the backend: API discovery, LIST
+(with label selectors), WATCH, GET, CREATE and DELETE of Kueue ``Workload``,
+``LocalQueue``, ``ClusterQueue`` and ``WorkloadPriorityClass``, batch ``Job``,
+``RayJob`` and ``Pod`` resources, as well as pod log streaming.
+Every API call is counted by verb and resource, so that benchmarks can report the
+number of API calls per backend request.
+
+Created jobs and RayJobs get a pending Kueue workload, like Kueue would create.
+Failures (e.g., throttling) can be injected with :meth:`FakeApiServer.fail_next`,
+and RBAC restrictions with :attr:`FakeApiServer.forbidden`.
+
+usage: python -m benchmarks.fake_apiserver [--port P] [--workloads N] [--pods-per-workload P]
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import copy
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Self
+from urllib.parse import parse_qsl, urlsplit
+
+import yaml
+from kubernetes.config import kube_config
+
+from benchmarks.data import (
+    POD_PHASES,
+    make_job,
+    make_job_uid,
+    make_pod,
+    make_rayjob,
+    make_workload,
+)
+from jobq_server.services.api_client import request_labels
+
+
+@dataclass(frozen=True)
+class ResourceType:
+    group: str
+    version: str
+    plural: str
+    kind: str
+    namespaced: bool = True
+    subresources: tuple[str, ...] = ()
+
+    @property
+    def api_version(self) -> str:
+        return f"{self.group}/{self.version}" if self.group else self.version
+
+
+RESOURCE_TYPES = [
+    ResourceType("", "v1", "namespaces", "Namespace", namespaced=False),
+    ResourceType("", "v1", "pods", "Pod", subresources=("log", "status")),
+    ResourceType("batch", "v1", "jobs", "Job", subresources=("status",)),
+    ResourceType(
+        "kueue.x-k8s.io", "v1beta1", "workloads", "Workload", subresources=("status",)
+    ),
+    ResourceType("kueue.x-k8s.io", "v1beta1", "localqueues", "LocalQueue"),
+    ResourceType(
+        "kueue.x-k8s.io", "v1beta1", "clusterqueues", "ClusterQueue", namespaced=False
+    ),
+    ResourceType(
+        "kueue.x-k8s.io",
+        "v1beta1",
+        "workloadpriorityclasses",
+        "WorkloadPriorityClass",
+        namespaced=False,
+    ),
+    ResourceType("ray.io", "v1", "rayjobs", "RayJob", subresources=("status",)),
+]
+
+_RESOURCE_TYPES_BY_PATH = {
+    (rt.group, rt.version, rt.plural): rt for rt in RESOURCE_TYPES
+}
+
+ObjectKey = tuple[str | None, str]
+Requirement = tuple[str, str, str | None]
+
+
+def parse_label_selector(selector: str) -> list[Requirement]:
+    """
+    Parse an equality-based label selector into ``(operator, key, value)`` requirements.
+
+    Examples
+    --------
+    >>> parse_label_selector("app=foo,tier!=db,release,!canary")
+    [('=', 'app', 'foo'), ('!=', 'tier', 'db'), ('exists', 'release', None), ('!exists', 'canary', None)]
+    """
+    requirements: list[Requirement] = []
+    for term in filter(None, (t.strip() for t in selector.split(","))):
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            requirements.append(("!=", key.strip(), value.strip()))
+        elif "=" in term:
+            key, value = term.replace("==", "=").split("=", 1)
+            requirements.append(("=", key.strip(), value.strip()))
+        elif term.startswith("!"):
+            requirements.append(("!exists", term[1:].strip(), None))
+        else:
+            requirements.append(("exists", term, None))
+    return requirements
+
+
+def _matches(labels: dict[str, str], requirements: Iterable[Requirement]) -> bool:
+    for op, key, value in requirements:
+        match op:
+            case "=" if labels.get(key) != value:
+                return False
+            case "!=" if labels.get(key) == value:
+                return False
+            case "exists" if key not in labels:
+                return False
+            case "!exists" if key in labels:
+                return False
+    return True
+
+
+def _timestamp() -> str:
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeCluster:
+    """Thread-safe in-memory store of Kubernetes objects."""
+
+    def __init__(self, log_lines: int = 1000) -> None:
+        self._objects: dict[ResourceType, dict[ObjectKey, dict[str, Any]]] = {
+            rt: {} for rt in RESOURCE_TYPES
+        }
+        # Lazily built indices of object keys by label value, per resource type and label
+        self._label_index: dict[
+            tuple[ResourceType, str], dict[str, list[ObjectKey]]
+        ] = {}
+        # Serialized LIST responses, invalidated when the resource type is modified
+        self._list_cache: dict[tuple[ResourceType, str | None, str], bytes] = {}
+        self._lock = threading.RLock()
+        self._resource_version = itertools.count(1)
+        self.pod_log = "".join(
+            f"2024-01-01T00:00:{i % 60:02d}Z INFO step {i} loss={1 / (i + 1):.6f}\n"
+            for i in range(log_lines)
+        ).encode()
+
+    def _invalidate(self, rt: ResourceType) -> None:
+        for key in [k for k in self._label_index if k[0] == rt]:
+            del self._label_index[key]
+        for key in [k for k in self._list_cache if k[0] == rt]:
+            del self._list_cache[key]
+
+    def add(self, rt: ResourceType, obj: dict[str, Any]) -> dict[str, Any]:
+        meta = obj["metadata"]
+        with self._lock:
+            meta["resourceVersion"] = str(next(self._resource_version))
+            key = (meta.get("namespace") if rt.namespaced else None, meta["name"])
+            self._objects[rt][key] = obj
+            self._invalidate(rt)
+        return obj
+
+    def get(
+        self, rt: ResourceType, namespace: str | None, name: str
+    ) -> dict[str, Any] | None:
+        return self._objects[rt].get((namespace if rt.namespaced else None, name))
+
+    def list(
+        self, rt: ResourceType, namespace: str | None, selector: str = ""
+    ) -> list[dict[str, Any]]:
+        requirements = parse_label_selector(selector)
+        with self._lock:
+            objects = self._objects[rt]
+            # Narrow down the candidates with an index on the first equality requirement
+            equality = [(k, v) for op, k, v in requirements if op == "="]
+            if equality:
+                label, value = equality[0]
+                if (rt, label) not in self._label_index:
+                    index = collections.defaultdict(list)
+                    for key, obj in objects.items():
+                        labels = obj["metadata"].get("labels") or {}
+                        if label in labels:
+                            index[labels[label]].append(key)
+                    self._label_index[rt, label] = index
+                candidates = [
+                    objects[k] for k in self._label_index[rt, label].get(value, [])
+                ]
+            else:
+                candidates = list(objects.values())
+        return [
+            obj
+            for obj in candidates
+            if (namespace is None or obj["metadata"].get("namespace") == namespace)
+            and _matches(obj["metadata"].get("labels") or {}, requirements)
+        ]
+
+    def changes(
+        self,
+        rt: ResourceType,
+        namespace: str | None,
+        resource_version: int,
+        selector: str = "",
+        timeout: float = 1.0,
+        poll_interval: float = 0.05,
+    ) -> Iterator[dict[str, Any]]:
+        """Watch events for the objects added or modified after a resource version,
+        until the timeout has passed. Deletions are not reported."""
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = sorted(
+                (
+                    obj
+                    for obj in self.list(rt, namespace, selector)
+                    if int(obj["metadata"]["resourceVersion"]) > resource_version
+                ),
+                key=lambda obj: int(obj["metadata"]["resourceVersion"]),
+            )
+            for obj in changed:
+                resource_version = int(obj["metadata"]["resourceVersion"])
+                yield {"type": "ADDED", "object": obj}
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(poll_interval)
+
+    def list_response(
+        self, rt: ResourceType, namespace: str | None, selector: str = ""
+    ) -> bytes:
+        """The serialized LIST response, cached until the resource type is modified."""
+        key = (rt, namespace, selector)
+        with self._lock:
+            if (cached := self._list_cache.get(key)) is not None:
+                return cached
+            items = self.list(rt, namespace, selector)
+            body = json.dumps({
+                "apiVersion": rt.api_version,
+                "kind": f"{rt.kind}List",
+                "metadata": {"resourceVersion": str(next(self._resource_version))},
+                "items": items,
+            }).encode()
+            self._list_cache[key] = body
+            return body
+
+    def create(
+        self, rt: ResourceType, namespace: str | None, obj: dict[str, Any]
+    ) -> dict[str, Any]:
+        obj = copy.deepcopy(obj)
+        obj.setdefault("apiVersion", rt.api_version)
+        obj.setdefault("kind", rt.kind)
+        meta = obj.setdefault("metadata", {})
+        if "name" not in meta:
+            meta["name"] = meta.get("generateName", "obj-") + uuid.uuid4().hex[:5]
+        if rt.namespaced:
+            meta["namespace"] = namespace
+        meta["uid"] = str(uuid.uuid4())
+        meta["creationTimestamp"] = _timestamp()
+        obj.setdefault("status", {})
+
+        with self._lock:
+            if self.get(rt, namespace, meta["name"]) is not None:
+                raise KeyError(meta["name"])
+            self.add(rt, obj)
+            # Emulate Kueue, which creates a workload for each job
+            if rt.kind in ("Job", "RayJob") and "kueue.x-k8s.io/queue-name" in (
+                meta.get("labels") or {}
+            ):
+                self.add(
+                    WORKLOADS,
+                    make_workload(
+                        len(self._objects[WORKLOADS]),
+                        namespace=namespace or "default",
+                        queue_name=meta["labels"]["kueue.x-k8s.io/queue-name"],
+                        kind=rt.kind,
+                        job_name=meta["name"],
+                        job_uid=meta["uid"],
+                        phase=0,
+                    ),
+                )
+        return obj
+
+    def delete(
+        self, rt: ResourceType, namespace: str | None, name: str
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            obj = self._objects[rt].pop(
+                (namespace if rt.namespaced else None, name), None
+            )
+            if obj is not None:
+                self._invalidate(rt)
+            return obj
+
+    @classmethod
+    def populate(
+        cls,
+        workloads: int,
+        pods_per_workload: int = 5,
+        namespace: str | Sequence[str] = "default",
+        rayjob_every: int = 0,
+        log_lines: int = 1000,
+        first: int = 0,
+        quota: Mapping[str, str] | None = None,
+    ) -> FakeCluster:
+        """
+        Create a cluster with synthetic jobs and their Kueue workloads and pods.
+
+        Parameters
+        ----------
+        workloads : int
+            The number of jobs (and workloads).
+        pods_per_workload : int, optional
+            The number of pods of each admitted job.
+        namespace : str | Sequence[str], optional
+            The namespace of all objects. Jobs are distributed round-robin over
+            several namespaces.
+        rayjob_every : int, optional
+            Create every n-th job as a RayJob (with a submission job), if positive.
+        log_lines : int, optional
+            The number of lines in the log of each pod.
+        first : int, optional
+            The index of the first job, to create distinct jobs in several clusters.
+        quota : Mapping[str, str] | None, optional
+            The nominal quota of the cluster queue. By default, 64 CPUs and 256Gi memory.
+        """
+
+        namespaces = [namespace] if isinstance(namespace, str) else list(namespace)
+        quota = quota or {"cpu": "64", "memory": "256Gi"}
+        cluster = cls(log_lines=log_lines)
+        for ns in namespaces:
+            cluster.add(NAMESPACES, {"metadata": {"name": ns}})
+            cluster.add(
+                LOCALQUEUES,
+                {
+                    "apiVersion": "kueue.x-k8s.io/v1beta1",
+                    "kind": "LocalQueue",
+                    "metadata": {"name": "user-queue", "namespace": ns},
+                    "spec": {"clusterQueue": "cluster-queue"},
+                },
+            )
+        cluster.add(
+            CLUSTERQUEUES,
+            {
+                "apiVersion": "kueue.x-k8s.io/v1beta1",
+                "kind": "ClusterQueue",
+                "metadata": {"name": "cluster-queue"},
+                "spec": {
+                    "namespaceSelector": {},
+                    "resourceGroups": [
+                        {
+                            "coveredResources": list(quota),
+                            "flavors": [
+                                {
+                                    "name": "default-flavor",
+                                    "resources": [
+                                        {"name": name, "nominalQuota": value}
+                                        for name, value in quota.items()
+                                    ],
+                                }
+                            ],
+                        }
+                    ],
+                },
+            },
+        )
+        for pc, value in [("low", 100), ("high", 1000)]:
+            cluster.add(
+                PRIORITY_CLASSES,
+                {
+                    "apiVersion": "kueue.x-k8s.io/v1beta1",
+                    "kind": "WorkloadPriorityClass",
+                    "metadata": {"name": pc},
+                    "value": value,
+                },
+            )
+
+        for i in range(first, first + workloads):
+            namespace = namespaces[i % len(namespaces)]
+            phase = i % 4
+            if rayjob_every > 0 and i % rayjob_every == 0:
+                kind = "RayJob"
+                rayjob = cluster.add(RAYJOBS, make_rayjob(i, namespace))
+                submitter = make_job(
+                    i,
+                    namespace,
+                    labels={
+                        "ray.io/originated-from-crd": "RayJob",
+                        "ray.io/originated-from-cr-name": rayjob["metadata"]["name"],
+                    },
+                )
+                submitter["metadata"]["name"] += "-submitter"
+                submitter["metadata"]["uid"] = make_job_uid(i + 2**32)
+                controller_uid = cluster.add(JOBS, submitter)["metadata"]["uid"]
+            else:
+                kind = "Job"
+                controller_uid = cluster.add(JOBS, make_job(i, namespace))["metadata"][
+                    "uid"
+                ]
+
+            cluster.add(WORKLOADS, make_workload(i, namespace=namespace, kind=kind))
+            # Pending workloads have no pods yet
+            if phase >= 1:
+                for j in range(pods_per_workload):
+                    pod_phase = (
+                        POD_PHASES[phase] if j == 0 else POD_PHASES[min(phase, 2)]
+                    )
+                    cluster.add(
+                        PODS, make_pod(i, j, controller_uid, pod_phase, namespace)
+                    )
+        return cluster
+
+    def job_uids(self) -> list[str]:
+        """UIDs of the jobs and RayJobs managed by Kueue workloads."""
+        return [
+            wl["metadata"]["ownerReferences"][0]["uid"]
+            for wl in self._objects[WORKLOADS].values()
+        ]
+
+
+(
+    NAMESPACES,
+    PODS,
+    JOBS,
+    WORKLOADS,
+    LOCALQUEUES,
+    CLUSTERQUEUES,
+    PRIORITY_CLASSES,
+    RAYJOBS,
+) = RESOURCE_TYPES
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Avoid delayed ACK stalls on keep-alive connections with small writes
+    disable_nagle_algorithm = True
+    server: FakeApiServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        self._handle()
+
+    def do_DELETE(self) -> None:
+        self._handle()
+
+    def do_PUT(self) -> None:
+        self._handle()
+
+    def do_PATCH(self) -> None:
+        self._handle()
+
+    def _send_json(
+        self, obj: Any, status: int = 200, headers: dict[str, str] | None = None
+    ) -> None:
+        self._send_bytes(json.dumps(obj).encode(), status, headers=headers)
+
+    def _send_bytes(
+        self,
+        body: bytes,
+        status: int = 200,
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, chunks: Iterator[bytes], content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunks:
+            if chunk:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_status(
+        self,
+        code: int,
+        reason: str,
+        message: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._send_json(
+            {
+                "apiVersion": "v1",
+                "kind": "Status",
+                "metadata": {},
+                "status": "Success" if code < 400 else "Failure",
+                "message": message,
+                "reason": reason,
+                "code": code,
+            },
+            status=code,
+            headers=headers,
+        )
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def _handle(self) -> None:
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query))
+        body = self._read_body()
+
+        # Control endpoints of the fake server, which are not counted
+        if url.path == "/_fake/calls":
+            if self.command == "DELETE":
+                self.server.reset_calls()
+            self._send_json({
+                f"{verb} {resource}": n
+                for (verb, resource), n in self.server.calls.items()
+            })
+            return
+
+        self.server.count_call(self.command, url.path, query.items())
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if fault := self.server.next_fault():
+            code, retry_after = fault
+            return self._send_status(
+                code,
+                "TooManyRequests" if code == 429 else "ServiceUnavailable",
+                "injected failure",
+                headers={"Retry-After": str(retry_after)}
+                if retry_after is not None
+                else None,
+            )
+        self._dispatch(url.path, query, body)
+
+    def _dispatch(self, path: str, query: dict[str, str], body: Any) -> None:
+        segments = [s for s in path.split("/") if s]
+        match segments:
+            case ["version"]:
+                return self._send_json({
+                    "major": "1",
+                    "minor": "31",
+                    "gitVersion": "v1.31.0",
+                })
+            case ["api"]:
+                return self._send_json({"kind": "APIVersions", "versions": ["v1"]})
+            case ["apis"]:
+                return self._send_json(_api_group_list())
+            case ["api", version]:
+                return self._send_json(_api_resource_list("", version))
+            case ["apis", group, version]:
+                return self._send_json(_api_resource_list(group, version))
+            case ["api", version, *rest]:
+                group = ""
+            case ["apis", group, version, *rest]:
+                pass
+            case _:
+                return self._send_status(404, "NotFound", f"unknown path {path}")
+
+        namespace = None
+        if len(rest) >= 3 and rest[0] == "namespaces":
+            namespace, rest = rest[1], rest[2:]
+        rt = _RESOURCE_TYPES_BY_PATH.get((group, version, rest[0]))
+        if rt is None:
+            return self._send_status(404, "NotFound", f"unknown resource {rest[0]}")
+        if rt.namespaced and namespace in self.server.forbidden:
+            return self._send_status(
+                403,
+                "Forbidden",
+                f"{rt.plural} is forbidden in namespace {namespace!r}"
+                if namespace
+                else f"{rt.plural} is forbidden at the cluster scope",
+            )
+        name = rest[1] if len(rest) > 1 else None
+        subresource = rest[2] if len(rest) > 2 else None
+        cluster = self.server.cluster
+
+        match self.command, name, subresource:
+            case "GET", None, _ if query.get("watch") in ("true", "1", "True"):
+                selector = query.get("labelSelector", "")
+                if "resourceVersion" in query:
+                    events = cluster.changes(
+                        rt,
+                        namespace,
+                        int(query["resourceVersion"]),
+                        selector,
+                        timeout=min(
+                            float(query.get("timeoutSeconds", "inf")),
+                            self.server.watch_timeout,
+                        ),
+                    )
+                else:
+                    events = (
+                        {"type": "ADDED", "object": obj}
+                        for obj in cluster.list(rt, namespace, selector)
+                    )
+                return self._send_stream(
+                    (json.dumps(event).encode() + b"\n" for event in events),
+                    "application/json",
+                )
+            case "GET", None, _:
+                return self._send_bytes(
+                    cluster.list_response(rt, namespace, query.get("labelSelector", ""))
+                )
+            case "GET", _, "log":
+                if cluster.get(rt, namespace, name) is None:
+                    return self._send_status(404, "NotFound", f"pod {name} not found")
+                return self._send_stream(
+                    _log_chunks(cluster.pod_log, int(query.get("tailLines", -1))),
+                    "text/plain",
+                )
+            case "GET", _, _:
+                obj = cluster.get(rt, namespace, name)
+                if obj is None:
+                    return self._send_status(
+                        404, "NotFound", f"{rt.plural} {name!r} not found"
+                    )
+                return self._send_json(obj)
+            case "POST", None, None:
+                try:
+                    obj = cluster.create(rt, namespace, body)
+                except KeyError:
+                    return self._send_status(
+                        409, "AlreadyExists", "object already exists"
+                    )
+                return self._send_json(obj, status=201)
+            case "DELETE", str(), None:
+                obj = cluster.delete(rt, namespace, name)
+                if obj is None:
+                    return self._send_status(
+                        404, "NotFound", f"{rt.plural} {name!r} not found"
+                    )
+                return self._send_status(200, "", f"{rt.plural} {name!r} deleted")
+            case _:
+                return self._send_status(405, "MethodNotAllowed", "not supported")
+
+
+def _log_chunks(log: bytes, tail: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    if tail >= 0:
+        lines = log.splitlines(keepends=True)
+        log = b"".join(lines[-tail:]) if tail else b""
+    for offset in range(0, len(log), chunk_size):
+        yield log[offset : offset + chunk_size]
+
+
+def _api_group_list() -> dict[str, Any]:
+    versions = collections.defaultdict(list)
+    for rt in RESOURCE_TYPES:
+        if rt.group and rt.version not in versions[rt.group]:
+            versions[rt.group].append(rt.version)
+    return {
+        "kind": "APIGroupList",
+        "apiVersion": "v1",
+        "groups": [
+            {
+                "name": group,
+                "versions": [
+                    {"groupVersion": f"{group}/{v}", "version": v} for v in vs
+                ],
+                "preferredVersion": {
+                    "groupVersion": f"{group}/{vs[0]}",
+                    "version": vs[0],
+                },
+            }
+            for group, vs in versions.items()
+        ],
+    }
+
+
+def _api_resource_list(group: str, version: str) -> dict[str, Any]:
+    resources = []
+    for rt in RESOURCE_TYPES:
+        if (rt.group, rt.version) != (group, version):
+            continue
+        resources.append({
+            "name": rt.plural,
+            "singularName": rt.kind.lower(),
+            "namespaced": rt.namespaced,
+            "kind": rt.kind,
+            "verbs": ["create", "delete", "get", "list", "patch", "update", "watch"],
+        })
+        for sub in rt.subresources:
+            resources.append({
+                "name": f"{rt.plural}/{sub}",
+                "singularName": "",
+                "namespaced": rt.namespaced,
+                "kind": rt.kind if sub != "log" else "Pod",
+                "verbs": ["get"],
+            })
+    return {
+        "kind": "APIResourceList",
+        "apiVersion": "v1",
+        "groupVersion": f"{group}/{version}" if group else version,
+        "resources": resources,
+    }
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    """
+    HTTP server for a :class:`FakeCluster`, counting API calls by verb and resource.
+
+    Use as a context manager to serve in a background thread.
+
+    Parameters
+    ----------
+    cluster : FakeCluster
+        The cluster state to serve.
+    address : tuple[str, int], optional
+        The address to listen on. By default, a free port on the loopback interface.
+    latency : float, optional
+        Artificial latency added to each API call, in seconds.
+    """
+
+    daemon_threads = True
+    # Allow many concurrent connections from load tests
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        cluster: FakeCluster,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        latency: float = 0.0,
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.cluster = cluster
+        self.latency = latency
+        self.calls: collections.Counter[tuple[str, str]] = collections.Counter()
+        self._calls_lock = threading.Lock()
+        self._faults: collections.deque[tuple[int, int | None]] = collections.deque()
+        self.forbidden: set[str | None] = set()
+        """Namespaces in which access to namespaced resources is forbidden (RBAC),
+        ``None`` forbids cluster-wide access to namespaced resources."""
+        self.watch_timeout = 1.0
+        """Maximum duration of a watch request, in seconds, so that watches end
+        quickly when the server is stopped."""
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_call(
+        self, method: str, path: str, query: Iterable[tuple[str, Any]]
+    ) -> None:
+        labels = request_labels(method, path, list(query))
+        with self._calls_lock:
+            self.calls[labels] += 1
+
+    def reset_calls(self) -> None:
+        with self._calls_lock:
+            self.calls.clear()
+
+    def fail_next(
+        self, n: int = 1, status: int = 429, retry_after: int | None = None
+    ) -> None:
+        """Fail the next ``n`` API calls with the given status code and ``Retry-After`` header."""
+        with self._calls_lock:
+            self._faults.extend([(status, retry_after)] * n)
+
+    def next_fault(self) -> tuple[int, int | None] | None:
+        with self._calls_lock:
+            return self._faults.popleft() if self._faults else None
+
+    def write_kubeconfig(self, path: Path, namespace: str = "default") -> Path:
+        """Write a kubeconfig file for connecting to the server."""
+        return write_kubeconfig(path, {"fake": self}, namespace)
+
+    def use_kubeconfig(self, path: Path, namespace: str = "default") -> Path:
+        """
+        Write a kubeconfig file for the server and make it the default kubeconfig.
+
+        Sets ``KUBECONFIG`` for subprocesses, and the default location of the
+        Kubernetes client, which is only read from the environment on import.
+        """
+        self.write_kubeconfig(path, namespace)
+        os.environ["KUBECONFIG"] = str(path)
+        kube_config.KUBE_CONFIG_DEFAULT_LOCATION = str(path)
+        # Force the use of the kubeconfig outside of a cluster
+        os.environ.pop("KUBERNETES_SERVICE_HOST", None)
+        return path
+
+    def __enter__(self) -> Self:
+        # Poll for shutdown frequently, so that tests can stop the server quickly
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def write_kubeconfig(
+    path: Path, servers: Mapping[str, FakeApiServer], namespace: str = "default"
+) -> Path:
+    """Write a kubeconfig file with a context for each server, named by the mapping.
+
+    The first context is the current context."""
+    path.write_text(
+        yaml.safe_dump({
+            "apiVersion": "v1",
+            "kind": "Config",
+            "clusters": [
+                {"name": name, "cluster": {"server": server.url}}
+                for name, server in servers.items()
+            ],
+            "users": [{"name": "fake", "user": {"token": "fake"}}],
+            "contexts": [
+                {
+                    "name": name,
+                    "context": {
+                        "cluster": name,
+                        "user": "fake",
+                        "namespace": namespace,
+                    },
+                }
+                for name in servers
+            ],
+            "current-context": next(iter(servers)),
+        })
+    )
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--workloads", type=int, default=10000)
+    parser.add_argument("--pods-per-workload", type=int, default=5)
+    parser.add_argument("--rayjob-every", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--kubeconfig", type=Path, help="Write a kubeconfig for the server to this path"
+    )
+    args = parser.parse_args()
+
+    cluster = FakeCluster.populate(
+        args.workloads, args.pods_per_workload, rayjob_every=args.rayjob_every
+    )
+    server = FakeApiServer(
+        cluster, (args.host, args.port), latency=args.latency_ms / 1000
+    )
+    if args.kubeconfig:
+        server.write_kubeconfig(args.kubeconfig)
+    print(f"Serving {args.workloads} workloads on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark queries of the persistent job history.
+
+Records a long synthetic job history (one job per minute by default, i.e., about
+70 days for 100000 jobs) spread over several queues and submitters, and measures
+the latency of typical history queries against the SQLite store.
+
+usage: python -m benchmarks.history [--jobs N] [--repeat R] [--database PATH]
+"""
+
+import argparse
+import functools
+import time
+from datetime import timedelta
+
+from benchmarks.data import EPOCH, make_job_uid, make_workload
+from benchmarks.utils import fmt_ms, format_table, measure, percentiles
+from jobq_server.models import JobStatus
+from jobq_server.services.history import HistoryStore
+from jobq_server.services.watcher import WorkloadEvent
+from jobq_server.utils.kueue import KueueWorkload
+
+QUEUES = ["cpu-queue", "gpu-queue", "debug-queue"]
+SUBMITTERS = [f"user-{i}@example.com" for i in range(50)]
+
+
+def populate(store: HistoryStore, jobs: int, batch_size: int = 10000) -> None:
+    for start in range(0, jobs, batch_size):
+        batch = range(start, min(start + batch_size, jobs))
+        store.record([
+            WorkloadEvent(
+                "ADDED",
+                KueueWorkload.from_api_object(
+                    make_workload(i, queue_name=QUEUES[i % len(QUEUES)])
+                ),
+            )
+            for i in batch
+        ])
+        for i in batch:
+            store.record_submission(
+                make_job_uid(i),
+                namespace="default",
+                name=f"job-{i}",
+                kind="Job",
+                labels={"team": f"team-{i % 7}"},
+                context={"submitter": {"email": SUBMITTERS[i % len(SUBMITTERS)]}},
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--database", default=":memory:", help="SQLite database file of the store"
+    )
+    args = parser.parse_args()
+
+    store = HistoryStore(args.database)
+    start = time.perf_counter()
+    populate(store, args.jobs)
+    print(
+        f"Recorded {args.jobs} jobs in {time.perf_counter() - start:.1f}s, "
+        f"{args.repeat} repetitions per query\n"
+    )
+
+    last_week = EPOCH + timedelta(minutes=args.jobs) - timedelta(days=7)
+    queries = {
+        "latest": {},
+        "status": {"status": [JobStatus.FAILED]},
+        "queue": {"queue_name": "gpu-queue"},
+        "submitter": {"submitter": SUBMITTERS[0]},
+        "last week": {"since": last_week},
+        "status + queue, last week": {
+            "status": [JobStatus.SUCCEEDED],
+            "queue_name": "cpu-queue",
+            "since": last_week,
+        },
+        "submitter, limit 1000": {"submitter": SUBMITTERS[1], "limit": 1000},
+    }
+    rows = []
+    for name, kwargs in queries.items():
+        p = percentiles(measure(functools.partial(store.query, **kwargs), args.repeat))
+        rows.append([
+            name,
+            len(store.query(**kwargs)),
+            fmt_ms(p["p50"]),
+            fmt_ms(p["p90"]),
+            fmt_ms(p["p99"]),
+        ])
+    print(format_table(rows, ["query", "results", "p50", "p90", "p99"]))
+
+
+if __name__ == "__main__":
+    main()
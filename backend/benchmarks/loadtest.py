@@ -0,0 +1,399 @@
+"""
+Load test of job submissions (``POST /jobs``) against a backend replica.
+
+Unless a target URL is given, starts the fake Kubernetes API server from
+:mod:`benchmarks.fake_apiserver` and a single backend replica (Uvicorn) in
+subprocesses, and submits realistic ``CreateJobModel`` payloads in Kueue mode.
+
+Without an arrival rate, a closed loop of ``--concurrency`` clients submits jobs
+back to back. With ``--rate``, requests arrive as a Poisson process at the given
+rate (per second), with at most ``--concurrency`` requests in flight. Latencies
+are measured from the scheduled arrival time, so that queueing in the load
+generator counts towards the latency. Several comma-separated rates run as
+consecutive stages, to find the saturation point of the backend.
+
+usage: python -m benchmarks.loadtest [--target URL] [--concurrency C] [--rate R[,R...]] [--duration S] [--json FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.utils import fmt_ms, format_table, percentiles
+
+_PRIORITY_CLASSES = [None, "low", "high"]
+_RESOURCES = [
+    {"cpu": "1", "memory": "2Gi"},
+    {"cpu": "4", "memory": "16Gi"},
+    {"cpu": "8", "memory": "64Gi", "gpu": 1},
+]
+# Submission context as sent by the CLI, including (part of) the platform information
+_SUBMISSION_CONTEXT = {
+    "submitter": {"username": "Jane Doe", "email": "jane.doe@example.com"},
+    "platform": {
+        "architecture": ["64bit", "ELF"],
+        "machine": "x86_64",
+        "node": "workstation",
+        "platform": "Linux-6.8.0-45-generic-x86_64-with-glibc2.39",
+        "processor": "x86_64",
+        "python_build": ["main", "Oct  1 2024 02:05:46"],
+        "python_compiler": "GCC 13.2.0",
+        "python_implementation": "CPython",
+        "python_version": "3.12.7",
+        "release": "6.8.0-45-generic",
+        "system": "Linux",
+        "version": "#45-Ubuntu SMP PREEMPT_DYNAMIC Fri Aug 30 12:02:04 UTC 2024",
+    },
+}
+
+
+def make_submission(i: int, queue_name: str = "user-queue") -> dict[str, Any]:
+    """A ``POST /jobs`` payload for the i-th submission, varying resources and priorities."""
+    scheduling: dict[str, Any] = {"queue_name": queue_name}
+    if priority_class := _PRIORITY_CLASSES[i % len(_PRIORITY_CLASSES)]:
+        scheduling["priority_class"] = priority_class
+    return {
+        "name": f"train-{i}",
+        "file": "examples/train.py",
+        "image_ref": f"registry.example.com/team/train-{i % 10}:latest",
+        "mode": "kueue",
+        "options": {
+            "resources": _RESOURCES[i % len(_RESOURCES)],
+            "scheduling": scheduling,
+            "labels": {"team": "research", "experiment": f"exp-{i % 7}"},
+        },
+        "submission_context": _SUBMISSION_CONTEXT,
+    }
+
+
+@dataclass
+class Sample:
+    start: float
+    """Scheduled start of the request, relative to the start of the stage"""
+    latency: float
+    outcome: str
+    """HTTP status code, or exception type for failed requests"""
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome.isdigit() and int(self.outcome) < 400
+
+
+async def _submit(client: httpx.AsyncClient, i: int, scheduled: float) -> Sample:
+    try:
+        response = await client.post("/jobs", json=make_submission(i))
+        outcome = str(response.status_code)
+    except httpx.HTTPError as e:
+        outcome = type(e).__name__
+    return Sample(scheduled, time.perf_counter() - scheduled, outcome)
+
+
+async def run_stage(
+    client: httpx.AsyncClient,
+    duration: float,
+    concurrency: int,
+    rate: float | None = None,
+    offset: int = 0,
+) -> list[Sample]:
+    """
+    Submit jobs for ``duration`` seconds, in a closed loop or at a Poisson arrival rate.
+
+    Sample start times are relative to the start of the stage.
+    """
+
+    counter = iter(range(offset, sys.maxsize))
+    samples: list[Sample] = []
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+
+    if rate is None:
+
+        async def worker() -> None:
+            while (now := time.perf_counter()) < deadline:
+                samples.append(await _submit(client, next(counter), now))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    else:
+        in_flight = asyncio.Semaphore(concurrency)
+
+        async def request(scheduled: float) -> None:
+            async with in_flight:
+                samples.append(await _submit(client, next(counter), scheduled))
+
+        async with asyncio.TaskGroup() as tg:
+            scheduled = t0
+            while (scheduled := scheduled + random.expovariate(rate)) < deadline:
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                tg.create_task(request(scheduled))
+
+    for s in samples:
+        s.start -= t0
+    return samples
+
+
+def summarize(samples: list[Sample], duration: float) -> dict[str, Any]:
+    succeeded = [s for s in samples if s.ok]
+    errors = collections.Counter(s.outcome for s in samples if not s.ok)
+    latencies = [s.latency for s in succeeded]
+    per_second = collections.Counter(int(s.start) for s in succeeded)
+    return {
+        "requests": len(samples),
+        "succeeded": len(succeeded),
+        "errors": dict(errors),
+        "error_rate": len(samples) and (len(samples) - len(succeeded)) / len(samples),
+        "throughput": len(succeeded) / duration,
+        "latency": {
+            **(percentiles(latencies) if latencies else {}),
+            "max": max(latencies, default=0.0),
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        },
+        "throughput_per_second": [per_second[t] for t in range(int(duration))],
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for(url: str, proc: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            httpx.get(url, timeout=1.0).raise_for_status()
+            return
+        except httpx.HTTPError:
+            if proc.poll() is not None:
+                raise RuntimeError(
+                    f"{proc.args[2]} exited with code {proc.returncode}"
+                ) from None
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+@contextlib.contextmanager
+def local_backend(
+    workloads: int, latency_ms: float, uvicorn_args: list[str]
+) -> Iterator[tuple[str, str]]:
+    """Run the fake API server and a backend replica, yielding their URLs."""
+    with contextlib.ExitStack() as stack:
+        tmpdir = stack.enter_context(tempfile.TemporaryDirectory())
+        kubeconfig = Path(tmpdir) / "kubeconfig"
+        log_path = Path(tmpdir) / "backend.log"
+        env = os.environ | {"KUBECONFIG": str(kubeconfig)}
+        env.pop("KUBERNETES_SERVICE_HOST", None)
+
+        fake_port, backend_port = _free_port(), _free_port()
+        log = stack.enter_context(log_path.open("w"))
+        procs = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.fake_apiserver",
+                    f"--port={fake_port}",
+                    f"--workloads={workloads}",
+                    f"--latency-ms={latency_ms}",
+                    f"--kubeconfig={kubeconfig}",
+                ],
+                stdout=subprocess.DEVNULL,
+            )
+        ]
+        try:
+            fake_url = f"http://127.0.0.1:{fake_port}"
+            _wait_for(f"{fake_url}/version", procs[0])
+            procs.append(
+                subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-m",
+                        "uvicorn",
+                        "jobq_server:app",
+                        "--host=127.0.0.1",
+                        f"--port={backend_port}",
+                        "--log-level=error",
+                        "--no-access-log",
+                        *uvicorn_args,
+                    ],
+                    env=env,
+                    # The backend logs every API response at debug level
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                )
+            )
+            backend_url = f"http://127.0.0.1:{backend_port}"
+            try:
+                _wait_for(f"{backend_url}/health", procs[1])
+            except Exception:
+                log.flush()
+                print(log_path.read_text()[-4000:], file=sys.stderr)
+                raise
+            yield backend_url, fake_url
+        finally:
+            for proc in reversed(procs):
+                proc.terminate()
+                proc.wait()
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(
+    target: str,
+    fake_url: str | None,
+    stages: list[float | None],
+    duration: float,
+    concurrency: int,
+    warmup: float,
+) -> list[dict[str, Any]]:
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    results = []
+    async with httpx.AsyncClient(
+        base_url=target, limits=limits, timeout=60.0
+    ) as client:
+        if warmup > 0:
+            await run_stage(client, warmup, min(concurrency, 4), offset=10**9)
+
+        offset = 0
+        for rate in stages:
+            if fake_url:
+                await client.delete(f"{fake_url}/_fake/calls")
+            samples = await run_stage(client, duration, concurrency, rate, offset)
+            offset += len(samples)
+
+            result = {
+                "rate": rate,
+                "concurrency": concurrency,
+                **summarize(samples, duration),
+            }
+            if fake_url:
+                calls = (await client.get(f"{fake_url}/_fake/calls")).json()
+                result["api_calls_per_request"] = {
+                    k: v / max(len(samples), 1) for k, v in calls.items()
+                }
+            results.append(result)
+            print(
+                f"  rate={rate or 'closed loop'}: {result['throughput']:.1f} jobs/s, "
+                f"{result['error_rate']:.1%} errors",
+                flush=True,
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--target",
+        help="URL of a running backend. By default, a local backend is started "
+        "against a fake Kubernetes API server.",
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--rate",
+        type=lambda s: [float(r) for r in s.split(",")],
+        help="Arrival rate(s) in requests per second, comma-separated for several stages",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Duration of each stage in seconds"
+    )
+    parser.add_argument("--warmup", type=float, default=2.0, help="Warm-up in seconds")
+    parser.add_argument(
+        "--workloads",
+        type=int,
+        default=1000,
+        help="Existing workloads in the fake cluster",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Artificial latency of each Kubernetes API call",
+    )
+    parser.add_argument(
+        "--uvicorn-arg",
+        action="append",
+        default=[],
+        help="Additional argument for the Uvicorn backend process (repeatable)",
+    )
+    parser.add_argument("--json", type=Path, help="Write the results to a JSON file")
+    args = parser.parse_args()
+
+    stages: list[float | None] = args.rate or [None]
+    with contextlib.ExitStack() as stack:
+        if args.target:
+            target, fake_url = args.target, None
+        else:
+            target, fake_url = stack.enter_context(
+                local_backend(args.workloads, args.latency_ms, args.uvicorn_arg)
+            )
+        print(f"Submitting jobs to {target}\n", flush=True)
+        results = asyncio.run(
+            run(target, fake_url, stages, args.duration, args.concurrency, args.warmup)
+        )
+
+    rows = [
+        [
+            f"{r['rate']:g}/s" if r["rate"] else "closed loop",
+            f"{r['throughput']:.1f}/s",
+            f"{r['error_rate']:.1%}",
+            fmt_ms(r["latency"].get("p50", 0.0)),
+            fmt_ms(r["latency"].get("p99", 0.0)),
+            fmt_ms(r["latency"]["max"]),
+        ]
+        for r in results
+    ]
+    print()
+    print(
+        format_table(
+            rows, ["arrival rate", "throughput", "errors", "p50", "p99", "max"]
+        )
+    )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "benchmark": "loadtest",
+                    "timestamp": datetime.now(UTC).isoformat(),
+                    "commit": _git_commit(),
+                    "parameters": {
+                        k: v if not isinstance(v, Path) else str(v)
+                        for k, v in vars(args).items()
+                    },
+                    "stages": results,
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
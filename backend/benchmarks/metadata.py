@@ -0,0 +1,62 @@
+"""
+Benchmark the parsing of Kueue workloads from API server responses.
+
+Measures the per-object cost of building the Kubernetes object metadata, with
+and without managed fields, and of creating ``KueueWorkload`` instances through
+full pydantic validation and through the trusted fast path.
+
+usage: python -m benchmarks.metadata [--workloads N] [--repeat R]
+"""
+
+import argparse
+import functools
+
+from benchmarks.data import make_workloads
+from benchmarks.utils import format_table, measure, percentiles
+from jobq_server.utils.k8s import build_metadata
+from jobq_server.utils.kueue import KueueWorkload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--workloads", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workloads = make_workloads(args.workloads)
+    print(f"Parsing {args.workloads} workloads, {args.repeat} repetitions\n")
+
+    def run(fn, **kwargs) -> None:
+        for wl in workloads:
+            fn(wl, **kwargs)
+
+    cases = {
+        "build_metadata": functools.partial(
+            run, lambda wl, **kw: build_metadata(wl["metadata"], **kw)
+        ),
+        "build_metadata (no managedFields)": functools.partial(
+            run,
+            lambda wl, **kw: build_metadata(wl["metadata"], **kw),
+            include_managed_fields=False,
+        ),
+        "KueueWorkload.model_validate": functools.partial(
+            run, KueueWorkload.model_validate
+        ),
+        "KueueWorkload.from_api_object": functools.partial(
+            run, KueueWorkload.from_api_object
+        ),
+    }
+
+    rows = []
+    for name, fn in cases.items():
+        p = percentiles(measure(fn, args.repeat))
+        rows.append([
+            name,
+            f"{p['p50'] / args.workloads * 1e6:.2f} µs",
+            f"{p['p90'] / args.workloads * 1e6:.2f} µs",
+        ])
+    print(format_table(rows, ["parser", "p50 / object", "p90 / object"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark the serialization and compression of workload listings.
+
+Measures the latency of ``GET /jobs?include_metadata=true`` for a synthetic list of
+workloads, comparing FastAPI's default response handling with the direct
+pydantic-core serialization, as well as the payload size and latency with each
+supported content coding.
+
+usage: python -m benchmarks.serialization [--workloads N] [--repeat R]
+"""
+
+import argparse
+import functools
+import gzip
+from typing import Annotated
+from unittest import mock
+
+from fastapi import FastAPI, Query
+from fastapi.testclient import TestClient
+
+from benchmarks.data import make_workloads
+from benchmarks.utils import fmt_bytes, fmt_ms, format_table, measure, percentiles
+from jobq_server import app
+from jobq_server.models import ListWorkloadModel, WorkloadIdentifier, WorkloadMetadata
+from jobq_server.services.k8s import KubernetesService
+from jobq_server.utils.compression import available_encoders
+from jobq_server.utils.fastapi import PydanticJSONResponse
+from jobq_server.utils.kueue import KueueWorkload
+
+
+def _listing(workloads: list[KueueWorkload]) -> list[ListWorkloadModel]:
+    return [
+        ListWorkloadModel(
+            name=wl.metadata.name,
+            id=WorkloadIdentifier.from_kueue_workload(wl),
+            metadata=WorkloadMetadata.from_kueue_workload(wl),
+        )
+        for wl in workloads
+    ]
+
+
+def serialization_app(listing: list[ListWorkloadModel]) -> FastAPI:
+    """App serving the same listing through FastAPI's default response handling and directly."""
+
+    bench_app = FastAPI()
+
+    @bench_app.get("/default", response_model_exclude_unset=True)
+    async def default(
+        include_metadata: Annotated[bool, Query()] = True,
+    ) -> list[ListWorkloadModel]:
+        return listing
+
+    @bench_app.get("/direct", response_model=list[ListWorkloadModel])
+    async def direct(
+        include_metadata: Annotated[bool, Query()] = True,
+    ) -> PydanticJSONResponse:
+        return PydanticJSONResponse(listing, exclude_unset=True)
+
+    return bench_app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--workloads", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    workloads = [
+        KueueWorkload.model_validate(wl) for wl in make_workloads(args.workloads)
+    ]
+
+    with (
+        mock.patch.object(KueueWorkload, "has_failed_pods", False),
+        mock.patch.object(KubernetesService, "__init__", return_value=None),
+        mock.patch.object(KubernetesService, "list_workloads", return_value=workloads),
+    ):
+        listing = _listing(workloads)
+        print(f"Listing {args.workloads} workloads, {args.repeat} repetitions\n")
+
+        # 1. Response rendering
+        client = TestClient(serialization_app(listing))
+        headers = {"Accept-Encoding": "identity"}
+        rows = []
+        for path in ["/default", "/direct"]:
+            durations = measure(
+                functools.partial(client.get, path, headers=headers), args.repeat
+            )
+            p = percentiles(durations)
+            rows.append([path.lstrip("/"), fmt_ms(p["p50"]), fmt_ms(p["p90"])])
+        print("Response rendering (uncompressed):")
+        print(format_table(rows, ["handling", "p50", "p90"]) + "\n")
+
+        # 2. Content codings (end to end, including workload to metadata conversion)
+        client = TestClient(app)
+        url = "/jobs?include_metadata=true"
+        rows = []
+        identity_size = 0
+        for encoding in ["identity", *available_encoders()]:
+            headers = {"Accept-Encoding": encoding}
+            with client.stream("GET", url, headers=headers) as response:
+                size = len(b"".join(response.iter_raw()))
+            if encoding == "identity":
+                identity_size = size
+            elif encoding == "gzip":
+                with client.stream("GET", url, headers=headers) as response:
+                    body = gzip.decompress(b"".join(response.iter_raw()))
+                assert len(body) == identity_size
+
+            durations = measure(
+                functools.partial(client.get, url, headers=headers), args.repeat
+            )
+            p = percentiles(durations)
+            rows.append([
+                encoding,
+                fmt_bytes(size),
+                f"{size / identity_size:.1%}",
+                fmt_ms(p["p50"]),
+                fmt_ms(p["p90"]),
+            ])
+        print(f"GET {url}:")
+        print(format_table(rows, ["encoding", "size", "ratio", "p50", "p90"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measurement and reporting helpers shared by the benchmarks."""
+
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> list[float]:
+    """Call a function repeatedly and return the wall-clock duration of each call in seconds."""
+    for _ in range(warmup):
+        fn()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def percentiles(
+    samples: Sequence[float], quantiles: Sequence[int] = (50, 90, 99)
+) -> dict[str, float]:
+    """Compute percentiles of a sample, e.g. ``{"p50": ..., "p90": ..., "p99": ...}``."""
+    if len(samples) == 1:
+        return {f"p{q}": samples[0] for q in quantiles}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {f"p{q}": cuts[q - 1] for q in quantiles}
+
+
+def format_table(rows: Sequence[Sequence[Any]], header: Sequence[str]) -> str:
+    """Render rows as a plain-text table with aligned columns."""
+    cells = [[str(c) for c in header]] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            c.rjust(w) if i else c.ljust(w)
+            for i, (c, w) in enumerate(zip(row, widths, strict=True))
+        )
+        for row in cells
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
+
+
+def fmt_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
+
+
+def fmt_bytes(n: float) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if n < 1024:
+            return f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
@@ -1,17 +1,56 @@
 import logging
+import math
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi import status as http_status
+from fastapi.responses import JSONResponse
 from kubernetes import config
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from jobq_server.routers import jobs
+from jobq_server.config import get_settings
+from jobq_server.exceptions import KubernetesUnavailableError
+from jobq_server.metrics import MetricsMiddleware
+from jobq_server.profiling import ProfilingMiddleware
+from jobq_server.routers import admin, jobs, queues
+from jobq_server.services.history import get_history_store
+from jobq_server.services.images import get_image_prepuller
+from jobq_server.services.queue_snapshot import get_queue_snapshot, start_queue_watchers
+from jobq_server.services.queue_stats import get_queue_stats
+from jobq_server.services.retention import get_job_reaper
+from jobq_server.services.watcher import start_workload_watchers
+from jobq_server.tracing import TracingMiddleware, configure_tracing
+from jobq_server.utils.compression import CompressionMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logging.basicConfig(level=logging.DEBUG)
     config.load_config()
+    tracer_provider = configure_tracing(get_settings())
+
+    handlers = []
+    if (history := get_history_store()) is not None:
+        handlers.append(history.record)
+    if (stats := get_queue_stats()) is not None:
+        handlers.append(stats.record)
+    if (reaper := get_job_reaper()) is not None:
+        handlers.append(reaper.record)
+        reaper.start()
+    if (prepuller := get_image_prepuller()) is not None:
+        prepuller.start()
+    watchers = start_workload_watchers(handlers) if handlers else []
+    if (snapshot := get_queue_snapshot()) is not None:
+        watchers += start_queue_watchers(snapshot)
     yield
+    for watcher in watchers:
+        watcher.stop()
+    if reaper is not None:
+        reaper.stop()
+    if prepuller is not None:
+        prepuller.stop()
+    if tracer_provider is not None:
+        tracer_provider.shutdown()
 
 
 app = FastAPI(
@@ -20,7 +59,26 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+
 app.include_router(jobs.router, prefix="/jobs")
+app.include_router(queues.router, prefix="/queues")
+app.include_router(admin.router, prefix="/admin")
+
+
+@app.exception_handler(KubernetesUnavailableError)
+async def kubernetes_unavailable(request: Request, exc: KubernetesUnavailableError):
+    headers = {}
+    if exc.retry_after is not None:
+        headers["Retry-After"] = str(math.ceil(exc.retry_after))
+    return JSONResponse(
+        {"detail": str(exc)},
+        status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers=headers,
+    )
 
 
 @app.get("/health", include_in_schema=False)
@@ -28,8 +86,13 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # URLs to be excluded from Uvicorn access logging
-log_exclude_endpoints = ["/health"]
+log_exclude_endpoints = ["/health", "/metrics"]
 
 
 class AccessLogFilter(logging.Filter):
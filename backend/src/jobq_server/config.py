@@ -0,0 +1,236 @@
+import functools
+from pathlib import Path, PurePosixPath
+from typing import Literal
+
+from pydantic import BaseModel, Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RateLimit(BaseModel):
+    qps: float = Field(
+        ge=0, description="Sustained rate in calls per second, 0 to disable"
+    )
+    burst: int = Field(ge=1, description="Maximum number of calls in a burst")
+
+
+class RetentionRule(BaseModel):
+    queue: str | None = Field(
+        None, description="Kueue local queue of the jobs, all queues if not set"
+    )
+    labels: dict[str, str] = Field(
+        {}, description="Labels of the jobs, which must all match"
+    )
+    ttl: int | None = Field(
+        ge=0,
+        description="Time to keep the jobs after they have finished, in seconds, "
+        "`null` to keep them indefinitely",
+    )
+
+
+class Settings(BaseSettings):
+    """Backend configuration, read from ``JOBQ_SERVER_*`` environment variables."""
+
+    tracing_exporter: Literal["none", "console", "file", "otlp"] = Field(
+        "none",
+        description="Exporter for OpenTelemetry traces (requires the `tracing` extra)",
+    )
+    tracing_file: Path = Field(
+        Path("traces.jsonl"),
+        description="Output file for the `file` trace exporter, one span per line",
+    )
+    tracing_otlp_endpoint: str | None = Field(
+        None,
+        description="Endpoint of the OTLP/HTTP collector for the `otlp` trace exporter. "
+        "Defaults to the standard `OTEL_EXPORTER_OTLP_*` environment variables.",
+    )
+    service_name: str = Field(
+        "jobq-server",
+        description="Service name reported in traces",
+    )
+
+    profiling_token: SecretStr | None = Field(
+        None,
+        description="Token enabling request profiling (requires the `profiling` extra), "
+        "to be passed in the `X-Jobq-Profile` header",
+    )
+    profiling_slowest: int = Field(
+        0,
+        ge=0,
+        description="Number of slowest request profiles to retain. "
+        "If positive, all requests are profiled.",
+    )
+    profiling_interval: float = Field(
+        0.001,
+        gt=0,
+        description="Sampling interval of the profiler, in seconds",
+    )
+
+    k8s_clusters: list[str] = Field(
+        [],
+        description="Kubeconfig contexts of the clusters to manage (`in-cluster` for the "
+        "in-cluster configuration). Clusters are named after their context. By default, "
+        "only the cluster of the backend (or the current kubeconfig context) is managed.",
+    )
+    k8s_default_cluster: str | None = Field(
+        None,
+        description="Cluster for requests that do not select one. Defaults to the first "
+        "of `k8s_clusters`.",
+    )
+
+    k8s_rate_limit: RateLimit = Field(
+        RateLimit(qps=100, burst=200),
+        description="Client-side rate limit of Kubernetes API calls",
+    )
+    k8s_verb_rate_limits: dict[str, RateLimit] = Field(
+        {},
+        description="Rate limits of Kubernetes API calls per verb (e.g., `list`), "
+        "instead of the shared default limit",
+    )
+    k8s_rate_limit_timeout: float = Field(
+        5.0,
+        ge=0,
+        description="Maximum time to wait for the rate limiter before failing a request, "
+        "in seconds",
+    )
+    k8s_max_retries: int = Field(
+        3,
+        ge=0,
+        description="Maximum number of retries of throttled (429) and failed (5xx) "
+        "Kubernetes API calls",
+    )
+    k8s_retry_backoff: float = Field(
+        0.2,
+        gt=0,
+        description="Base delay of the exponential backoff between retries, in seconds",
+    )
+    k8s_retry_max_backoff: float = Field(
+        10.0,
+        gt=0,
+        description="Maximum delay between retries, in seconds",
+    )
+    k8s_circuit_failure_threshold: int = Field(
+        5,
+        ge=0,
+        description="Number of consecutive failed Kubernetes API calls that open the "
+        "circuit breaker, 0 to disable",
+    )
+    k8s_circuit_reset_timeout: float = Field(
+        30.0,
+        gt=0,
+        description="Time until an open circuit breaker lets a trial call through, in seconds",
+    )
+
+    k8s_fan_out_concurrency: int = Field(
+        8,
+        ge=1,
+        description="Maximum number of concurrent Kubernetes API calls when querying "
+        "several namespaces of a cluster",
+    )
+    k8s_coalesce_reads: bool = Field(
+        True,
+        description="Share a single API call between identical concurrent Kubernetes reads",
+    )
+    k8s_read_cache_ttl: float = Field(
+        0.0,
+        ge=0,
+        description="Time to cache the responses of Kubernetes reads, in seconds. "
+        "Reads may be stale by up to this time, 0 disables the cache.",
+    )
+
+    watch_namespace: str | None = Field(
+        None,
+        description="Namespace whose Kueue workloads and LocalQueues are watched (e.g., "
+        "for the job history), `*` for all namespaces. Defaults to the namespace of "
+        "the backend.",
+    )
+    queue_stats_window: float = Field(
+        86400.0,
+        ge=0,
+        description="Rolling time window of the queue statistics, in seconds, "
+        "0 to disable them",
+    )
+    queue_snapshot: bool = Field(
+        True,
+        description="Watch the Kueue ClusterQueues and LocalQueues, to serve cached "
+        "snapshots of their quota and usage",
+    )
+    history_database: Path | None = Field(
+        None,
+        description="SQLite database file of the persistent job history, which is "
+        "created if it does not exist. The job history is disabled if not set.",
+    )
+
+    job_retention: int | None = Field(
+        None,
+        ge=0,
+        description="Time to keep finished jobs (and their Kueue workloads), in seconds, "
+        "unless a retention rule applies. Finished jobs are kept indefinitely if not set.",
+    )
+    job_retention_rules: list[RetentionRule] = Field(
+        [],
+        description="Retention times of finished jobs by queue and labels. The first "
+        "matching rule applies.",
+    )
+    job_reaper_interval: float = Field(
+        60.0,
+        ge=0,
+        description="Interval between the sweeps of the background reaper, which "
+        "deletes finished jobs after their retention time, in seconds, 0 to disable it",
+    )
+    job_log_archive_max_bytes: int | None = Field(
+        64 << 20,
+        ge=0,
+        description="Maximum size of the archived log of each pod of a finished job, in "
+        "bytes, beyond which the log is truncated. Not limited if not set.",
+    )
+    log_search_timeout: float = Field(
+        10.0,
+        gt=0,
+        description="Time budget of a log search, in seconds, after which the matches "
+        "found so far are returned",
+    )
+    log_search_max_line_length: int = Field(
+        4096,
+        ge=1,
+        description="Maximum length of the log lines searched, longer lines are truncated",
+    )
+
+    host_cache_root: PurePosixPath | None = Field(
+        None,
+        description="Directory on the nodes under which the node-local cache volumes of "
+        "jobs are created, as `<root>/<host path>`. Jobs with node-local caches are "
+        "rejected if not set.",
+    )
+
+    image_digest_pinning: bool = Field(
+        False,
+        description="Pin the images of submitted jobs to the digest of their tag, if "
+        "it can be resolved with the registry API (which is queried on submission)",
+    )
+    image_prepull: bool = Field(
+        False,
+        description="Pre-pull the images of queued jobs on the nodes they can be "
+        "placed on, with a DaemonSet per job",
+    )
+    image_prepull_timeout: float = Field(
+        1800.0,
+        gt=0,
+        description="Time after which a pre-pull DaemonSet is deleted, even if the "
+        "image has not been pulled on all nodes, in seconds",
+    )
+    accelerator_node_label: str = Field(
+        "nvidia.com/gpu.product",
+        description="Node label with the accelerator type (e.g., the GPU model) of a "
+        "node, to select the nodes of jobs with an accelerator type that does not name "
+        "a Kueue ResourceFlavor",
+    )
+
+    model_config = SettingsConfigDict(
+        extra="ignore",
+        env_prefix="JOBQ_SERVER_",
+    )
+
+
+@functools.cache
+def get_settings() -> Settings:
+    return Settings()
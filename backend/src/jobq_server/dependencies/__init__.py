@@ -1,26 +1,174 @@
 from typing import Annotated
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 
-from jobq_server.models import JobId
-from jobq_server.services.k8s import KubernetesService
+from jobq_server.models import JobId, WorkloadMetadata
+from jobq_server.services.clusters import ALL_CLUSTERS, get_clusters
+from jobq_server.services.history import HistoryStore, get_history_store
+from jobq_server.services.k8s import KubernetesService, get_kubernetes_service
+from jobq_server.services.queue_snapshot import QueueSnapshot, get_queue_snapshot
+from jobq_server.services.queue_stats import QueueStatsCollector, get_queue_stats
+from jobq_server.utils.k8s import ALL_NAMESPACES
 from jobq_server.utils.kueue import KueueWorkload
 
 
-def k8s_service() -> KubernetesService:
-    return KubernetesService()
+def _split_values(values: list[str]) -> list[str]:
+    """Split repeated and comma-separated query parameter values, without duplicates."""
+    split = (v.strip() for value in values for v in value.split(","))
+    return list(dict.fromkeys(v for v in split if v))
+
+
+def cluster_name(
+    cluster: Annotated[
+        str | None,
+        Query(
+            description="Cluster of the job, if the server manages several clusters. "
+            "Defaults to the cluster the job is found in (or, for submissions, the "
+            "cluster with the most free quota).",
+        ),
+    ] = None,
+) -> str | None:
+    clusters = get_clusters()
+    if cluster is not None and (clusters is None or cluster not in clusters):
+        raise HTTPException(404, f"unknown cluster: {cluster!r}")
+    return cluster
+
+
+def k8s_service(
+    cluster: Annotated[str | None, Depends(cluster_name)],
+) -> KubernetesService:
+    if (clusters := get_clusters()) is None:
+        return get_kubernetes_service()
+    return clusters[cluster or clusters.default]
+
+
+def cluster_names(
+    cluster: Annotated[
+        list[str] | None,
+        Query(
+            description="Clusters to query, either as repeated or comma-separated "
+            f"values, if the server manages several clusters. `{ALL_CLUSTERS}` (the "
+            "default) queries all clusters.",
+        ),
+    ] = None,
+) -> list[str | None]:
+    requested = _split_values(cluster or [])
+    clusters = get_clusters()
+    if clusters is None:
+        if requested:
+            raise HTTPException(404, f"unknown clusters: {', '.join(requested)}")
+        return [None]
+
+    if not requested or ALL_CLUSTERS in requested:
+        requested = clusters.names
+    if unknown := [name for name in requested if name not in clusters]:
+        raise HTTPException(404, f"unknown clusters: {', '.join(unknown)}")
+    return list(requested)
+
+
+def cluster_services(
+    names: Annotated[list[str | None], Depends(cluster_names)],
+) -> dict[str | None, KubernetesService]:
+    if (clusters := get_clusters()) is None:
+        return {None: get_kubernetes_service()}
+    return {name: clusters[name] for name in names if name is not None}
+
+
+def namespaces(
+    namespace: Annotated[
+        list[str] | None,
+        Query(
+            description="Namespaces to query, either as repeated or comma-separated "
+            f"values. `{ALL_NAMESPACES}` queries all namespaces. Defaults to the "
+            "namespace of the server.",
+        ),
+    ] = None,
+) -> list[str] | None:
+    if namespace is None:
+        return None
+
+    requested = _split_values(namespace)
+    if ALL_NAMESPACES in requested:
+        return [ALL_NAMESPACES]
+    return requested or None
 
 
 def managed_workload(
     k8s: Annotated[KubernetesService, Depends(k8s_service)],
     uid: JobId,
-    namespace: str | None = None,
+    namespace: Annotated[list[str] | None, Depends(namespaces)],
+    cluster: Annotated[str | None, Depends(cluster_name)],
 ) -> KueueWorkload:
-    wl = k8s.workload_for_managed_resource(uid, namespace)
+    clusters = get_clusters()
+    if clusters is not None and cluster is None:
+        wl = clusters.workload_for_managed_resource(uid, namespace)
+    else:
+        wl = k8s.workload_for_managed_resource(uid, namespace)
     if wl is None:
         raise HTTPException(404, "workload not found")
     return wl
 
 
+def workload_service(
+    workload: Annotated[KueueWorkload, Depends(managed_workload)],
+    k8s: Annotated[KubernetesService, Depends(k8s_service)],
+) -> KubernetesService:
+    """The service of the cluster a managed workload was found in."""
+    if get_clusters() is None:
+        return k8s
+    return workload.k8s
+
+
+def metadata_fields(
+    fields: Annotated[
+        list[str] | None,
+        Query(
+            description="Workload metadata fields to include in the response, "
+            "either as repeated or comma-separated values. Expensive fields "
+            "(e.g., `has_failed_pods`) are only computed if requested. "
+            "All fields are included by default.",
+        ),
+    ] = None,
+) -> set[str] | None:
+    if fields is None:
+        return None
+
+    requested = {f.strip() for value in fields for f in value.split(",") if f.strip()}
+    if unknown := requested - WorkloadMetadata.model_fields.keys():
+        raise HTTPException(
+            422, f"unknown workload metadata fields: {', '.join(sorted(unknown))}"
+        )
+    return requested
+
+
+def history_store() -> HistoryStore:
+    if (store := get_history_store()) is None:
+        raise HTTPException(404, "job history is disabled")
+    return store
+
+
+def queue_stats() -> QueueStatsCollector:
+    if (stats := get_queue_stats()) is None:
+        raise HTTPException(404, "queue statistics are disabled")
+    return stats
+
+
+def queue_snapshot() -> QueueSnapshot:
+    if (snapshot := get_queue_snapshot()) is None:
+        raise HTTPException(404, "queue snapshots are disabled")
+    return snapshot
+
+
 ManagedWorkload = Annotated[KueueWorkload, Depends(managed_workload)]
 Kubernetes = Annotated[KubernetesService, Depends(k8s_service)]
+WorkloadKubernetes = Annotated[KubernetesService, Depends(workload_service)]
+ClusterName = Annotated[str | None, Depends(cluster_name)]
+ClusterNames = Annotated[list[str | None], Depends(cluster_names)]
+ClusterServices = Annotated[
+    dict[str | None, KubernetesService], Depends(cluster_services)
+]
+MetadataFields = Annotated[set[str] | None, Depends(metadata_fields)]
+Namespaces = Annotated[list[str] | None, Depends(namespaces)]
+History = Annotated[HistoryStore, Depends(history_store)]
+QueueStats = Annotated[QueueStatsCollector, Depends(queue_stats)]
+Queues = Annotated[QueueSnapshot, Depends(queue_snapshot)]
@@ -23,3 +23,11 @@ class PodNotReadyError(Exception):
         self.pod_name = name
         self.pod_namespace = namespace
         super().__init__(f"pod not ready: {name!r} in {namespace!r}")
+
+
+class KubernetesUnavailableError(Exception):
+    """Exception indicating that the Kubernetes API server is unavailable or overloaded"""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
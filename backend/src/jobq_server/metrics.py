@@ -0,0 +1,110 @@
+"""Prometheus metrics exposed by the backend on the `/metrics` endpoint."""
+
+from __future__ import annotations
+
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Covers both fast API calls and long-running requests, such as log downloads
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "jobq_http_request_duration_seconds",
+    "Duration of HTTP requests handled by the backend, until the response is complete",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+KUBERNETES_API_CALL_DURATION = Histogram(
+    "jobq_kubernetes_api_call_duration_seconds",
+    "Duration of Kubernetes API calls, until the response headers are received",
+    ["verb", "resource"],
+    buckets=LATENCY_BUCKETS,
+)
+
+KUBERNETES_API_RETRIES = Counter(
+    "jobq_kubernetes_api_retries_total",
+    "Number of retried Kubernetes API calls",
+    ["verb", "resource", "status"],
+)
+
+KUBERNETES_API_COALESCED = Counter(
+    "jobq_kubernetes_api_coalesced_total",
+    "Number of Kubernetes API reads served by an identical in-flight call or from the cache",
+    ["verb", "resource", "source"],
+)
+
+KUBERNETES_API_CIRCUIT_STATE = Gauge(
+    "jobq_kubernetes_api_circuit_state",
+    "State of the Kubernetes API circuit breaker of a cluster "
+    "(0: closed, 1: open, 2: half-open)",
+    ["cluster"],
+)
+
+ACTIVE_LOG_STREAMS = Gauge(
+    "jobq_active_log_streams",
+    "Number of pod log streams currently being relayed to clients",
+)
+
+JOB_SUBMISSIONS = Counter(
+    "jobq_job_submissions_total",
+    "Number of successfully submitted jobs",
+    ["mode", "runner"],
+)
+
+# Route label for requests that did not match any route, to bound the label cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the duration of HTTP requests.
+
+    Requests are labelled with the path template of the matched route (e.g.,
+    ``/jobs/{uid}/status``) rather than the actual path, so that the number of
+    time series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the (shared) request scope
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=getattr(route, "path", UNMATCHED_ROUTE),
+                status=str(status_code),
+            ).observe(time.perf_counter() - start)
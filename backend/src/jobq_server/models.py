@@ -1,14 +1,16 @@
 import datetime
 import json
 import re
+from collections.abc import Callable, Collection
 from enum import StrEnum
-from typing import Annotated, Any, Self, TypeAlias
+from typing import Annotated, Any, Literal, Self, TypeAlias
 
-from annotated_types import Ge
+from annotated_types import Ge, Le
 from jobq import JobOptions
-from pydantic import AfterValidator, BaseModel, Field, StrictStr
+from pydantic import AfterValidator, BaseModel, Field, StrictStr, field_validator
 
 from jobq_server.utils.kueue import JobId, KueueWorkload, WorkloadSpec, WorkloadStatus
+from jobq_server.utils.logs import has_nested_quantifier
 
 
 def validate_image_ref(ref: str) -> str:
@@ -72,9 +74,13 @@ class WorkloadIdentifier(BaseModel):
 
     namespace: StrictStr
     uid: StrictStr
+    # Only set if the backend manages several clusters
+    cluster: StrictStr | None = None
 
     @classmethod
-    def from_kueue_workload(cls, workload: KueueWorkload) -> Self:
+    def from_kueue_workload(
+        cls, workload: KueueWorkload, cluster: str | None = None
+    ) -> Self:
         if len(workload.metadata.owner_references) != 1:
             raise ValueError(
                 f"Workload {workload.metadata.uid} has multiple owner references: {workload.metadata.owner_references}"
@@ -86,6 +92,7 @@ class WorkloadIdentifier(BaseModel):
             kind=owner_ref.kind,
             uid=owner_ref.uid,
             namespace=workload.metadata.namespace,
+            **({"cluster": cluster} if cluster is not None else {}),
         )
 
 
@@ -104,8 +111,8 @@ class JobStatus(StrEnum):
 class WorkloadMetadata(BaseModel):
     managed_resource_id: JobId
     execution_status: JobStatus
-    spec: WorkloadSpec
-    kueue_status: WorkloadStatus
+    spec: WorkloadSpec | None = None
+    kueue_status: WorkloadStatus | None = None
     submission_timestamp: datetime.datetime
     last_admission_timestamp: datetime.datetime | None = None
     termination_timestamp: datetime.datetime | None = None
@@ -114,20 +121,42 @@ class WorkloadMetadata(BaseModel):
     has_failed_pods: bool = False
 
     @classmethod
-    def from_kueue_workload(cls, workload: KueueWorkload) -> Self:
+    def from_kueue_workload(
+        cls, workload: KueueWorkload, fields: Collection[str] | None = None
+    ) -> Self:
+        """Create the metadata for a Kueue workload.
+
+        Parameters
+        ----------
+        workload : KueueWorkload
+            The workload to describe.
+        fields : Collection[str] | None, optional
+            Names of the optional fields to populate. The remaining optional fields
+            are neither computed nor marked as set, so that they can be excluded from
+            the response. If ``None``, all fields are populated.
+        """
         if workload.owner_uid is None:
             raise ValueError("Workload has no owner UID")
-        return WorkloadMetadata(
+
+        # Evaluated lazily, since some fields are expensive to compute (e.g., pod lookups)
+        optional_fields: dict[str, Callable[[], Any]] = {
+            "spec": lambda: workload.spec,
+            "kueue_status": lambda: workload.status,
+            "last_admission_timestamp": lambda: workload.last_admission_timestamp,
+            "termination_timestamp": lambda: workload.termination_timestamp,
+            "was_evicted": lambda: workload.was_evicted,
+            "was_inadmissible": lambda: workload.was_inadmissible,
+            "has_failed_pods": lambda: workload.has_failed_pods,
+        }
+        return cls(
             managed_resource_id=workload.owner_uid,
             execution_status=workload.execution_status,
-            spec=workload.spec,
-            kueue_status=workload.status,
             submission_timestamp=workload.submission_timestamp,
-            last_admission_timestamp=workload.last_admission_timestamp,
-            termination_timestamp=workload.termination_timestamp,
-            was_evicted=workload.was_evicted,
-            was_inadmissible=workload.was_inadmissible,
-            has_failed_pods=workload.has_failed_pods,
+            **{
+                name: compute()
+                for name, compute in optional_fields.items()
+                if fields is None or name in fields
+            },
         )
 
 
@@ -139,7 +168,192 @@ class LogOptions(BaseModel):
     )
 
 
+class LogSearchOptions(BaseModel):
+    pattern: str = Field(
+        min_length=1,
+        max_length=1024,
+        description="Regular expression to search for in the logs",
+    )
+    ignore_case: bool = Field(
+        default=False,
+        description="Whether to match the pattern case-insensitively",
+    )
+    context: Annotated[int, Ge(0), Le(100)] = Field(
+        default=0,
+        description="Number of context lines to include before and after each match",
+    )
+    max_matches: Annotated[int, Ge(1), Le(10_000)] = Field(
+        default=100,
+        description="Maximum number of matches to return",
+    )
+    max_bytes: Annotated[int, Ge(1), Le(16 * 2**20)] = Field(
+        default=2**20,
+        description="Maximum size of the response body in bytes",
+    )
+
+    @field_validator("pattern")
+    @classmethod
+    def validate_pattern(cls, v: str) -> str:
+        try:
+            re.compile(v)
+        except re.error as e:
+            raise ValueError(f"invalid regular expression: {e}") from e
+        # Catastrophic backtracking would tie up a worker thread on a single line
+        if has_nested_quantifier(v):
+            raise ValueError(
+                "nested quantifiers (like `(a+)+`) are not supported in search patterns"
+            )
+        return v
+
+    def compile(self) -> re.Pattern[str]:
+        return re.compile(self.pattern, re.IGNORECASE if self.ignore_case else 0)
+
+
+class LogSearchMatch(BaseModel):
+    pod: str
+    line_number: int
+    line: str
+    context_before: list[str] = Field(default_factory=list)
+    context_after: list[str] = Field(default_factory=list)
+
+
+class LogSearchTimeout(BaseModel):
+    """Last record of a log search that ran out of time, whose matches are incomplete."""
+
+    timed_out: Literal[True] = True
+
+
 class ListWorkloadModel(BaseModel):
     name: str
     id: WorkloadIdentifier
     metadata: WorkloadMetadata | None = None
+
+
+class JobHistoryEntry(BaseModel):
+    """The recorded lifecycle of a job, which outlives the job in the cluster."""
+
+    uid: JobId
+    cluster: str | None = None
+    namespace: str | None = None
+    name: str | None = None
+    kind: str | None = None
+    queue_name: str | None = None
+    cluster_queue: str | None = None
+    priority_class: str | None = None
+    priority: int | None = None
+    labels: dict[str, str] = Field(default_factory=dict)
+    submitter: str | None = None
+    execution_status: JobStatus | None = None
+    submission_timestamp: datetime.datetime | None = None
+    last_admission_timestamp: datetime.datetime | None = None
+    eviction_timestamp: datetime.datetime | None = None
+    termination_timestamp: datetime.datetime | None = None
+
+
+class QueueKind(StrEnum):
+    LOCAL = "local"
+    CLUSTER = "cluster"
+
+
+class DurationStatistics(BaseModel):
+    count: int
+    mean: float | None = None
+    percentiles: dict[str, float] = Field(
+        default_factory=dict, description="Estimated percentiles, e.g. `p50`"
+    )
+
+
+class QueueStatistics(BaseModel):
+    """Rolling statistics of a Kueue LocalQueue or ClusterQueue.
+
+    Durations are in seconds, and the percentiles are accurate up to 1%."""
+
+    name: str
+    kind: QueueKind
+    namespace: str | None = None
+    cluster: str | None = None
+    window_seconds: float
+    admitted: int
+    evicted: int
+    finished: int
+    wait_time: DurationStatistics = Field(
+        description="Time from submission (or eviction) to admission"
+    )
+    runtime: DurationStatistics = Field(
+        description="Time from admission to termination"
+    )
+    eviction_rate: float | None = Field(None, description="Evictions per admission")
+    jobs_per_hour: float = Field(description="Terminated jobs per hour")
+
+
+class ResourceQuota(BaseModel):
+    """Quota and usage of a resource in a flavor of a Kueue ClusterQueue.
+
+    Quantities are Kubernetes quantities, e.g. `500m` or `16Gi`."""
+
+    name: str
+    nominal_quota: str
+    borrowing_limit: str | None = Field(
+        None, description="Maximum quota borrowed from the cohort (default: unlimited)"
+    )
+    lending_limit: str | None = Field(
+        None, description="Maximum quota lent to the cohort (default: unlimited)"
+    )
+    reserved: str = Field("0", description="Quota reserved by admitted workloads")
+    usage: str = Field("0", description="Quota used by running workloads")
+    borrowed: str = Field("0", description="Reserved quota borrowed from the cohort")
+
+
+class FlavorQuota(BaseModel):
+    name: str
+    resources: list[ResourceQuota]
+
+
+class LocalQueueSnapshot(BaseModel):
+    name: str
+    namespace: str
+    pending_workloads: int = 0
+    reserving_workloads: int = 0
+    admitted_workloads: int = 0
+
+
+class ClusterQueueSnapshot(BaseModel):
+    """Snapshot of the quota, usage and workloads of a Kueue ClusterQueue."""
+
+    name: str
+    cluster: str | None = None
+    cohort: str | None = None
+    flavors: list[FlavorQuota] = Field(default_factory=list)
+    pending_workloads: int = 0
+    reserving_workloads: int = 0
+    admitted_workloads: int = 0
+    local_queues: list[LocalQueueSnapshot] = Field(
+        default_factory=list, description="The LocalQueues submitting to the queue"
+    )
+
+
+class AdmissionVerdict(StrEnum):
+    FITS_NOW = "fits_now"
+    FITS_LATER = "fits_later"
+    NEVER_FITS = "never_fits"
+
+
+class AdmissionEstimate(BaseModel):
+    """Whether a job would be admitted by its Kueue ClusterQueue, without submitting it."""
+
+    verdict: AdmissionVerdict
+    cluster: str | None = None
+    cluster_queue: str
+    flavors: dict[str, str] = Field(
+        default_factory=dict,
+        description="The flavor each requested resource would be assigned, if it fits",
+    )
+    queued_ahead: int = Field(
+        0, description="Pending workloads in the ClusterQueue ahead of the job"
+    )
+    estimated_start: datetime.datetime | None = Field(
+        None,
+        description="Rough estimate of the admission time, from the historical "
+        "runtimes of the ClusterQueue",
+    )
+    reason: str | None = Field(None, description="Why the job does not fit now")
@@ -0,0 +1,276 @@
+"""
+On-demand and continuous profiling of HTTP requests.
+
+Profiling requires the ``profiling`` extra (pyinstrument) and is enabled by setting a
+profiling token in the server settings (see :class:`jobq_server.config.Settings`):
+
+- A request carrying the token in the ``X-Jobq-Profile`` header is profiled, and the ID
+  of its profile is returned in the ``X-Jobq-Profile-Id`` response header.
+- If ``profiling_slowest`` is set, all requests are profiled, and the profiles of the
+  slowest ones are retained.
+
+Profiles are served on the ``/admin/profiles`` endpoints, which require the same token.
+
+The profiler samples the event loop, while sync route handlers and dependencies run in
+the threadpool. Routes of :class:`ProfiledRoute` therefore also profile their sync
+handler and dependencies in the worker thread, and their samples are merged into the
+profile of the request.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import itertools
+import logging
+import secrets
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from fastapi.dependencies.models import Dependant
+from fastapi.dependencies.utils import (
+    is_async_gen_callable,
+    is_coroutine_callable,
+    is_gen_callable,
+)
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from jobq_server.config import Settings, get_settings
+
+try:
+    import pyinstrument
+    import pyinstrument.session
+except ImportError:
+    pyinstrument = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from pyinstrument.session import Session
+
+PROFILE_HEADER = "X-Jobq-Profile"
+PROFILE_ID_HEADER = "X-Jobq-Profile-Id"
+
+# Paths that are never profiled, to keep the profile buffer relevant
+EXCLUDED_PATH_PREFIXES = ("/admin", "/health", "/metrics")
+
+# Profiles of the threadpool work of the current request, if it is being profiled
+# (the context of a request is copied to the worker threads that run its sync code)
+_thread_sessions: ContextVar[list[Session] | None] = ContextVar(
+    "_thread_sessions", default=None
+)
+
+
+@dataclass
+class RequestProfile:
+    """The profile of a single HTTP request."""
+
+    id: str
+    method: str
+    path: str
+    route: str | None
+    status: int
+    started_at: datetime
+    duration: float
+    requested: bool
+    session: Session = field(repr=False)
+
+
+class ProfileStore:
+    """
+    Thread-safe buffer of request profiles.
+
+    Retains the ``slowest`` slowest request profiles seen so far, as well as the
+    ``requested`` most recent explicitly requested ones.
+    """
+
+    def __init__(self, slowest: int = 0, requested: int = 20) -> None:
+        self.slowest = slowest
+        self._requested: OrderedDict[str, RequestProfile] = OrderedDict()
+        self._requested_size = requested
+        # Min-heap on the duration, so that the fastest retained profile is evicted first
+        self._slowest: list[tuple[float, int, RequestProfile]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            if profile.requested:
+                self._requested[profile.id] = profile
+                if len(self._requested) > self._requested_size:
+                    self._requested.popitem(last=False)
+            elif self.slowest > 0:
+                entry = (profile.duration, next(self._counter), profile)
+                if len(self._slowest) < self.slowest:
+                    heapq.heappush(self._slowest, entry)
+                else:
+                    heapq.heappushpop(self._slowest, entry)
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        with self._lock:
+            if profile := self._requested.get(profile_id):
+                return profile
+            return next((p for _, _, p in self._slowest if p.id == profile_id), None)
+
+    def list(self) -> list[RequestProfile]:
+        """All retained profiles, slowest first."""
+        with self._lock:
+            profiles = [*self._requested.values(), *(p for _, _, p in self._slowest)]
+        return sorted(profiles, key=lambda p: p.duration, reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._requested.clear()
+            self._slowest.clear()
+
+
+def profiling_enabled(settings: Settings) -> bool:
+    return settings.profiling_token is not None and pyinstrument is not None
+
+
+@functools.cache
+def get_profile_store() -> ProfileStore:
+    return ProfileStore(slowest=get_settings().profiling_slowest)
+
+
+@functools.cache
+def _profiled_in_thread(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a sync function, so that it is profiled in the thread it runs in if its
+    request is being profiled.
+
+    Cached, so that a dependency keeps the same wrapper (and cache key) in all routes."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if (sessions := _thread_sessions.get()) is None:
+            return func(*args, **kwargs)
+        # The context of the request (and of its event loop profiler) is copied to the
+        # worker thread, which has a sampler of its own
+        profiler = pyinstrument.Profiler(
+            interval=get_settings().profiling_interval, async_mode="disabled"
+        )
+        profiler.start()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sessions.append(profiler.stop())
+
+    wrapper.__jobq_profiled__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _is_sync(call: Callable[..., Any] | None) -> bool:
+    # Routes are copied when their router is included, with their wrapped endpoint
+    if call is None or getattr(call, "__jobq_profiled__", False):
+        return False
+    return not (
+        is_coroutine_callable(call)
+        or is_gen_callable(call)
+        or is_async_gen_callable(call)
+    )
+
+
+class ProfiledRoute(APIRoute):
+    """API route that profiles its sync endpoint and sync dependencies in the threadpool.
+
+    Streaming response iterators are not profiled in their worker threads."""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        if _is_sync(endpoint):
+            endpoint = _profiled_in_thread(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+        def wrap_dependencies(dependant: Dependant) -> None:
+            for dependency in dependant.dependencies:
+                if _is_sync(dependency.call):
+                    dependency.call = _profiled_in_thread(dependency.call)
+                wrap_dependencies(dependency)
+
+        wrap_dependencies(self.dependant)
+
+
+class ProfilingMiddleware:
+    """ASGI middleware running requests under the pyinstrument sampling profiler.
+
+    The event loop is sampled, along with the threadpool work of :class:`ProfiledRoute`
+    routes, which is merged into the profile of the request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+        settings = get_settings()
+        if settings.profiling_token is not None and pyinstrument is None:
+            logging.warning(
+                "Profiling is configured, but pyinstrument is not installed "
+                "(install the `profiling` extra)"
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        settings = get_settings()
+        if (
+            scope["type"] != "http"
+            or not profiling_enabled(settings)
+            or scope["path"].startswith(EXCLUDED_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        assert settings.profiling_token is not None
+        token = Headers(scope=scope).get(PROFILE_HEADER)
+        requested = token is not None and secrets.compare_digest(
+            token.encode(), settings.profiling_token.get_secret_value().encode()
+        )
+        store = get_profile_store()
+        if not requested and store.slowest == 0:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if requested:
+                    MutableHeaders(raw=message["headers"])[PROFILE_ID_HEADER] = (
+                        profile_id
+                    )
+            await send(message)
+
+        profiler = pyinstrument.Profiler(
+            interval=settings.profiling_interval, async_mode="enabled"
+        )
+        thread_sessions: list[Session] = []
+        reset_token = _thread_sessions.set(thread_sessions)
+        started_at = datetime.now(UTC)
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session = profiler.stop()
+            _thread_sessions.reset(reset_token)
+            session = functools.reduce(
+                pyinstrument.session.Session.combine, thread_sessions, session
+            )
+            store.add(
+                RequestProfile(
+                    id=profile_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    route=getattr(scope.get("route"), "path", None),
+                    status=status,
+                    started_at=started_at,
+                    duration=time.perf_counter() - start,
+                    requested=requested,
+                    session=session,
+                )
+            )
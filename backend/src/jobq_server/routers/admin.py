@@ -0,0 +1,125 @@
+import datetime
+import secrets
+from enum import StrEnum
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi import status as http_status
+from pydantic import BaseModel
+
+from jobq_server.config import Settings, get_settings
+from jobq_server.profiling import (
+    PROFILE_HEADER,
+    ProfileStore,
+    get_profile_store,
+    profiling_enabled,
+)
+
+
+def require_profiling_token(
+    settings: Annotated[Settings, Depends(get_settings)],
+    token: Annotated[str | None, Header(alias=PROFILE_HEADER)] = None,
+) -> None:
+    if not profiling_enabled(settings):
+        raise HTTPException(http_status.HTTP_404_NOT_FOUND, "profiling is disabled")
+    assert settings.profiling_token is not None
+    if token is None or not secrets.compare_digest(
+        token.encode(), settings.profiling_token.get_secret_value().encode()
+    ):
+        raise HTTPException(http_status.HTTP_403_FORBIDDEN, "invalid profiling token")
+
+
+router = APIRouter(
+    tags=["Administration"],
+    dependencies=[Depends(require_profiling_token)],
+    include_in_schema=False,
+)
+
+Profiles = Annotated[ProfileStore, Depends(get_profile_store)]
+
+
+class ProfileFormat(StrEnum):
+    HTML = "html"
+    SPEEDSCOPE = "speedscope"
+    TEXT = "text"
+    PSTATS = "pstats"
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    method: str
+    path: str
+    route: str | None
+    status: int
+    started_at: datetime.datetime
+    duration: float
+    requested: bool
+
+
+@router.get("/profiles")
+async def list_profiles(profiles: Profiles) -> list[ProfileSummary]:
+    """List the retained request profiles, slowest first."""
+    return [
+        ProfileSummary(
+            id=p.id,
+            method=p.method,
+            path=p.path,
+            route=p.route,
+            status=p.status,
+            started_at=p.started_at,
+            duration=p.duration,
+            requested=p.requested,
+        )
+        for p in profiles.list()
+    ]
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    profiles: Profiles,
+    format: ProfileFormat = ProfileFormat.HTML,
+) -> Response:
+    """Render a request profile.
+
+    The `speedscope` format can be viewed as a flame graph on https://www.speedscope.app,
+    the `pstats` format can be loaded with the `pstats` module or tools like snakeviz."""
+    from pyinstrument import renderers
+
+    profile = profiles.get(profile_id)
+    if profile is None:
+        raise HTTPException(http_status.HTTP_404_NOT_FOUND, "profile not found")
+
+    match format:
+        case ProfileFormat.HTML:
+            return Response(
+                renderers.HTMLRenderer().render(profile.session),
+                media_type="text/html",
+            )
+        case ProfileFormat.SPEEDSCOPE:
+            return Response(
+                renderers.SpeedscopeRenderer().render(profile.session),
+                media_type="application/json",
+            )
+        case ProfileFormat.TEXT:
+            return Response(
+                renderers.ConsoleRenderer(unicode=True, color=False).render(
+                    profile.session
+                ),
+                media_type="text/plain",
+            )
+        case ProfileFormat.PSTATS:
+            stats = renderers.PstatsRenderer().render(profile.session)
+            return Response(
+                stats.encode("utf-8", errors="surrogateescape"),
+                media_type="application/octet-stream",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{profile_id}.pstats"'
+                },
+            )
+
+
+@router.delete("/profiles", status_code=http_status.HTTP_204_NO_CONTENT)
+async def clear_profiles(profiles: Profiles) -> None:
+    """Discard all retained request profiles."""
+    profiles.clear()
@@ -1,35 +1,123 @@
 import asyncio
+import datetime
+import functools
+import io
 import logging
-from collections.abc import AsyncGenerator, Generator
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Iterator
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi import status as http_status
 from fastapi.responses import StreamingResponse
 from jobq import Image, Job
+from jobq.types import K8sResourceKind
+from kubernetes.client import ApiException
 
-from jobq_server.dependencies import Kubernetes, ManagedWorkload
-from jobq_server.exceptions import PodNotReadyError
+from jobq_server.config import get_settings
+from jobq_server.dependencies import (
+    ClusterName,
+    ClusterServices,
+    History,
+    Kubernetes,
+    ManagedWorkload,
+    MetadataFields,
+    Namespaces,
+    WorkloadKubernetes,
+)
+from jobq_server.exceptions import KubernetesUnavailableError, PodNotReadyError
+from jobq_server.metrics import JOB_SUBMISSIONS
 from jobq_server.models import (
+    AdmissionEstimate,
     CreateJobModel,
     ExecutionMode,
+    JobHistoryEntry,
+    JobStatus,
     ListWorkloadModel,
     LogOptions,
+    LogSearchMatch,
+    LogSearchOptions,
+    LogSearchTimeout,
     WorkloadIdentifier,
     WorkloadMetadata,
 )
+from jobq_server.profiling import ProfiledRoute
 from jobq_server.runner import Runner
-from jobq_server.utils.fastapi import make_dependable
-from jobq_server.utils.kueue import JobId
+from jobq_server.services import admission
+from jobq_server.services.clusters import get_clusters
+from jobq_server.services.history import get_history_store
+from jobq_server.services.images import pin_digest
+from jobq_server.services.k8s import KubernetesService
+from jobq_server.services.queue_snapshot import get_queue_snapshot
+from jobq_server.services.queue_stats import get_queue_stats
+from jobq_server.tracing import traced
+from jobq_server.utils.fastapi import PydanticJSONResponse, make_dependable
+from jobq_server.utils.k8s import ALL_NAMESPACES
+from jobq_server.utils.kueue import JobId, KueueWorkload
+from jobq_server.utils.logs import grep
+
+# Route handlers calling the Kubernetes API are plain functions, which FastAPI runs in
+# its threadpool, so that blocking API calls (and their rate limiting and retries) do
+# not block the event loop (and which are profiled in the threadpool, see `ProfiledRoute`)
+router = APIRouter(tags=["Job management"], route_class=ProfiledRoute)
 
-router = APIRouter(tags=["Job management"])
+# Response header listing the namespaces omitted from a listing due to missing permissions
+FORBIDDEN_NAMESPACES_HEADER = "X-Jobq-Forbidden-Namespaces"
+# Response header listing the clusters omitted from a listing due to errors
+UNAVAILABLE_CLUSTERS_HEADER = "X-Jobq-Unavailable-Clusters"
+
+
+def _dry_run(
+    job: Job, k8s: KubernetesService, cluster: str | None
+) -> AdmissionEstimate:
+    scheduling = job.options.scheduling if job.options else None
+    if scheduling is None or not scheduling.queue_name:
+        raise HTTPException(
+            http_status.HTTP_400_BAD_REQUEST, "dry runs require a Kueue queue name"
+        )
+    if (snapshot := get_queue_snapshot()) is None:
+        raise HTTPException(
+            http_status.HTTP_400_BAD_REQUEST, "dry runs require queue snapshots"
+        )
+
+    clusters = get_clusters()
+    names = clusters.names if clusters is not None and cluster is None else [cluster]
+    if not all(snapshot.synced(name) for name in names):
+        raise KubernetesUnavailableError("queues not listed yet", retry_after=1)
+
+    resources = job.options.resources if job.options else None
+    requests = resources.to_kubernetes(K8sResourceKind.REQUESTS) if resources else {}
+    try:
+        return admission.dry_run(
+            requests,  # type: ignore[arg-type]
+            scheduling.queue_name,
+            k8s.namespace,
+            snapshot,
+            names,
+            stats=get_queue_stats(),
+            default=clusters.default if clusters is not None else None,
+            flavor=placement.accelerator
+            if job.options and (placement := job.options.placement)
+            else None,
+        )
+    except ValueError as e:
+        raise HTTPException(http_status.HTTP_400_BAD_REQUEST, str(e)) from e
 
 
 @router.post("")
-async def submit_job(
+@traced()
+def submit_job(
     opts: CreateJobModel,
     k8s: Kubernetes,
-) -> WorkloadIdentifier:
+    cluster: ClusterName,
+    dry_run: Annotated[
+        bool,
+        Query(
+            description="Only estimate whether and when the job would be admitted by "
+            "its Kueue queue, from the cached queue quotas, without submitting it.",
+        ),
+    ] = False,
+) -> WorkloadIdentifier | AdmissionEstimate:
     # FIXME: Having to define a function just to set the job name is ugly
     def job_fn(): ...
 
@@ -42,6 +130,16 @@ async def submit_job(
             status_code=http_status.HTTP_400_BAD_REQUEST,
             detail=f"unsupported job execution mode: {opts.mode!r}",
         )
+    if dry_run:
+        return _dry_run(job, k8s, cluster)
+
+    clusters = get_clusters()
+    if clusters is not None and cluster is None:
+        try:
+            cluster = clusters.route(job)
+        except ValueError as e:
+            raise HTTPException(http_status.HTTP_400_BAD_REQUEST, str(e)) from e
+        k8s = clusters[cluster]
 
     runner = Runner.for_mode(opts.mode, k8s=k8s)
     if runner is None:
@@ -50,17 +148,46 @@ async def submit_job(
             detail=f"unsupported job execution mode: {opts.mode!r}",
         )
 
-    image = Image(opts.image_ref)
-    workload_id = runner.run(job, image, opts.submission_context)
+    image_ref = opts.image_ref
+    if opts.mode != ExecutionMode.DOCKER and get_settings().image_digest_pinning:
+        # Local images are not pushed to (and could be stale in) the registry
+        image_ref = pin_digest(image_ref)
+    image = Image(image_ref)
+    try:
+        workload_id = runner.run(job, image, opts.submission_context)
+    except ValueError as e:
+        # Job options the runner cannot fulfill (e.g., node-local caches if disabled)
+        raise HTTPException(http_status.HTTP_400_BAD_REQUEST, str(e)) from e
+    if workload_id is not None and clusters is not None:
+        workload_id.cluster = cluster
+    if workload_id is not None and (history := get_history_store()) is not None:
+        try:
+            history.record_submission(
+                workload_id.uid,
+                namespace=workload_id.namespace,
+                name=opts.name,
+                kind=workload_id.kind,
+                labels=opts.options.labels,
+                context=opts.submission_context,
+                cluster=workload_id.cluster,
+            )
+        except Exception:
+            # The job has been submitted, its lifecycle is still recorded by the watcher
+            logging.exception(
+                f"Failed to record the submission of job {workload_id.uid}"
+            )
+    JOB_SUBMISSIONS.labels(mode=opts.mode.value, runner=type(runner).__name__).inc()
     return workload_id
 
 
-@router.get("/{uid}/status")
-async def status(
+@router.get("/{uid}/status", response_model_exclude_unset=True)
+@traced()
+def status(
     workload: ManagedWorkload,
+    fields: MetadataFields,
 ) -> WorkloadMetadata:
     try:
-        return WorkloadMetadata.from_kueue_workload(workload)
+        return WorkloadMetadata.from_kueue_workload(workload, fields)
     except ValueError as e:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND,
@@ -69,9 +196,10 @@ async def status(
 
 
 @router.get("/{uid}/logs")
-async def logs(
+@traced()
+def logs(
     workload: ManagedWorkload,
-    k8s: Kubernetes,
+    k8s: WorkloadKubernetes,
     params: Annotated[LogOptions, Depends(make_dependable(LogOptions))],
 ):
     try:
@@ -159,11 +287,112 @@ async def logs(
         raise HTTPException(http_status.HTTP_400_BAD_REQUEST, "pod not ready") from e
 
 
+@router.get(
+    "/{uid}/logs/search",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Matching log lines as newline-delimited JSON",
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+@traced()
+def search_logs(
+    workload: ManagedWorkload,
+    k8s: WorkloadKubernetes,
+    params: Annotated[LogSearchOptions, Depends(make_dependable(LogSearchOptions))],
+):
+    """Search the logs of a workload's pods for a regular expression.
+
+    The logs are scanned on the server, and only the matching lines (along with
+    the requested context) are sent back, one `LogSearchMatch` JSON object per line.
+    The response is truncated once `max_matches` matches or `max_bytes` bytes are reached.
+    If the search runs out of time, the matches found so far are followed by a
+    `LogSearchTimeout` object.
+    """
+
+    pods = workload.pods
+    if len(pods) == 0:
+        raise HTTPException(
+            http_status.HTTP_404_NOT_FOUND,
+            "workload pod not found",
+        )
+    pod_logs = [
+        (p.metadata.name, functools.partial(k8s.stream_pod_logs, p, follow=False))
+        for p in pods
+    ]
+    return StreamingResponse(
+        _search_logs(pod_logs, params), media_type="application/x-ndjson"
+    )
+
+
+def _search_logs(
+    pod_logs: Iterable[tuple[str, Callable[[], Generator[bytes, None, None]]]],
+    params: LogSearchOptions,
+) -> Iterator[bytes]:
+    """Search the logs of pods, given as pod names and functions opening their log
+    streams, as newline-delimited `LogSearchMatch` JSON objects.
+
+    The log of each pod is only opened once the previous one has been searched, and
+    closed as soon as the search stops. Lines are truncated to the maximum searched
+    length, and a `LogSearchTimeout` record ends the results if the search runs out
+    of time (which is checked between lines)."""
+    settings = get_settings()
+    max_line_length = settings.log_search_max_line_length
+    deadline = time.monotonic() + settings.log_search_timeout
+    timed_out = False
+
+    def read_lines(stream: Iterable[bytes]) -> Generator[str, None, None]:
+        nonlocal timed_out
+        for line in stream:
+            if time.monotonic() > deadline:
+                timed_out = True
+                return
+            yield line.rstrip(b"\r\n")[:max_line_length].decode(errors="replace")
+
+    pattern = params.compile()
+    n_matches, n_bytes = 0, 0
+    for pod_name, open_log in pod_logs:
+        try:
+            stream = open_log()
+        except PodNotReadyError:
+            # The pod has not started yet, there is nothing to search
+            continue
+        try:
+            for match in grep(read_lines(stream), pattern, context=params.context):
+                chunk = (
+                    LogSearchMatch(
+                        pod=pod_name,
+                        line_number=match.line_number,
+                        line=match.line,
+                        context_before=match.context_before,
+                        context_after=match.context_after,
+                    ).model_dump_json()
+                    + "\n"
+                ).encode()
+
+                n_bytes += len(chunk)
+                if n_bytes > params.max_bytes:
+                    return
+                yield chunk
+
+                n_matches += 1
+                if n_matches >= params.max_matches:
+                    return
+        finally:
+            stream.close()
+        if timed_out:
+            yield (LogSearchTimeout().model_dump_json() + "\n").encode()
+            return
+
+
 @router.post("/{uid}/stop")
-async def stop_workload(
+@traced()
+def stop_workload(
     uid: JobId,
     workload: ManagedWorkload,
-    k8s: Kubernetes,
+    k8s: WorkloadKubernetes,
 ):
     try:
         workload.stop(k8s)
@@ -179,26 +408,198 @@ async def stop_workload(
         ) from e
 
 
-@router.get("", response_model_exclude_unset=True)
-async def list_jobs(
-    k8s: Kubernetes,
-    include_metadata: Annotated[bool, Query()] = False,
-) -> list[ListWorkloadModel]:
-    workloads = k8s.list_workloads()
+def _list_cluster_jobs(
+    k8s: KubernetesService,
+    cluster: str | None,
+    namespaces: list[str] | None,
+    include_metadata: bool,
+    fields: set[str] | None,
+) -> tuple[list[tuple[KueueWorkload, ListWorkloadModel]], list[str]]:
+    """List the jobs in a cluster, along with the namespaces that could not be listed."""
+    forbidden: list[str] = []
+    if namespaces is None:
+        workloads = k8s.list_workloads()
+    else:
+        try:
+            workloads, forbidden = k8s.list_workloads_across(namespaces)
+        except ApiException as e:
+            if e.status != http_status.HTTP_403_FORBIDDEN:
+                raise
+            raise HTTPException(
+                http_status.HTTP_403_FORBIDDEN, "Not allowed to list namespaces"
+            ) from e
+        if ALL_NAMESPACES not in namespaces and len(forbidden) == len(namespaces):
+            raise HTTPException(
+                http_status.HTTP_403_FORBIDDEN,
+                f"Not allowed to list jobs in namespaces: {', '.join(forbidden)}",
+            )
     if include_metadata:
-        return [
+        result = [
             ListWorkloadModel(
                 name=workload.metadata.name,
-                id=WorkloadIdentifier.from_kueue_workload(workload),
-                metadata=WorkloadMetadata.from_kueue_workload(workload),
+                id=WorkloadIdentifier.from_kueue_workload(workload, cluster),
+                metadata=WorkloadMetadata.from_kueue_workload(workload, fields),
             )
             for workload in workloads
         ]
     else:
-        return [
+        result = [
             ListWorkloadModel(
                 name=workload.metadata.name,
-                id=WorkloadIdentifier.from_kueue_workload(workload),
+                id=WorkloadIdentifier.from_kueue_workload(workload, cluster),
             )
             for workload in workloads
         ]
+    return list(zip(workloads, result, strict=False)), forbidden
+
+
+@router.get("", response_model=list[ListWorkloadModel])
+@traced()
+def list_jobs(
+    clusters: ClusterServices,
+    fields: MetadataFields,
+    namespaces: Namespaces,
+    include_metadata: Annotated[bool, Query()] = False,
+) -> PydanticJSONResponse:
+    unavailable: list[str] = []
+    if len(clusters) == 1:
+        ((cluster, k8s),) = clusters.items()
+        jobs, forbidden = _list_cluster_jobs(
+            k8s, cluster, namespaces, include_metadata, fields
+        )
+        result = [job for _, job in jobs]
+    else:
+        results, errors = get_clusters().fan_out(  # type: ignore[union-attr]
+            lambda name, k8s: _list_cluster_jobs(
+                k8s, name, namespaces, include_metadata, fields
+            ),
+            clusters.keys(),  # type: ignore[arg-type]
+        )
+        if not results:
+            raise next(iter(errors.values()))
+        # Merge the listings of all clusters in submission order
+        result = [
+            job
+            for _, job in sorted(
+                (pair for jobs, _ in results.values() for pair in jobs),
+                key=lambda pair: pair[0].submission_timestamp,
+            )
+        ]
+        forbidden = [
+            f"{name}/{ns}"
+            for name, (_, namespaces) in results.items()
+            for ns in namespaces
+        ]
+        unavailable = list(errors)
+
+    # Listings can be large, skip FastAPI's response validation round trip
+    response = PydanticJSONResponse(result, exclude_unset=True)
+    if forbidden:
+        response.headers[FORBIDDEN_NAMESPACES_HEADER] = ",".join(forbidden)
+    if unavailable:
+        response.headers[UNAVAILABLE_CLUSTERS_HEADER] = ",".join(unavailable)
+    return response
+
+
+@router.get("/history")
+@traced()
+def job_history(
+    history: History,
+    status: Annotated[
+        list[JobStatus] | None,
+        Query(description="Execution statuses of the jobs, as repeated values"),
+    ] = None,
+    queue: Annotated[
+        str | None, Query(description="Kueue local queue of the jobs")
+    ] = None,
+    submitter: Annotated[
+        str | None,
+        Query(description="Submitter of the jobs (email, or username if unknown)"),
+    ] = None,
+    cluster: Annotated[str | None, Query(description="Cluster of the jobs")] = None,
+    namespace: Annotated[str | None, Query(description="Namespace of the jobs")] = None,
+    since: Annotated[
+        datetime.datetime | None,
+        Query(description="Only jobs submitted at or after this time"),
+    ] = None,
+    until: Annotated[
+        datetime.datetime | None,
+        Query(description="Only jobs submitted before this time"),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=10000)] = 100,
+) -> list[JobHistoryEntry]:
+    """Query the recorded job history, most recently submitted jobs first.
+
+    The history includes jobs that no longer exist in the cluster."""
+    return history.query(
+        status=status,
+        queue_name=queue,
+        submitter=submitter,
+        cluster=cluster,
+        namespace=namespace,
+        since=since,
+        until=until,
+        limit=limit,
+    )
+
+
+@router.get(
+    "/history/{uid}/logs",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "The archived logs of the pods of the job",
+            "content": {"text/plain": {}},
+        }
+    },
+)
+@traced()
+def archived_logs(uid: JobId, history: History):
+    """Get the archived logs of a finished job, which are kept after the job has been
+    deleted from the cluster.
+
+    The logs of all pods are concatenated, similarly to the logs of a running job."""
+    pods = history.archived_pods(str(uid))
+    if not pods:
+        raise HTTPException(
+            http_status.HTTP_404_NOT_FOUND, "no archived logs for this job"
+        )
+    return StreamingResponse(
+        (chunk for pod in pods for chunk in history.archived_log(str(uid), pod)),
+        media_type="text/plain",
+    )
+
+
+@router.get(
+    "/history/{uid}/logs/search",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Matching log lines as newline-delimited JSON",
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+@traced()
+def search_archived_logs(
+    uid: JobId,
+    history: History,
+    params: Annotated[LogSearchOptions, Depends(make_dependable(LogSearchOptions))],
+):
+    """Search the archived logs of a finished job for a regular expression, like the
+    logs of a running job."""
+    pods = history.archived_pods(str(uid))
+    if not pods:
+        raise HTTPException(
+            http_status.HTTP_404_NOT_FOUND, "no archived logs for this job"
+        )
+
+    def archived_lines(pod: str) -> Generator[bytes, None, None]:
+        # The archived chunks hold whole lines
+        for chunk in history.archived_log(str(uid), pod):
+            yield from io.BytesIO(chunk)
+
+    pod_logs = [(pod, functools.partial(archived_lines, pod)) for pod in pods]
+    return StreamingResponse(
+        _search_logs(pod_logs, params), media_type="application/x-ndjson"
+    )
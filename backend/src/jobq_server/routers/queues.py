@@ -0,0 +1,69 @@
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi import status as http_status
+
+from jobq_server.dependencies import (
+    ClusterName,
+    ClusterNames,
+    Kubernetes,
+    Queues,
+    QueueStats,
+)
+from jobq_server.exceptions import KubernetesUnavailableError
+from jobq_server.models import ClusterQueueSnapshot, QueueKind, QueueStatistics
+from jobq_server.profiling import ProfiledRoute
+from jobq_server.services.clusters import get_clusters
+from jobq_server.tracing import traced
+
+router = APIRouter(tags=["Queues"], route_class=ProfiledRoute)
+
+
+@router.get("")
+@traced()
+async def list_queues(
+    snapshot: Queues,
+    clusters: ClusterNames,
+) -> list[ClusterQueueSnapshot]:
+    """The Kueue ClusterQueues, with their quota, usage, workload counts and LocalQueues.
+
+    The queues are served from a snapshot that is kept up to date by watching them, and
+    the LocalQueues are limited to the namespaces watched by the server."""
+    if not all(snapshot.synced(cluster) for cluster in clusters):
+        raise KubernetesUnavailableError("queues not listed yet", retry_after=1)
+    return snapshot.cluster_queues(clusters)
+
+
+@router.get("/{name}/stats")
+@traced()
+def queue_stats(
+    name: str,
+    stats: QueueStats,
+    k8s: Kubernetes,
+    cluster: ClusterName,
+    kind: Annotated[
+        QueueKind,
+        Query(description="Whether the queue is a LocalQueue or ClusterQueue"),
+    ] = QueueKind.LOCAL,
+    namespace: Annotated[
+        str | None,
+        Query(
+            description="Namespace of a LocalQueue. Defaults to the server's namespace."
+        ),
+    ] = None,
+) -> QueueStatistics:
+    """Rolling wait time, runtime, eviction and throughput statistics of a Kueue queue.
+
+    The statistics are maintained from the workload watch events of the server, and
+    cover the workloads admitted, evicted or terminated in the rolling time window."""
+    if kind == QueueKind.LOCAL and namespace is None:
+        namespace = k8s.namespace
+    if (clusters := get_clusters()) is not None:
+        cluster = cluster or clusters.default
+
+    result = stats.stats(kind, name, namespace, cluster)
+    if result is None:
+        raise HTTPException(
+            http_status.HTTP_404_NOT_FOUND, f"no statistics for {kind} queue {name!r}"
+        )
+    return result
@@ -1,9 +1,16 @@
 import abc
-from typing import ClassVar, Self
+import json
+from collections.abc import Sequence
+from typing import Any, ClassVar, Self
 
-from jobq import Image, Job
+from jobq import CacheVolume, Image, Job, PlacementOptions, ResourceOptions
+from jobq.cache import CACHES_ENV
+from kubernetes import client
 
+from jobq_server.config import get_settings
 from jobq_server.models import ExecutionMode, SubmissionContext, WorkloadIdentifier
+from jobq_server.services.k8s import KubernetesService
+from jobq_server.utils.kueue import kueue_resource_flavor
 
 
 class Runner(abc.ABC):
@@ -34,3 +41,208 @@ def _make_executor_command(job: Job) -> list[str]:
         job.file,
         job.name,
     ]
+
+
+JOB_LABEL = "x-jobq.io/job"
+"""Pod label with the name of the job, to spread the pods of a job."""
+
+SCRATCH_PATH = "/scratch"
+"""Mount path of the scratch volume of a job."""
+
+
+def _resource_volumes(
+    resources: ResourceOptions,
+) -> tuple[list[client.V1Volume], list[client.V1VolumeMount]]:
+    """Build the shared memory and scratch volumes of a job, and their mounts."""
+    volumes = []
+    mounts = []
+    if resources.shm_size:
+        volumes.append(
+            client.V1Volume(
+                name="shm",
+                empty_dir=client.V1EmptyDirVolumeSource(
+                    medium="Memory", size_limit=resources.shm_size
+                ),
+            )
+        )
+        mounts.append(client.V1VolumeMount(name="shm", mount_path="/dev/shm"))
+    if resources.scratch_size:
+        if resources.scratch_storage_class:
+            # Generic ephemeral volume, provisioned for each pod, and deleted with it
+            volume = client.V1Volume(
+                name="scratch",
+                ephemeral=client.V1EphemeralVolumeSource(
+                    volume_claim_template=client.V1PersistentVolumeClaimTemplate(
+                        spec=client.V1PersistentVolumeClaimSpec(
+                            access_modes=["ReadWriteOnce"],
+                            storage_class_name=resources.scratch_storage_class,
+                            resources=client.V1VolumeResourceRequirements(
+                                requests={"storage": resources.scratch_size}
+                            ),
+                        )
+                    )
+                ),
+            )
+        else:
+            volume = client.V1Volume(
+                name="scratch",
+                empty_dir=client.V1EmptyDirVolumeSource(
+                    size_limit=resources.scratch_size
+                ),
+            )
+        volumes.append(volume)
+        mounts.append(client.V1VolumeMount(name="scratch", mount_path=SCRATCH_PATH))
+    return volumes, mounts
+
+
+def _cache_volumes(
+    caches: Sequence[CacheVolume],
+) -> tuple[list[client.V1Volume], list[client.V1VolumeMount], client.V1EnvVar]:
+    """Build the volumes and mounts of the cache volumes of a job, and the environment
+    variable that makes them known to ``jobq.cache``."""
+    volumes = []
+    mounts = []
+    for cache in caches:
+        name = f"cache-{cache.name}"
+        if cache.volume_claim is not None:
+            volumes.append(
+                client.V1Volume(
+                    name=name,
+                    persistent_volume_claim=client.V1PersistentVolumeClaimVolumeSource(
+                        claim_name=cache.volume_claim
+                    ),
+                )
+            )
+        else:
+            # Node-local cache, shared by the jobs running on the same node, which is
+            # confined to the host cache root (the host path is a relative path without
+            # `..`, see `CacheVolume`)
+            if (root := get_settings().host_cache_root) is None:
+                raise ValueError(
+                    f"Cache {cache.name!r} needs a host path, but node-local caches "
+                    "are not enabled on this server"
+                )
+            volumes.append(
+                client.V1Volume(
+                    name=name,
+                    host_path=client.V1HostPathVolumeSource(
+                        path=str(root / cache.host_path), type="DirectoryOrCreate"
+                    ),
+                )
+            )
+        mounts.append(client.V1VolumeMount(name=name, mount_path=cache.mount_path))
+    env = client.V1EnvVar(
+        name=CACHES_ENV,
+        value=json.dumps({cache.name: cache.mount_path for cache in caches}),
+    )
+    return volumes, mounts, env
+
+
+def _accelerator_placement(
+    accelerator: str, k8s: KubernetesService
+) -> tuple[dict[str, str], list[client.V1Toleration]]:
+    """The node selector and tolerations of an accelerator type, from the Kueue
+    ``ResourceFlavor`` of the same name, if it exists."""
+    default = {get_settings().accelerator_node_label: accelerator}
+    if (flavor := kueue_resource_flavor(k8s, accelerator)) is None:
+        return default, []
+    spec = flavor.get("spec") or {}
+    # Kueue only assigns the flavor to jobs that select its nodes, and tolerate
+    # their taints (the tolerations of the flavor are added on admission)
+    tolerations = [
+        client.V1Toleration(
+            key=taint["key"],
+            operator="Equal",
+            value=taint.get("value"),
+            effect=taint["effect"],
+        )
+        for taint in spec.get("nodeTaints") or []
+    ]
+    return spec.get("nodeLabels") or default, tolerations
+
+
+def _node_affinity(placement: PlacementOptions) -> client.V1Affinity | None:
+    required = []
+    preferred = []
+    for requirement in placement.node_affinity:
+        expression = client.V1NodeSelectorRequirement(
+            key=requirement.key,
+            operator=requirement.operator,
+            values=requirement.values or None,
+        )
+        if requirement.weight is None:
+            required.append(expression)
+        else:
+            preferred.append(
+                client.V1PreferredSchedulingTerm(
+                    weight=requirement.weight,
+                    preference=client.V1NodeSelectorTerm(
+                        match_expressions=[expression]
+                    ),
+                )
+            )
+    if not required and not preferred:
+        return None
+    return client.V1Affinity(
+        node_affinity=client.V1NodeAffinity(
+            required_during_scheduling_ignored_during_execution=(
+                client.V1NodeSelector(
+                    node_selector_terms=[
+                        client.V1NodeSelectorTerm(match_expressions=required)
+                    ]
+                )
+                if required
+                else None
+            ),
+            preferred_during_scheduling_ignored_during_execution=preferred or None,
+        )
+    )
+
+
+def _pod_placement(
+    job: Job, placement: PlacementOptions, k8s: KubernetesService
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """The node selector, affinity, tolerations and topology spread constraints of the
+    pods of a job (as keyword arguments of ``V1PodSpec``), and the labels of its pods."""
+    node_selector = dict(placement.node_selector)
+    tolerations = [
+        client.V1Toleration(
+            key=t.key, operator=t.operator, value=t.value, effect=t.effect
+        )
+        for t in placement.tolerations
+    ]
+    if placement.accelerator is not None:
+        accelerator_selector, accelerator_tolerations = _accelerator_placement(
+            placement.accelerator, k8s
+        )
+        for key, value in accelerator_selector.items():
+            if node_selector.setdefault(key, value) != value:
+                raise ValueError(
+                    f"Node selector {key}={node_selector[key]!r} conflicts with "
+                    f"accelerator type {placement.accelerator!r}"
+                )
+        tolerations += accelerator_tolerations
+
+    labels = {}
+    constraints = []
+    if placement.topology_spread:
+        # Label values are at most 63 characters long, and start and end with an
+        # alphanumeric character
+        labels[JOB_LABEL] = job.name[:63].strip("_.-")
+        constraints = [
+            client.V1TopologySpreadConstraint(
+                topology_key=spread.topology_key,
+                max_skew=spread.max_skew,
+                when_unsatisfiable=spread.when_unsatisfiable,
+                label_selector=client.V1LabelSelector(match_labels=labels),
+            )
+            for spread in placement.topology_spread
+        ]
+
+    spec = {
+        "node_selector": node_selector or None,
+        "affinity": _node_affinity(placement),
+        "tolerations": tolerations or None,
+        "topology_spread_constraints": constraints or None,
+    }
+    return spec, labels
@@ -7,6 +7,7 @@ from jobq.job import DockerResourceOptions
 
 from jobq_server.models import ExecutionMode, SubmissionContext
 from jobq_server.runner.base import Runner, _make_executor_command
+from jobq_server.tracing import traced
 from jobq_server.utils.helpers import remove_none_values
 
 
@@ -15,6 +16,7 @@ class DockerRunner(Runner):
         super().__init__()
         self._client = docker.from_env()
 
+    @traced()
     def run(self, job: Job, image: Image, context: SubmissionContext) -> None:
         command = _make_executor_command(job)
 
@@ -22,6 +24,7 @@ class DockerRunner(Runner):
             "mem_limit": None,
             "nano_cpus": None,
             "device_requests": None,
+            "shm_size": None,
         }
         if job.options and (res := job.options.resources):
             resource_kwargs = res.to_docker()
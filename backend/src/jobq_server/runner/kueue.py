@@ -1,13 +1,23 @@
 import logging
 from dataclasses import asdict
 
-from jobq import Image, Job
+from jobq import CheckpointOptions, Image, Job, RetryOptions
+from jobq.checkpoint import CHECKPOINT_DIR_ENV
 from jobq.types import K8sResourceKind
 from kubernetes import client
 
 from jobq_server.models import ExecutionMode, SubmissionContext, WorkloadIdentifier
-from jobq_server.runner.base import Runner, _make_executor_command
+from jobq_server.runner.base import (
+    Runner,
+    _cache_volumes,
+    _make_executor_command,
+    _pod_placement,
+    _resource_volumes,
+)
+from jobq_server.services.images import get_image_prepuller
 from jobq_server.services.k8s import KubernetesService
+from jobq_server.services.retention import ttl_seconds_after_finished
+from jobq_server.tracing import traced
 from jobq_server.utils.k8s import (
     gvk,
     k8s_annotations,
@@ -16,6 +26,69 @@ from jobq_server.utils.k8s import (
 from jobq_server.utils.kueue import kueue_scheduling_labels
 
 
+def _pod_failure_policy(
+    retries: RetryOptions, container: str
+) -> client.V1PodFailurePolicy | None:
+    """The pod failure policy of a job, from its retry options."""
+    rules = []
+    if retries.fail_on_exit_codes:
+        rules.append(
+            client.V1PodFailurePolicyRule(
+                action="FailJob",
+                on_exit_codes=client.V1PodFailurePolicyOnExitCodesRequirement(
+                    container_name=container,
+                    operator="In",
+                    values=retries.fail_on_exit_codes,
+                ),
+            )
+        )
+    if retries.retry_on_disruption:
+        rules.append(
+            client.V1PodFailurePolicyRule(
+                action="Ignore",
+                on_pod_conditions=[
+                    client.V1PodFailurePolicyOnPodConditionsPattern(
+                        type="DisruptionTarget", status="True"
+                    )
+                ],
+            )
+        )
+    return client.V1PodFailurePolicy(rules=rules) if rules else None
+
+
+def _checkpoint_volume(
+    checkpoint: CheckpointOptions, container: client.V1Container
+) -> client.V1Volume:
+    """Mount the checkpoint volume of a job in its container, and return the volume."""
+    volume = client.V1Volume(
+        name="checkpoints",
+        persistent_volume_claim=client.V1PersistentVolumeClaimVolumeSource(
+            claim_name=checkpoint.volume_claim
+        ),
+    )
+    # Each job checkpoints to its own directory on the volume, which is kept when
+    # its pods are recreated (e.g., after a preemption)
+    container.env = (container.env or []) + [
+        client.V1EnvVar(
+            name="JOBQ_JOB_NAME",
+            value_from=client.V1EnvVarSource(
+                field_ref=client.V1ObjectFieldSelector(
+                    field_path="metadata.labels['job-name']"
+                )
+            ),
+        ),
+        client.V1EnvVar(name=CHECKPOINT_DIR_ENV, value=checkpoint.mount_path),
+    ]
+    container.volume_mounts = (container.volume_mounts or []) + [
+        client.V1VolumeMount(
+            name=volume.name,
+            mount_path=checkpoint.mount_path,
+            sub_path_expr="$(JOBQ_JOB_NAME)",
+        )
+    ]
+    return volume
+
+
 class KueueRunner(Runner):
     def __init__(self, k8s: KubernetesService, **kwargs: str) -> None:
         super().__init__()
@@ -23,13 +96,14 @@ class KueueRunner(Runner):
         self._k8s = k8s
         self._queue = kwargs.get("local_queue", "user-queue")
 
+    @traced()
     def _make_job_crd(
         self, job: Job, image: Image, context: SubmissionContext
     ) -> client.V1Job:
         if not job.options:
             raise ValueError("Job options must be specified")
 
-        scheduling_labels = kueue_scheduling_labels(job, self._k8s.namespace)
+        scheduling_labels = kueue_scheduling_labels(job, self._k8s.namespace, self._k8s)
 
         metadata = client.V1ObjectMeta(
             generate_name=sanitize_rfc1123_domain_name(job.name),
@@ -53,12 +127,40 @@ class KueueRunner(Runner):
             ),
         )
 
+        # Volumes
+        volumes, mounts = (
+            _resource_volumes(res) if (res := job.options.resources) else ([], [])
+        )
+        if caches := job.options.caches:
+            cache_volumes, cache_mounts, env = _cache_volumes(caches)
+            volumes += cache_volumes
+            mounts += cache_mounts
+            container.env = [env]
+        container.volume_mounts = mounts or None
+
         # Job template
+        placement, pod_labels = (
+            _pod_placement(job, opts, self._k8s)
+            if (opts := job.options.placement)
+            else ({}, {})
+        )
+        pod_spec = client.V1PodSpec(
+            containers=[container],
+            restart_policy="Never",
+            volumes=volumes or None,
+            **placement,
+        )
+        if (checkpoint := job.options.checkpoint) is not None:
+            pod_spec.volumes = (pod_spec.volumes or []) + [
+                _checkpoint_volume(checkpoint, container)
+            ]
+            pod_spec.termination_grace_period_seconds = checkpoint.grace_period_seconds
         template = client.V1PodTemplateSpec(
-            spec=client.V1PodSpec(containers=[container], restart_policy="Never")
+            metadata=client.V1ObjectMeta(labels=pod_labels) if pod_labels else None,
+            spec=pod_spec,
         )
-        # TODO: Set backoff_limit to a lower number than 6 (default)?
-        #  alternatively: pod_failure_policy (needs k8s>=1.31.0)
+        # Pod failure policies are enabled by default since Kubernetes 1.26 (GA in 1.31)
+        retries = job.options.retries
         return client.V1Job(
             api_version="batch/v1",
             kind="Job",
@@ -67,17 +169,28 @@ class KueueRunner(Runner):
                 parallelism=1,
                 suspend=True,
                 template=template,
+                backoff_limit=retries.max_retries if retries else None,
+                pod_failure_policy=(
+                    _pod_failure_policy(retries, container.name) if retries else None
+                ),
+                # Suspended jobs (i.e., waiting in the queue) do not count
+                # towards the deadline
+                active_deadline_seconds=job.options.deadline_seconds,
+                ttl_seconds_after_finished=ttl_seconds_after_finished(
+                    scheduling_labels.get("kueue.x-k8s.io/queue-name"),
+                    job.options.labels,
+                ),
             ),
         )
 
+    @traced()
     def run(
         self, job: Job, image: Image, context: SubmissionContext
     ) -> WorkloadIdentifier:
         logging.info(f"Submitting job {job.name} to Kueue")
 
         k8s_job = self._make_job_crd(job, image, context)
-        batch_api = client.BatchV1Api()
-        resource: client.V1Job = batch_api.create_namespaced_job(
+        resource: client.V1Job = self._k8s.batch_v1.create_namespaced_job(
             self._k8s.namespace, k8s_job
         )
 
@@ -85,6 +198,18 @@ class KueueRunner(Runner):
             f"Submitted job {resource.metadata.name!r} in namespace {resource.metadata.namespace!r} successfully to Kueue."
         )
 
+        if (prepuller := get_image_prepuller()) is not None:
+            serialize = self._k8s.api_client.sanitize_for_serialization
+            prepuller.prepull(
+                self._k8s,
+                {
+                    "apiVersion": k8s_job.api_version,
+                    "kind": k8s_job.kind,
+                    "metadata": serialize(resource.metadata),
+                },
+                serialize(k8s_job.spec.template.spec),
+            )
+
         return WorkloadIdentifier(
             **asdict(gvk(resource)),
             name=resource.metadata.name,
@@ -10,8 +10,17 @@ from jobq.types import K8sResourceKind
 from kubernetes import client
 
 from jobq_server.models import ExecutionMode, SubmissionContext, WorkloadIdentifier
-from jobq_server.runner.base import Runner, _make_executor_command
+from jobq_server.runner.base import (
+    Runner,
+    _cache_volumes,
+    _make_executor_command,
+    _pod_placement,
+    _resource_volumes,
+)
+from jobq_server.services.images import get_image_prepuller
 from jobq_server.services.k8s import KubernetesService
+from jobq_server.services.retention import ttl_seconds_after_finished
+from jobq_server.tracing import traced
 from jobq_server.utils.k8s import (
     gvk,
     k8s_annotations,
@@ -28,6 +37,7 @@ class RayJobRunner(Runner):
 
         self._k8s = k8s
 
+    @traced()
     def _create_ray_job(
         self, job: Job, image: Image, context: SubmissionContext
     ) -> dict:
@@ -40,7 +50,7 @@ class RayJobRunner(Runner):
         if not res_opts:
             raise ValueError("Job resource options must be set")
 
-        scheduling_labels = kueue_scheduling_labels(job, self._k8s.namespace)
+        scheduling_labels = kueue_scheduling_labels(job, self._k8s.namespace, self._k8s)
 
         runtime_env = {
             "working_dir": "/home/ray/app",
@@ -109,8 +119,59 @@ class RayJobRunner(Runner):
             },
         }
 
+        # Kuberay retries failed RayJobs with a new Ray cluster, there are no failure
+        # policies for the exit codes or disruptions of its pods
+        if (retries := job.options.retries) is not None:
+            if retries.fail_on_exit_codes:
+                raise ValueError(
+                    "Exit code failure policies are not supported for RayJobs"
+                )
+            if retries.max_retries is not None:
+                manifest["spec"]["backoffLimit"] = retries.max_retries
+        if job.options.checkpoint is not None:
+            raise ValueError("Checkpoint options are not supported for RayJobs")
+        # The entrypoint of the job runs in the head pod of the Ray cluster
+        volumes, mounts = _resource_volumes(res_opts)
+        env = []
+        if caches := job.options.caches:
+            cache_volumes, cache_mounts, cache_env = _cache_volumes(caches)
+            volumes += cache_volumes
+            mounts += cache_mounts
+            env.append(cache_env)
+        if volumes:
+            serialize = self._k8s.api_client.sanitize_for_serialization
+            head = manifest["spec"]["rayClusterSpec"]["headGroupSpec"]["template"]
+            head["spec"]["volumes"] = serialize(volumes)
+            (head_container,) = head["spec"]["containers"]
+            head_container["volumeMounts"] = serialize(mounts)
+            if env:
+                head_container["env"] = serialize(env)
+        if (placement := job.options.placement) is not None:
+            # Only the head pod runs the job, the submitter pod needs no accelerators
+            pod_spec, pod_labels = _pod_placement(job, placement, self._k8s)
+            serialize = self._k8s.api_client.sanitize_for_serialization
+            head = manifest["spec"]["rayClusterSpec"]["headGroupSpec"]["template"]
+            head["spec"].update({
+                client.V1PodSpec.attribute_map[name]: serialize(value)
+                for name, value in pod_spec.items()
+                if value is not None
+            })
+            if pod_labels:
+                head["metadata"] = {"labels": pod_labels}
+        if job.options.deadline_seconds is not None:
+            manifest["spec"]["activeDeadlineSeconds"] = job.options.deadline_seconds
+
+        # Kuberay deletes the Ray cluster (and, depending on the version, the RayJob)
+        # after the TTL
+        ttl = ttl_seconds_after_finished(
+            scheduling_labels.get("kueue.x-k8s.io/queue-name"), job.options.labels
+        )
+        if ttl is not None:
+            manifest["spec"]["ttlSecondsAfterFinished"] = ttl
+
         return manifest
 
+    @traced()
     def run(
         self, job: Job, image: Image, context: SubmissionContext
     ) -> WorkloadIdentifier:
@@ -119,10 +180,13 @@ class RayJobRunner(Runner):
         )
 
         manifest = self._create_ray_job(job, image, context)
-        api = client.CustomObjectsApi()
-        obj = api.create_namespaced_custom_object(
+        obj = self._k8s.custom_objects.create_namespaced_custom_object(
             "ray.io", "v1", self._k8s.namespace, "rayjobs", manifest
         )
+        if (prepuller := get_image_prepuller()) is not None:
+            # The job runs in the head pod of the Ray cluster
+            head = manifest["spec"]["rayClusterSpec"]["headGroupSpec"]["template"]
+            prepuller.prepull(self._k8s, obj, head["spec"])
 
         return WorkloadIdentifier(
             **asdict(gvk(obj)),
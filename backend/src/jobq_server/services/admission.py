@@ -0,0 +1,251 @@
+"""
+Admission dry runs of Kueue jobs.
+
+Whether the resource requests of a job fit the Kueue ClusterQueue behind its LocalQueue
+is estimated from the cached queue snapshot (see
+:mod:`jobq_server.services.queue_snapshot`), without calling the Kubernetes API, and the
+time until its admission from the historical runtimes of the ClusterQueue (see
+:mod:`jobq_server.services.queue_stats`).
+
+The estimate approximates the flavor assignment of Kueue: the requested resources are
+assigned the first flavor of their resource group with enough quota, including the
+quota that can be borrowed from the cohort. Jobs with an accelerator type that names a
+flavor are restricted to that flavor (see :class:`jobq.job.PlacementOptions`), other node
+selectors and affinities are not taken into account, nor are preemption, fair sharing
+and admission checks.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Collection, Mapping
+from decimal import Decimal
+
+from kubernetes.utils import parse_quantity
+
+from jobq_server.models import (
+    AdmissionEstimate,
+    AdmissionVerdict,
+    ClusterQueueSnapshot,
+    QueueKind,
+    ResourceQuota,
+)
+from jobq_server.services.queue_snapshot import QueueSnapshot
+from jobq_server.services.queue_stats import QueueStatsCollector
+
+_VERDICT_RANK = {verdict: rank for rank, verdict in enumerate(AdmissionVerdict)}
+
+
+class _Quotas:
+    """The quotas of a ClusterQueue and of the other ClusterQueues in its cohort."""
+
+    def __init__(
+        self, queue: ClusterQueueSnapshot, peers: Collection[ClusterQueueSnapshot]
+    ) -> None:
+        self.queue = queue
+        self.peers = peers
+
+    @staticmethod
+    def _quota(
+        queue: ClusterQueueSnapshot, flavor: str, resource: str
+    ) -> ResourceQuota | None:
+        for f in queue.flavors:
+            if f.name == flavor:
+                return next((r for r in f.resources if r.name == resource), None)
+        return None
+
+    def _lendable(self, flavor: str, resource: str, free: bool) -> Decimal:
+        """The (currently unused) quota the cohort can lend to the queue."""
+        total = Decimal(0)
+        for peer in self.peers:
+            if (quota := self._quota(peer, flavor, resource)) is None:
+                continue
+            nominal = parse_quantity(quota.nominal_quota)
+            lendable = parse_quantity(quota.lending_limit or quota.nominal_quota)
+            if free:
+                lendable = min(lendable, nominal - parse_quantity(quota.reserved))
+            total += max(lendable, Decimal(0))
+        return total
+
+    def available(self, flavor: str, resource: str, free: bool) -> Decimal:
+        """The total (or currently free) quota of a resource flavor for the queue."""
+        quota = self._quota(self.queue, flavor, resource)
+        assert quota is not None
+        nominal = parse_quantity(quota.nominal_quota)
+        reserved = parse_quantity(quota.reserved) if free else Decimal(0)
+        if self.queue.cohort is None:
+            return nominal - reserved
+        # Quota borrowed by the queue is part of the unused quota of its peers
+        available = nominal - reserved + self._lendable(flavor, resource, free)
+        if quota.borrowing_limit is not None:
+            available = min(
+                available, nominal + parse_quantity(quota.borrowing_limit) - reserved
+            )
+        return available
+
+    def first_fit(
+        self, flavors: Collection[str], requests: Mapping[str, Decimal], free: bool
+    ) -> str | None:
+        """The first flavor with enough (free) quota for all requested resources."""
+        return next(
+            (
+                flavor
+                for flavor in flavors
+                if all(
+                    quantity <= self.available(flavor, resource, free)
+                    for resource, quantity in requests.items()
+                )
+            ),
+            None,
+        )
+
+
+def estimate_admission(
+    requests: Mapping[str, str],
+    queue: ClusterQueueSnapshot,
+    peers: Collection[ClusterQueueSnapshot] = (),
+    runtime: float | None = None,
+    now: datetime.datetime | None = None,
+    flavor: str | None = None,
+) -> AdmissionEstimate:
+    """
+    Estimate whether and when a job would be admitted by a ClusterQueue.
+
+    Parameters
+    ----------
+    requests : Mapping[str, str]
+        The resource requests of the job, as Kubernetes quantities.
+    queue : ClusterQueueSnapshot
+        The ClusterQueue the job would be submitted to.
+    peers : Collection[ClusterQueueSnapshot], optional
+        The other ClusterQueues in the cohort of the queue.
+    runtime : float | None, optional
+        The typical runtime of the workloads of the queue, in seconds, to estimate
+        the start time of queued jobs.
+    now : datetime.datetime | None, optional
+        The current time.
+    flavor : str | None, optional
+        The resource flavor the job is restricted to, in the resource groups that
+        have it (e.g., by its accelerator type).
+
+    Returns
+    -------
+    AdmissionEstimate
+        Whether the job fits now, after the pending workloads of the queue (and some of
+        the admitted ones) have finished, or never.
+    """
+    now = now or datetime.datetime.now(datetime.UTC)
+    estimate = AdmissionEstimate(
+        verdict=AdmissionVerdict.FITS_NOW,
+        cluster=queue.cluster,
+        cluster_queue=queue.name,
+        queued_ahead=queue.pending_workloads,
+    )
+    quotas = _Quotas(queue, [p for p in peers if p.name != queue.name])
+    requested = {
+        name: quantity
+        for name, quantity in requests.items()
+        if parse_quantity(quantity) > 0
+    }
+
+    # All flavors of a resource group cover the same resources, so the requested
+    # resources are grouped by the flavors that cover them
+    groups: dict[tuple[str, ...], list[str]] = {}
+    for resource in requested:
+        flavors = tuple(
+            f.name
+            for f in queue.flavors
+            if any(r.name == resource for r in f.resources)
+        )
+        if flavor in flavors:
+            flavors = (flavor,)
+        if not flavors:
+            estimate.verdict = AdmissionVerdict.NEVER_FITS
+            estimate.reason = f"no quota for {resource} in ClusterQueue {queue.name!r}"
+            return estimate
+        groups.setdefault(flavors, []).append(resource)
+
+    blocked: list[str] = []
+    for flavors, resources in groups.items():
+        group = {r: parse_quantity(requested[r]) for r in resources}
+        if (assigned := quotas.first_fit(flavors, group, free=True)) is None:
+            blocked.extend(resources)
+            assigned = quotas.first_fit(flavors, group, free=False)
+        if assigned is None:
+            estimate.verdict = AdmissionVerdict.NEVER_FITS
+            estimate.reason = (
+                f"requests ({', '.join(f'{r}: {requested[r]}' for r in resources)}) "
+                f"exceed the quota of every flavor of ClusterQueue {queue.name!r}"
+            )
+            return estimate
+        estimate.flavors.update(dict.fromkeys(resources, assigned))
+
+    if not blocked and estimate.queued_ahead == 0:
+        estimate.estimated_start = now
+        return estimate
+
+    estimate.verdict = AdmissionVerdict.FITS_LATER
+    if blocked:
+        estimate.reason = f"not enough free quota for {', '.join(blocked)}"
+    else:
+        estimate.reason = f"{estimate.queued_ahead} pending workloads in the queue"
+    if runtime is not None:
+        # The admitted workloads of the queue finish one by one, each making room for
+        # the next workload in line
+        slots = estimate.queued_ahead + (1 if blocked else 0)
+        wait = slots * runtime / max(queue.admitted_workloads, 1)
+        estimate.estimated_start = now + datetime.timedelta(seconds=wait)
+    return estimate
+
+
+def dry_run(
+    requests: Mapping[str, str],
+    queue_name: str,
+    namespace: str,
+    snapshot: QueueSnapshot,
+    clusters: Collection[str | None],
+    stats: QueueStatsCollector | None = None,
+    default: str | None = None,
+    flavor: str | None = None,
+) -> AdmissionEstimate:
+    """
+    Estimate the admission of a job submitted to a LocalQueue, in the cluster where it
+    would be admitted first (preferring the default cluster).
+
+    Raises
+    ------
+    ValueError
+        If the LocalQueue does not exist in any of the clusters.
+    """
+    queues = snapshot.cluster_queues(clusters)
+    estimates = []
+    for queue in queues:
+        if not any(
+            lq.name == queue_name and lq.namespace == namespace
+            for lq in queue.local_queues
+        ):
+            continue
+        peers = [
+            q
+            for q in queues
+            if q.cluster == queue.cluster
+            and queue.cohort is not None
+            and q.cohort == queue.cohort
+        ]
+        runtime = None
+        if stats is not None and (
+            queue_stats := stats.stats(
+                QueueKind.CLUSTER, queue.name, None, queue.cluster
+            )
+        ):
+            runtime = queue_stats.runtime.percentiles.get("p50")
+        estimates.append(
+            estimate_admission(requests, queue, peers, runtime, flavor=flavor)
+        )
+
+    if not estimates:
+        raise ValueError(f"Kueue local queue {queue_name!r} does not exist")
+    return min(
+        estimates,
+        key=lambda e: (_VERDICT_RANK[e.verdict], e.queued_ahead, e.cluster != default),
+    )
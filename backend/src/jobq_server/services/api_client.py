@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import functools
+import itertools
+import time
+from collections.abc import Iterable
+from typing import Any
+from urllib.parse import urlsplit
+
+import urllib3
+from kubernetes import client
+from kubernetes.client import rest
+
+from jobq_server.exceptions import KubernetesUnavailableError
+from jobq_server.metrics import (
+    KUBERNETES_API_CALL_DURATION,
+    KUBERNETES_API_COALESCED,
+    KUBERNETES_API_RETRIES,
+)
+from jobq_server.services.resilience import ApiCallPolicy, parse_retry_after
+from jobq_server.tracing import span
+
+# Status codes of failed API calls that are reported as service unavailability
+UNAVAILABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def request_labels(
+    method: str, url: str, query_params: Iterable[tuple[str, Any]] | None = None
+) -> tuple[str, str]:
+    """
+    Determine the Kubernetes API verb and resource of a request.
+
+    Parameters
+    ----------
+    method : str
+        The HTTP method of the request.
+    url : str
+        The request URL (or path).
+    query_params : Iterable[tuple[str, Any]] | None, optional
+        The query parameters of the request.
+
+    Returns
+    -------
+    tuple[str, str]
+        The API verb (e.g., ``list``, ``get``, ``watch``, ``create``) and the resource,
+        including the subresource if any (e.g., ``pods/log``). Requests to discovery
+        endpoints have the resource ``discovery``.
+
+    Examples
+    --------
+    >>> request_labels("GET", "https://k8s:6443/api/v1/namespaces/default/pods")
+    ('list', 'pods')
+    >>> request_labels("GET", "/api/v1/namespaces/default/pods/foo/log", [("follow", True)])
+    ('get', 'pods/log')
+    >>> request_labels("DELETE", "/apis/batch/v1/namespaces/default/jobs/foo")
+    ('delete', 'jobs')
+    >>> request_labels("GET", "/apis/kueue.x-k8s.io/v1beta1/workloads", [("watch", True)])
+    ('watch', 'workloads')
+    """
+
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    # Strip the API group and version: /api/<version>/... and /apis/<group>/<version>/...
+    match segments[:1]:
+        case ["api"]:
+            rest = segments[2:]
+        case ["apis"]:
+            rest = segments[3:]
+        case _:
+            rest = []
+    if len(rest) >= 3 and rest[0] == "namespaces":
+        rest = rest[2:]
+
+    if not rest:
+        resource, has_name = "discovery", False
+    else:
+        resource = "/".join([rest[0], *rest[2:3]])
+        has_name = len(rest) > 1
+
+    watch = any(k == "watch" and v for k, v in query_params or ())
+    match method.upper():
+        case "GET" if watch:
+            verb = "watch"
+        case "GET":
+            verb = "get" if has_name else "list"
+        case "POST":
+            verb = "create"
+        case "PUT":
+            verb = "update"
+        case "PATCH":
+            verb = "patch"
+        case "DELETE":
+            verb = "delete" if has_name else "deletecollection"
+        case other:
+            verb = other.lower()
+    return verb, resource
+
+
+class KubernetesApiClient(client.ApiClient):
+    """Kubernetes API client recording the duration of each API call as a Prometheus metric.
+
+    Each API call is also recorded as a trace span, if tracing is enabled.
+    For streaming requests (e.g., pod logs), the time until the response headers are
+    received is recorded.
+
+    If an API call policy is given, calls are rate-limited, retried and guarded by
+    a circuit breaker according to it (see :mod:`jobq_server.services.resilience`).
+    Identical concurrent reads are coalesced into a single API call, if the policy
+    has a request coalescer (see :mod:`jobq_server.services.coalescing`)."""
+
+    def __init__(
+        self,
+        configuration: client.Configuration | None = None,
+        policy: ApiCallPolicy | None = None,
+        **kwargs: Any,
+    ) -> None:
+        configuration = configuration or client.Configuration.get_default_copy()
+        if configuration.retries is None:
+            # urllib3 would retry throttled requests on its own, bypassing the policy.
+            # Connection errors are still retried by urllib3.
+            configuration.retries = urllib3.Retry(3, respect_retry_after_header=False)
+        super().__init__(configuration, **kwargs)
+        self.policy = policy or ApiCallPolicy()
+
+    def request(
+        self,
+        method,
+        url,
+        query_params=None,
+        headers=None,
+        post_params=None,
+        body=None,
+        _preload_content=True,
+        _request_timeout=None,
+    ):
+        verb, resource = request_labels(method, url, query_params)
+        kwargs = {
+            "headers": headers,
+            "post_params": post_params,
+            "body": body,
+            "_preload_content": _preload_content,
+            "_request_timeout": _request_timeout,
+        }
+        coalescer = self.policy.coalescer
+        if coalescer is None or verb == "watch":
+            return self._request(verb, resource, method, url, query_params, **kwargs)
+        if verb not in ("get", "list"):
+            try:
+                return self._request(
+                    verb, resource, method, url, query_params, **kwargs
+                )
+            finally:
+                # Make writes visible to subsequent reads
+                coalescer.invalidate()
+        if not _preload_content or body is not None:
+            return self._request(verb, resource, method, url, query_params, **kwargs)
+
+        key = (
+            url,
+            tuple(tuple(p) for p in query_params or ()),
+            (headers or {}).get("Accept"),
+        )
+        response, shared = coalescer.do(
+            key,
+            functools.partial(
+                self._request, verb, resource, method, url, query_params, **kwargs
+            ),
+        )
+        if shared is not None:
+            KUBERNETES_API_COALESCED.labels(
+                verb=verb, resource=resource, source=shared
+            ).inc()
+        # The generated client decodes the response data in place, so every caller
+        # gets its own response object (with the decoded data, since plain text
+        # responses such as pod logs are not deserialized from bytes)
+        copy = rest.RESTResponse(response.urllib3_response)
+        copy.data = response.data
+        return copy
+
+    def _request(self, verb, resource, method, url, query_params, **kwargs):
+        policy = self.policy
+        for attempt in itertools.count():
+            # Wait for the rate limiter first, so that calls let through by the
+            # circuit breaker are made right away
+            if policy.limiter is not None:
+                policy.limiter.acquire(verb)
+            policy.breaker.before_call()
+
+            outcome_recorded = False
+            try:
+                response = self._timed_request(
+                    verb, resource, method, url, query_params, **kwargs
+                )
+            except client.ApiException as e:
+                if e.status is not None and e.status >= 500:
+                    policy.breaker.record_failure()
+                else:
+                    policy.breaker.record_success()
+                outcome_recorded = True
+
+                retry_after = parse_retry_after((e.headers or {}).get("Retry-After"))
+                delay = policy.retry.delay(verb, e.status or 0, attempt, retry_after)
+                if delay is not None:
+                    KUBERNETES_API_RETRIES.labels(
+                        verb=verb, resource=resource, status=str(e.status)
+                    ).inc()
+                    time.sleep(delay)
+                    continue
+                if e.status in UNAVAILABLE_STATUS_CODES:
+                    raise KubernetesUnavailableError(
+                        f"Kubernetes API server unavailable ({e.status} {e.reason})",
+                        retry_after=retry_after,
+                    ) from e
+                raise
+            except urllib3.exceptions.HTTPError:
+                # Connection errors, already retried by urllib3
+                policy.breaker.record_failure()
+                outcome_recorded = True
+                raise
+            else:
+                policy.breaker.record_success()
+                outcome_recorded = True
+            finally:
+                # Other errors say nothing about the API server, but must not leave
+                # a trial call of the circuit breaker pending
+                if not outcome_recorded:
+                    policy.breaker.release()
+            return response
+
+    def _timed_request(self, verb, resource, method, url, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            with span(
+                f"kubernetes {verb} {resource}",
+                {"k8s.api.verb": verb, "k8s.api.resource": resource},
+            ):
+                return super().request(method, url, *args, **kwargs)
+        finally:
+            KUBERNETES_API_CALL_DURATION.labels(verb=verb, resource=resource).observe(
+                time.perf_counter() - start
+            )
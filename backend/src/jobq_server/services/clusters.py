@@ -0,0 +1,174 @@
+"""
+Federation of several Kubernetes clusters.
+
+The backend can manage several clusters at once (see ``k8s_clusters`` in
+:class:`jobq_server.config.Settings`), each with its own API client, connection pool,
+rate limits and read cache. Listings fan out across the clusters concurrently, and
+submissions are routed to an explicitly chosen cluster, or to the cluster with the
+most free Kueue quota for the job.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import logging
+import threading
+from collections.abc import Callable, Collection, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from jobq import Job
+from jobq.types import K8sResourceKind
+
+from jobq_server.config import get_settings
+from jobq_server.models import JobId
+from jobq_server.services.k8s import KubernetesService
+from jobq_server.utils.kueue import KueueWorkload
+
+T = TypeVar("T")
+
+# Cluster selector for querying all clusters
+ALL_CLUSTERS = "*"
+
+
+class ClusterSet:
+    """
+    The Kubernetes clusters managed by the backend, by name.
+
+    Clusters are named after their kubeconfig context. Their services are created on
+    first use, so that an unreachable cluster does not prevent the backend from starting.
+
+    Parameters
+    ----------
+    contexts : Sequence[str]
+        The kubeconfig contexts of the clusters.
+    default : str | None, optional
+        The cluster for requests that do not select one. Defaults to the first cluster.
+    """
+
+    def __init__(self, contexts: Sequence[str], default: str | None = None) -> None:
+        if not contexts:
+            raise ValueError("At least one cluster is required")
+        self.names = list(dict.fromkeys(contexts))
+        self.default = default or self.names[0]
+        if self.default not in self.names:
+            raise ValueError(f"Unknown default cluster: {self.default!r}")
+
+        self._services: dict[str, KubernetesService] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.names), thread_name_prefix="cluster-fan-out"
+        )
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def __getitem__(self, name: str) -> KubernetesService:
+        if name not in self.names:
+            raise KeyError(name)
+        with self._lock:
+            if (k8s := self._services.get(name)) is None:
+                k8s = self._services[name] = KubernetesService(context=name)
+        return k8s
+
+    def fan_out(
+        self,
+        fn: Callable[[str, KubernetesService], T],
+        names: Collection[str] | None = None,
+    ) -> tuple[dict[str, T], dict[str, Exception]]:
+        """
+        Call a function for each cluster concurrently.
+
+        Parameters
+        ----------
+        fn : Callable[[str, KubernetesService], T]
+            The function, called with the name and the service of each cluster.
+        names : Collection[str] | None, optional
+            The clusters to call the function for. Defaults to all clusters.
+
+        Returns
+        -------
+        tuple[dict[str, T], dict[str, Exception]]
+            The results by cluster, and the errors of the clusters for which the
+            function failed (e.g., because the cluster is unavailable).
+        """
+
+        def call(name: str) -> T:
+            return fn(name, self[name])
+
+        futures = {
+            # Propagate the context (e.g., the active trace span) to the worker threads
+            name: self._executor.submit(contextvars.copy_context().run, call, name)
+            for name in (self.names if names is None else names)
+        }
+        results: dict[str, T] = {}
+        errors: dict[str, Exception] = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logging.warning(f"Request to cluster {name!r} failed: {e}")
+                errors[name] = e
+        return results, errors
+
+    def workload_for_managed_resource(
+        self, uid: JobId, namespace: str | Collection[str] | None = None
+    ) -> KueueWorkload | None:
+        """Find the Kueue workload of a job in any of the clusters.
+
+        Raises the error of an unavailable cluster if the workload was not found in
+        the other clusters."""
+        results, errors = self.fan_out(
+            lambda _, k8s: k8s.workload_for_managed_resource(uid, namespace)
+        )
+        for name in self.names:
+            if (workload := results.get(name)) is not None:
+                return workload
+        if errors:
+            raise next(iter(errors.values()))
+        return None
+
+    def route(self, job: Job) -> str:
+        """
+        Choose the cluster to submit a job to.
+
+        Jobs are routed to the cluster with the most free quota for their resource
+        requests in the Kueue cluster queue behind their local queue. Jobs without a
+        local queue are submitted to the default cluster.
+
+        Raises
+        ------
+        ValueError
+            If the local queue of the job does not exist (or has no quota for the
+            requested resources) in any of the clusters.
+        """
+        scheduling = job.options.scheduling if job.options else None
+        if scheduling is None or not scheduling.queue_name:
+            return self.default
+
+        queue = scheduling.queue_name
+        resources = job.options.resources if job.options else None
+        requests = (
+            resources.to_kubernetes(K8sResourceKind.REQUESTS) if resources else {}
+        )
+        results, _ = self.fan_out(
+            lambda _, k8s: k8s.queue_headroom(queue, requests)  # type: ignore[arg-type]
+        )
+        candidates = [name for name in self.names if results.get(name) is not None]
+        if not candidates:
+            raise ValueError(
+                f"Kueue local queue {queue!r} does not exist in any cluster, "
+                "or has no quota for the requested resources"
+            )
+        # Prefer the default cluster among equally suitable ones
+        return max(candidates, key=lambda name: (results[name], name == self.default))
+
+
+@functools.cache
+def get_clusters() -> ClusterSet | None:
+    """The clusters managed by the backend, or ``None`` if it manages a single cluster."""
+    settings = get_settings()
+    if not settings.k8s_clusters:
+        return None
+    return ClusterSet(settings.k8s_clusters, settings.k8s_default_cluster)
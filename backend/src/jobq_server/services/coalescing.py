@@ -0,0 +1,93 @@
+"""
+Coalescing of identical concurrent Kubernetes API reads.
+
+Concurrent callers of the same read (same URL, query parameters and content type)
+share a single API call ("singleflight"). Optionally, responses are cached for a
+short time, so that bursts of identical reads result in a single API call.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer(Generic[T]):
+    """
+    Thread-safe deduplication of identical in-flight calls, with an optional response cache.
+
+    Parameters
+    ----------
+    ttl : float, optional
+        Time to live of cached results in seconds. Results are not cached if zero.
+    max_entries : int, optional
+        Maximum number of cached results.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 256) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._in_flight: dict[Hashable, _Call[T]] = {}
+        self._cache: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, str | None]:
+        """
+        Call ``fn``, unless an identical call is in flight or cached.
+
+        Returns
+        -------
+        tuple[T, str | None]
+            The result, and how it was shared: ``"in_flight"`` if another caller made
+            the call, ``"cache"`` if it was cached, or ``None`` if this caller made it.
+            Errors of a shared call are raised for all callers.
+        """
+        with self._lock:
+            if self.ttl > 0 and (entry := self._cache.get(key)) is not None:
+                expires, result = entry
+                if expires > time.monotonic():
+                    return result, "cache"
+                del self._cache[key]
+
+            call = self._in_flight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._in_flight[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, "in_flight"  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if self.ttl > 0 and call.error is None:
+                    self._cache[key] = (time.monotonic() + self.ttl, call.result)  # type: ignore[assignment]
+                    while len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+            call.done.set()
+        return call.result, None
+
+    def invalidate(self) -> None:
+        """Discard all cached results, e.g., after a write."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,397 @@
+"""
+Persistent history of the jobs managed by the backend.
+
+The history store records the lifecycle of each job (submission, admission, eviction
+and termination timestamps, queue, priority, labels and submitter) in an embedded SQLite
+database, so that it outlives the job and its Kueue workload in the cluster. It is fed
+by the workload watchers (see :mod:`jobq_server.services.watcher`), and by the backend
+itself when a job is submitted, which records the labels and the submitter (from the
+submission context) that are not part of the workload.
+
+The history is enabled by setting ``history_database`` in the server settings (see
+:class:`jobq_server.config.Settings`). Queries by status, queue, submitter and time
+are served from indexes, ordered by submission time.
+
+The logs of finished jobs are archived in the store before the jobs are deleted from the
+cluster (see :mod:`jobq_server.services.retention`). The log of each pod is stored as
+it is read, in compressed chunks of whole lines, so that neither archiving nor reading
+it back holds a whole log in memory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import functools
+import itertools
+import json
+import queue
+import sqlite3
+import threading
+import zlib
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from jobq_server.config import get_settings
+from jobq_server.models import JobHistoryEntry, JobStatus, SubmissionContext
+from jobq_server.services.watcher import WorkloadEvent
+from jobq_server.utils.k8s import parse_timestamp
+
+COLUMNS = tuple(JobHistoryEntry.model_fields)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    uid TEXT PRIMARY KEY,
+    cluster TEXT,
+    namespace TEXT,
+    name TEXT,
+    kind TEXT,
+    queue_name TEXT,
+    cluster_queue TEXT,
+    priority_class TEXT,
+    priority INTEGER,
+    labels TEXT,
+    submitter TEXT,
+    execution_status TEXT,
+    submission_timestamp TEXT,
+    last_admission_timestamp TEXT,
+    eviction_timestamp TEXT,
+    termination_timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_by_submission ON jobs (submission_timestamp);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (execution_status, submission_timestamp);
+CREATE INDEX IF NOT EXISTS jobs_by_queue ON jobs (queue_name, submission_timestamp);
+CREATE INDEX IF NOT EXISTS jobs_by_submitter ON jobs (submitter, submission_timestamp);
+CREATE TABLE IF NOT EXISTS log_chunks (
+    uid TEXT,
+    pod TEXT,
+    seq INTEGER,
+    data BLOB,
+    PRIMARY KEY (uid, pod, seq)
+);
+"""
+
+# Uncompressed size of the archived log chunks, in bytes
+LOG_CHUNK_SIZE = 1 << 20
+
+
+def _upsert(prefer: str) -> str:
+    # Known values are never overwritten with unknown ones, since the workload watchers
+    # and the submission each know only part of the lifecycle of a job
+    other = "jobs" if prefer == "excluded" else "excluded"
+    return f"""
+INSERT INTO jobs ({", ".join(COLUMNS)}) VALUES ({", ".join(f":{c}" for c in COLUMNS)})
+ON CONFLICT (uid) DO UPDATE SET {
+        ", ".join(
+            f"{c} = COALESCE({prefer}.{c}, {other}.{c})" for c in COLUMNS if c != "uid"
+        )
+    }
+"""
+
+
+# Watched workload states supersede the recorded ones
+UPSERT = _upsert(prefer="excluded")
+# Submissions only fill in what the workload watchers have not recorded yet
+UPSERT_MISSING = _upsert(prefer="jobs")
+
+
+def _timestamp(value: datetime.datetime | str | None) -> str | None:
+    """Normalize a timestamp to an ISO 8601 string in UTC, which sorts chronologically."""
+    parsed = parse_timestamp(value)
+    return parsed.isoformat(timespec="microseconds") if parsed else None
+
+
+def submitter(context: SubmissionContext) -> str | None:
+    """Identify the submitter of a job from its submission context, by email if known."""
+    info = context.get("submitter") or {}
+    for key in ("email", "username"):
+        if (value := info.get(key)) and value != "Unknown":
+            return value
+    return None
+
+
+class HistoryStore:
+    """
+    Thread-safe store of the job history in a SQLite database.
+
+    Each thread uses its own database connection (from a pool of idle connections).
+    Writes are serialized, since SQLite has a single writer at a time, while readers
+    run concurrently with each other and with the writer in WAL mode.
+
+    Parameters
+    ----------
+    database : str | Path
+        The database file, created if it does not exist, or ``":memory:"`` for a
+        transient in-memory database.
+    """
+
+    def __init__(self, database: str | Path) -> None:
+        in_memory = str(database) == ":memory:"
+        # Every connection to ":memory:" would open a database of its own
+        self._database = (
+            f"file:jobq-history-{id(self)}?mode=memory&cache=shared"
+            if in_memory
+            else str(database)
+        )
+        self._idle: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        # In-memory databases have no WAL, so their readers wait for the writer
+        self._read_lock: contextlib.AbstractContextManager = (
+            self._write_lock if in_memory else contextlib.nullcontext()
+        )
+        with self._write_lock, self._connection() as conn, conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._database, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """A database connection for the exclusive use of the calling thread."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        with self._write_lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    def _upsert(self, sql: str, rows: Iterable[Mapping[str, Any]]) -> None:
+        with self._write_lock, self._connection() as conn, conn:
+            conn.executemany(sql, ({c: row.get(c) for c in COLUMNS} for row in rows))
+
+    def record(self, events: Sequence[WorkloadEvent]) -> None:
+        """Record the state of the workloads of a batch of watch events.
+
+        Can be used as a handler of :class:`~jobq_server.services.watcher.WorkloadWatcher`."""
+        rows = []
+        for event in events:
+            workload = event.workload
+            owners = workload.metadata.owner_references or []
+            if len(owners) != 1:
+                continue
+            admission = workload.status.admission
+            rows.append({
+                "uid": owners[0].uid,
+                "cluster": event.cluster,
+                "namespace": workload.metadata.namespace,
+                "name": owners[0].name,
+                "kind": owners[0].kind,
+                "queue_name": workload.spec.queueName,
+                "cluster_queue": admission.clusterQueue if admission else None,
+                "priority_class": workload.spec.priorityClassName,
+                "priority": workload.spec.priority,
+                "execution_status": workload.execution_status.value,
+                "submission_timestamp": _timestamp(workload.submission_timestamp),
+                "last_admission_timestamp": _timestamp(
+                    workload.last_admission_timestamp
+                ),
+                "eviction_timestamp": _timestamp(workload.eviction_timestamp),
+                "termination_timestamp": _timestamp(workload.termination_timestamp),
+            })
+        self._upsert(UPSERT, rows)
+
+    def record_submission(
+        self,
+        uid: str,
+        *,
+        namespace: str,
+        name: str,
+        kind: str,
+        labels: Mapping[str, str],
+        context: SubmissionContext,
+        cluster: str | None = None,
+    ) -> None:
+        """Record the submission of a job through the backend."""
+        self._upsert(
+            UPSERT_MISSING,
+            [
+                {
+                    "uid": uid,
+                    "cluster": cluster,
+                    "namespace": namespace,
+                    "name": name,
+                    "kind": kind,
+                    "labels": json.dumps(dict(labels)),
+                    "submitter": submitter(context),
+                    "execution_status": JobStatus.PENDING.value,
+                    "submission_timestamp": _timestamp(
+                        datetime.datetime.now(datetime.UTC)
+                    ),
+                }
+            ],
+        )
+
+    def archive_logs(
+        self,
+        uid: str,
+        pod: str,
+        lines: Iterable[bytes],
+        max_bytes: int | None = None,
+    ) -> int:
+        """
+        Archive the log of a pod of a job, replacing any previously archived log of the pod.
+
+        The log is written in chunks as it is read, without blocking the other writers
+        while waiting for the next line.
+
+        Parameters
+        ----------
+        uid : str
+            The UID of the job.
+        pod : str
+            The name of the pod.
+        lines : Iterable[bytes]
+            The lines of the log, e.g., a pod log stream.
+        max_bytes : int | None, optional
+            The maximum size of the archived log, in bytes. Longer logs are truncated at
+            a line boundary, and reading them stops there.
+
+        Returns
+        -------
+        int
+            The size of the archived log, in bytes.
+        """
+        with self._write_lock, self._connection() as conn, conn:
+            conn.execute("DELETE FROM log_chunks WHERE uid = ? AND pod = ?", (uid, pod))
+
+        seq, size = 0, 0
+        chunk = bytearray()
+
+        def flush() -> None:
+            nonlocal seq
+            with self._write_lock, self._connection() as conn, conn:
+                conn.execute(
+                    "INSERT INTO log_chunks (uid, pod, seq, data) VALUES (?, ?, ?, ?)",
+                    (uid, pod, seq, zlib.compress(chunk)),
+                )
+            seq += 1
+            chunk.clear()
+
+        for line in lines:
+            if max_bytes is not None and size + len(line) > max_bytes:
+                chunk += f"[log truncated after {size} bytes]\n".encode()
+                break
+            chunk += line
+            size += len(line)
+            if len(chunk) >= LOG_CHUNK_SIZE:
+                flush()
+        if chunk or seq == 0:
+            # An empty log is archived as well, to tell it from a missing one
+            flush()
+        return size
+
+    def archived_pods(self, uid: str) -> list[str]:
+        """The pods of a job whose logs have been archived, in the order of archival."""
+        with self._read_lock, self._connection() as conn:
+            rows = conn.execute(
+                "SELECT pod FROM log_chunks WHERE uid = ? AND seq = 0 ORDER BY rowid",
+                (uid,),
+            ).fetchall()
+        return [row["pod"] for row in rows]
+
+    def archived_log(self, uid: str, pod: str) -> Iterator[bytes]:
+        """Read back the archived log of a pod of a job, one chunk of lines at a time."""
+        for seq in itertools.count():
+            with self._read_lock, self._connection() as conn:
+                row = conn.execute(
+                    "SELECT data FROM log_chunks WHERE uid = ? AND pod = ? AND seq = ?",
+                    (uid, pod, seq),
+                ).fetchone()
+            if row is None:
+                return
+            yield zlib.decompress(row["data"])
+
+    def query(
+        self,
+        *,
+        status: Collection[JobStatus] | None = None,
+        queue_name: str | None = None,
+        submitter: str | None = None,
+        cluster: str | None = None,
+        namespace: str | None = None,
+        since: datetime.datetime | None = None,
+        until: datetime.datetime | None = None,
+        limit: int = 100,
+    ) -> list[JobHistoryEntry]:
+        """
+        Query the job history, most recently submitted jobs first.
+
+        Parameters
+        ----------
+        status : Collection[JobStatus] | None, optional
+            Only return jobs with one of these execution statuses.
+        queue_name : str | None, optional
+            Only return jobs submitted to this Kueue local queue.
+        submitter : str | None, optional
+            Only return jobs of this submitter.
+        cluster : str | None, optional
+            Only return jobs of this cluster.
+        namespace : str | None, optional
+            Only return jobs in this namespace.
+        since : datetime.datetime | None, optional
+            Only return jobs submitted at or after this time.
+        until : datetime.datetime | None, optional
+            Only return jobs submitted before this time.
+        limit : int, optional
+            The maximum number of jobs to return.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status:
+            clauses.append(f"execution_status IN ({', '.join('?' * len(status))})")
+            params.extend(JobStatus(s).value for s in status)
+        for column, value in [
+            ("queue_name", queue_name),
+            ("submitter", submitter),
+            ("cluster", cluster),
+            ("namespace", namespace),
+        ]:
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("submission_timestamp >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("submission_timestamp < ?")
+            params.append(_timestamp(until))
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY submission_timestamp DESC LIMIT ?"
+        params.append(limit)
+
+        with self._read_lock, self._connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            JobHistoryEntry.model_validate({
+                **{k: v for k, v in dict(row).items() if v is not None},
+                "labels": json.loads(row["labels"] or "{}"),
+            })
+            for row in rows
+        ]
+
+
+@functools.cache
+def get_history_store() -> HistoryStore | None:
+    """The job history store, or ``None`` if the job history is disabled."""
+    database = get_settings().history_database
+    if database is None:
+        return None
+    return HistoryStore(database)
@@ -0,0 +1,428 @@
+"""
+Container images of jobs: digest pinning and pre-pulling.
+
+Image tags are mutable, so the images of submitted jobs can be pinned to the digest the
+tag refers to at submission (``image_digest_pinning`` in the server settings, see
+:class:`jobq_server.config.Settings`). The digest is resolved with the registry API, for
+public images and registries that allow anonymous pulls, and cached briefly. Images that
+cannot be resolved (e.g., in private registries) keep their tag.
+
+Pulling a multi-GB image on a fresh node delays the start of a job, so the images of
+queued jobs can be pre-pulled (``image_prepull``): for each submitted job, a
+``DaemonSet`` runs a no-op init container with the image on every node the job can be
+placed on (see :class:`jobq.job.PlacementOptions`, e.g., the nodes of the Kueue
+ResourceFlavor of its accelerator type), while the job waits in the queue. Once the
+image has been pulled on all of these nodes (or after a timeout), the
+:class:`ImagePrePuller` records the time it took on the job, and deletes the DaemonSet.
+The DaemonSet is owned by the job, so that it is deleted with the job otherwise (e.g.,
+after a restart of the backend).
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from kubernetes import client
+
+from jobq_server.config import get_settings
+from jobq_server.services.k8s import KubernetesService
+from jobq_server.utils.k8s import gvk, parse_timestamp
+
+DOCKER_HUB = "registry-1.docker.io"
+
+# Media types of the manifests a tag can refer to, including multi-platform indexes,
+# whose digest is the same for all platforms
+_MANIFEST_TYPES = ", ".join([
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+])
+
+PREPULL_LABEL = "x-jobq.io/prepull"
+"""Label of the pre-pull DaemonSets and their pods, with the UID of their job."""
+PULL_SECONDS_ANNOTATION = "x-jobq.io/image-pull-seconds"
+"""Annotation of a job with the longest time its image took to pull on a node."""
+PREPULLED_NODES_ANNOTATION = "x-jobq.io/image-prepulled-nodes"
+"""Annotation of a job with the number of nodes its image has been pre-pulled on."""
+
+# Runs the pre-pull pods after their init container has pulled the image
+_PAUSE_IMAGE = "registry.k8s.io/pause:3.10"
+_PREPULL_RESOURCES = {
+    "requests": {"cpu": "1m", "memory": "16Mi"},
+    "limits": {"memory": "64Mi"},
+}
+
+
+def _parse_image_ref(ref: str) -> tuple[str, str, str]:
+    """Split an image reference into its registry, repository and tag."""
+    name, _, tag = ref.rpartition(":")
+    if not name or "/" in tag:
+        # No tag, the colon (if any) separates the port of the registry
+        name, tag = ref, "latest"
+    registry, _, repository = name.partition("/")
+    if not repository or not (
+        "." in registry or ":" in registry or registry == "localhost"
+    ):
+        # Docker Hub, with the `library/` namespace for official images
+        registry, repository = DOCKER_HUB, name
+        if "/" not in repository:
+            repository = f"library/{repository}"
+    return registry, repository, tag
+
+
+def _bearer_token(challenge: str, timeout: float) -> str | None:
+    """Request an anonymous token for a ``WWW-Authenticate: Bearer ...`` challenge."""
+    scheme, _, params = challenge.partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    fields = {
+        key.strip(): value.strip('"')
+        for key, _, value in (
+            param.partition("=") for param in params.split(",") if "=" in param
+        )
+    }
+    if not (realm := fields.pop("realm", None)):
+        return None
+    url = f"{realm}?{urllib.parse.urlencode(fields)}"
+    with urllib.request.urlopen(url, timeout=timeout) as response:  # noqa: S310
+        body = json.load(response)
+    return body.get("token") or body.get("access_token")
+
+
+def resolve_digest(ref: str, timeout: float = 5.0) -> str | None:
+    """
+    Resolve the tag of an image to the digest of its manifest in the registry.
+
+    Parameters
+    ----------
+    ref : str
+        The image reference, e.g., ``ghcr.io/org/image:tag``.
+    timeout : float, optional
+        The timeout of the registry requests, in seconds.
+
+    Returns
+    -------
+    str | None
+        The digest (``sha256:...``), or ``None`` if it could not be resolved (e.g.,
+        the registry is unreachable, or requires credentials).
+    """
+    registry, repository, tag = _parse_image_ref(ref)
+    # Local registries are usually served over plain HTTP
+    scheme = "http" if registry.split(":")[0] in ("localhost", "127.0.0.1") else "https"
+    url = f"{scheme}://{registry}/v2/{repository}/manifests/{tag}"
+    headers = {"Accept": _MANIFEST_TYPES}
+    for _ in range(2):
+        request = urllib.request.Request(url, headers=headers, method="HEAD")
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310
+                return response.headers.get("Docker-Content-Digest")
+        except urllib.error.HTTPError as e:
+            challenge = e.headers.get("WWW-Authenticate")
+            if e.code != 401 or "Authorization" in headers or not challenge:
+                logging.debug(f"Could not resolve image {ref!r}: HTTP {e.code}")
+                return None
+            if (token := _bearer_token(challenge, timeout)) is None:
+                return None
+            headers["Authorization"] = f"Bearer {token}"
+    return None
+
+
+# Resolved digests (or failures) by image reference, with their expiry time, so that
+# submissions of the same image do not query the registry every time
+DIGEST_CACHE_TTL = 60.0
+_digests: dict[str, tuple[float, str | None]] = {}
+_digests_lock = threading.Lock()
+
+
+def _cached_digest(ref: str) -> str | None:
+    now = time.monotonic()
+    with _digests_lock:
+        expires, digest = _digests.get(ref, (0.0, None))
+    if now < expires:
+        return digest
+    try:
+        digest = resolve_digest(ref)
+    except (OSError, ValueError) as e:
+        digest = None
+        logging.debug(f"Could not resolve image {ref!r}: {e}")
+    with _digests_lock:
+        for key in [k for k, (expires, _) in _digests.items() if expires <= now]:
+            del _digests[key]
+        _digests[ref] = (now + DIGEST_CACHE_TTL, digest)
+    return digest
+
+
+def pin_digest(ref: str) -> str:
+    """Pin an image reference to the current digest of its tag, if it is not pinned
+    yet and the digest can be resolved.
+
+    Resolved digests are cached for ``DIGEST_CACHE_TTL`` seconds."""
+    if "@" in ref:
+        return ref
+    if (digest := _cached_digest(ref)) is None:
+        logging.warning(f"Could not resolve the digest of image {ref!r}, using its tag")
+        return ref
+    return f"{ref}@{digest}"
+
+
+def prepull_daemonset(owner: Mapping[str, Any], pod_spec: Mapping[str, Any]) -> dict:
+    """
+    The pre-pull DaemonSet of a job.
+
+    Parameters
+    ----------
+    owner : Mapping[str, Any]
+        The job resource, as created in the cluster.
+    pod_spec : Mapping[str, Any]
+        The (serialized) spec of the pod of the job that runs its image, with the
+        node selection of the job.
+    """
+    meta = owner["metadata"]
+    labels = {PREPULL_LABEL: meta["uid"]}
+    (container, *_) = pod_spec["containers"]
+    template_spec = {
+        key: pod_spec[key]
+        for key in ("nodeSelector", "affinity", "tolerations", "imagePullSecrets")
+        if pod_spec.get(key)
+    }
+    template_spec |= {
+        # The images of jobs are Python images (see `jobq.job.ImageOptions`)
+        "initContainers": [
+            {
+                "name": "prepull",
+                "image": container["image"],
+                "imagePullPolicy": "IfNotPresent",
+                "command": ["python", "-c", ""],
+                "resources": _PREPULL_RESOURCES,
+            }
+        ],
+        "containers": [
+            {"name": "pause", "image": _PAUSE_IMAGE, "resources": _PREPULL_RESOURCES}
+        ],
+        "terminationGracePeriodSeconds": 0,
+    }
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "DaemonSet",
+        "metadata": {
+            "name": f"{meta['name']}-prepull",
+            "namespace": meta["namespace"],
+            "labels": labels,
+            "ownerReferences": [
+                {
+                    "apiVersion": owner["apiVersion"],
+                    "kind": owner["kind"],
+                    "name": meta["name"],
+                    "uid": meta["uid"],
+                }
+            ],
+        },
+        "spec": {
+            "selector": {"matchLabels": labels},
+            "template": {"metadata": {"labels": labels}, "spec": template_spec},
+        },
+    }
+
+
+def _pull_seconds(pod: client.V1Pod) -> float | None:
+    """The time the image of a pre-pull pod took to pull, or ``None`` if it has not
+    been pulled yet.
+
+    The init container starts once its image has been pulled, so the pull time is
+    approximated by the time between the start of the pod and of its init container."""
+    status = pod.status
+    if status is None or status.start_time is None:
+        return None
+    for container in status.init_container_statuses or []:
+        state = container.state
+        started = (
+            state.terminated.started_at
+            if state and state.terminated
+            else state.running.started_at
+            if state and state.running
+            else None
+        )
+        if started is not None:
+            pulled = parse_timestamp(started) - parse_timestamp(status.start_time)
+            return max(pulled.total_seconds(), 0.0)
+    return None
+
+
+@dataclass
+class _PrePull:
+    """The pre-pull DaemonSet of a job."""
+
+    k8s: KubernetesService
+    owner: dict[str, Any]
+    name: str
+    started: float
+
+
+class ImagePrePuller:
+    """
+    Pre-pulling of the images of queued jobs (see the module documentation).
+
+    Parameters
+    ----------
+    interval : float, optional
+        The interval between the checks of the pre-pull DaemonSets, in seconds.
+    timeout : float, optional
+        The time after which a DaemonSet is deleted, even if the image has not been
+        pulled on all nodes, in seconds.
+    clock : Callable[[], float], optional
+        The current time, as a Unix timestamp.
+    """
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        timeout: float = 1800.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self.clock = clock
+        # Pre-pulls by the UID of their job
+        self._prepulls: dict[str, _PrePull] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def prepull(
+        self,
+        k8s: KubernetesService,
+        owner: Mapping[str, Any],
+        pod_spec: Mapping[str, Any],
+    ) -> None:
+        """Start pre-pulling the image of a submitted job.
+
+        Failures are logged, and do not affect the job."""
+        manifest = prepull_daemonset(owner, pod_spec)
+        meta = manifest["metadata"]
+        try:
+            k8s.apps_v1.create_namespaced_daemon_set(meta["namespace"], manifest)
+        except client.ApiException as e:
+            logging.warning(
+                f"Could not create pre-pull DaemonSet {meta['name']!r}: {e}"
+            )
+            return
+        with self._lock:
+            self._prepulls[owner["metadata"]["uid"]] = _PrePull(
+                k8s, dict(owner), meta["name"], self.clock()
+            )
+
+    def sweep(self) -> int:
+        """Record the pull times of the completed pre-pulls, and delete their
+        DaemonSets.
+
+        Returns
+        -------
+        int
+            The number of completed pre-pulls.
+        """
+        with self._lock:
+            prepulls = list(self._prepulls.items())
+        now = self.clock()
+        completed = 0
+        for uid, prepull in prepulls:
+            try:
+                done = self._sweep(uid, prepull, now)
+            except Exception:
+                logging.exception(f"Failed to check pre-pull {prepull.name!r}")
+                continue
+            if done:
+                with self._lock:
+                    self._prepulls.pop(uid, None)
+                completed += 1
+        return completed
+
+    def _sweep(self, uid: str, prepull: _PrePull, now: float) -> bool:
+        """Check a pre-pull, and return whether it has completed."""
+        namespace = prepull.owner["metadata"]["namespace"]
+        try:
+            daemonset = prepull.k8s.apps_v1.read_namespaced_daemon_set(
+                prepull.name, namespace
+            )
+        except client.ApiException as e:
+            if e.status == 404:
+                # Deleted with its job
+                return True
+            raise
+        status = daemonset.status
+        if (status.observed_generation or 0) < (daemonset.metadata.generation or 0):
+            # The pods of the DaemonSet have not been scheduled yet
+            return False
+        pods = prepull.k8s.core_v1.list_namespaced_pod(
+            namespace, label_selector=f"{PREPULL_LABEL}={uid}"
+        ).items
+        durations = [d for pod in pods if (d := _pull_seconds(pod)) is not None]
+        if (
+            len(durations) < (status.desired_number_scheduled or 0)
+            and now < prepull.started + self.timeout
+        ):
+            return False
+
+        owner = prepull.owner
+        if durations:
+            try:
+                prepull.k8s.annotate_resource(
+                    gvk(owner),
+                    owner["metadata"]["name"],
+                    namespace,
+                    {
+                        PULL_SECONDS_ANNOTATION: f"{max(durations):.1f}",
+                        PREPULLED_NODES_ANNOTATION: str(len(durations)),
+                    },
+                )
+            except client.ApiException as e:
+                if e.status != 404:
+                    raise
+        try:
+            prepull.k8s.delete_resource(
+                gvk({"apiVersion": "apps/v1", "kind": "DaemonSet"}),
+                prepull.name,
+                namespace,
+                propagation_policy="Background",
+            )
+        except client.ApiException as e:
+            if e.status != 404:
+                raise
+        return True
+
+    def run(self) -> None:
+        """Check the pre-pulls periodically until the pre-puller is stopped."""
+        while not self._stopped.wait(self.interval):
+            self.sweep()
+
+    def start(self) -> None:
+        """Start checking the pre-pulls on a background thread."""
+        self._thread = threading.Thread(
+            target=self.run, name="image-prepuller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        """Stop checking the pre-pulls."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+@functools.cache
+def get_image_prepuller() -> ImagePrePuller | None:
+    """The image pre-puller, or ``None`` if pre-pulling is disabled."""
+    settings = get_settings()
+    if not settings.image_prepull:
+        return None
+    return ImagePrePuller(timeout=settings.image_prepull_timeout)
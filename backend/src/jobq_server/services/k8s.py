@@ -1,35 +1,105 @@
+import contextvars
+import functools
 import logging
-from collections.abc import Generator
+from collections.abc import Callable, Collection, Generator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, TypeVar
 
 from kubernetes import client, config, dynamic
 
+from jobq_server.config import get_settings
 from jobq_server.exceptions import PodNotReadyError, WorkloadNotFound
+from jobq_server.metrics import ACTIVE_LOG_STREAMS
 from jobq_server.models import JobId
+from jobq_server.services.api_client import KubernetesApiClient
+from jobq_server.services.resilience import get_api_call_policy
+from jobq_server.tracing import traced
 from jobq_server.utils.helpers import traverse
-from jobq_server.utils.k8s import GroupVersionKind
-from jobq_server.utils.kueue import KueueWorkload
+from jobq_server.utils.k8s import ALL_NAMESPACES, GroupVersionKind
+from jobq_server.utils.kueue import KueueWorkload, cluster_queue_headroom
+
+T = TypeVar("T")
+
+
+@functools.cache
+def _fan_out_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=get_settings().k8s_fan_out_concurrency,
+        thread_name_prefix="k8s-fan-out",
+    )
+
+
+def _submission_order(workload: dict[str, Any]) -> tuple[str, str, str]:
+    meta = workload["metadata"]
+    # RFC 3339 timestamps in UTC sort chronologically as strings
+    return meta.get("creationTimestamp", ""), meta.get("namespace", ""), meta["name"]
+
+
+# Context name denoting the in-cluster configuration of the backend
+IN_CLUSTER_CONTEXT = "in-cluster"
 
 
 class KubernetesService:
-    def __init__(self):
-        try:
-            config.load_incluster_config()
-            self._in_cluster = True
-        except config.ConfigException:
-            logging.warning(
-                "Could not load in-cluster config, attempting to load Kubeconfig",
-            )
-            config.load_kube_config()
-            self._in_cluster = False
+    """Access to the Kubernetes API of a cluster.
+
+    Parameters
+    ----------
+    context : str | None, optional
+        The kubeconfig context of the cluster, or :data:`IN_CLUSTER_CONTEXT`.
+        By default, the in-cluster configuration is used if available, and the
+        current kubeconfig context otherwise.
+    """
+
+    def __init__(self, context: str | None = None):
+        self.context = context
+        configuration = None
+        if context is None:
+            try:
+                config.load_incluster_config()
+                self._in_cluster = True
+            except config.ConfigException:
+                logging.warning(
+                    "Could not load in-cluster config, attempting to load Kubeconfig",
+                )
+                config.load_kube_config()
+                self._in_cluster = False
+        else:
+            # Clusters of a federation have their own configuration, instead of the
+            # global default one
+            configuration = client.Configuration()
+            self._in_cluster = context == IN_CLUSTER_CONTEXT
+            if self._in_cluster:
+                config.load_incluster_config(client_configuration=configuration)
+            else:
+                config.load_kube_config(
+                    context=context, client_configuration=configuration
+                )
+
+        # All API calls to a cluster share the same (instrumented) client and its
+        # connection pool, and are subject to the rate limits and circuit breaker
+        # of the cluster
+        self.api_client = KubernetesApiClient(
+            configuration, policy=get_api_call_policy(context)
+        )
+        self.core_v1 = client.CoreV1Api(self.api_client)
+        self.apps_v1 = client.AppsV1Api(self.api_client)
+        self.batch_v1 = client.BatchV1Api(self.api_client)
+        self.custom_objects = client.CustomObjectsApi(self.api_client)
 
-        self._core_v1_api = client.CoreV1Api()
+    @cached_property
+    def dynamic(self) -> dynamic.DynamicClient:
+        """Dynamic API client, created on first use since it performs API discovery."""
+        return dynamic.DynamicClient(self.api_client)
 
     @property
+    @traced()
     def namespace(self) -> str:
         if not self._in_cluster:
-            _, active_context = config.list_kube_config_contexts()
+            contexts, active_context = config.list_kube_config_contexts()
+            if self.context is not None:
+                active_context = next(c for c in contexts if c["name"] == self.context)
             current_namespace = traverse(active_context, "context.namespace")
         else:
             # When running in a cluster, determine the namespace from the mounted service account
@@ -43,22 +113,111 @@ class KubernetesService:
                 raise RuntimeError("Could not determine current namespace") from e
         return current_namespace
 
+    @traced()
     def workload_for_managed_resource(
-        self, uid: JobId, namespace: str | None = None
+        self, uid: JobId, namespace: str | Collection[str] | None = None
     ) -> KueueWorkload | None:
+        """Find the Kueue workload of a job.
+
+        Parameters
+        ----------
+        uid : JobId
+            The UID of the job.
+        namespace : str | Collection[str] | None, optional
+            The namespace(s) to search, or :data:`ALL_NAMESPACES`. Defaults to the
+            current namespace. Namespaces that cannot be accessed are skipped.
+        """
+        if namespace is None or isinstance(namespace, str):
+            namespaces = [namespace or self.namespace]
+        else:
+            namespaces = list(dict.fromkeys(namespace))
+
+        def lookup(ns: str) -> KueueWorkload | None:
+            try:
+                return KueueWorkload.for_managed_resource(uid, namespace=ns, k8s=self)
+            except WorkloadNotFound:
+                return None
+
+        if ALL_NAMESPACES in namespaces:
+            try:
+                return lookup(ALL_NAMESPACES)
+            except client.ApiException as e:
+                if e.status != 403:
+                    raise
+                namespaces = self.list_namespaces()
+        if len(namespaces) == 1:
+            return lookup(namespaces[0])
+
+        results, _ = self._fan_out(lookup, namespaces)
+        return next((wl for wl in results.values() if wl is not None), None)
+
+    @traced()
+    def queue_headroom(
+        self,
+        queue_name: str,
+        requests: Mapping[str, str],
+        namespace: str | None = None,
+    ) -> float | None:
+        """Free quota of the Kueue cluster queue behind a local queue after admitting
+        a job with the given resource requests (see :func:`cluster_queue_headroom`).
+
+        Returns ``None`` if the local queue does not exist."""
         try:
-            return KueueWorkload.for_managed_resource(
-                uid, namespace=namespace or self.namespace
+            local_queue = self.custom_objects.get_namespaced_custom_object(
+                "kueue.x-k8s.io",
+                "v1beta1",
+                namespace or self.namespace,
+                "localqueues",
+                queue_name,
             )
-        except WorkloadNotFound:
+            cluster_queue = self.custom_objects.get_cluster_custom_object(
+                "kueue.x-k8s.io",
+                "v1beta1",
+                "clusterqueues",
+                local_queue["spec"]["clusterQueue"],
+            )
+        except client.ApiException as e:
+            if e.status != 404:
+                raise
             return None
+        return cluster_queue_headroom(cluster_queue, requests)
+
+    @traced()
+    def list_namespaces(self) -> list[str]:
+        return [ns.metadata.name for ns in self.core_v1.list_namespace().items]
+
+    def _fan_out(
+        self, fn: Callable[[str], T], namespaces: Collection[str]
+    ) -> tuple[dict[str, T], list[str]]:
+        """Call a function for each namespace concurrently.
+
+        Returns the results by namespace, and the namespaces in which the function
+        failed because access was forbidden (RBAC)."""
+        executor = _fan_out_executor()
+        futures = {
+            # Propagate the context (e.g., the active trace span) to the worker threads
+            ns: executor.submit(contextvars.copy_context().run, fn, ns)
+            for ns in namespaces
+        }
+        results: dict[str, T] = {}
+        forbidden: list[str] = []
+        for ns, future in futures.items():
+            try:
+                results[ns] = future.result()
+            except client.ApiException as e:
+                if e.status != 403:
+                    raise
+                logging.warning(f"Access to namespace {ns!r} forbidden: {e.reason}")
+                forbidden.append(ns)
+        return results, forbidden
 
     def _sanitize_log_kwargs(self, tail: int) -> dict[str, int]:
         return {"tail_lines": tail} if tail != -1 else {}
 
+    @traced()
     def get_pod_logs(self, pod: client.V1Pod, tail: int = -1) -> str:
         try:
-            return self._core_v1_api.read_namespaced_pod_log(
+            return self.core_v1.read_namespaced_pod_log(
                 pod.metadata.name,
                 pod.metadata.namespace,
                 **self._sanitize_log_kwargs(tail),
@@ -71,18 +230,22 @@ class KubernetesService:
                 ) from e
             raise
 
+    @traced()
     def stream_pod_logs(
-        self, pod: client.V1Pod, tail: int = -1
-    ) -> Generator[str, None, None]:
+        self, pod: client.V1Pod, tail: int = -1, follow: bool = True
+    ) -> Generator[bytes, None, None]:
+        """Open a log stream for a pod.
+
+        The log request is issued eagerly, so that errors (e.g., a pod that is not ready yet)
+        surface when calling this method, rather than when consuming the stream."""
         try:
-            log_stream = self._core_v1_api.read_namespaced_pod_log(
+            log_stream = self.core_v1.read_namespaced_pod_log(
                 pod.metadata.name,
                 pod.metadata.namespace,
-                follow=True,
+                follow=follow,
                 _preload_content=False,
                 **self._sanitize_log_kwargs(tail),
             )
-            yield from log_stream
         except client.ApiException as e:
             if e.status == 400:
                 raise PodNotReadyError(
@@ -91,6 +254,17 @@ class KubernetesService:
                 ) from e
             raise
 
+        def _iter_lines() -> Generator[bytes, None, None]:
+            try:
+                with ACTIVE_LOG_STREAMS.track_inprogress():
+                    yield from log_stream
+            finally:
+                # Abort the underlying HTTP response if the consumer stops reading early
+                log_stream.close()
+
+        return _iter_lines()
+
+    @traced()
     def delete_resource(
         self,
         gvk: GroupVersionKind,
@@ -100,32 +274,104 @@ class KubernetesService:
             "Foreground", "Background", "Orphan"
         ] = "Foreground",
     ) -> None:
-        dyn = dynamic.DynamicClient(client.ApiClient())
-
-        resource = dyn.resources.get(
+        resource = self.dynamic.resources.get(
             api_version=f"{gvk.group}/{gvk.version}" if gvk.group else gvk.version,
             kind=gvk.kind,
         )
 
-        dyn.delete(
+        self.dynamic.delete(
             resource,
             name=name,
             namespace=namespace,
             body=client.V1DeleteOptions(propagation_policy=propagation_policy),
         )
 
+    @traced()
+    def annotate_resource(
+        self,
+        gvk: GroupVersionKind,
+        name: str,
+        namespace: str,
+        annotations: Mapping[str, str],
+    ) -> None:
+        resource = self.dynamic.resources.get(
+            api_version=f"{gvk.group}/{gvk.version}" if gvk.group else gvk.version,
+            kind=gvk.kind,
+        )
+
+        self.dynamic.patch(
+            resource,
+            name=name,
+            namespace=namespace,
+            body={"metadata": {"annotations": dict(annotations)}},
+            content_type="application/merge-patch+json",
+        )
+
+    @traced()
     def list_workloads(self, namespace: str | None = None) -> list[KueueWorkload]:
-        api = client.CustomObjectsApi()
-        workloads = api.list_namespaced_custom_object(
+        workloads = self.custom_objects.list_namespaced_custom_object(
             group="kueue.x-k8s.io",
             version="v1beta1",
             namespace=namespace or self.namespace,
             plural="workloads",
         )
-        self._core_v1_api.list_namespaced_pod(
-            namespace=namespace or self.namespace,
-        )
         return [
-            KueueWorkload.model_validate(workload)
+            KueueWorkload.from_api_object(workload, k8s=self)
             for workload in workloads.get("items", [])
         ]
+
+    @traced()
+    def list_workloads_across(
+        self, namespaces: Collection[str]
+    ) -> tuple[list[KueueWorkload], list[str]]:
+        """List the Kueue workloads in several namespaces, in submission order.
+
+        If :data:`ALL_NAMESPACES` is requested, a single cluster-scoped query is made,
+        falling back to querying each namespace if cluster-wide access is forbidden.
+        Other namespaces are queried concurrently.
+
+        Returns
+        -------
+        tuple[list[KueueWorkload], list[str]]
+            The workloads, and the namespaces that could not be listed because access
+            was forbidden.
+        """
+        namespaces = list(dict.fromkeys(namespaces))
+        if ALL_NAMESPACES in namespaces:
+            try:
+                items = self.custom_objects.list_cluster_custom_object(
+                    group="kueue.x-k8s.io",
+                    version="v1beta1",
+                    plural="workloads",
+                ).get("items", [])
+                forbidden = []
+            except client.ApiException as e:
+                if e.status != 403:
+                    raise
+                namespaces = self.list_namespaces()
+
+        if ALL_NAMESPACES not in namespaces:
+            results, forbidden = self._fan_out(
+                lambda ns: self.custom_objects.list_namespaced_custom_object(
+                    group="kueue.x-k8s.io",
+                    version="v1beta1",
+                    namespace=ns,
+                    plural="workloads",
+                ).get("items", []),
+                namespaces,
+            )
+            items = [wl for ns_items in results.values() for wl in ns_items]
+
+        return [
+            KueueWorkload.from_api_object(workload, k8s=self)
+            for workload in sorted(items, key=_submission_order)
+        ], forbidden
+
+
+@functools.cache
+def get_kubernetes_service() -> KubernetesService:
+    """The service of the cluster, if the backend manages a single cluster.
+
+    The service is shared by all requests, along with its API client (and connection
+    pool), dynamic client and API call policy."""
+    return KubernetesService()
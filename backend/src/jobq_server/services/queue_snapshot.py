@@ -0,0 +1,239 @@
+"""
+Cached snapshots of the Kueue queues.
+
+The ClusterQueues and LocalQueues of the managed clusters are watched in the background
+(see :mod:`jobq_server.services.watcher`), so that their quota, usage and pending
+workloads can be served without calling the Kubernetes API per request.
+
+The snapshots are enabled by default, and configured with ``queue_snapshot`` in the
+server settings (see :class:`jobq_server.config.Settings`).
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections.abc import Collection
+from typing import Any, ClassVar
+
+from jobq_server.config import get_settings
+from jobq_server.models import (
+    ClusterQueueSnapshot,
+    FlavorQuota,
+    LocalQueueSnapshot,
+    QueueKind,
+    ResourceQuota,
+)
+from jobq_server.services.k8s import KubernetesService
+from jobq_server.services.watcher import ResourceWatcher, managed_clusters
+
+
+def _quantity(value: Any) -> str | None:
+    # Quantities can be serialized as numbers, e.g., `nominalQuota: 4`
+    return None if value is None else str(value)
+
+
+def cluster_queue_snapshot(
+    obj: dict[str, Any], cluster: str | None = None
+) -> ClusterQueueSnapshot:
+    """The snapshot of a ``ClusterQueue`` resource, without its LocalQueues."""
+    spec = obj.get("spec") or {}
+    status = obj.get("status") or {}
+
+    # Quota reserved by admitted workloads, and used by the running ones (older Kueue
+    # versions only report the reservation as usage)
+    reserved: dict[tuple[str, str], dict[str, Any]] = {}
+    usage: dict[tuple[str, str], dict[str, Any]] = {}
+    for field, by_resource in [
+        ("flavorsReservation", reserved),
+        ("flavorsUsage", usage),
+    ]:
+        for flavor in status.get(field) or []:
+            for resource in flavor.get("resources") or []:
+                by_resource[flavor["name"], resource["name"]] = resource
+
+    flavors = []
+    for group in spec.get("resourceGroups") or []:
+        for flavor in group.get("flavors") or []:
+            resources = []
+            for resource in flavor.get("resources") or []:
+                key = (flavor["name"], resource["name"])
+                reservation = reserved.get(key) or usage.get(key) or {}
+                resources.append(
+                    ResourceQuota(
+                        name=resource["name"],
+                        nominal_quota=str(resource["nominalQuota"]),
+                        borrowing_limit=_quantity(resource.get("borrowingLimit")),
+                        lending_limit=_quantity(resource.get("lendingLimit")),
+                        reserved=str(reservation.get("total", "0")),
+                        usage=str(usage.get(key, {}).get("total", "0")),
+                        borrowed=str(reservation.get("borrowed", "0")),
+                    )
+                )
+            flavors.append(FlavorQuota(name=flavor["name"], resources=resources))
+
+    return ClusterQueueSnapshot(
+        name=obj["metadata"]["name"],
+        cluster=cluster,
+        cohort=spec.get("cohort"),
+        flavors=flavors,
+        pending_workloads=status.get("pendingWorkloads", 0),
+        reserving_workloads=status.get("reservingWorkloads", 0),
+        admitted_workloads=status.get("admittedWorkloads", 0),
+    )
+
+
+def local_queue_snapshot(obj: dict[str, Any]) -> LocalQueueSnapshot:
+    """The snapshot of a ``LocalQueue`` resource."""
+    status = obj.get("status") or {}
+    return LocalQueueSnapshot(
+        name=obj["metadata"]["name"],
+        namespace=obj["metadata"]["namespace"],
+        pending_workloads=status.get("pendingWorkloads", 0),
+        reserving_workloads=status.get("reservingWorkloads", 0),
+        admitted_workloads=status.get("admittedWorkloads", 0),
+    )
+
+
+class QueueSnapshot:
+    """
+    Thread-safe snapshot of the Kueue queues of the managed clusters, kept up to date
+    by :class:`ClusterQueueWatcher` and :class:`LocalQueueWatcher` instances.
+    """
+
+    def __init__(self) -> None:
+        self._cluster_queues: dict[str | None, dict[str, ClusterQueueSnapshot]] = {}
+        # LocalQueues by namespace and name, with the name of their ClusterQueue
+        self._local_queues: dict[
+            str | None, dict[tuple[str, str], tuple[str, LocalQueueSnapshot]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def replace(
+        self, kind: QueueKind, cluster: str | None, objects: list[dict[str, Any]]
+    ) -> None:
+        """Replace all queues of a kind in a cluster, after listing them."""
+        with self._lock:
+            if kind == QueueKind.CLUSTER:
+                self._cluster_queues[cluster] = {
+                    obj["metadata"]["name"]: cluster_queue_snapshot(obj, cluster)
+                    for obj in objects
+                }
+            else:
+                self._local_queues[cluster] = {
+                    (obj["metadata"]["namespace"], obj["metadata"]["name"]): (
+                        obj["spec"]["clusterQueue"],
+                        local_queue_snapshot(obj),
+                    )
+                    for obj in objects
+                }
+
+    def update(
+        self, kind: QueueKind, cluster: str | None, type: str, obj: dict[str, Any]
+    ) -> None:
+        """Apply a watch event (``ADDED``, ``MODIFIED`` or ``DELETED``) of a queue."""
+        meta = obj["metadata"]
+        with self._lock:
+            if kind == QueueKind.CLUSTER:
+                queues = self._cluster_queues.setdefault(cluster, {})
+                if type == "DELETED":
+                    queues.pop(meta["name"], None)
+                else:
+                    queues[meta["name"]] = cluster_queue_snapshot(obj, cluster)
+            else:
+                local_queues = self._local_queues.setdefault(cluster, {})
+                key = (meta["namespace"], meta["name"])
+                if type == "DELETED":
+                    local_queues.pop(key, None)
+                else:
+                    local_queues[key] = (
+                        obj["spec"]["clusterQueue"],
+                        local_queue_snapshot(obj),
+                    )
+
+    def synced(self, cluster: str | None) -> bool:
+        """Whether the queues of a cluster have been listed."""
+        with self._lock:
+            return cluster in self._cluster_queues and cluster in self._local_queues
+
+    def cluster_queues(
+        self, clusters: Collection[str | None]
+    ) -> list[ClusterQueueSnapshot]:
+        """The ClusterQueues of some clusters, with their LocalQueues, by name."""
+        result = []
+        with self._lock:
+            for cluster in clusters:
+                local_queues: dict[str, list[LocalQueueSnapshot]] = {}
+                for cluster_queue, local_queue in sorted(
+                    self._local_queues.get(cluster, {}).values(),
+                    key=lambda item: (item[1].namespace, item[1].name),
+                ):
+                    local_queues.setdefault(cluster_queue, []).append(local_queue)
+                for name, queue in sorted(
+                    self._cluster_queues.get(cluster, {}).items()
+                ):
+                    result.append(
+                        queue.model_copy(
+                            update={"local_queues": local_queues.get(name, [])}
+                        )
+                    )
+        return result
+
+
+class _QueueWatcher(ResourceWatcher):
+    """Background watch of Kueue queues, updating a snapshot."""
+
+    kind: ClassVar[QueueKind]
+
+    def __init__(
+        self,
+        k8s: KubernetesService,
+        snapshot: QueueSnapshot,
+        namespace: str | None = None,
+        cluster: str | None = None,
+        max_backoff: float = 60.0,
+    ) -> None:
+        super().__init__(k8s, namespace, cluster, max_backoff)
+        self.snapshot = snapshot
+
+    def on_list(self, objects: list[dict[str, Any]]) -> None:
+        self.snapshot.replace(self.kind, self.cluster, objects)
+
+    def on_event(self, type: str, obj: dict[str, Any]) -> None:
+        self.snapshot.update(self.kind, self.cluster, type, obj)
+
+
+class ClusterQueueWatcher(_QueueWatcher):
+    """Background watch of the ClusterQueues of a cluster, updating a snapshot."""
+
+    plural = "clusterqueues"
+    namespaced = False
+    kind = QueueKind.CLUSTER
+
+
+class LocalQueueWatcher(_QueueWatcher):
+    """Background watch of the LocalQueues of a cluster, updating a snapshot."""
+
+    plural = "localqueues"
+    kind = QueueKind.LOCAL
+
+
+def start_queue_watchers(snapshot: QueueSnapshot) -> list[ResourceWatcher]:
+    """Start watching the ClusterQueues and LocalQueues of all managed clusters (see
+    ``watch_namespace`` in :class:`jobq_server.config.Settings`)."""
+    namespace = get_settings().watch_namespace
+    watchers: list[ResourceWatcher] = []
+    for cluster, k8s in managed_clusters():
+        watchers.append(ClusterQueueWatcher(k8s, snapshot, cluster=cluster))
+        watchers.append(LocalQueueWatcher(k8s, snapshot, namespace, cluster))
+    for watcher in watchers:
+        watcher.start()
+    return watchers
+
+
+@functools.cache
+def get_queue_snapshot() -> QueueSnapshot | None:
+    """The queue snapshot, or ``None`` if it is disabled."""
+    if not get_settings().queue_snapshot:
+        return None
+    return QueueSnapshot()
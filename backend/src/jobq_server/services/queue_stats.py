@@ -0,0 +1,275 @@
+"""
+Rolling statistics of the Kueue queues.
+
+Queue statistics are maintained incrementally from the workload watch events (see
+:mod:`jobq_server.services.watcher`), without rescanning workloads: each admission,
+eviction and termination of a workload is counted once, for its LocalQueue and its
+ClusterQueue, in the time bucket of its timestamp. Wait times (from the submission, or
+the last eviction, to the admission) and runtimes (from the admission to the termination)
+are summarized in quantile sketches per bucket, which are merged over the rolling time
+window on request.
+
+The statistics are enabled by default, and configured with ``queue_stats_window`` in
+the server settings (see :class:`jobq_server.config.Settings`).
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from jobq_server.config import get_settings
+from jobq_server.models import DurationStatistics, QueueKind, QueueStatistics
+from jobq_server.services.watcher import WorkloadEvent
+from jobq_server.utils.k8s import parse_timestamp
+from jobq_server.utils.sketch import QuantileSketch
+
+# Reported quantiles of the wait times and runtimes
+QUANTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+# Relative error of the reported quantiles
+RELATIVE_ACCURACY = 0.01
+
+QueueKey = tuple[QueueKind, str | None, str | None, str]
+"""The kind, cluster, namespace (of local queues) and name of a queue."""
+
+
+def _epoch(value: datetime.datetime | str | None) -> float | None:
+    parsed = parse_timestamp(value)
+    return parsed.timestamp() if parsed else None
+
+
+@dataclass
+class _Bucket:
+    """The statistics of a queue in a time interval."""
+
+    wait: QuantileSketch = field(
+        default_factory=lambda: QuantileSketch(RELATIVE_ACCURACY)
+    )
+    runtime: QuantileSketch = field(
+        default_factory=lambda: QuantileSketch(RELATIVE_ACCURACY)
+    )
+    admitted: int = 0
+    evicted: int = 0
+    finished: int = 0
+
+
+@dataclass
+class _Milestones:
+    """The lifecycle timestamps of a workload that have already been counted."""
+
+    admitted: float | None = None
+    evicted: float | None = None
+    finished: float | None = None
+    cluster_queue: str | None = None
+
+
+def _duration_statistics(sketch: QuantileSketch) -> DurationStatistics:
+    return DurationStatistics(
+        count=sketch.count,
+        mean=sketch.mean,
+        percentiles={
+            name: value
+            for name, q in QUANTILES.items()
+            if (value := sketch.quantile(q)) is not None
+        },
+    )
+
+
+class QueueStatsCollector:
+    """
+    Thread-safe rolling statistics of the Kueue queues, fed by workload watch events.
+
+    Parameters
+    ----------
+    window : float, optional
+        The rolling time window of the statistics, in seconds.
+    buckets : int, optional
+        The number of time buckets the window is divided into. Events expire from the
+        statistics one bucket at a time.
+    clock : Callable[[], float], optional
+        The current time, as a Unix timestamp.
+    """
+
+    def __init__(
+        self,
+        window: float = 86400.0,
+        buckets: int = 24,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.window = window
+        self.buckets = buckets
+        self.clock = clock
+        self._bucket_width = window / buckets
+        self._queues: dict[QueueKey, dict[int, _Bucket]] = {}
+        self._seen: dict[tuple[str | None, str, str], _Milestones] = {}
+        self._first: int | None = None
+        # Start of the time covered by the statistics, which is shorter than the window
+        # until the statistics have been collected for that long (including the past
+        # events of the workloads that existed when the collection started)
+        self._since = clock()
+        self._lock = threading.Lock()
+
+    def _first_bucket(self, now: float) -> int:
+        return math.floor(now / self._bucket_width) - self.buckets + 1
+
+    def _expire(self, now: float) -> None:
+        first = self._first_bucket(now)
+        # Buckets expire one at a time, so there is nothing to do in between
+        if first == self._first:
+            return
+        self._first = first
+        for buckets in self._queues.values():
+            for index in [i for i in buckets if i < first]:
+                del buckets[index]
+        # Finished workloads that have expired cannot contribute anymore
+        start = first * self._bucket_width
+        for key in [
+            key
+            for key, seen in self._seen.items()
+            if seen.finished is not None and seen.finished < start
+        ]:
+            del self._seen[key]
+
+    def _bucket(self, queues: Sequence[QueueKey], at: float) -> list[_Bucket]:
+        index = math.floor(at / self._bucket_width)
+        return [
+            self._queues.setdefault(q, {}).setdefault(index, _Bucket()) for q in queues
+        ]
+
+    def record(self, events: Sequence[WorkloadEvent]) -> None:
+        """Count the lifecycle transitions of the workloads of a batch of watch events.
+
+        Can be used as a handler of :class:`~jobq_server.services.watcher.WorkloadWatcher`."""
+        with self._lock:
+            now = self.clock()
+            start = self._first_bucket(now) * self._bucket_width
+            for event in events:
+                self._record(event, start)
+            self._expire(now)
+
+    def _record(self, event: WorkloadEvent, start: float) -> None:
+        workload = event.workload
+        key = (event.cluster, workload.metadata.namespace, workload.metadata.name)
+        if event.type == "DELETED":
+            self._seen.pop(key, None)
+            return
+
+        seen = self._seen.setdefault(key, _Milestones())
+        if (admission := workload.status.admission) is not None:
+            seen.cluster_queue = admission.clusterQueue
+
+        queues: list[QueueKey] = [
+            (QueueKind.LOCAL, event.cluster, key[1], workload.spec.queueName)
+        ]
+        if seen.cluster_queue is not None:
+            queues.append((QueueKind.CLUSTER, event.cluster, None, seen.cluster_queue))
+        for queue in queues:
+            self._queues.setdefault(queue, {})
+
+        submitted = _epoch(workload.submission_timestamp)
+        evicted = _epoch(workload.eviction_timestamp)
+        admitted = _epoch(workload.last_admission_timestamp)
+        finished = _epoch(workload.termination_timestamp)
+
+        if evicted is not None and evicted != seen.evicted:
+            seen.evicted = evicted
+            if evicted >= start:
+                self._since = min(self._since, evicted)
+                for bucket in self._bucket(queues, evicted):
+                    bucket.evicted += 1
+
+        if admitted is not None and admitted != seen.admitted:
+            seen.admitted = admitted
+            if admitted >= start:
+                self._since = min(self._since, admitted)
+                # Requeued workloads wait from their eviction on
+                waiting_since = max(
+                    submitted or admitted,
+                    evicted if evicted is not None and evicted <= admitted else 0.0,
+                )
+                for bucket in self._bucket(queues, admitted):
+                    bucket.admitted += 1
+                    bucket.wait.add(admitted - waiting_since)
+
+        if finished is not None and finished != seen.finished:
+            seen.finished = finished
+            if finished >= start:
+                self._since = min(self._since, finished)
+                for bucket in self._bucket(queues, finished):
+                    bucket.finished += 1
+                    if admitted is not None:
+                        bucket.runtime.add(finished - admitted)
+
+    def stats(
+        self,
+        kind: QueueKind,
+        name: str,
+        namespace: str | None = None,
+        cluster: str | None = None,
+    ) -> QueueStatistics | None:
+        """
+        The statistics of a queue over the rolling time window.
+
+        Parameters
+        ----------
+        kind : QueueKind
+            Whether the queue is a LocalQueue or a ClusterQueue.
+        name : str
+            The name of the queue.
+        namespace : str | None, optional
+            The namespace of a LocalQueue.
+        cluster : str | None, optional
+            The cluster of the queue, if the backend manages several clusters.
+
+        Returns
+        -------
+        QueueStatistics | None
+            The statistics, or ``None`` if no workloads of the queue have been seen.
+        """
+        key = (kind, cluster, namespace if kind == QueueKind.LOCAL else None, name)
+        wait = QuantileSketch(RELATIVE_ACCURACY)
+        runtime = QuantileSketch(RELATIVE_ACCURACY)
+        admitted = evicted = finished = 0
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            # Rates are averaged over the time covered, at least one bucket
+            covered = min(self.window, max(now - self._since, self._bucket_width))
+            if (buckets := self._queues.get(key)) is None:
+                return None
+            for bucket in buckets.values():
+                wait.merge(bucket.wait)
+                runtime.merge(bucket.runtime)
+                admitted += bucket.admitted
+                evicted += bucket.evicted
+                finished += bucket.finished
+
+        return QueueStatistics(
+            name=name,
+            kind=kind,
+            namespace=key[2],
+            cluster=cluster,
+            window_seconds=self.window,
+            admitted=admitted,
+            evicted=evicted,
+            finished=finished,
+            wait_time=_duration_statistics(wait),
+            runtime=_duration_statistics(runtime),
+            eviction_rate=evicted / admitted if admitted else None,
+            jobs_per_hour=finished / (covered / 3600),
+        )
+
+
+@functools.cache
+def get_queue_stats() -> QueueStatsCollector | None:
+    """The queue statistics, or ``None`` if they are disabled."""
+    window = get_settings().queue_stats_window
+    if window <= 0:
+        return None
+    return QueueStatsCollector(window)
@@ -0,0 +1,314 @@
+"""
+Client-side protection of the Kubernetes API server.
+
+All Kubernetes API calls of the backend to a cluster share a :class:`ApiCallPolicy`, which
+
+- limits the rate of API calls with token buckets, per API verb,
+- retries throttled (429) and failed (5xx) calls with jittered exponential backoff,
+  respecting the ``Retry-After`` header of the API server,
+- fails fast with a circuit breaker while the API server is unhealthy, and
+- coalesces identical concurrent reads into a single API call.
+
+The policy is configured through the server settings (see :class:`jobq_server.config.Settings`).
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from jobq_server.config import RateLimit, Settings, get_settings
+from jobq_server.exceptions import KubernetesUnavailableError
+from jobq_server.metrics import KUBERNETES_API_CIRCUIT_STATE
+from jobq_server.services.coalescing import RequestCoalescer
+
+# Status codes indicating an overloaded or temporarily unavailable API server
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Verbs that can safely be repeated if the API server failed to respond properly
+IDEMPOTENT_VERBS = frozenset({"get", "list", "watch", "delete", "update"})
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to ``burst`` calls, refilled at ``qps`` tokens per second.
+    Callers reserve a token and then wait until it becomes available, so that
+    concurrent callers are served in order.
+    """
+
+    def __init__(self, qps: float, burst: int) -> None:
+        self.qps = qps
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a token, and return the time to wait until it is available, in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.qps
+            )
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.qps if self._tokens < 0 else 0.0
+
+    def cancel(self) -> None:
+        """Return a reserved token, e.g., if the caller gave up waiting for it."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+class RateLimiter:
+    """
+    Rate limiter for Kubernetes API calls, with token buckets per API verb.
+
+    Verbs without a dedicated limit share the default bucket. A rate of zero
+    disables the limit.
+    """
+
+    def __init__(
+        self,
+        default: RateLimit,
+        per_verb: Mapping[str, RateLimit] | None = None,
+        timeout: float = 5.0,
+    ) -> None:
+        self.timeout = timeout
+        self._default = self._bucket(default)
+        self._per_verb = {
+            verb: self._bucket(limit) for verb, limit in (per_verb or {}).items()
+        }
+
+    @staticmethod
+    def _bucket(limit: RateLimit) -> TokenBucket | None:
+        return TokenBucket(limit.qps, limit.burst) if limit.qps > 0 else None
+
+    def acquire(self, verb: str) -> None:
+        """
+        Wait until an API call with the given verb is allowed.
+
+        Raises
+        ------
+        KubernetesUnavailableError
+            If the call would have to wait longer than the timeout of the limiter.
+        """
+        bucket = self._per_verb[verb] if verb in self._per_verb else self._default
+        if bucket is None:
+            return
+
+        delay = bucket.reserve()
+        if delay > self.timeout:
+            bucket.cancel()
+            raise KubernetesUnavailableError(
+                f"Kubernetes API rate limit exceeded for {verb!r} calls",
+                retry_after=delay,
+            )
+        if delay > 0:
+            time.sleep(delay)
+
+
+class CircuitState(IntEnum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the Kubernetes API server.
+
+    Opens after ``failure_threshold`` consecutive failed API calls (5xx responses or
+    connection errors), and rejects all calls until ``reset_timeout`` seconds have
+    passed. Then, a single trial call is let through, which closes the circuit
+    again if it succeeds. If the outcome of the trial call is not recorded within
+    ``reset_timeout`` seconds (or it is released, see :meth:`release`), another
+    trial call is let through. A threshold of zero disables the circuit breaker.
+
+    The state is exported with the ``cluster`` label of the breaker (empty for the
+    single cluster of the backend).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        cluster: str = "",
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state_gauge = KUBERNETES_API_CIRCUIT_STATE.labels(cluster=cluster)
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._state = state
+        self._state_gauge.set(state)
+
+    def before_call(self) -> None:
+        """
+        Check whether an API call is allowed.
+
+        Raises
+        ------
+        KubernetesUnavailableError
+            If the circuit is open, or a trial call is already in progress.
+        """
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return
+            now = time.monotonic()
+            since = (
+                self._opened_at
+                if self._state == CircuitState.OPEN
+                else self._trial_started_at
+            )
+            remaining = since + self.reset_timeout - now
+            if remaining <= 0:
+                self._trial_started_at = now
+                self._set_state(CircuitState.HALF_OPEN)
+                return
+        raise KubernetesUnavailableError(
+            "Kubernetes API server is unavailable",
+            retry_after=max(remaining, 1.0),
+        )
+
+    def record_success(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures = 0
+            if self._state != CircuitState.CLOSED:
+                self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._set_state(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """Release an allowed API call without an outcome (e.g., since it failed on the
+        client side), so that a pending trial call does not block further trials."""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._trial_started_at = time.monotonic() - self.reset_timeout
+
+
+@dataclass
+class RetryPolicy:
+    """Retries of failed API calls with exponential backoff and full jitter."""
+
+    max_retries: int = 3
+    backoff: float = 0.2
+    """Base delay of the exponential backoff, in seconds"""
+    max_backoff: float = 10.0
+    """Maximum delay between retries, in seconds. Calls are not retried if the API
+    server asks to wait longer."""
+
+    def delay(
+        self, verb: str, status: int, attempt: int, retry_after: float | None = None
+    ) -> float | None:
+        """
+        The delay before retrying a failed API call, or ``None`` if it should not be retried.
+
+        Parameters
+        ----------
+        verb : str
+            The API verb of the call.
+        status : int
+            The HTTP status code of the failed call.
+        attempt : int
+            The number of the failed attempt, starting at zero.
+        retry_after : float | None, optional
+            The delay requested by the API server in the ``Retry-After`` header.
+        """
+        if attempt >= self.max_retries or status not in RETRYABLE_STATUS_CODES:
+            return None
+        # Throttled requests were not processed, so they can always be retried. Other
+        # failures are only retried for idempotent calls, unless the server asks for it.
+        if status != 429 and verb not in IDEMPOTENT_VERBS and retry_after is None:
+            return None
+
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        if retry_after is not None:
+            if retry_after > self.max_backoff:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header in seconds (HTTP dates are not supported)."""
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
+
+
+@dataclass
+class ApiCallPolicy:
+    """Rate limiting, retries, circuit breaking and read coalescing shared by all
+    Kubernetes API calls."""
+
+    limiter: RateLimiter | None = None
+    coalescer: RequestCoalescer | None = None
+    breaker: CircuitBreaker = field(default_factory=lambda: CircuitBreaker(0))
+    retry: RetryPolicy = field(default_factory=lambda: RetryPolicy(max_retries=0))
+
+    @classmethod
+    def from_settings(cls, settings: Settings, cluster: str = "") -> ApiCallPolicy:
+        return cls(
+            limiter=RateLimiter(
+                settings.k8s_rate_limit,
+                settings.k8s_verb_rate_limits,
+                timeout=settings.k8s_rate_limit_timeout,
+            ),
+            breaker=CircuitBreaker(
+                settings.k8s_circuit_failure_threshold,
+                settings.k8s_circuit_reset_timeout,
+                cluster=cluster,
+            ),
+            retry=RetryPolicy(
+                max_retries=settings.k8s_max_retries,
+                backoff=settings.k8s_retry_backoff,
+                max_backoff=settings.k8s_retry_max_backoff,
+            ),
+            coalescer=(
+                RequestCoalescer(ttl=settings.k8s_read_cache_ttl)
+                if settings.k8s_coalesce_reads
+                else None
+            ),
+        )
+
+
+@functools.cache
+def get_api_call_policy(cluster: str | None = None) -> ApiCallPolicy:
+    """The API call policy of a cluster (by default, the single cluster of the backend).
+
+    Each cluster has its own rate limits, circuit breaker and read cache."""
+    return ApiCallPolicy.from_settings(get_settings(), cluster=cluster or "")
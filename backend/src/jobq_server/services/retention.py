@@ -0,0 +1,266 @@
+"""
+Retention of finished jobs.
+
+Finished jobs (and their Kueue workloads, which are owned by the jobs) are deleted after
+a retention time, configured with ``job_retention`` and ``job_retention_rules`` in the
+server settings (see :class:`jobq_server.config.Settings`), by queue and job labels.
+
+Jobs submitted through the backend are created with a TTL (``ttlSecondsAfterFinished``),
+so that Kubernetes (or the Kuberay operator) deletes them. Existing jobs without a TTL
+are deleted by the :class:`JobReaper`, which tracks the finished workloads from the
+workload watch events (see :mod:`jobq_server.services.watcher`). The reaper archives the
+logs of each finished job in the job history (see :mod:`jobq_server.services.history`)
+first, so that they can still be queried after the job has been deleted. The TTL set at
+creation is extended by two reaper intervals, which gives the reaper time to archive the
+logs before Kubernetes deletes the job.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+from kubernetes import client
+
+from jobq_server.config import Settings, get_settings
+from jobq_server.exceptions import PodNotReadyError
+from jobq_server.services.history import HistoryStore, get_history_store
+from jobq_server.services.watcher import WorkloadEvent
+from jobq_server.utils.k8s import gvk, parse_timestamp
+from jobq_server.utils.kueue import KueueWorkload
+
+
+def retention_ttl(
+    queue: str | None,
+    labels: Mapping[str, str],
+    settings: Settings | None = None,
+) -> int | None:
+    """
+    The retention time of a finished job, from the first matching retention rule.
+
+    Parameters
+    ----------
+    queue : str | None
+        The Kueue local queue of the job.
+    labels : Mapping[str, str]
+        The labels of the job (stored as annotations of the Kubernetes resource).
+    settings : Settings | None, optional
+        The server settings, by default the settings of the backend.
+
+    Returns
+    -------
+    int | None
+        The time to keep the job after it has finished, in seconds, or ``None`` to keep
+        it indefinitely.
+    """
+    settings = settings or get_settings()
+    for rule in settings.job_retention_rules:
+        if rule.queue is not None and rule.queue != queue:
+            continue
+        if all(labels.get(k) == v for k, v in rule.labels.items()):
+            return rule.ttl
+    return settings.job_retention
+
+
+def ttl_seconds_after_finished(
+    queue: str | None, labels: Mapping[str, str]
+) -> int | None:
+    """The TTL of a job created by the backend (see the module documentation), or
+    ``None`` if the job is kept indefinitely."""
+    if (ttl := retention_ttl(queue, labels)) is None:
+        return None
+    if get_job_reaper() is not None:
+        ttl += math.ceil(2 * get_settings().job_reaper_interval)
+    return ttl
+
+
+@dataclass
+class _FinishedJob:
+    """A job whose workload has finished, with its retention state."""
+
+    workload: KueueWorkload | None
+    finished: float
+    resolved: bool = False
+    """Whether the retention time of the job has been determined."""
+    ttl: int | None = None
+    archived: bool = False
+
+
+class JobReaper:
+    """
+    Background deletion of finished jobs after their retention time.
+
+    Parameters
+    ----------
+    history : HistoryStore | None, optional
+        The job history to archive the logs of the jobs in before deleting them.
+    interval : float, optional
+        The interval between the sweeps of the finished jobs, in seconds.
+    settings : Settings | None, optional
+        The server settings with the retention rules, by default the settings of
+        the backend.
+    clock : Callable[[], float], optional
+        The current time, as a Unix timestamp.
+    """
+
+    def __init__(
+        self,
+        history: HistoryStore | None = None,
+        interval: float = 60.0,
+        settings: Settings | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.history = history
+        self.interval = interval
+        self.settings = settings
+        self.clock = clock
+        # Finished jobs by the cluster, namespace and name of their workload
+        self._finished: dict[tuple[str | None, str, str], _FinishedJob] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def record(self, events: Sequence[WorkloadEvent]) -> None:
+        """Track the finished workloads of a batch of watch events.
+
+        Can be used as a handler of :class:`~jobq_server.services.watcher.WorkloadWatcher`."""
+        with self._lock:
+            for event in events:
+                workload = event.workload
+                key = (
+                    event.cluster,
+                    workload.metadata.namespace,
+                    workload.metadata.name,
+                )
+                finished = parse_timestamp(workload.termination_timestamp)
+                if event.type == "DELETED" or finished is None:
+                    self._finished.pop(key, None)
+                elif key not in self._finished:
+                    self._finished[key] = _FinishedJob(workload, finished.timestamp())
+
+    def reap(self) -> int:
+        """Archive the logs of the finished jobs, and delete the jobs whose retention
+        time has passed.
+
+        Returns
+        -------
+        int
+            The number of deleted jobs.
+        """
+        with self._lock:
+            jobs = [
+                (key, job)
+                for key, job in self._finished.items()
+                if not job.resolved or job.ttl is not None
+            ]
+        now = self.clock()
+        deleted = 0
+        for key, job in jobs:
+            try:
+                done = self._reap(job, now)
+            except Exception:
+                logging.exception(f"Failed to reap the job of workload {key[2]!r}")
+                continue
+            if done:
+                with self._lock:
+                    self._finished.pop(key, None)
+                deleted += 1
+        return deleted
+
+    def _reap(self, job: _FinishedJob, now: float) -> bool:
+        """Process a finished job, and return whether it no longer exists."""
+        workload = job.workload
+        assert workload is not None
+        if not job.resolved:
+            try:
+                owner = workload.managed_resource.to_dict()
+            except client.ApiException as e:
+                if e.status == 404:
+                    return True
+                raise
+            annotations = owner["metadata"].get("annotations") or {}
+            job.ttl = retention_ttl(workload.spec.queueName, annotations, self.settings)
+            job.resolved = True
+            if job.ttl is None:
+                # Kept indefinitely, the workload is not needed anymore
+                job.workload = None
+                return False
+
+        if not job.archived:
+            if self.history is not None:
+                self._archive(workload)
+            job.archived = True
+
+        if job.ttl is None or now < job.finished + job.ttl:
+            return False
+        owner_ref = workload.metadata.owner_references[0]
+        logging.info(
+            f"Deleting finished {owner_ref.kind} {owner_ref.name!r} in namespace "
+            f"{workload.metadata.namespace!r} after its retention time"
+        )
+        try:
+            # The workload is deleted with its owner by the garbage collector
+            workload.k8s.delete_resource(
+                gvk({"apiVersion": owner_ref.api_version, "kind": owner_ref.kind}),
+                owner_ref.name,
+                workload.metadata.namespace,
+                propagation_policy="Background",
+            )
+        except client.ApiException as e:
+            if e.status != 404:
+                raise
+        return True
+
+    def _archive(self, workload: KueueWorkload) -> None:
+        assert self.history is not None
+        settings = self.settings or get_settings()
+        uid = workload.metadata.owner_references[0].uid
+        for pod in workload.pods:
+            try:
+                lines = workload.k8s.stream_pod_logs(pod, follow=False)
+            except PodNotReadyError:
+                # The pod has never run, e.g., after the job has failed
+                continue
+            try:
+                self.history.archive_logs(
+                    uid,
+                    pod.metadata.name,
+                    lines,
+                    max_bytes=settings.job_log_archive_max_bytes,
+                )
+            finally:
+                lines.close()
+
+    def run(self) -> None:
+        """Sweep the finished jobs periodically until the reaper is stopped."""
+        while not self._stopped.wait(self.interval):
+            self.reap()
+
+    def start(self) -> None:
+        """Start sweeping the finished jobs on a background thread."""
+        self._thread = threading.Thread(target=self.run, name="job-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        """Stop sweeping the finished jobs."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+@functools.cache
+def get_job_reaper() -> JobReaper | None:
+    """The job reaper, or ``None`` if it is disabled or no retention time is set."""
+    settings = get_settings()
+    if settings.job_reaper_interval <= 0:
+        return None
+    if settings.job_retention is None and not any(
+        rule.ttl is not None for rule in settings.job_retention_rules
+    ):
+        return None
+    return JobReaper(get_history_store(), settings.job_reaper_interval)
@@ -0,0 +1,270 @@
+"""
+Watching the Kueue resources of the managed clusters.
+
+A :class:`ResourceWatcher` lists the objects of a Kueue resource in a cluster once, and
+then keeps a watch on them. Expired watches are resumed by listing the objects again,
+and failed watches are retried with exponential backoff.
+
+A :class:`WorkloadWatcher` passes every change of the Kueue workloads to its handlers
+(e.g., the job history store, see :mod:`jobq_server.services.history`).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, ClassVar
+
+from kubernetes import client, watch
+
+from jobq_server.config import get_settings
+from jobq_server.services.clusters import get_clusters
+from jobq_server.services.k8s import KubernetesService, get_kubernetes_service
+from jobq_server.utils.k8s import ALL_NAMESPACES
+from jobq_server.utils.kueue import KueueWorkload
+
+# Server-side timeout of a single watch request, after which the watch is resumed
+WATCH_TIMEOUT_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class WorkloadEvent:
+    """A change of a Kueue workload."""
+
+    type: str
+    """The type of the change: ``ADDED``, ``MODIFIED`` or ``DELETED``. Workloads
+    found when (re-)listing the workloads are reported as ``ADDED``."""
+    workload: KueueWorkload
+    cluster: str | None = None
+    """The cluster of the workload, if the backend manages several clusters."""
+
+
+WorkloadEventHandler = Callable[[Sequence[WorkloadEvent]], None]
+
+
+def _workload(obj: dict[str, Any], k8s: KubernetesService) -> KueueWorkload:
+    # Workloads that have not been processed by Kueue yet have no status
+    status = obj.get("status") or {}
+    return KueueWorkload.from_api_object(
+        {**obj, "status": {"conditions": [], **status}}, k8s=k8s
+    )
+
+
+class ResourceWatcher(ABC):
+    """
+    Background list and watch of the objects of a Kueue resource in a cluster.
+
+    Subclasses handle the listed objects and their changes on the watcher thread.
+
+    Parameters
+    ----------
+    k8s : KubernetesService
+        The service of the cluster to watch.
+    namespace : str | None, optional
+        The namespace to watch, or :data:`ALL_NAMESPACES` for all namespaces (which
+        requires cluster-wide RBAC permissions). Defaults to the namespace of the backend.
+        Ignored for cluster-scoped resources.
+    cluster : str | None, optional
+        The name of the cluster, if the backend manages several clusters.
+    max_backoff : float, optional
+        Maximum delay between attempts to re-establish a failed watch, in seconds.
+    """
+
+    plural: ClassVar[str]
+    """The plural name of the watched Kueue resource, e.g., ``workloads``."""
+    namespaced: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        k8s: KubernetesService,
+        namespace: str | None = None,
+        cluster: str | None = None,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self.k8s = k8s
+        self.namespace = namespace
+        self.cluster = cluster
+        self.max_backoff = max_backoff
+        self._stopped = threading.Event()
+        self._watch: watch.Watch | None = None
+        self._thread: threading.Thread | None = None
+
+    @cached_property
+    def _list_call(self) -> tuple[Callable[..., Any], dict[str, Any]]:
+        """The API function listing the watched objects, and its arguments."""
+        kwargs: dict[str, Any] = {
+            "group": "kueue.x-k8s.io",
+            "version": "v1beta1",
+            "plural": self.plural,
+        }
+        namespace = self.namespace or self.k8s.namespace
+        if not self.namespaced or namespace == ALL_NAMESPACES:
+            return self.k8s.custom_objects.list_cluster_custom_object, kwargs
+        return self.k8s.custom_objects.list_namespaced_custom_object, {
+            **kwargs,
+            "namespace": namespace,
+        }
+
+    @abstractmethod
+    def on_list(self, objects: list[dict[str, Any]]) -> None:
+        """Handle all objects of the resource, after (re-)listing them."""
+
+    @abstractmethod
+    def on_event(self, type: str, obj: dict[str, Any]) -> None:
+        """Handle a change (``ADDED``, ``MODIFIED`` or ``DELETED``) of an object."""
+
+    def resync(self) -> str:
+        """List all objects, handle them, and return the resource version to resume
+        watching from."""
+        list_fn, kwargs = self._list_call
+        response = list_fn(**kwargs)
+        self.on_list(response.get("items", []))
+        return response["metadata"]["resourceVersion"]
+
+    def watch(self, resource_version: str) -> str:
+        """Watch the objects until the watch times out or is stopped, and return
+        the resource version to resume watching from.
+
+        Raises
+        ------
+        kubernetes.client.ApiException
+            With status 410 (Gone) if the resource version has expired.
+        """
+        list_fn, kwargs = self._list_call
+        self._watch = watch.Watch()
+        for event in self._watch.stream(
+            list_fn,
+            **kwargs,
+            resource_version=resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=WATCH_TIMEOUT_SECONDS,
+        ):
+            obj = event["raw_object"]
+            resource_version = obj["metadata"]["resourceVersion"]
+            if event["type"] != "BOOKMARK":
+                self.on_event(event["type"], obj)
+        return resource_version
+
+    def run(self) -> None:
+        """Keep watching the objects until the watcher is stopped."""
+        resource_version: str | None = None
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self.resync()
+                resource_version = self.watch(resource_version)
+                failures = 0
+            except Exception as e:
+                if isinstance(e, client.ApiException) and e.status == 410:
+                    # The resource version has expired, list the objects again
+                    resource_version = None
+                    continue
+                delay = min(self.max_backoff, 2.0**failures)
+                failures += 1
+                logging.warning(
+                    f"Watching Kueue {self.plural} failed, retrying in {delay:.0f}s: {e}"
+                )
+                resource_version = None
+                self._stopped.wait(delay)
+
+    def start(self) -> None:
+        """Start watching the objects on a background thread."""
+        self._thread = threading.Thread(
+            target=self.run,
+            name=f"{self.plural}-watcher-{self.cluster or 'default'}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        """Stop watching the objects.
+
+        A pending watch request is abandoned (the thread is a daemon thread), if it
+        does not return within the timeout."""
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+class WorkloadWatcher(ResourceWatcher):
+    """
+    Background watch of the Kueue workloads of a cluster.
+
+    Handlers are called on the watcher thread with batches of events: all workloads
+    once after (re-)listing them, and then each change as it happens. Failing handlers
+    are logged, but do not stop the watch.
+
+    Parameters
+    ----------
+    k8s : KubernetesService
+        The service of the cluster to watch.
+    handlers : Sequence[WorkloadEventHandler]
+        The handlers to pass the workload events to.
+    namespace : str | None, optional
+        The namespace to watch, or :data:`ALL_NAMESPACES` for all namespaces (which
+        requires cluster-wide RBAC permissions). Defaults to the namespace of the backend.
+    cluster : str | None, optional
+        The name of the cluster, if the backend manages several clusters.
+    max_backoff : float, optional
+        Maximum delay between attempts to re-establish a failed watch, in seconds.
+    """
+
+    plural = "workloads"
+
+    def __init__(
+        self,
+        k8s: KubernetesService,
+        handlers: Sequence[WorkloadEventHandler],
+        namespace: str | None = None,
+        cluster: str | None = None,
+        max_backoff: float = 60.0,
+    ) -> None:
+        super().__init__(k8s, namespace, cluster, max_backoff)
+        self.handlers = list(handlers)
+
+    def _dispatch(self, events: Sequence[WorkloadEvent]) -> None:
+        for handler in self.handlers:
+            try:
+                handler(events)
+            except Exception:
+                logging.exception(f"Workload event handler {handler!r} failed")
+
+    def on_list(self, objects: list[dict[str, Any]]) -> None:
+        self._dispatch([
+            WorkloadEvent("ADDED", _workload(obj, self.k8s), self.cluster)
+            for obj in objects
+        ])
+
+    def on_event(self, type: str, obj: dict[str, Any]) -> None:
+        self._dispatch([WorkloadEvent(type, _workload(obj, self.k8s), self.cluster)])
+
+
+def managed_clusters() -> list[tuple[str | None, KubernetesService]]:
+    """The names and services of the managed clusters (``None`` for the only cluster,
+    if the backend does not manage several clusters)."""
+    clusters = get_clusters()
+    if clusters is None:
+        return [(None, get_kubernetes_service())]
+    return [(name, clusters[name]) for name in clusters.names]
+
+
+def start_workload_watchers(
+    handlers: Sequence[WorkloadEventHandler],
+) -> list[WorkloadWatcher]:
+    """Start watching the workloads of all managed clusters (see ``watch_namespace``
+    in :class:`jobq_server.config.Settings`)."""
+    namespace = get_settings().watch_namespace
+    watchers = [
+        WorkloadWatcher(k8s, handlers, namespace, cluster=cluster)
+        for cluster, k8s in managed_clusters()
+    ]
+    for watcher in watchers:
+        watcher.start()
+    return watchers
@@ -0,0 +1,187 @@
+"""
+Optional OpenTelemetry tracing of the backend.
+
+Tracing requires the ``tracing`` extra and is configured through the server settings
+(see :class:`jobq_server.config.Settings`). If it is disabled, the instrumentation
+in this module reduces to a flag check per call.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import logging
+from collections.abc import Callable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from jobq_server.config import Settings
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:
+    propagate = None  # type: ignore[assignment]
+    trace = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SpanExporter
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_enabled = False
+
+
+def _make_exporter(settings: Settings) -> SpanExporter:
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    match settings.tracing_exporter:
+        case "console":
+            return ConsoleSpanExporter(service_name=settings.service_name)
+        case "file":
+            out = settings.tracing_file.open("a", encoding="utf-8")
+            return ConsoleSpanExporter(
+                service_name=settings.service_name,
+                out=out,
+                formatter=lambda span: span.to_json(indent=None) + "\n",
+            )
+        case "otlp":
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+
+            return OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+        case other:
+            raise ValueError(f"unsupported trace exporter: {other!r}")
+
+
+def configure_tracing(settings: Settings) -> TracerProvider | None:
+    """
+    Set up the global tracer provider according to the server settings.
+
+    Returns
+    -------
+    TracerProvider | None
+        The tracer provider, which should be shut down on exit to flush pending spans,
+        or ``None`` if tracing is disabled.
+    """
+
+    global _enabled
+
+    if settings.tracing_exporter == "none":
+        return None
+    if trace is None:
+        logging.warning(
+            "Tracing is configured, but OpenTelemetry is not installed "
+            "(install the `tracing` extra)"
+        )
+        return None
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.service_name})
+    )
+    provider.add_span_processor(BatchSpanProcessor(_make_exporter(settings)))
+    trace.set_tracer_provider(provider)
+    _enabled = True
+    return provider
+
+
+@contextlib.contextmanager
+def span(name: str, attributes: Mapping[str, Any] | None = None) -> Iterator[None]:
+    """Record the enclosed block as a span, if tracing is enabled."""
+    if not _enabled:
+        yield
+        return
+    with trace.get_tracer(__name__).start_as_current_span(name, attributes=attributes):
+        yield
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """
+    Decorator recording a span for each call of a function or coroutine function.
+
+    Exceptions raised by the function are recorded on the span.
+
+    Parameters
+    ----------
+    name : str | None, optional
+        The span name. Defaults to the qualified name of the function.
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _enabled:
+                    return await func(*args, **kwargs)
+                with trace.get_tracer(__name__).start_as_current_span(span_name):
+                    return await func(*args, **kwargs)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            with trace.get_tracer(__name__).start_as_current_span(span_name):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware recording a server span for each HTTP request.
+
+    The trace context is continued from the W3C ``traceparent`` request header, if present.
+    The span is named after the path template of the matched route.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _enabled:
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {
+            k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]
+        }
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span(
+            scope["method"],
+            context=propagate.extract(carrier),
+            kind=trace.SpanKind.SERVER,
+            attributes={
+                "http.request.method": scope["method"],
+                "url.path": scope["path"],
+            },
+        ) as server_span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    server_span.set_attribute(
+                        "http.response.status_code", message["status"]
+                    )
+                    if message["status"] >= 500:
+                        server_span.set_status(trace.StatusCode.ERROR)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if (route := getattr(scope.get("route"), "path", None)) is not None:
+                    server_span.set_attribute("http.route", route)
+                    server_span.update_name(f"{scope['method']} {route}")
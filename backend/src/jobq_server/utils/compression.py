@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Callable, Collection
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk of data and flush it, so that it can be sent immediately."""
+        ...
+
+    def finish(self) -> bytes:
+        """Terminate the compressed stream."""
+        ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int = 6) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class ZstdEncoder:
+    def __init__(self, level: int = 3) -> None:
+        if zstandard is None:
+            raise RuntimeError("zstd compression requires the `zstandard` package")
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encoders() -> dict[str, Callable[[], Encoder]]:
+    """Content codings supported by the server, in order of preference."""
+    encoders: dict[str, Callable[[], Encoder]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    encoders["gzip"] = GzipEncoder
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, supported: Collection[str]) -> str | None:
+    """
+    Select a content coding from an ``Accept-Encoding`` request header.
+
+    Codings with a higher quality value are preferred. Between codings of equal
+    quality, the order of ``supported`` decides.
+
+    Returns
+    -------
+    str | None
+        The selected coding, or ``None`` if the response should not be compressed.
+
+    Examples
+    --------
+    >>> negotiate_encoding("gzip, deflate, br, zstd", ["zstd", "gzip"])
+    'zstd'
+    >>> negotiate_encoding("zstd;q=0.5, gzip", ["zstd", "gzip"])
+    'gzip'
+    >>> negotiate_encoding("*;q=0", ["zstd", "gzip"]) is None
+    True
+    """
+
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in supported:
+        q = qualities.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with a content coding negotiated from the request.
+
+    Both gzip and (if the ``zstandard`` package is installed) zstd are supported.
+    Only responses with a compressible content type and a minimum size are compressed.
+    Streaming responses are compressed chunk by chunk, and each chunk is flushed
+    immediately, so that streamed logs reach the client without delay.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Collection[str] = (
+            "application/json",
+            "application/x-ndjson",
+            "text/plain",
+        ),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+        self.encoders = available_encoders()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(
+            headers.get("accept-encoding", ""), self.encoders.keys()
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send,
+            encoding=encoding,
+            encoder_factory=self.encoders[encoding],
+            minimum_size=self.minimum_size,
+            content_types=self.content_types,
+        )
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        encoder_factory: Callable[[], Encoder],
+        minimum_size: int,
+        content_types: Collection[str],
+    ) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+
+        self.start_message: Message | None = None
+        self.encoder: Encoder | None = None
+        self.passthrough = False
+
+    def _is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").partition(";")[0].strip()
+        return content_type in self.content_types
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Defer sending the headers until we know whether to compress the body
+            self.start_message = message
+            self.passthrough = not self._is_compressible(
+                Headers(raw=message["headers"])
+            )
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(start_message)
+                await self.send(message)
+                return
+
+            self.encoder = self.encoder_factory()
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+                body = self.encoder.compress(body)
+            else:
+                body = self.encoder.compress(body) + self.encoder.finish()
+                headers["Content-Length"] = str(len(body))
+            await self.send(start_message)
+            await self.send({**message, "body": body})
+            return
+
+        if self.passthrough or self.encoder is None:
+            await self.send(message)
+            return
+
+        body = self.encoder.compress(body) if body else b""
+        if not more_body:
+            body += self.encoder.finish()
+        await self.send({**message, "body": body})
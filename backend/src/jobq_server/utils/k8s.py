@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import datetime
+import functools
 import json
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
@@ -13,6 +17,10 @@ if TYPE_CHECKING:
     from jobq_server.models import SubmissionContext
 
 
+# Namespace selector for cluster-wide queries
+ALL_NAMESPACES = "*"
+
+
 def sanitize_rfc1123_domain_name(s: str) -> str:
     """Sanitize a string to be compliant with RFC 1123 domain name
 
@@ -60,6 +68,19 @@ def gvk(obj: KubernetesObject | dict[str, Any]) -> GroupVersionKind:
     return GroupVersionKind(group, version, kind)
 
 
+def parse_timestamp(value: datetime.datetime | str | None) -> datetime.datetime | None:
+    """Parse a Kubernetes (RFC 3339) timestamp as a timezone-aware datetime in UTC.
+
+    Datetimes without a timezone are assumed to be in UTC."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.UTC)
+    return value.astimezone(datetime.UTC)
+
+
 def filter_conditions(
     obj: Any,
     typ: str | None = None,
@@ -118,17 +139,6 @@ def filter_conditions(
     [{'type': 'Failed', 'reason': 'DeploymentFailed', 'message': 'Deployment failed due to timeout.'}]
     """
 
-    def _safe_bool(s: str | bool) -> bool:
-        if isinstance(s, bool):
-            return s
-        ls = s.lower()
-        if ls == "true":
-            return True
-        elif ls == "false":
-            return False
-        else:
-            raise ValueError(f"unexpected string literal {s!r}")
-
     def _match(cond):
         return all([
             typ is None or cond["type"] == typ,
@@ -140,6 +150,113 @@ def filter_conditions(
     return [cond for cond in traverse(obj, "status.conditions") if _match(cond)]
 
 
+def _safe_bool(s: str | bool) -> bool:
+    if isinstance(s, bool):
+        return s
+    ls = s.lower()
+    if ls == "true":
+        return True
+    elif ls == "false":
+        return False
+    else:
+        raise ValueError(f"unexpected string literal {s!r}")
+
+
+class ConditionIndex:
+    """
+    Index of Kubernetes object conditions by type and reason.
+
+    Provides the same filtering as :func:`filter_conditions`, but the conditions are
+    parsed only once, so that repeated queries against the same object are cheap.
+
+    Parameters
+    ----------
+    conditions : Iterable[Mapping[str, Any]]
+        The conditions of the object, typically its `status.conditions` field.
+
+    Notes
+    -----
+    Conditions with a status other than ``"True"`` or ``"False"`` (e.g., ``"Unknown"``)
+    never match a status filter.
+
+    Examples
+    --------
+    >>> index = ConditionIndex([
+    ...     {"type": "Admitted", "status": "True", "reason": "Admitted"},
+    ...     {"type": "Finished", "status": "True", "reason": "Succeeded"},
+    ... ])
+    >>> [c["type"] for c in index.filter(reason="Succeeded")]
+    ['Finished']
+    >>> index.filter(typ="Admitted", status=False)
+    []
+    """
+
+    def __init__(self, conditions: Iterable[Mapping[str, Any]]) -> None:
+        self._conditions: list[tuple[Mapping[str, Any], bool | None]] = []
+        self._by_type: defaultdict[str, list[int]] = defaultdict(list)
+        self._by_reason: defaultdict[str, list[int]] = defaultdict(list)
+
+        for idx, cond in enumerate(conditions):
+            try:
+                status = _safe_bool(cond.get("status", ""))
+            except ValueError:
+                status = None
+            self._conditions.append((cond, status))
+            if (typ := cond.get("type")) is not None:
+                self._by_type[typ].append(idx)
+            if (reason := cond.get("reason")) is not None:
+                self._by_reason[reason].append(idx)
+
+    def __len__(self) -> int:
+        return len(self._conditions)
+
+    def filter(
+        self,
+        typ: str | None = None,
+        reason: str | None = None,
+        message: str | None = None,
+        status: bool | None = None,
+    ) -> list[Mapping[str, Any]]:
+        """
+        Look up the conditions matching all the specified attributes.
+
+        See :func:`filter_conditions` for the semantics of the parameters.
+        The conditions are returned in their original order.
+        """
+
+        if typ is not None and reason is not None:
+            by_reason = set(self._by_reason.get(reason, ()))
+            candidates: Iterable[int] = (
+                i for i in self._by_type.get(typ, ()) if i in by_reason
+            )
+        elif typ is not None:
+            candidates = self._by_type.get(typ, ())
+        elif reason is not None:
+            candidates = self._by_reason.get(reason, ())
+        else:
+            candidates = range(len(self._conditions))
+
+        result = []
+        for i in candidates:
+            cond, cond_status = self._conditions[i]
+            if status is not None and cond_status != status:
+                continue
+            if message is not None and cond.get("message") != message:
+                continue
+            result.append(cond)
+        return result
+
+    def first(
+        self,
+        typ: str | None = None,
+        reason: str | None = None,
+        status: bool | None = None,
+    ) -> Mapping[str, Any] | None:
+        """Return the first condition matching the specified attributes, if any."""
+        conds = self.filter(typ=typ, reason=reason, status=status)
+        return conds[0] if conds else None
+
+
 class AttributeMapping(Protocol):
     attribute_map: dict[str, str]
 
@@ -147,22 +264,63 @@ class AttributeMapping(Protocol):
 T = TypeVar("T", bound=AttributeMapping)
 
 
+@functools.cache
+def _reverse_attribute_map(cls: type[AttributeMapping]) -> dict[str, str]:
+    """Map the JSON attribute names of a Kubernetes model class to its Python attribute names."""
+    return {v: k for k, v in cls.attribute_map.items()}
+
+
+@functools.cache
+def _local_vars_configuration() -> client.Configuration:
+    """Client configuration shared by the Kubernetes objects created by `build_metadata`.
+
+    Kubernetes model classes create a new configuration for each instance by default,
+    which dominates the cost of instantiating them."""
+    return client.Configuration()
+
+
 def build_metadata(
     obj: dict[str, Any] | client.V1ObjectMeta,
+    include_managed_fields: bool = True,
 ) -> client.V1ObjectMeta:
-    """Instantiate a Kubernetes object metadata from a dictionary or existing instance."""
+    """
+    Instantiate a Kubernetes object metadata from a dictionary or existing instance.
 
-    def _attribute_name(attribute_map: dict[str, str], attribute: str) -> str:
-        """Convert an attribute name in a dict to snake case name in a Kubernetes object."""
-        return next(k for k, v in attribute_map.items() if v == attribute)
+    Parameters
+    ----------
+    obj : dict[str, Any] | client.V1ObjectMeta
+        The metadata as returned by the API server, or an existing instance,
+        which is returned unchanged.
+    include_managed_fields : bool, optional
+        Whether to include the `managedFields` entries. These make up the bulk of the
+        metadata of most objects, but are rarely needed. Default is True.
+
+    Returns
+    -------
+    client.V1ObjectMeta
+        The object metadata.
+
+    Notes
+    -----
+    Attributes unknown to the Kubernetes client models are ignored.
+    """
+
+    config = _local_vars_configuration()
 
     def _make(cls: type[T], obj: dict[str, Any]) -> T:
         """Map a dictionary to a Kubernetes object non-recursively."""
-        return cls(**{_attribute_name(cls.attribute_map, k): v for k, v in obj.items()})
+        names = _reverse_attribute_map(cls)
+        return cls(
+            **{names[k]: v for k, v in obj.items() if k in names},
+            local_vars_configuration=config,
+        )
 
     if isinstance(obj, client.V1ObjectMeta):
         return obj
 
+    if not include_managed_fields and "managedFields" in obj:
+        obj = {k: v for k, v in obj.items() if k != "managedFields"}
+
     metadata = _make(client.V1ObjectMeta, obj)
     if metadata.owner_references:
         metadata.owner_references = [
@@ -1,15 +1,20 @@
+from collections import defaultdict
 from collections.abc import Mapping
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, cast
+from decimal import Decimal
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Self, cast
 
 from jobq.job import Job
 from jobq.utils.helpers import remove_none_values
-from kubernetes import client, dynamic
-from pydantic import UUID4, BaseModel, ConfigDict, field_validator
+from kubernetes import client
+from kubernetes.utils import parse_quantity
+from pydantic import UUID4, BaseModel, ConfigDict, PrivateAttr, field_validator
 
 from jobq_server.exceptions import WorkloadNotFound
+from jobq_server.tracing import traced
 from jobq_server.utils.helpers import traverse
-from jobq_server.utils.k8s import build_metadata, filter_conditions, gvk
+from jobq_server.utils.k8s import ALL_NAMESPACES, ConditionIndex, build_metadata, gvk
 
 if TYPE_CHECKING:
     from jobq_server.models import JobStatus
@@ -18,10 +23,13 @@ if TYPE_CHECKING:
 JobId = UUID4
 
 
-def assert_kueue_localqueue(namespace: str, name: str) -> bool:
+@traced()
+def assert_kueue_localqueue(
+    k8s: "KubernetesService", namespace: str, name: str
+) -> bool:
     """Check the existence of a Kueue `LocalQueue` in a namespace."""
     try:
-        _ = client.CustomObjectsApi().get_namespaced_custom_object(
+        _ = k8s.custom_objects.get_namespaced_custom_object(
             "kueue.x-k8s.io",
             "v1beta1",
             namespace,
@@ -33,10 +41,11 @@ def assert_kueue_localqueue(namespace: str, name: str) -> bool:
         return False
 
 
-def assert_kueue_workloadpriorityclass(name: str) -> bool:
+@traced()
+def assert_kueue_workloadpriorityclass(k8s: "KubernetesService", name: str) -> bool:
     """Check the existence of a Kueue `WorkloadPriorityClass` in the cluster."""
     try:
-        _ = client.CustomObjectsApi().get_cluster_custom_object(
+        _ = k8s.custom_objects.get_cluster_custom_object(
             "kueue.x-k8s.io",
             "v1beta1",
             "workloadpriorityclasses",
@@ -47,7 +56,26 @@ def assert_kueue_workloadpriorityclass(name: str) -> bool:
         return False
 
 
-def kueue_scheduling_labels(job: Job, namespace: str) -> Mapping[str, str]:
+@traced()
+def kueue_resource_flavor(k8s: "KubernetesService", name: str) -> dict[str, Any] | None:
+    """Get a Kueue `ResourceFlavor`, or ``None`` if it does not exist."""
+    try:
+        return k8s.custom_objects.get_cluster_custom_object(
+            "kueue.x-k8s.io",
+            "v1beta1",
+            "resourceflavors",
+            name,
+        )
+    except client.exceptions.ApiException as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+@traced()
+def kueue_scheduling_labels(
+    job: Job, namespace: str, k8s: "KubernetesService"
+) -> Mapping[str, str]:
     """Determine the Kubernetes labels controlling Kueue features such as queues and priority for a job."""
 
     if not job.options:
@@ -56,10 +84,10 @@ def kueue_scheduling_labels(job: Job, namespace: str) -> Mapping[str, str]:
         return {}
 
     if queue := sched_opts.queue_name:
-        if not assert_kueue_localqueue(namespace, queue):
+        if not assert_kueue_localqueue(k8s, namespace, queue):
             raise ValueError(f"Specified Kueue local queue does not exist: {queue!r}")
     if pc := sched_opts.priority_class:
-        if not assert_kueue_workloadpriorityclass(pc):
+        if not assert_kueue_workloadpriorityclass(k8s, pc):
             raise ValueError(
                 f"Specified Kueue workload priority class does not exist: {pc!r}"
             )
@@ -77,17 +105,72 @@ def kueue_scheduling_labels(job: Job, namespace: str) -> Mapping[str, str]:
     )
 
 
-def workload_by_managed_uid(uid: "JobId", namespace: str):
-    """Find a Kueue Workload by the UID of its underlying job."""
+def cluster_queue_headroom(
+    cluster_queue: Mapping[str, Any], requests: Mapping[str, str]
+) -> float | None:
+    """Determine the free quota of a Kueue ``ClusterQueue`` after admitting a job.
+
+    Parameters
+    ----------
+    cluster_queue : Mapping[str, Any]
+        The ``ClusterQueue`` resource, as returned by the Kubernetes API.
+    requests : Mapping[str, str]
+        The resource requests of the job, as Kubernetes quantities (e.g., ``{"cpu": "500m"}``).
+
+    Returns
+    -------
+    float | None
+        The smallest remaining fraction of the nominal quota of any requested resource,
+        summed over all resource flavors. Negative if the job does not fit into the
+        free quota, and ``None`` if the queue has no quota for a requested resource.
+    """
 
-    api = client.CustomObjectsApi()
-    objs = api.list_namespaced_custom_object(
-        "kueue.x-k8s.io",
-        "v1beta1",
-        namespace,
-        "workloads",
-        label_selector=f"kueue.x-k8s.io/job-uid={uid}",
-    ).get("items")
+    nominal: dict[str, Decimal] = defaultdict(Decimal)
+    for group in traverse(cluster_queue, "spec.resourceGroups", strict=False) or []:
+        for flavor in group.get("flavors", []):
+            for resource in flavor.get("resources", []):
+                nominal[resource["name"]] += parse_quantity(resource["nominalQuota"])
+
+    # Quota reserved by admitted workloads (reported as usage by older Kueue versions)
+    status = cluster_queue.get("status") or {}
+    used: dict[str, Decimal] = defaultdict(Decimal)
+    for flavor in status.get("flavorsReservation") or status.get("flavorsUsage") or []:
+        for resource in flavor.get("resources", []):
+            used[resource["name"]] += parse_quantity(resource.get("total", "0"))
+
+    headroom = 1.0
+    for name, quantity in requests.items():
+        requested = parse_quantity(quantity)
+        if requested == 0:
+            continue
+        if not nominal.get(name):
+            return None
+        headroom = min(
+            headroom, float((nominal[name] - used[name] - requested) / nominal[name])
+        )
+    return headroom
+
+
+@traced()
+def workload_by_managed_uid(uid: "JobId", namespace: str, k8s: "KubernetesService"):
+    """Find a Kueue Workload by the UID of its underlying job.
+
+    The namespace can be :data:`ALL_NAMESPACES` to search all namespaces with a single
+    cluster-scoped query, which requires cluster-wide RBAC permissions."""
+
+    label_selector = f"kueue.x-k8s.io/job-uid={uid}"
+    if namespace == ALL_NAMESPACES:
+        objs = k8s.custom_objects.list_cluster_custom_object(
+            "kueue.x-k8s.io", "v1beta1", "workloads", label_selector=label_selector
+        ).get("items")
+    else:
+        objs = k8s.custom_objects.list_namespaced_custom_object(
+            "kueue.x-k8s.io",
+            "v1beta1",
+            namespace,
+            "workloads",
+            label_selector=label_selector,
+        ).get("items")
 
     if not objs:
         raise WorkloadNotFound(uid=uid, namespace=namespace)
@@ -115,6 +198,11 @@ class WorkloadStatus(BaseModel):
     reclaimablePods: list | None = None
     admissionChecks: list | None = None
 
+    @cached_property
+    def condition_index(self) -> ConditionIndex:
+        """Index of the workload conditions, parsed on first access."""
+        return ConditionIndex(self.conditions)
+
 
 class KueueWorkload(BaseModel):
     """Wrapper class for Kueue Workload resources.
@@ -126,6 +214,11 @@ class KueueWorkload(BaseModel):
     spec: WorkloadSpec
     status: WorkloadStatus
 
+    # Kubernetes service used to look up related resources (e.g., pods). Unlike the
+    # cached status properties below, it takes part in equality (as a private attribute),
+    # so that the same workload seen in two clusters does not compare equal.
+    _k8s: "KubernetesService | None" = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
@@ -138,27 +231,74 @@ class KueueWorkload(BaseModel):
     def owner_uid(self) -> JobId:
         return self.metadata.owner_references[0].uid
 
+    def _service(self) -> "KubernetesService":
+        if self._k8s is None:
+            raise RuntimeError(
+                f"Workload {self.metadata.name!r} is not bound to a Kubernetes service"
+            )
+        return self._k8s
+
+    @property
+    def k8s(self) -> "KubernetesService":
+        """The service of the cluster the workload was retrieved from."""
+        return self._service()
+
     @classmethod
-    def for_managed_resource(cls, uid: str, namespace: str):
-        workload = workload_by_managed_uid(uid, namespace)
+    def from_api_object(
+        cls,
+        obj: Mapping[str, Any],
+        k8s: "KubernetesService | None" = None,
+        include_managed_fields: bool = False,
+    ) -> Self:
+        """Create a workload from a trusted Kueue `Workload` object returned by the API server.
+
+        Skips pydantic validation, as well as the `managedFields` metadata unless requested,
+        which makes it considerably faster than `model_validate` for bulk listings.
+        Related resources of the workload are looked up through `k8s`, if given.
+        """
+        status = obj["status"]
+        admission = status.get("admission")
+        workload = cls.model_construct(
+            metadata=build_metadata(
+                obj["metadata"], include_managed_fields=include_managed_fields
+            ),
+            spec=WorkloadSpec.model_construct(**obj["spec"]),
+            status=WorkloadStatus.model_construct(**{
+                **status,
+                "admission": (
+                    WorkloadAdmission.model_construct(**admission)
+                    if admission is not None
+                    else None
+                ),
+            }),
+        )
+        workload._k8s = k8s
+        return workload
+
+    @classmethod
+    def for_managed_resource(cls, uid: str, namespace: str, k8s: "KubernetesService"):
+        workload = workload_by_managed_uid(uid, namespace, k8s)
         if workload.get("status") is None:
             raise WorkloadNotFound(uid=uid, namespace=namespace)
-        result = cls.model_validate(workload)
-        return result
+        return cls.from_api_object(workload, k8s=k8s)
 
-    @property
+    # The status properties below are derived from the workload conditions.
+    # Since workloads are snapshots of the cluster state, they are computed only once,
+    # and cached in the instance dict, which (unlike private attributes) is left out of
+    # equality, so that evaluating them does not change how workloads compare.
+
+    @cached_property
     def execution_status(self) -> "JobStatus":
         from jobq_server.models import JobStatus
 
-        if filter_conditions(self, reason="Succeeded"):
+        conditions = self.status.condition_index
+        if conditions.first(reason="Succeeded"):
             return JobStatus.SUCCEEDED
-        elif filter_conditions(self, reason="Failed"):
+        elif conditions.first(reason="Failed"):
             return JobStatus.FAILED
-        elif filter_conditions(self, typ="Admitted", status=True):
+        elif conditions.first(typ="Admitted", status=True):
             return JobStatus.EXECUTING
-        elif filter_conditions(
-            self, typ="QuotaReserved", status=False, reason="Inadmissible"
-        ):
+        elif self.was_inadmissible:
             return JobStatus.INADMISSIBLE
         else:
             return JobStatus.PENDING
@@ -167,35 +307,40 @@ class KueueWorkload(BaseModel):
     def submission_timestamp(self) -> datetime:
         return self.metadata.creation_timestamp  # type: ignore
 
-    @property
+    @cached_property
     def last_admission_timestamp(self) -> datetime | None:
-        conds = filter_conditions(self, typ="Admitted", status=True)
-        return conds[0]["lastTransitionTime"] if conds else None
+        cond = self.status.condition_index.first(typ="Admitted", status=True)
+        return cond["lastTransitionTime"] if cond else None
 
-    @property
+    @cached_property
     def termination_timestamp(self) -> datetime | None:
-        conds = filter_conditions(self, typ="Finished")
-        return conds[0]["lastTransitionTime"] if conds else None
+        cond = self.status.condition_index.first(typ="Finished")
+        return cond["lastTransitionTime"] if cond else None
 
-    @property
+    @cached_property
+    def eviction_timestamp(self) -> datetime | None:
+        cond = self.status.condition_index.first(typ="Evicted", status=True)
+        return cond["lastTransitionTime"] if cond else None
+
+    @cached_property
     def was_evicted(self) -> bool:
         """Check if the workload was evicted (preempted) at any point in its lifecycle."""
-        conds = filter_conditions(self, reason="Preempted")
-        return bool(conds)
+        return self.status.condition_index.first(reason="Preempted") is not None
 
-    @property
+    @cached_property
     def was_inadmissible(self) -> bool:
         """Check if the workload was inadmissible at any point in its lifecycle."""
-        conds = filter_conditions(
-            self, typ="QuotaReserved", status=False, reason="Inadmissible"
+        cond = self.status.condition_index.first(
+            typ="QuotaReserved", status=False, reason="Inadmissible"
         )
-        return bool(conds)
+        return cond is not None
 
     @property
+    @traced()
     def managed_resource(self):
         owner_ref: client.V1OwnerReference = self.metadata.owner_references[0]
 
-        dyn = dynamic.DynamicClient(client.ApiClient())
+        dyn = self._service().dynamic
         resource = dyn.resources.get(
             api_version=owner_ref.api_version, kind=owner_ref.kind
         )
@@ -203,8 +348,9 @@ class KueueWorkload(BaseModel):
         return owner
 
     @property
+    @traced()
     def pods(self) -> list[client.V1Pod]:
-        api = client.CoreV1Api()
+        k8s = self._service()
 
         if self.managed_resource.kind == "Job":
             # Jobs are simple, they directly control the pods (which we can look up by their controller UID)
@@ -224,7 +370,7 @@ class KueueWorkload(BaseModel):
             # Once we know the job, we can find the pods as usual.
 
             rayjob_name = self.metadata.owner_references[0].name
-            submission_jobs: client.BatchV1JobList = client.BatchV1Api().list_namespaced_job(
+            submission_jobs: client.BatchV1JobList = k8s.batch_v1.list_namespaced_job(
                 namespace=self.metadata.namespace,
                 label_selector=f"ray.io/originated-from-crd=RayJob,ray.io/originated-from-cr-name={rayjob_name}",
             )
@@ -241,7 +387,7 @@ class KueueWorkload(BaseModel):
         else:
             raise ValueError(f"Unsupported resource kind: {self.managed_resource.kind}")
 
-        pods: list[client.V1Pod] = api.list_namespaced_pod(
+        pods: list[client.V1Pod] = k8s.core_v1.list_namespaced_pod(
             namespace=self.metadata.namespace,
             label_selector=f"controller-uid={controller_uid}",
         ).items
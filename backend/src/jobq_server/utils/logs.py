@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass, field
+from re import _constants, _parser
+from typing import Any
+
+_REPEATS = (_constants.MAX_REPEAT, _constants.MIN_REPEAT, _constants.POSSESSIVE_REPEAT)
+
+
+@dataclass
+class LineMatch:
+    """A single line matching a search pattern, along with its surrounding context."""
+
+    line_number: int
+    line: str
+    context_before: list[str] = field(default_factory=list)
+    context_after: list[str] = field(default_factory=list)
+
+
+def grep(
+    lines: Iterable[str],
+    pattern: re.Pattern[str],
+    context: int = 0,
+) -> Generator[LineMatch, None, None]:
+    """
+    Search an iterable of lines for a regular expression.
+
+    The input is consumed lazily, so that arbitrarily large inputs can be searched
+    in constant memory (bounded by the amount of context lines).
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines to search, without trailing line breaks.
+    pattern : re.Pattern[str]
+        The compiled regular expression to search for.
+    context : int, optional
+        The number of lines of context to include before and after each match.
+        Default is 0.
+
+    Yields
+    ------
+    LineMatch
+        The matching lines (with 1-based line numbers), in input order.
+
+    Examples
+    --------
+    >>> lines = ["foo", "bar", "baz"]
+    >>> [m.line_number for m in grep(lines, re.compile("ba"))]
+    [2, 3]
+    >>> next(grep(lines, re.compile("bar"), context=1))
+    LineMatch(line_number=2, line='bar', context_before=['foo'], context_after=['baz'])
+    """
+
+    before: deque[str] = deque(maxlen=context)
+    # Matches that are still waiting for their trailing context lines
+    pending: deque[LineMatch] = deque()
+
+    for line_number, line in enumerate(lines, start=1):
+        for match in pending:
+            match.context_after.append(line)
+        while pending and len(pending[0].context_after) >= context:
+            yield pending.popleft()
+
+        if pattern.search(line):
+            match = LineMatch(
+                line_number=line_number,
+                line=line,
+                context_before=list(before),
+            )
+            if context:
+                pending.append(match)
+            else:
+                yield match
+
+        if context:
+            before.append(line)
+
+    # Flush matches at the end of the input, which have incomplete trailing context
+    yield from pending
+
+
+def has_nested_quantifier(pattern: str, flags: int = 0) -> bool:
+    """
+    Check whether a regular expression repeats a variable-length repetition, like
+    ``(a+)+``, whose backtracking takes exponential time on non-matching inputs.
+
+    Examples
+    --------
+    >>> has_nested_quantifier(r"(a+)+$")
+    True
+    >>> has_nested_quantifier(r"(ab)+c*")
+    False
+    """
+
+    def nested(items: Any, repeated: bool) -> bool:
+        if isinstance(items, _parser.SubPattern):
+            for op, av in items:
+                if op in _REPEATS:
+                    lo, hi, sub = av
+                    variable = lo != hi
+                    if (repeated and variable) or nested(sub, variable and hi > 1):
+                        return True
+                elif nested(av, repeated):
+                    return True
+        elif isinstance(items, list | tuple):
+            return any(nested(item, repeated) for item in items)
+        return False
+
+    return nested(_parser.parse(pattern, flags), False)
@@ -0,0 +1,88 @@
+"""
+Streaming quantile sketches.
+
+A :class:`QuantileSketch` summarizes a stream of non-negative values (e.g., durations) in
+logarithmically sized buckets, following DDSketch (Masson et al., "DDSketch: A fast and
+fully-mergeable quantile sketch with relative-error guarantees", VLDB 2019). Quantiles
+are estimated with a bounded relative error, in memory logarithmic in the range of the
+values, and sketches of disjoint streams can be merged exactly, e.g., to aggregate the
+sketches of consecutive time intervals.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Parameters
+    ----------
+    relative_accuracy : float, optional
+        The maximum relative error of the estimated quantiles, e.g., 0.01 for 1%.
+    min_value : float, optional
+        Values below this are counted as zero.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-3):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Counter[int] = Counter()
+        self._zeros = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a value to the sketch. Negative values are counted as zero."""
+        value = max(value, 0.0)
+        if value < self.min_value:
+            self._zeros += 1
+        else:
+            self._buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Add the values of another sketch with the same accuracy to this sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different accuracies")
+        self._buckets.update(other._buckets)
+        self._zeros += other._zeros
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the q-quantile of the values, or ``None`` if the sketch is empty."""
+        if not 0 <= q <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                # The midpoint of the bucket, in the relative sense
+                estimate = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
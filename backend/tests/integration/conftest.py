@@ -1,3 +1,5 @@
+from collections.abc import Generator
+
 import docker
 import pytest
 from fastapi.testclient import TestClient
@@ -5,6 +7,15 @@ from pytest_mock import MockFixture
 
 import jobq_server.services.k8s
 from jobq_server import app
+from jobq_server.services.k8s import get_kubernetes_service
+
+
+@pytest.fixture(autouse=True)
+def kubernetes_service() -> Generator[None, None, None]:
+    # The service of the cluster is shared by all requests, so every test gets its own
+    get_kubernetes_service.cache_clear()
+    yield
+    get_kubernetes_service.cache_clear()
 
 
 @pytest.fixture
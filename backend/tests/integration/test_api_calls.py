@@ -0,0 +1,324 @@
+"""Kubernetes API calls made by the endpoints, against the benchmark fake API server."""
+
+import asyncio
+import time
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+from benchmarks.fake_apiserver import FakeApiServer, FakeCluster
+from fastapi.testclient import TestClient
+from kubernetes.config import kube_config
+from pytest_mock import MockerFixture
+
+from jobq_server import app
+from jobq_server.config import get_settings
+from jobq_server.routers.jobs import FORBIDDEN_NAMESPACES_HEADER
+from jobq_server.services.k8s import KubernetesService
+from jobq_server.services.resilience import get_api_call_policy
+from jobq_server.utils.k8s import GroupVersionKind
+
+
+@pytest.fixture(autouse=True)
+def api_call_policy(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    # Fresh rate limiters and circuit breaker for each test, with quick retries
+    monkeypatch.setenv("JOBQ_SERVER_K8S_RETRY_BACKOFF", "0.001")
+    monkeypatch.setenv("JOBQ_SERVER_K8S_CIRCUIT_FAILURE_THRESHOLD", "6")
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+    yield
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+
+
+@pytest.fixture
+def fake_cluster(request: pytest.FixtureRequest) -> FakeCluster:
+    namespace = getattr(request, "param", "default")
+    return FakeCluster.populate(
+        8, pods_per_workload=2, namespace=namespace, rayjob_every=4, log_lines=20
+    )
+
+
+# Jobs distributed round-robin over three namespaces
+multi_namespace = pytest.mark.parametrize(
+    "fake_cluster", [["default", "team-a", "team-b"]], indirect=True
+)
+
+
+@pytest.fixture
+def fake_server(
+    fake_cluster: FakeCluster, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[FakeApiServer, None, None]:
+    with FakeApiServer(fake_cluster) as server:
+        kubeconfig = server.write_kubeconfig(tmp_path / "kubeconfig")
+        monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+        monkeypatch.setattr(
+            kube_config, "KUBE_CONFIG_DEFAULT_LOCATION", str(kubeconfig)
+        )
+        yield server
+
+
+@pytest.fixture
+def api_client(fake_server: FakeApiServer) -> TestClient:
+    return TestClient(app)
+
+
+def _calls(server: FakeApiServer) -> dict[str, int]:
+    # API discovery depends on the disk cache of the dynamic client, so is not counted
+    return {
+        f"{verb} {resource}": n
+        for (verb, resource), n in server.calls.items()
+        if resource != "discovery"
+    }
+
+
+def test_list_jobs(api_client: TestClient, fake_server: FakeApiServer):
+    response = api_client.get("/jobs")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 8
+    assert _calls(fake_server) == {"list workloads": 1}
+
+
+def test_status(
+    api_client: TestClient, fake_server: FakeApiServer, fake_cluster: FakeCluster
+):
+    # The second job is a running batch job
+    uid = fake_cluster.job_uids()[1]
+
+    response = api_client.get(f"/jobs/{uid}/status")
+
+    assert response.status_code == 200
+    assert response.json()["execution_status"] == "executing"
+    assert _calls(fake_server) == {
+        "list workloads": 1,
+        "list pods": 1,
+        "get jobs": 1,
+    }
+
+
+def test_logs(
+    api_client: TestClient, fake_server: FakeApiServer, fake_cluster: FakeCluster
+):
+    uid = fake_cluster.job_uids()[1]
+
+    response = api_client.get(f"/jobs/{uid}/logs", params={"tail": 5})
+
+    assert response.status_code == 200
+    assert fake_server.calls["get", "pods/log"] == 2
+    # Plain-text responses are decoded, also when read through the coalescer
+    lines = response.json().splitlines()
+    assert len(lines) == 10
+    assert all(line.startswith("2024-01-01T") for line in lines)
+
+
+def test_submit_job(
+    api_client: TestClient, fake_server: FakeApiServer, fake_cluster: FakeCluster
+):
+    response = api_client.post(
+        "/jobs",
+        json={
+            "name": "test-job",
+            "file": "test_example.py",
+            "image_ref": "localhost:5000/hello-world-dev:latest",
+            "mode": "kueue",
+            "options": {"scheduling": {"queue_name": "user-queue"}},
+        },
+    )
+
+    assert response.status_code == 200
+    assert _calls(fake_server) == {"get localqueues": 1, "create jobs": 1}
+    # The fake API server creates a pending Kueue workload for the new job
+    assert response.json()["uid"] in fake_cluster.job_uids()
+
+
+def test_service_is_shared(
+    api_client: TestClient, fake_server: FakeApiServer, mocker: MockerFixture
+):
+    init = mocker.spy(KubernetesService, "__init__")
+
+    for _ in range(3):
+        assert api_client.get("/jobs").status_code == 200
+
+    # All requests share the API client, its connection pool and the call policy
+    assert init.call_count == 1
+    assert _calls(fake_server) == {"list workloads": 3}
+
+
+@multi_namespace
+def test_list_jobs_namespaces(api_client: TestClient, fake_server: FakeApiServer):
+    response = api_client.get(
+        "/jobs", params=[("namespace", "default,team-b"), ("namespace", "team-b")]
+    )
+
+    assert response.status_code == 200
+    assert [job["id"]["namespace"] for job in response.json()] == [
+        "default",
+        "team-b",
+        "default",
+        "team-b",
+        "default",
+    ]
+    assert FORBIDDEN_NAMESPACES_HEADER not in response.headers
+    assert _calls(fake_server) == {"list workloads": 2}
+
+
+@multi_namespace
+def test_list_jobs_all_namespaces(
+    api_client: TestClient, fake_server: FakeApiServer, fake_cluster: FakeCluster
+):
+    response = api_client.get("/jobs", params={"namespace": "*"})
+
+    assert response.status_code == 200
+    # A single cluster-scoped call, results in submission order
+    assert [job["id"]["uid"] for job in response.json()] == fake_cluster.job_uids()
+    assert _calls(fake_server) == {"list workloads": 1}
+
+
+@multi_namespace
+def test_list_jobs_forbidden_namespaces(
+    api_client: TestClient, fake_server: FakeApiServer
+):
+    fake_server.forbidden = {None, "team-a"}
+
+    # Without cluster-wide access, the namespaces are listed one by one,
+    # and forbidden namespaces are skipped
+    response = api_client.get("/jobs", params={"namespace": "*"})
+
+    assert response.status_code == 200
+    assert {job["id"]["namespace"] for job in response.json()} == {"default", "team-b"}
+    assert response.headers[FORBIDDEN_NAMESPACES_HEADER] == "team-a"
+    assert _calls(fake_server) == {"list workloads": 4, "list namespaces": 1}
+
+    # Access to all requested namespaces is forbidden
+    response = api_client.get("/jobs", params={"namespace": "team-a"})
+    assert response.status_code == 403
+
+
+@multi_namespace
+def test_status_namespaces(
+    api_client: TestClient, fake_server: FakeApiServer, fake_cluster: FakeCluster
+):
+    # The second job is a running batch job in the "team-a" namespace
+    uid = fake_cluster.job_uids()[1]
+
+    response = api_client.get(f"/jobs/{uid}/status")
+    assert response.status_code == 404
+
+    response = api_client.get(
+        f"/jobs/{uid}/status", params={"namespace": "default,team-a"}
+    )
+    assert response.status_code == 200
+
+    fake_server.forbidden = {None}
+    fake_server.reset_calls()
+    response = api_client.get(f"/jobs/{uid}/status", params={"namespace": "*"})
+    assert response.status_code == 200
+    assert response.json()["execution_status"] == "executing"
+    assert _calls(fake_server) == {
+        "list workloads": 4,
+        "list namespaces": 1,
+        "list pods": 1,
+        "get jobs": 1,
+    }
+
+
+def test_throttled_calls_are_retried(
+    api_client: TestClient, fake_server: FakeApiServer
+):
+    fake_server.fail_next(2, status=429, retry_after=0)
+
+    response = api_client.get("/jobs")
+
+    assert response.status_code == 200
+    assert _calls(fake_server) == {"list workloads": 3}
+
+
+def test_api_calls_do_not_block_event_loop(fake_server: FakeApiServer):
+    fake_server.latency = 0.5
+
+    async def requests() -> tuple[float, int]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            start = time.perf_counter()
+            jobs = asyncio.create_task(c.get("/jobs"))
+            await asyncio.sleep(0.1)
+            assert (await c.get("/health")).status_code == 200
+            return time.perf_counter() - start, (await jobs).status_code
+
+    health_done, jobs_status = asyncio.run(requests())
+
+    # The health check is served while the jobs are being listed
+    assert health_done < 0.4
+    assert jobs_status == 200
+
+
+def test_unavailable_api_server(api_client: TestClient, fake_server: FakeApiServer):
+    fake_server.fail_next(100, status=503, retry_after=0)
+
+    response = api_client.get("/jobs")
+
+    # Retried three times, then reported as unavailable instead of an internal error
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "0"
+    assert _calls(fake_server) == {"list workloads": 4}
+
+    # The circuit breaker opens after six consecutive failures
+    response = api_client.get("/jobs")
+    assert response.status_code == 503
+    assert _calls(fake_server) == {"list workloads": 6}
+
+    # ... and then rejects calls without reaching the API server
+    response = api_client.get("/jobs")
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) > 0
+    assert _calls(fake_server) == {"list workloads": 6}
+
+
+def test_concurrent_reads_are_coalesced(fake_server: FakeApiServer):
+    fake_server.latency = 0.2
+    services = [KubernetesService() for _ in range(10)]
+
+    with ThreadPoolExecutor(len(services)) as pool:
+        results = list(pool.map(lambda k8s: k8s.list_workloads("default"), services))
+
+    assert [len(r) for r in results] == [8] * 10
+    assert _calls(fake_server) == {"list workloads": 1}
+
+
+def test_concurrent_requests_are_coalesced(fake_server: FakeApiServer):
+    fake_server.latency = 0.2
+
+    async def requests() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            return await asyncio.gather(*(c.get("/jobs") for _ in range(10)))
+
+    responses = asyncio.run(requests())
+
+    assert [len(r.json()) for r in responses] == [8] * 10
+    assert _calls(fake_server) == {"list workloads": 1}
+
+
+def test_read_cache(
+    fake_server: FakeApiServer,
+    fake_cluster: FakeCluster,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("JOBQ_SERVER_K8S_READ_CACHE_TTL", "60")
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+    k8s = KubernetesService()
+
+    for _ in range(3):
+        assert len(k8s.list_workloads("default")) == 8
+    assert _calls(fake_server) == {"list workloads": 1}
+
+    # Writes invalidate the cache
+    k8s.delete_resource(
+        GroupVersionKind("batch", "v1", "Job"), "job-1", namespace="default"
+    )
+    k8s.list_workloads("default")
+    assert fake_server.calls["list", "workloads"] == 2
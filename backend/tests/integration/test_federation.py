@@ -0,0 +1,161 @@
+"""Job management across several clusters, against two benchmark fake API servers."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from benchmarks.fake_apiserver import (
+    CLUSTERQUEUES,
+    JOBS,
+    FakeApiServer,
+    FakeCluster,
+    write_kubeconfig,
+)
+from fastapi.testclient import TestClient
+from kubernetes.config import kube_config
+
+from jobq_server import app
+from jobq_server.config import get_settings
+from jobq_server.routers.jobs import UNAVAILABLE_CLUSTERS_HEADER
+from jobq_server.services.clusters import get_clusters
+from jobq_server.services.resilience import get_api_call_policy
+
+
+@pytest.fixture
+def servers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[dict[str, FakeApiServer], None, None]:
+    # Distinct jobs in both clusters: four jobs in the GPU cluster, then three in the CPU cluster
+    gpu = FakeCluster.populate(
+        4, pods_per_workload=1, log_lines=10, quota={"cpu": "32", "nvidia.com/gpu": "8"}
+    )
+    cpu = FakeCluster.populate(3, pods_per_workload=1, log_lines=10, first=4)
+    with FakeApiServer(gpu) as gpu_server, FakeApiServer(cpu) as cpu_server:
+        servers = {"gpu": gpu_server, "cpu": cpu_server}
+        kubeconfig = write_kubeconfig(tmp_path / "kubeconfig", servers)
+        monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+        monkeypatch.setattr(
+            kube_config, "KUBE_CONFIG_DEFAULT_LOCATION", str(kubeconfig)
+        )
+        monkeypatch.setenv("JOBQ_SERVER_K8S_CLUSTERS", '["gpu", "cpu"]')
+        monkeypatch.setenv("JOBQ_SERVER_K8S_RETRY_BACKOFF", "0.001")
+        get_settings.cache_clear()
+        get_api_call_policy.cache_clear()
+        get_clusters.cache_clear()
+        yield servers
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+    get_clusters.cache_clear()
+
+
+@pytest.fixture
+def api_client(servers: dict[str, FakeApiServer]) -> TestClient:
+    return TestClient(app)
+
+
+def _submission(**options) -> dict:
+    return {
+        "name": "test-job",
+        "file": "test_example.py",
+        "image_ref": "localhost:5000/hello-world-dev:latest",
+        "mode": "kueue",
+        "options": options,
+    }
+
+
+def test_list_jobs(api_client: TestClient, servers: dict[str, FakeApiServer]):
+    response = api_client.get("/jobs")
+
+    assert response.status_code == 200
+    jobs = response.json()
+    # Merged in submission order, and tagged with their cluster
+    assert [job["id"]["cluster"] for job in jobs] == ["gpu"] * 4 + ["cpu"] * 3
+    assert [job["id"]["uid"] for job in jobs] == (
+        servers["gpu"].cluster.job_uids() + servers["cpu"].cluster.job_uids()
+    )
+    assert servers["gpu"].calls["list", "workloads"] == 1
+    assert servers["cpu"].calls["list", "workloads"] == 1
+
+    response = api_client.get("/jobs", params={"cluster": "cpu"})
+    assert {job["id"]["cluster"] for job in response.json()} == {"cpu"}
+
+    response = api_client.get("/jobs", params={"cluster": "tpu"})
+    assert response.status_code == 404
+
+
+def test_list_jobs_unavailable_cluster(
+    api_client: TestClient, servers: dict[str, FakeApiServer]
+):
+    servers["cpu"].fail_next(100, status=503, retry_after=0)
+
+    response = api_client.get("/jobs")
+
+    assert response.status_code == 200
+    assert {job["id"]["cluster"] for job in response.json()} == {"gpu"}
+    assert response.headers[UNAVAILABLE_CLUSTERS_HEADER] == "cpu"
+
+
+def test_status(api_client: TestClient, servers: dict[str, FakeApiServer]):
+    uid = servers["cpu"].cluster.job_uids()[0]
+
+    # Found in any cluster, unless one is selected
+    response = api_client.get(f"/jobs/{uid}/status")
+    assert response.status_code == 200
+
+    response = api_client.get(f"/jobs/{uid}/status", params={"cluster": "gpu"})
+    assert response.status_code == 404
+
+
+def test_stop(api_client: TestClient, servers: dict[str, FakeApiServer]):
+    uid = servers["cpu"].cluster.job_uids()[0]
+
+    response = api_client.post(f"/jobs/{uid}/stop")
+
+    assert response.status_code == 200
+    assert servers["cpu"].calls["delete", "jobs"] == 1
+    assert servers["gpu"].calls["delete", "jobs"] == 0
+
+
+def test_submit_job_explicit_cluster(
+    api_client: TestClient, servers: dict[str, FakeApiServer]
+):
+    response = api_client.post(
+        "/jobs",
+        params={"cluster": "cpu"},
+        json=_submission(scheduling={"queue_name": "user-queue"}),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["cluster"] == "cpu"
+    assert servers["cpu"].calls["create", "jobs"] == 1
+
+
+def test_submit_job_routing(api_client: TestClient, servers: dict[str, FakeApiServer]):
+    # GPU jobs only fit into the GPU cluster
+    response = api_client.post(
+        "/jobs",
+        json=_submission(scheduling={"queue_name": "user-queue"}, resources={"gpu": 1}),
+    )
+    assert response.json()["cluster"] == "gpu"
+
+    # CPU jobs go to the cluster with the most free quota
+    gpu_queue = servers["gpu"].cluster.get(CLUSTERQUEUES, None, "cluster-queue")
+    gpu_queue["status"] = {
+        "flavorsReservation": [
+            {"name": "default-flavor", "resources": [{"name": "cpu", "total": "30"}]}
+        ]
+    }
+    response = api_client.post(
+        "/jobs",
+        json=_submission(
+            scheduling={"queue_name": "user-queue"}, resources={"cpu": "4"}
+        ),
+    )
+    assert response.status_code == 200
+    assert response.json()["cluster"] == "cpu"
+    assert len(servers["cpu"].cluster.list(JOBS, "default")) == 4
+
+    response = api_client.post(
+        "/jobs", json=_submission(scheduling={"queue_name": "missing-queue"})
+    )
+    assert response.status_code == 400
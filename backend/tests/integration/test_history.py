@@ -0,0 +1,110 @@
+"""Recording of the job history from workload watches, against the benchmark fake API server."""
+
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from benchmarks.fake_apiserver import FakeApiServer, FakeCluster
+from fastapi.testclient import TestClient
+from kubernetes import config
+from kubernetes.config import kube_config
+
+from jobq_server import app
+from jobq_server.config import get_settings
+from jobq_server.services.history import get_history_store
+from jobq_server.services.resilience import get_api_call_policy
+
+
+@pytest.fixture
+def fake_server(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[FakeApiServer, None, None]:
+    cluster = FakeCluster.populate(8, pods_per_workload=1, log_lines=10)
+    with FakeApiServer(cluster) as server:
+        kubeconfig = server.write_kubeconfig(tmp_path / "kubeconfig")
+        monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+        # The lifespan of the app loads the default kubeconfig
+        for module in (kube_config, config):
+            monkeypatch.setattr(module, "KUBE_CONFIG_DEFAULT_LOCATION", str(kubeconfig))
+        server.watch_timeout = 0.2
+        yield server
+
+
+@pytest.fixture
+def history_enabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    monkeypatch.setenv("JOBQ_SERVER_HISTORY_DATABASE", str(tmp_path / "history.db"))
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+    get_history_store.cache_clear()
+    yield
+    if (store := get_history_store()) is not None:
+        store.close()
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+    get_history_store.cache_clear()
+
+
+def _wait_for(
+    client: TestClient, predicate: Callable[[list[dict]], bool], **params
+) -> list[dict]:
+    deadline = time.monotonic() + 5
+    while True:
+        response = client.get("/jobs/history", params=params)
+        assert response.status_code == 200
+        if predicate(entries := response.json()) or time.monotonic() > deadline:
+            return entries
+        time.sleep(0.05)
+
+
+@pytest.mark.usefixtures("history_enabled")
+def test_history(fake_server: FakeApiServer):
+    with TestClient(app) as client:
+        # Existing workloads are recorded when the watch starts
+        entries = _wait_for(client, lambda entries: len(entries) == 8)
+        assert [entry["uid"] for entry in entries] == list(
+            reversed(fake_server.cluster.job_uids())
+        )
+        executing = client.get("/jobs/history", params={"status": "executing"})
+        assert {e["execution_status"] for e in executing.json()} == {"executing"}
+
+        # New workloads are recorded from the watch, along with the submission context
+        response = client.post(
+            "/jobs",
+            json={
+                "name": "test-job",
+                "file": "test_example.py",
+                "image_ref": "localhost:5000/hello-world-dev:latest",
+                "mode": "kueue",
+                "options": {
+                    "scheduling": {"queue_name": "user-queue"},
+                    "labels": {"team": "ml"},
+                },
+                "submission_context": {
+                    "submitter": {"username": "jane", "email": "jane@example.com"}
+                },
+            },
+        )
+        assert response.status_code == 200
+        uid = response.json()["uid"]
+
+        (entry,) = _wait_for(
+            client,
+            lambda entries: entries and entries[0].get("queue_name") is not None,
+            submitter="jane@example.com",
+        )
+        assert entry["uid"] == uid
+        assert entry["labels"] == {"team": "ml"}
+        assert entry["queue_name"] == "user-queue"
+        assert entry["execution_status"] == "pending"
+
+
+def test_history_disabled(fake_server: FakeApiServer):
+    get_settings.cache_clear()
+    get_history_store.cache_clear()
+
+    response = TestClient(app).get("/jobs/history")
+
+    assert response.status_code == 404
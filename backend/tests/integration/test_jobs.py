@@ -1,4 +1,7 @@
+import json
+import time
 import uuid
+from collections.abc import Callable, Generator, Iterable
 from datetime import datetime, timedelta
 from unittest import mock
 
@@ -7,8 +10,10 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
 from jobq import JobOptions, SchedulingOptions
 from kubernetes import client as k8s_client
+from prometheus_client import REGISTRY
 from pytest_mock import MockFixture
 
+from jobq_server.config import get_settings
 from jobq_server.exceptions import PodNotReadyError
 from jobq_server.models import (
     CreateJobModel,
@@ -116,6 +121,51 @@ def test_submit_job(
         response_model = WorkloadIdentifier.model_validate_json(response.text)
         assert response_model == job_id
 
+        submissions = REGISTRY.get_sample_value(
+            "jobq_job_submissions_total",
+            {"mode": mode.value, "runner": runner_type.__name__},
+        )
+        assert submissions is not None and submissions >= 1
+
+
+@pytest.mark.parametrize(
+    "host_path, expected_status",
+    [
+        # Node-local caches are disabled without a host cache root
+        ("data", 400),
+        ("/var/lib/kubelet", 422),
+        ("../etc", 422),
+    ],
+)
+def test_submit_job_host_cache(
+    host_path: str, expected_status: int, client: TestClient, mocker: MockFixture
+) -> None:
+    mocker.patch(
+        "jobq_server.runner.kueue.kueue_scheduling_labels",
+        return_value={"kueue.x-k8s.io/queue-name": "q"},
+    )
+    mocker.patch.object(
+        KubernetesService, "namespace", new_callable=mock.PropertyMock
+    ).return_value = "default"
+    create_job = mocker.patch.object(k8s_client.BatchV1Api, "create_namespaced_job")
+
+    response = client.post(
+        "/jobs",
+        json={
+            "image_ref": "localhost:5000/hello-world-dev:latest",
+            "name": "test-job",
+            "file": "test_example.py",
+            "mode": "kueue",
+            "options": {
+                "scheduling": {"queue_name": "q"},
+                "caches": [{"name": "data", "host_path": host_path}],
+            },
+        },
+    )
+
+    assert response.status_code == expected_status
+    create_job.assert_not_called()
+
 
 class TestJobStatus:
     def test_success(
@@ -168,7 +218,48 @@ class TestJobStatus:
         response = client.get(f"/jobs/{job_id}/status")
 
         assert response.status_code == 404
-        metadata_mock.assert_called_once_with(workload_mock.return_value)
+        metadata_mock.assert_called_once_with(workload_mock.return_value, None)
+
+    def test_fields(
+        self, workload: KueueWorkload, client: TestClient, mocker: MockFixture
+    ) -> None:
+        mocker.patch.object(
+            KueueWorkload, "for_managed_resource", return_value=workload
+        )
+        mocker.patch.object(KubernetesService, "namespace", return_value="default")
+        failed_pods_mock = mocker.patch.object(KueueWorkload, "has_failed_pods")
+
+        response = client.get(
+            f"/jobs/{workload.metadata.uid}/status",
+            params={"fields": ["was_evicted,termination_timestamp"]},
+        )
+
+        assert response.status_code == 200
+        assert response.json().keys() == {
+            "managed_resource_id",
+            "execution_status",
+            "submission_timestamp",
+            "was_evicted",
+            "termination_timestamp",
+        }
+        # Expensive fields must not be computed unless requested
+        failed_pods_mock.assert_not_called()
+
+    def test_unknown_fields(
+        self, workload: KueueWorkload, client: TestClient, mocker: MockFixture
+    ) -> None:
+        mocker.patch.object(
+            KueueWorkload, "for_managed_resource", return_value=workload
+        )
+        mocker.patch.object(KubernetesService, "namespace", return_value="default")
+
+        response = client.get(
+            f"/jobs/{workload.metadata.uid}/status",
+            params={"fields": ["spec,foo"]},
+        )
+
+        assert response.status_code == 422
+        assert "foo" in response.json()["detail"]
 
 
 class TestJobLogs:
@@ -267,6 +358,192 @@ class TestJobLogs:
         mock_pod_logs.assert_called_once()
 
 
+def _log_stream(
+    lines: Iterable[bytes], on_close: Callable[[bool], None] | None = None
+) -> Generator[bytes, None, None]:
+    try:
+        yield from lines
+    finally:
+        if on_close is not None:
+            on_close(True)
+
+
+class TestJobLogSearch:
+    @pytest.fixture(autouse=True)
+    def workload(self, mocker: MockFixture) -> None:
+        mocker.patch.object(
+            KubernetesService,
+            "workload_for_managed_resource",
+            return_value=TestJobLogs.MyWorkload(),
+        )
+
+    def test_search(self, client: TestClient, mocker: MockFixture) -> None:
+        mock_pod_logs = mocker.patch.object(
+            KubernetesService,
+            "stream_pod_logs",
+            return_value=_log_stream([b"starting\n", b"Error: boom\n", b"exiting\n"]),
+        )
+
+        job_id = uuid.uuid4()
+        response = client.get(
+            f"/jobs/{job_id}/logs/search",
+            params={"pattern": "error", "ignore_case": True, "context": 1},
+        )
+
+        assert response.is_success
+        matches = [json.loads(line) for line in response.text.splitlines()]
+        assert matches == [
+            {
+                "pod": "test-pod",
+                "line_number": 2,
+                "line": "Error: boom",
+                "context_before": ["starting"],
+                "context_after": ["exiting"],
+            }
+        ]
+        mock_pod_logs.assert_called_once_with(mock.ANY, follow=False)
+
+    @pytest.mark.parametrize(
+        "params, expected_matches",
+        [
+            ({"max_matches": 2}, 2),
+            # every match serializes to roughly 100 bytes
+            ({"max_bytes": 250}, 2),
+        ],
+    )
+    def test_search_limits(
+        self,
+        params: dict[str, int],
+        expected_matches: int,
+        client: TestClient,
+        mocker: MockFixture,
+    ) -> None:
+        mocker.patch.object(
+            KubernetesService,
+            "stream_pod_logs",
+            side_effect=lambda *args, **kwargs: _log_stream([b"match\n"] * 10),
+        )
+
+        job_id = uuid.uuid4()
+        response = client.get(
+            f"/jobs/{job_id}/logs/search", params={"pattern": "match", **params}
+        )
+
+        assert response.is_success
+        assert len(response.text.splitlines()) == expected_matches
+
+    def test_search_opens_streams_lazily(
+        self, client: TestClient, mocker: MockFixture
+    ) -> None:
+        pods = [
+            mock.Mock(
+                k8s_client.V1Pod,
+                metadata=k8s_client.V1ObjectMeta(name=name, namespace="default"),
+            )
+            for name in ("pod-0", "pod-1", "pod-2")
+        ]
+        mocker.patch.object(TestJobLogs.MyWorkload, "pods", pods)
+        closed = []
+        opened = []
+
+        def stream_pod_logs(pod, follow):
+            opened.append(pod.metadata.name)
+            if pod.metadata.name == "pod-0":
+                raise PodNotReadyError(name=pod.metadata.name, namespace="default")
+            return _log_stream([b"match\n"] * 10, on_close=closed.append)
+
+        mocker.patch.object(
+            KubernetesService, "stream_pod_logs", side_effect=stream_pod_logs
+        )
+
+        job_id = uuid.uuid4()
+        response = client.get(
+            f"/jobs/{job_id}/logs/search", params={"pattern": "match", "max_matches": 3}
+        )
+
+        assert response.is_success
+        # Pods that are not ready are skipped, and the search stops at the first
+        # stream with enough matches, which is closed
+        assert {m["pod"] for m in map(json.loads, response.text.splitlines())} == {
+            "pod-1"
+        }
+        assert opened == ["pod-0", "pod-1"]
+        assert closed == [True]
+
+    def test_search_truncates_long_lines(
+        self, client: TestClient, mocker: MockFixture
+    ) -> None:
+        mocker.patch.object(
+            KubernetesService,
+            "stream_pod_logs",
+            return_value=_log_stream([
+                b"needle" + b"a" * 10_000 + b"\n",
+                b"a" * 10_000 + b"needle\n",
+            ]),
+        )
+
+        job_id = uuid.uuid4()
+        response = client.get(
+            f"/jobs/{job_id}/logs/search", params={"pattern": "needle"}
+        )
+
+        assert response.is_success
+        # The end of the second line is beyond the searched length
+        matches = [json.loads(line) for line in response.text.splitlines()]
+        assert [(m["line_number"], len(m["line"])) for m in matches] == [(1, 4096)]
+
+    def test_search_timeout(
+        self,
+        client: TestClient,
+        mocker: MockFixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("JOBQ_SERVER_LOG_SEARCH_TIMEOUT", "0.1")
+        get_settings.cache_clear()
+        closed = []
+
+        def slow_lines() -> Generator[bytes, None, None]:
+            yield from [b"match\n"] * 2
+            time.sleep(0.2)
+            yield from [b"match\n"] * 10
+
+        mocker.patch.object(
+            KubernetesService,
+            "stream_pod_logs",
+            return_value=_log_stream(slow_lines(), on_close=closed.append),
+        )
+
+        job_id = uuid.uuid4()
+        try:
+            response = client.get(
+                f"/jobs/{job_id}/logs/search", params={"pattern": "match"}
+            )
+        finally:
+            get_settings.cache_clear()
+
+        assert response.is_success
+        # The matches found in time are followed by the timeout marker
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r.get("line_number") for r in records[:-1]] == [1, 2]
+        assert records[-1] == {"timed_out": True}
+        assert closed == [True]
+
+    # Nested quantifiers backtrack catastrophically on non-matching lines
+    @pytest.mark.parametrize("pattern", ["(unbalanced", "", "(a+)+$"])
+    def test_search_invalid_pattern(
+        self, pattern: str, client: TestClient, mocker: MockFixture
+    ) -> None:
+        mock_pod_logs = mocker.patch.object(KubernetesService, "stream_pod_logs")
+
+        job_id = uuid.uuid4()
+        response = client.get(
+            f"/jobs/{job_id}/logs/search", params={"pattern": pattern}
+        )
+
+        assert response.status_code == 422
+        mock_pod_logs.assert_not_called()
+
+
 class TestListJobs:
     def test_list_jobs(
         self, workload: KueueWorkload, client: TestClient, mocker: MockFixture
@@ -288,6 +565,32 @@ class TestListJobs:
 
         mock.assert_called_once()
 
+    def test_list_jobs_fields(
+        self, workload: KueueWorkload, client: TestClient, mocker: MockFixture
+    ) -> None:
+        mocker.patch.object(
+            KubernetesService,
+            "list_workloads",
+            return_value=[workload],
+        )
+        failed_pods_mock = mocker.patch.object(KueueWorkload, "has_failed_pods")
+
+        response = client.get(
+            "/jobs",
+            params={"include_metadata": True, "fields": ["spec", "kueue_status"]},
+        )
+
+        assert response.is_success
+        [item] = response.json()
+        assert item["metadata"].keys() == {
+            "managed_resource_id",
+            "execution_status",
+            "submission_timestamp",
+            "spec",
+            "kueue_status",
+        }
+        failed_pods_mock.assert_not_called()
+
     def test_list_jobs_empty(self, client: TestClient, mocker: MockFixture) -> None:
         mock = mocker.patch.object(
             KubernetesService,
@@ -0,0 +1,39 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from pytest_mock import MockFixture
+
+from jobq_server.services.k8s import KubernetesService
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics(client: TestClient):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for name in [
+        "jobq_http_request_duration_seconds",
+        "jobq_kubernetes_api_call_duration_seconds",
+        "jobq_active_log_streams",
+        "jobq_job_submissions_total",
+    ]:
+        assert name in response.text
+
+
+def test_http_route_labels(client: TestClient, mocker: MockFixture):
+    mocker.patch.object(
+        KubernetesService, "workload_for_managed_resource", return_value=None
+    )
+    labels = {"method": "GET", "route": "/jobs/{uid}/status", "status": "404"}
+    before = _sample("jobq_http_request_duration_seconds_count", labels)
+
+    response = client.get(f"/jobs/{uuid.uuid4()}/status")
+
+    assert response.status_code == 404
+    # Requests are labelled with the route template, not the actual path
+    assert _sample("jobq_http_request_duration_seconds_count", labels) == before + 1
@@ -0,0 +1,130 @@
+import pstats
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from pytest_mock import MockFixture
+
+from jobq_server.config import get_settings
+from jobq_server.profiling import (
+    PROFILE_HEADER,
+    PROFILE_ID_HEADER,
+    get_profile_store,
+)
+from jobq_server.services.k8s import KubernetesService
+
+TOKEN = "s3cr3t"
+
+
+@pytest.fixture
+def profiling(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("JOBQ_SERVER_PROFILING_TOKEN", TOKEN)
+    monkeypatch.setenv("JOBQ_SERVER_PROFILING_SLOWEST", "2")
+    get_settings.cache_clear()
+    get_profile_store.cache_clear()
+    yield
+    get_settings.cache_clear()
+    get_profile_store.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def no_workloads(mocker: MockFixture) -> None:
+    mocker.patch.object(KubernetesService, "list_workloads", return_value=[])
+
+
+def test_profiling_disabled(client: TestClient) -> None:
+    response = client.get("/jobs", headers={PROFILE_HEADER: TOKEN})
+
+    assert response.is_success
+    assert PROFILE_ID_HEADER not in response.headers
+    assert client.get("/admin/profiles").status_code == 404
+
+
+@pytest.mark.usefixtures("profiling")
+def test_on_demand_profile(client: TestClient, tmp_path: Path) -> None:
+    response = client.get("/jobs", headers={PROFILE_HEADER: TOKEN})
+    assert response.is_success
+    profile_id = response.headers[PROFILE_ID_HEADER]
+
+    headers = {PROFILE_HEADER: TOKEN}
+    [summary] = [
+        p
+        for p in client.get("/admin/profiles", headers=headers).json()
+        if p["id"] == profile_id
+    ]
+    assert summary["route"] == "/jobs"
+    assert summary["requested"]
+
+    for fmt, content_type in [
+        ("html", "text/html"),
+        ("speedscope", "application/json"),
+        ("text", "text/plain"),
+    ]:
+        response = client.get(
+            f"/admin/profiles/{profile_id}", params={"format": fmt}, headers=headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(content_type)
+
+    response = client.get(
+        f"/admin/profiles/{profile_id}", params={"format": "pstats"}, headers=headers
+    )
+    stats_file = tmp_path / "profile.pstats"
+    stats_file.write_bytes(response.content)
+    pstats.Stats(str(stats_file))
+
+
+def _busy_list_workloads(*args: Any, **kwargs: Any) -> list:
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    return []
+
+
+@pytest.mark.usefixtures("profiling")
+def test_threadpool_profile(client: TestClient, mocker: MockFixture) -> None:
+    mocker.patch.object(
+        KubernetesService, "list_workloads", side_effect=_busy_list_workloads
+    )
+    response = client.get("/jobs", headers={PROFILE_HEADER: TOKEN})
+    profile_id = response.headers[PROFILE_ID_HEADER]
+
+    # The sync handler runs in the threadpool, which is profiled as well
+    response = client.get(
+        f"/admin/profiles/{profile_id}",
+        params={"format": "text"},
+        headers={PROFILE_HEADER: TOKEN},
+    )
+    assert "list_jobs" in response.text
+    assert "_busy_list_workloads" in response.text
+
+
+@pytest.mark.usefixtures("profiling")
+def test_slowest_profiles(client: TestClient) -> None:
+    for _ in range(3):
+        response = client.get("/jobs")
+        # Profiles of requests without the header are only retained, not announced
+        assert PROFILE_ID_HEADER not in response.headers
+
+    profiles = client.get("/admin/profiles", headers={PROFILE_HEADER: TOKEN}).json()
+    assert len(profiles) == 2
+    assert all(not p["requested"] for p in profiles)
+
+    response = client.delete("/admin/profiles", headers={PROFILE_HEADER: TOKEN})
+    assert response.status_code == 204
+    assert client.get("/admin/profiles", headers={PROFILE_HEADER: TOKEN}).json() == []
+
+
+@pytest.mark.usefixtures("profiling")
+def test_invalid_token(client: TestClient) -> None:
+    response = client.get("/jobs", headers={PROFILE_HEADER: "wrong"})
+    assert PROFILE_ID_HEADER not in response.headers
+
+    assert client.get("/admin/profiles").status_code == 403
+    assert (
+        client.get("/admin/profiles", headers={PROFILE_HEADER: "wrong"}).status_code
+        == 403
+    )
@@ -0,0 +1,154 @@
+"""Snapshots of the Kueue queues from watches, against the benchmark fake API server."""
+
+import copy
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from benchmarks.fake_apiserver import CLUSTERQUEUES, JOBS, FakeApiServer, FakeCluster
+from fastapi.testclient import TestClient
+from kubernetes import config
+from kubernetes.config import kube_config
+
+from jobq_server import app
+from jobq_server.config import get_settings
+from jobq_server.services.queue_snapshot import get_queue_snapshot
+from jobq_server.services.resilience import get_api_call_policy
+
+
+@pytest.fixture
+def fake_server(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[FakeApiServer, None, None]:
+    cluster = FakeCluster.populate(
+        4, pods_per_workload=1, namespace=["default", "ml"], log_lines=10
+    )
+    with FakeApiServer(cluster) as server:
+        kubeconfig = server.write_kubeconfig(tmp_path / "kubeconfig")
+        monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+        # The lifespan of the app loads the default kubeconfig
+        for module in (kube_config, config):
+            monkeypatch.setattr(module, "KUBE_CONFIG_DEFAULT_LOCATION", str(kubeconfig))
+        monkeypatch.setenv("JOBQ_SERVER_WATCH_NAMESPACE", "*")
+        server.watch_timeout = 0.2
+        get_settings.cache_clear()
+        get_api_call_policy.cache_clear()
+        get_queue_snapshot.cache_clear()
+        yield server
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+    get_queue_snapshot.cache_clear()
+
+
+def _wait_for(
+    client: TestClient, predicate: Callable[[list[dict]], bool]
+) -> list[dict]:
+    deadline = time.monotonic() + 5
+    while True:
+        response = client.get("/queues")
+        # The queues are not available until they have been listed
+        assert response.status_code in (200, 503)
+        if response.status_code == 200 and predicate(queues := response.json()):
+            return queues
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+
+def test_queue_snapshot(fake_server: FakeApiServer):
+    with TestClient(app) as client:
+        (queue,) = _wait_for(client, lambda queues: len(queues) == 1)
+        assert queue["name"] == "cluster-queue"
+        assert [(lq["namespace"], lq["name"]) for lq in queue["local_queues"]] == [
+            ("default", "user-queue"),
+            ("ml", "user-queue"),
+        ]
+        (flavor,) = queue["flavors"]
+        assert {r["name"]: r["nominal_quota"] for r in flavor["resources"]} == {
+            "cpu": "64",
+            "memory": "256Gi",
+        }
+
+        # Changes of the queues are picked up from the watch
+        cluster_queue = copy.deepcopy(
+            fake_server.cluster.get(CLUSTERQUEUES, None, "cluster-queue")
+        )
+        cluster_queue["status"] = {
+            "pendingWorkloads": 2,
+            "flavorsReservation": [
+                {
+                    "name": "default-flavor",
+                    "resources": [
+                        {"name": "cpu", "total": "16", "borrowed": "0"},
+                        {"name": "memory", "total": "64Gi", "borrowed": "0"},
+                    ],
+                }
+            ],
+        }
+        fake_server.cluster.add(CLUSTERQUEUES, cluster_queue)
+
+        (queue,) = _wait_for(client, lambda queues: queues[0]["pending_workloads"])
+        assert queue["pending_workloads"] == 2
+        reserved = {r["name"]: r["reserved"] for r in queue["flavors"][0]["resources"]}
+        assert reserved == {"cpu": "16", "memory": "64Gi"}
+
+
+@pytest.mark.parametrize(
+    "cpu, verdict", [("4", "fits_now"), ("100", "fits_later"), ("1000", "never_fits")]
+)
+def test_dry_run(fake_server: FakeApiServer, cpu: str, verdict: str):
+    cluster_queue = copy.deepcopy(
+        fake_server.cluster.get(CLUSTERQUEUES, None, "cluster-queue")
+    )
+    cluster_queue["spec"]["cohort"] = "team"
+    cluster_queue["status"] = {
+        "flavorsReservation": [
+            {"name": "default-flavor", "resources": [{"name": "cpu", "total": "32"}]}
+        ],
+    }
+    fake_server.cluster.add(CLUSTERQUEUES, cluster_queue)
+    # Another queue of the cohort, with 256 unused CPUs to lend
+    peer = copy.deepcopy(cluster_queue)
+    peer["metadata"]["name"] = "peer-queue"
+    peer["spec"]["resourceGroups"][0]["flavors"][0]["resources"] = [
+        {"name": "cpu", "nominalQuota": "256", "lendingLimit": "64"}
+    ]
+    peer["status"] = {}
+    fake_server.cluster.add(CLUSTERQUEUES, peer)
+    jobs = len(fake_server.cluster.list(JOBS, None))
+
+    with TestClient(app) as client:
+        _wait_for(client, lambda queues: len(queues) == 2)
+        response = client.post(
+            "/jobs",
+            params={"dry_run": True},
+            json={
+                "name": "test-job",
+                "file": "test_example.py",
+                "image_ref": "localhost:5000/hello-world-dev:latest",
+                "mode": "kueue",
+                "options": {
+                    "scheduling": {"queue_name": "user-queue"},
+                    "resources": {"cpu": cpu},
+                },
+            },
+        )
+
+    assert response.status_code == 200
+    estimate = response.json()
+    assert estimate["verdict"] == verdict
+    assert estimate["cluster_queue"] == "cluster-queue"
+    # Nothing is submitted
+    assert len(fake_server.cluster.list(JOBS, None)) == jobs
+
+
+def test_queue_snapshot_disabled(
+    fake_server: FakeApiServer, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("JOBQ_SERVER_QUEUE_SNAPSHOT", "false")
+    get_settings.cache_clear()
+    get_queue_snapshot.cache_clear()
+
+    response = TestClient(app).get("/queues")
+
+    assert response.status_code == 404
@@ -0,0 +1,67 @@
+"""Queue statistics from workload watches, against the benchmark fake API server."""
+
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from benchmarks.fake_apiserver import FakeApiServer, FakeCluster
+from fastapi.testclient import TestClient
+from kubernetes import config
+from kubernetes.config import kube_config
+
+from jobq_server import app
+from jobq_server.config import get_settings
+from jobq_server.services.queue_stats import get_queue_stats
+from jobq_server.services.resilience import get_api_call_policy
+
+
+@pytest.fixture
+def api_client(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[TestClient, None, None]:
+    # Pending, executing, succeeded and failed jobs, submitted in 2024
+    cluster = FakeCluster.populate(8, pods_per_workload=1, log_lines=10)
+    with FakeApiServer(cluster) as server:
+        kubeconfig = server.write_kubeconfig(tmp_path / "kubeconfig")
+        monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+        # The lifespan of the app loads the default kubeconfig
+        for module in (kube_config, config):
+            monkeypatch.setattr(module, "KUBE_CONFIG_DEFAULT_LOCATION", str(kubeconfig))
+        server.watch_timeout = 0.2
+        # A window covering the synthetic jobs
+        monkeypatch.setenv("JOBQ_SERVER_QUEUE_STATS_WINDOW", str(100 * 365 * 86400))
+        get_settings.cache_clear()
+        get_api_call_policy.cache_clear()
+        get_queue_stats.cache_clear()
+        with TestClient(app) as client:
+            yield client
+    get_settings.cache_clear()
+    get_api_call_policy.cache_clear()
+    get_queue_stats.cache_clear()
+
+
+def _stats(client: TestClient, name: str, **params) -> dict:
+    deadline = time.monotonic() + 5
+    while True:
+        response = client.get(f"/queues/{name}/stats", params=params)
+        if response.status_code != 404 or time.monotonic() > deadline:
+            assert response.status_code == 200
+            return response.json()
+        time.sleep(0.05)
+
+
+def test_queue_stats(api_client: TestClient):
+    local = _stats(api_client, "user-queue")
+    cluster = _stats(api_client, "cluster-queue", kind="cluster")
+
+    for stats in (local, cluster):
+        assert (stats["admitted"], stats["finished"], stats["evicted"]) == (6, 4, 0)
+        assert stats["wait_time"]["percentiles"]["p50"] == pytest.approx(300, rel=0.01)
+        assert stats["runtime"]["percentiles"]["p90"] == pytest.approx(1800, rel=0.01)
+        assert stats["eviction_rate"] == 0
+    assert local["namespace"] == "default"
+    assert cluster["namespace"] is None
+
+    response = api_client.get("/queues/missing-queue/stats")
+    assert response.status_code == 404
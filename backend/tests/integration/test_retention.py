@@ -0,0 +1,110 @@
+"""Deletion of finished jobs after their retention time, against the benchmark fake API server."""
+
+import json
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from benchmarks.fake_apiserver import JOBS, FakeApiServer, FakeCluster
+from fastapi.testclient import TestClient
+from kubernetes import config
+from kubernetes.config import kube_config
+
+from jobq_server import app
+from jobq_server.config import get_settings
+from jobq_server.services.history import get_history_store
+from jobq_server.services.resilience import get_api_call_policy
+from jobq_server.services.retention import get_job_reaper
+
+
+@pytest.fixture
+def fake_server(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[FakeApiServer, None, None]:
+    cluster = FakeCluster.populate(8, pods_per_workload=1, log_lines=10)
+    with FakeApiServer(cluster) as server:
+        kubeconfig = server.write_kubeconfig(tmp_path / "kubeconfig")
+        monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+        # The lifespan of the app loads the default kubeconfig
+        for module in (kube_config, config):
+            monkeypatch.setattr(module, "KUBE_CONFIG_DEFAULT_LOCATION", str(kubeconfig))
+        server.watch_timeout = 0.2
+        yield server
+
+
+@pytest.fixture
+def retention_enabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    monkeypatch.setenv("JOBQ_SERVER_HISTORY_DATABASE", str(tmp_path / "history.db"))
+    monkeypatch.setenv("JOBQ_SERVER_JOB_RETENTION", "3600")
+    monkeypatch.setenv(
+        "JOBQ_SERVER_JOB_RETENTION_RULES",
+        '[{"queue": "user-queue", "labels": {"keep": "true"}, "ttl": null}]',
+    )
+    monkeypatch.setenv("JOBQ_SERVER_JOB_REAPER_INTERVAL", "0.1")
+    caches = [get_settings, get_api_call_policy, get_history_store, get_job_reaper]
+    for cache in caches:
+        cache.cache_clear()
+    yield
+    if (store := get_history_store()) is not None:
+        store.close()
+    for cache in caches:
+        cache.cache_clear()
+
+
+@pytest.mark.usefixtures("retention_enabled")
+def test_reaper(fake_server: FakeApiServer):
+    cluster = fake_server.cluster
+    uids = cluster.job_uids()
+    with TestClient(app) as client:
+        # The synthetic jobs 2, 3, 6 and 7 have finished long ago
+        deadline = time.monotonic() + 5
+        while len(cluster.list(JOBS, "default")) > 4 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        remaining = {job["metadata"]["uid"] for job in cluster.list(JOBS, "default")}
+        assert remaining == {uids[i] for i in (0, 1, 4, 5)}
+
+        # Their logs have been archived before the deletion
+        response = client.get(f"/jobs/history/{uids[2]}/logs")
+        assert response.status_code == 200
+        assert response.text == cluster.pod_log.decode()
+        assert client.get(f"/jobs/history/{uids[1]}/logs").status_code == 404
+
+        # And can be searched like the logs of running jobs
+        response = client.get(
+            f"/jobs/history/{uids[2]}/logs/search", params={"pattern": r"step [37] "}
+        )
+        assert response.status_code == 200
+        matches = [json.loads(line) for line in response.text.splitlines()]
+        assert [m["line_number"] for m in matches] == [4, 8]
+        assert (
+            client.get(
+                f"/jobs/history/{uids[1]}/logs/search", params={"pattern": "step"}
+            ).status_code
+            == 404
+        )
+
+        # New jobs are created with a TTL, unless a rule keeps them
+        for labels, ttl in [({}, 3600 + 1), ({"keep": "true"}, None)]:
+            response = client.post(
+                "/jobs",
+                json={
+                    "name": "test-job",
+                    "file": "test_example.py",
+                    "image_ref": "localhost:5000/hello-world-dev:latest",
+                    "mode": "kueue",
+                    "options": {
+                        "scheduling": {"queue_name": "user-queue"},
+                        "labels": labels,
+                    },
+                },
+            )
+            assert response.status_code == 200
+            (job,) = [
+                job
+                for job in cluster.list(JOBS, "default")
+                if job["metadata"]["uid"] == response.json()["uid"]
+            ]
+            assert job["spec"].get("ttlSecondsAfterFinished") == ttl
@@ -0,0 +1,217 @@
+import datetime
+
+import pytest
+
+from jobq_server.models import (
+    AdmissionVerdict,
+    ClusterQueueSnapshot,
+    FlavorQuota,
+    QueueKind,
+    ResourceQuota,
+)
+from jobq_server.services.admission import dry_run, estimate_admission
+from jobq_server.services.queue_snapshot import QueueSnapshot
+
+NOW = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+def _queue(
+    name: str = "gpu-queue",
+    flavors: dict[str, dict[str, tuple[str, str]]] | None = None,
+    cohort: str | None = None,
+    borrowing_limit: str | None = None,
+    pending: int = 0,
+    admitted: int = 0,
+) -> ClusterQueueSnapshot:
+    """A ClusterQueue with (nominal, reserved) quotas by flavor and resource."""
+    flavors = flavors or {"a100": {"cpu": ("32", "0"), "nvidia.com/gpu": ("4", "0")}}
+    return ClusterQueueSnapshot(
+        name=name,
+        cohort=cohort,
+        flavors=[
+            FlavorQuota(
+                name=flavor,
+                resources=[
+                    ResourceQuota(
+                        name=resource,
+                        nominal_quota=nominal,
+                        reserved=reserved,
+                        borrowing_limit=borrowing_limit,
+                    )
+                    for resource, (nominal, reserved) in resources.items()
+                ],
+            )
+            for flavor, resources in flavors.items()
+        ],
+        pending_workloads=pending,
+        admitted_workloads=admitted,
+    )
+
+
+def test_fits_now():
+    estimate = estimate_admission(
+        {"cpu": "4", "nvidia.com/gpu": "2"}, _queue(), now=NOW
+    )
+
+    assert estimate.verdict == AdmissionVerdict.FITS_NOW
+    assert estimate.flavors == {"cpu": "a100", "nvidia.com/gpu": "a100"}
+    assert estimate.estimated_start == NOW
+
+
+def test_fits_after_pending_workloads():
+    queue = _queue(pending=3, admitted=2)
+
+    estimate = estimate_admission({"cpu": "4"}, queue, runtime=600, now=NOW)
+
+    assert estimate.verdict == AdmissionVerdict.FITS_LATER
+    assert estimate.queued_ahead == 3
+    # Two admitted workloads finish every 600s
+    assert estimate.estimated_start == NOW + datetime.timedelta(seconds=900)
+
+
+def test_fits_after_running_workloads():
+    queue = _queue(
+        flavors={"a100": {"nvidia.com/gpu": ("4", "3")}},
+        admitted=1,
+    )
+
+    estimate = estimate_admission({"nvidia.com/gpu": "2"}, queue, runtime=600, now=NOW)
+    assert estimate.verdict == AdmissionVerdict.FITS_LATER
+    assert estimate.reason == "not enough free quota for nvidia.com/gpu"
+    assert estimate.estimated_start == NOW + datetime.timedelta(seconds=600)
+
+    # Without historical runtimes, there is no estimate
+    estimate = estimate_admission({"nvidia.com/gpu": "2"}, queue, now=NOW)
+    assert estimate.estimated_start is None
+
+
+def test_never_fits():
+    estimate = estimate_admission({"nvidia.com/gpu": "8"}, _queue())
+    assert estimate.verdict == AdmissionVerdict.NEVER_FITS
+    assert "nvidia.com/gpu: 8" in (estimate.reason or "")
+
+    estimate = estimate_admission({"memory": "1Gi"}, _queue())
+    assert estimate.verdict == AdmissionVerdict.NEVER_FITS
+    assert estimate.reason == "no quota for memory in ClusterQueue 'gpu-queue'"
+
+    # Resources of a resource group are assigned the same flavor
+    queue = _queue(
+        flavors={
+            "a100": {"cpu": ("8", "0"), "nvidia.com/gpu": ("4", "0")},
+            "h100": {"cpu": ("32", "0"), "nvidia.com/gpu": ("1", "0")},
+        }
+    )
+    estimate = estimate_admission({"cpu": "16", "nvidia.com/gpu": "2"}, queue)
+    assert estimate.verdict == AdmissionVerdict.NEVER_FITS
+
+
+def test_flavor_order():
+    queue = _queue(
+        flavors={
+            "a100": {"nvidia.com/gpu": ("4", "4")},
+            "h100": {"nvidia.com/gpu": ("4", "0")},
+        }
+    )
+
+    estimate = estimate_admission({"nvidia.com/gpu": "2"}, queue)
+
+    assert estimate.verdict == AdmissionVerdict.FITS_NOW
+    assert estimate.flavors == {"nvidia.com/gpu": "h100"}
+
+
+def test_accelerator_flavor():
+    queue = _queue(
+        flavors={
+            "t4": {"nvidia.com/gpu": ("4", "0")},
+            "a100": {"nvidia.com/gpu": ("4", "4")},
+        }
+    )
+
+    estimate = estimate_admission({"nvidia.com/gpu": "2"}, queue, flavor="a100")
+    assert estimate.verdict == AdmissionVerdict.FITS_LATER
+    assert estimate.flavors == {"nvidia.com/gpu": "a100"}
+
+    # Accelerator types without a flavor do not restrict the flavors
+    estimate = estimate_admission({"nvidia.com/gpu": "2"}, queue, flavor="h100")
+    assert estimate.flavors == {"nvidia.com/gpu": "t4"}
+
+
+@pytest.mark.parametrize(
+    "borrowing_limit, peer_reserved, verdict",
+    [
+        (None, "4", AdmissionVerdict.FITS_NOW),
+        (None, "7", AdmissionVerdict.FITS_LATER),
+        ("1", "0", AdmissionVerdict.NEVER_FITS),
+    ],
+)
+def test_cohort_borrowing(
+    borrowing_limit: str | None, peer_reserved: str, verdict: AdmissionVerdict
+):
+    gpus = {"a100": {"nvidia.com/gpu": ("4", "0")}}
+    queue = _queue(flavors=gpus, cohort="team", borrowing_limit=borrowing_limit)
+    peer = _queue(
+        "peer-queue",
+        flavors={"a100": {"nvidia.com/gpu": ("8", peer_reserved)}},
+        cohort="team",
+    )
+
+    # 4 nominal GPUs, and the unused GPUs of the peer (up to the borrowing limit)
+    estimate = estimate_admission({"nvidia.com/gpu": "6"}, queue, [queue, peer])
+
+    assert estimate.verdict == verdict
+
+
+def test_dry_run():
+    snapshot = QueueSnapshot()
+    for cluster, reserved in [("a", "4"), ("b", "0")]:
+        snapshot.update(
+            QueueKind.CLUSTER,
+            cluster,
+            "ADDED",
+            {
+                "metadata": {"name": "gpu-queue"},
+                "spec": {
+                    "resourceGroups": [
+                        {
+                            "flavors": [
+                                {
+                                    "name": "a100",
+                                    "resources": [
+                                        {"name": "nvidia.com/gpu", "nominalQuota": "4"}
+                                    ],
+                                }
+                            ]
+                        }
+                    ]
+                },
+                "status": {
+                    "flavorsReservation": [
+                        {
+                            "name": "a100",
+                            "resources": [
+                                {"name": "nvidia.com/gpu", "total": reserved}
+                            ],
+                        }
+                    ]
+                },
+            },
+        )
+        snapshot.update(
+            QueueKind.LOCAL,
+            cluster,
+            "ADDED",
+            {
+                "metadata": {"name": "user-queue", "namespace": "default"},
+                "spec": {"clusterQueue": "gpu-queue"},
+            },
+        )
+
+    requests = {"nvidia.com/gpu": "2"}
+    estimate = dry_run(requests, "user-queue", "default", snapshot, ["a", "b"])
+    assert (estimate.cluster, estimate.verdict) == ("b", AdmissionVerdict.FITS_NOW)
+
+    estimate = dry_run(requests, "user-queue", "default", snapshot, ["a"])
+    assert (estimate.cluster, estimate.verdict) == ("a", AdmissionVerdict.FITS_LATER)
+
+    with pytest.raises(ValueError):
+        dry_run(requests, "user-queue", "other", snapshot, ["a", "b"])
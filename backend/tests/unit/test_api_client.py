@@ -0,0 +1,111 @@
+import pytest
+from kubernetes import client
+from pytest_mock import MockFixture
+
+from jobq_server.config import RateLimit
+from jobq_server.exceptions import KubernetesUnavailableError
+from jobq_server.services.api_client import KubernetesApiClient, request_labels
+from jobq_server.services.resilience import (
+    ApiCallPolicy,
+    CircuitBreaker,
+    CircuitState,
+    RateLimiter,
+)
+
+
+@pytest.mark.parametrize(
+    "method, url, query_params, expected",
+    [
+        # Typed APIs
+        (
+            "GET",
+            "https://k8s:6443/api/v1/namespaces/default/pods",
+            [],
+            ("list", "pods"),
+        ),
+        ("GET", "/api/v1/namespaces/default/pods/foo", None, ("get", "pods")),
+        (
+            "GET",
+            "/api/v1/namespaces/default/pods/foo/log",
+            [("follow", True)],
+            ("get", "pods/log"),
+        ),
+        ("POST", "/apis/batch/v1/namespaces/default/jobs", [], ("create", "jobs")),
+        (
+            "DELETE",
+            "/apis/batch/v1/namespaces/default/jobs/foo",
+            [],
+            ("delete", "jobs"),
+        ),
+        (
+            "DELETE",
+            "/apis/batch/v1/namespaces/default/jobs",
+            [],
+            ("deletecollection", "jobs"),
+        ),
+        # Custom resources, cluster-scoped and namespaced
+        (
+            "GET",
+            "/apis/kueue.x-k8s.io/v1beta1/namespaces/default/workloads",
+            [("labelSelector", "a=b")],
+            ("list", "workloads"),
+        ),
+        (
+            "GET",
+            "/apis/kueue.x-k8s.io/v1beta1/workloadpriorityclasses/high",
+            [],
+            ("get", "workloadpriorityclasses"),
+        ),
+        (
+            "GET",
+            "/apis/kueue.x-k8s.io/v1beta1/workloads",
+            [("watch", True)],
+            ("watch", "workloads"),
+        ),
+        ("PATCH", "/apis/ray.io/v1/namespaces/ns/rayjobs/x", [], ("patch", "rayjobs")),
+        # Namespaces themselves
+        ("GET", "/api/v1/namespaces/default", [], ("get", "namespaces")),
+        ("GET", "/api/v1/namespaces", [], ("list", "namespaces")),
+        # Discovery
+        ("GET", "/apis", [], ("list", "discovery")),
+        ("GET", "/apis/batch/v1", [], ("list", "discovery")),
+        ("GET", "/version", [], ("list", "discovery")),
+    ],
+)
+def test_request_labels(method, url, query_params, expected):
+    assert request_labels(method, url, query_params) == expected
+
+
+def test_circuit_breaker_trial_errors(mocker: MockFixture):
+    clock = mocker.patch("time.monotonic", return_value=100.0)
+    policy = ApiCallPolicy(
+        limiter=RateLimiter(
+            RateLimit(qps=0, burst=1), {"get": RateLimit(qps=0.01, burst=1)}, timeout=0
+        ),
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=10),
+    )
+    api_client = KubernetesApiClient(client.Configuration(), policy=policy)
+    request = mocker.patch.object(client.ApiClient, "request")
+
+    request.side_effect = client.ApiException(status=500)
+    with pytest.raises(client.ApiException):
+        api_client.request("GET", "/api/v1/namespaces/default/pods")
+    assert policy.breaker.state == CircuitState.OPEN
+
+    # Rate-limited calls do not take the place of the trial call
+    clock.return_value = 110.0
+    policy.limiter.acquire("get")
+    with pytest.raises(KubernetesUnavailableError, match="rate limit"):
+        api_client.request("GET", "/api/v1/namespaces/default/pods/foo")
+    assert policy.breaker.state == CircuitState.OPEN
+
+    # A trial call failing on the client side leaves the circuit open for a new trial
+    clock.return_value = 111.0
+    request.side_effect = RuntimeError("client error")
+    with pytest.raises(RuntimeError):
+        api_client.request("GET", "/api/v1/namespaces/default/pods")
+
+    clock.return_value = 112.0
+    request.side_effect = None
+    api_client.request("GET", "/api/v1/namespaces/default/pods")
+    assert policy.breaker.state == CircuitState.CLOSED
@@ -0,0 +1,88 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_mock import MockFixture
+
+from jobq_server.services.coalescing import RequestCoalescer
+
+
+def test_concurrent_calls_are_coalesced():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    calls = 0
+
+    def fn():
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=5)
+        return "result"
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(coalescer.do, "key", fn) for _ in range(8)]
+        # Give all followers time to join the leader's call
+        while not all(f.running() for f in futures):
+            pass
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert calls == 1
+    assert {r for r, _ in results} == {"result"}
+    assert sorted((s for _, s in results), key=str) == [None] + ["in_flight"] * 7
+
+
+def test_different_keys_are_not_coalesced():
+    coalescer = RequestCoalescer()
+
+    assert coalescer.do("a", lambda: 1) == (1, None)
+    assert coalescer.do("b", lambda: 2) == (2, None)
+    # Without a TTL, completed calls are not cached
+    assert coalescer.do("a", lambda: 3) == (3, None)
+
+
+def test_errors_are_shared():
+    coalescer = RequestCoalescer()
+    started, release = threading.Event(), threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(timeout=5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(coalescer.do, "key", fn)
+        started.wait(timeout=5)
+        follower = pool.submit(coalescer.do, "key", lambda: "unused")
+        while not follower.running():
+            pass
+        time.sleep(0.1)
+        release.set()
+
+        with pytest.raises(ValueError, match="boom"):
+            leader.result()
+        with pytest.raises(ValueError, match="boom"):
+            follower.result()
+
+    # Errors are not cached
+    assert coalescer.do("key", lambda: "ok") == ("ok", None)
+
+
+def test_cache(mocker: MockFixture):
+    clock = mocker.patch("time.monotonic", return_value=100.0)
+    coalescer = RequestCoalescer(ttl=1.0, max_entries=2)
+
+    assert coalescer.do("a", lambda: 1) == (1, None)
+    assert coalescer.do("a", lambda: 2) == (1, "cache")
+
+    clock.return_value = 101.5
+    assert coalescer.do("a", lambda: 3) == (3, None)
+
+    # Least recently stored entries are evicted first
+    coalescer.do("b", lambda: 4)
+    coalescer.do("c", lambda: 5)
+    assert coalescer.do("a", lambda: 6) == (6, None)
+
+    coalescer.invalidate()
+    assert coalescer.do("c", lambda: 7) == (7, None)
@@ -0,0 +1,102 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from jobq_server.utils.compression import CompressionMiddleware, negotiate_encoding
+
+PAYLOAD = "jobq " * 1000
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(PAYLOAD)
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("small")
+
+    @app.get("/binary")
+    async def binary():
+        return PlainTextResponse(PAYLOAD, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(10):
+                yield f"line {i}\n"
+
+        return StreamingResponse(lines(), media_type="text/plain")
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("zstd;q=0.5, gzip;q=0.8", "gzip"),
+        ("gzip;q=0, zstd;q=0", None),
+        ("*", "zstd"),
+        ("*;q=0.1, gzip", "gzip"),
+        ("GZIP;q=invalid, zstd", "zstd"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str | None) -> None:
+    assert negotiate_encoding(accept_encoding, ["zstd", "gzip"]) == expected
+
+
+@pytest.mark.parametrize(
+    "path, accept_encoding, expected_encoding",
+    [
+        ("/large", "gzip", "gzip"),
+        ("/large", "identity", None),
+        # below the minimum size
+        ("/small", "gzip", None),
+        # not a compressible content type
+        ("/binary", "gzip", None),
+        ("/stream", "gzip", "gzip"),
+    ],
+)
+def test_compression(
+    client: TestClient,
+    path: str,
+    accept_encoding: str,
+    expected_encoding: str | None,
+) -> None:
+    response = client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    assert response.is_success
+    assert response.headers.get("Content-Encoding") == expected_encoding
+    if expected_encoding is not None:
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_gzip_roundtrip(client: TestClient) -> None:
+    with client.stream(
+        "GET", "/large", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert int(response.headers["Content-Length"]) == len(raw) < len(PAYLOAD)
+    assert gzip.decompress(raw).decode() == PAYLOAD
+
+
+def test_zstd_stream(client: TestClient) -> None:
+    pytest.importorskip("zstandard")
+
+    response = client.get("/stream", headers={"Accept-Encoding": "zstd"})
+
+    assert response.headers["Content-Encoding"] == "zstd"
+    assert "Content-Length" not in response.headers
+    assert response.text == "".join(f"line {i}\n" for i in range(10))
@@ -0,0 +1,221 @@
+import datetime
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from jobq_server.models import JobStatus
+from jobq_server.services import history
+from jobq_server.services.history import HistoryStore, submitter
+from jobq_server.services.watcher import WorkloadEvent
+from jobq_server.utils.kueue import KueueWorkload
+
+EPOCH = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+def _job_uid(i: int) -> str:
+    return str(uuid.UUID(int=i, version=4))
+
+
+def _workload(
+    i: int,
+    queue_name: str = "user-queue",
+    conditions: list[dict[str, Any]] | None = None,
+) -> KueueWorkload:
+    """The workload of the i-th job, submitted i hours after the epoch."""
+    created = EPOCH + datetime.timedelta(hours=i)
+    return KueueWorkload.from_api_object({
+        "metadata": {
+            "name": f"job-{i}",
+            "namespace": "default",
+            "creationTimestamp": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "ownerReferences": [
+                {
+                    "apiVersion": "batch/v1",
+                    "kind": "Job",
+                    "name": f"job-{i}",
+                    "uid": _job_uid(i),
+                }
+            ],
+        },
+        "spec": {
+            "podSets": [],
+            "queueName": queue_name,
+            "active": True,
+            "priorityClassName": "high",
+            "priority": 100,
+        },
+        "status": {"conditions": conditions or []},
+    })
+
+
+def _condition(typ: str, reason: str, time: str, status: str = "True") -> dict:
+    return {"type": typ, "status": status, "reason": reason, "lastTransitionTime": time}
+
+
+@pytest.fixture
+def store() -> HistoryStore:
+    return HistoryStore(":memory:")
+
+
+def test_record_lifecycle(store: HistoryStore):
+    store.record([WorkloadEvent("ADDED", _workload(0), cluster="gpu")])
+    (entry,) = store.query()
+    assert entry.execution_status == JobStatus.PENDING
+    assert entry.submission_timestamp == EPOCH
+    assert entry.last_admission_timestamp is None
+
+    finished = _workload(
+        0,
+        conditions=[
+            _condition("Admitted", "Admitted", "2024-01-01T00:05:00Z"),
+            _condition("Evicted", "Preempted", "2024-01-01T00:10:00Z"),
+            _condition("Finished", "Succeeded", "2024-01-01T01:00:00Z"),
+        ],
+    )
+    store.record([WorkloadEvent("MODIFIED", finished, cluster="gpu")])
+
+    (entry,) = store.query()
+    assert entry.uid == uuid.UUID(_job_uid(0))
+    assert entry.cluster == "gpu"
+    assert (entry.name, entry.kind, entry.queue_name) == ("job-0", "Job", "user-queue")
+    assert (entry.priority_class, entry.priority) == ("high", 100)
+    assert entry.execution_status == JobStatus.SUCCEEDED
+    assert entry.last_admission_timestamp == EPOCH + datetime.timedelta(minutes=5)
+    assert entry.eviction_timestamp == EPOCH + datetime.timedelta(minutes=10)
+    assert entry.termination_timestamp == EPOCH + datetime.timedelta(hours=1)
+
+
+def test_record_submission(store: HistoryStore):
+    context = {"submitter": {"username": "Jane Doe", "email": "jane@example.com"}}
+    store.record([WorkloadEvent("ADDED", _workload(0, conditions=[]))])
+    store.record_submission(
+        _job_uid(0),
+        namespace="default",
+        name="job-0",
+        kind="Job",
+        labels={"team": "ml"},
+        context=context,
+    )
+
+    (entry,) = store.query(submitter="jane@example.com")
+    assert entry.labels == {"team": "ml"}
+    # The watched workload state is kept
+    assert entry.submission_timestamp == EPOCH
+    assert entry.queue_name == "user-queue"
+
+
+@pytest.mark.parametrize(
+    "context, expected",
+    [
+        (
+            {"submitter": {"username": "jane", "email": "jane@example.com"}},
+            "jane@example.com",
+        ),
+        ({"submitter": {"username": "jane", "email": "Unknown"}}, "jane"),
+        ({}, None),
+    ],
+)
+def test_submitter(context: dict, expected: str | None):
+    assert submitter(context) == expected
+
+
+def test_query(store: HistoryStore):
+    admitted = [_condition("Admitted", "Admitted", "2024-01-01T00:00:00Z")]
+    store.record([
+        WorkloadEvent(
+            "ADDED",
+            _workload(
+                i,
+                queue_name="gpu-queue" if i % 2 else "cpu-queue",
+                conditions=admitted if i % 3 == 0 else [],
+            ),
+        )
+        for i in range(10)
+    ])
+
+    indices = {_job_uid(i): i for i in range(10)}
+
+    def uids(**kwargs: Any) -> list[int]:
+        return [indices[str(entry.uid)] for entry in store.query(**kwargs)]
+
+    # Most recently submitted first
+    assert uids() == list(reversed(range(10)))
+    assert uids(limit=3) == [9, 8, 7]
+    assert uids(queue_name="gpu-queue") == [9, 7, 5, 3, 1]
+    assert uids(status=[JobStatus.EXECUTING]) == [9, 6, 3, 0]
+    assert uids(status=[JobStatus.EXECUTING], queue_name="cpu-queue") == [6, 0]
+    assert uids(
+        since=EPOCH + datetime.timedelta(hours=2),
+        until=EPOCH + datetime.timedelta(hours=5),
+    ) == [4, 3, 2]
+    assert uids(submitter="nobody") == []
+
+
+@pytest.mark.parametrize(
+    "kwargs, index",
+    [
+        ({}, "jobs_by_submission"),
+        ({"status": [JobStatus.FAILED]}, "jobs_by_status"),
+        ({"queue_name": "q"}, "jobs_by_queue"),
+        ({"submitter": "jane"}, "jobs_by_submitter"),
+        ({"since": EPOCH}, "jobs_by_submission"),
+    ],
+)
+def test_query_uses_index(store: HistoryStore, kwargs: dict[str, Any], index: str):
+    statements: list[str] = []
+    # Queries run one at a time reuse the same connection
+    with store._connection() as conn:
+        conn.set_trace_callback(statements.append)
+    store.query(**kwargs)
+    with store._connection() as conn:
+        conn.set_trace_callback(None)
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {statements[-1]}").fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert f"USING INDEX {index}" in details
+    # Results are ordered by the index, without sorting
+    assert "TEMP B-TREE" not in details
+
+
+def test_concurrent_readers(tmp_path: Path):
+    store = HistoryStore(tmp_path / "history.db")
+    store.record([WorkloadEvent("ADDED", _workload(0))])
+
+    # A write transaction is in progress on another connection
+    with store._write_lock, store._connection() as writer:
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("DELETE FROM jobs")
+
+        results = []
+        reader = threading.Thread(target=lambda: results.append(store.query()))
+        reader.start()
+        reader.join(timeout=5)
+        # Readers do not wait for the writer, and see the last committed state
+        assert [len(r) for r in results] == [1]
+        writer.rollback()
+    store.close()
+
+
+def test_archived_logs(store: HistoryStore, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(history, "LOG_CHUNK_SIZE", 100)
+    uid = _job_uid(0)
+    assert store.archived_pods(uid) == []
+
+    lines = [f"line {i}\n".encode() for i in range(100)]
+    assert store.archive_logs(uid, "pod-b", iter(lines)) == len(b"".join(lines))
+    assert store.archive_logs(uid, "pod-a", iter([])) == 0
+    assert store.archived_pods(uid) == ["pod-b", "pod-a"]
+    chunks = list(store.archived_log(uid, "pod-b"))
+    # The log is stored in chunks of whole lines
+    assert len(chunks) > 1
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert b"".join(chunks) == b"".join(lines)
+    assert list(store.archived_log(uid, "pod-a")) == [b""]
+
+    # Archiving a log again replaces it, and long logs are truncated
+    assert store.archive_logs(uid, "pod-b", iter(lines), max_bytes=75) == 70
+    assert b"".join(store.archived_log(uid, "pod-b")) == (
+        b"".join(lines[:10]) + b"[log truncated after 70 bytes]\n"
+    )
@@ -0,0 +1,199 @@
+import datetime
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes import client
+
+from jobq_server.services.images import (
+    PREPULL_LABEL,
+    PULL_SECONDS_ANNOTATION,
+    ImagePrePuller,
+    _parse_image_ref,
+    pin_digest,
+    resolve_digest,
+)
+
+DIGEST = "sha256:" + "a" * 64
+T0 = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+
+@pytest.mark.parametrize(
+    "ref, expected",
+    [
+        ("python", ("registry-1.docker.io", "library/python", "latest")),
+        ("python:3.11", ("registry-1.docker.io", "library/python", "3.11")),
+        ("org/image:v1", ("registry-1.docker.io", "org/image", "v1")),
+        ("ghcr.io/org/image:v1", ("ghcr.io", "org/image", "v1")),
+        ("localhost:5000/image", ("localhost:5000", "image", "latest")),
+        ("localhost:5000/image:dev", ("localhost:5000", "image", "dev")),
+    ],
+)
+def test_parse_image_ref(ref: str, expected: tuple[str, str, str]):
+    assert _parse_image_ref(ref) == expected
+
+
+class _Registry(BaseHTTPRequestHandler):
+    """A registry that requires an anonymous bearer token."""
+
+    manifest_requests: list[str] = []
+
+    def do_GET(self) -> None:
+        assert (
+            self.path == "/token?service=registry&scope=repository%3Aorg%2Fimage%3Apull"
+        )
+        body = b'{"token": "secret"}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self.manifest_requests.append(self.path)
+        if self.path != "/v2/org/image/manifests/v1":
+            self.send_response(404)
+        elif self.headers.get("Authorization") != "Bearer secret":
+            host, port = self.server.server_address[:2]
+            self.send_response(401)
+            self.send_header(
+                "WWW-Authenticate",
+                f'Bearer realm="http://{host}:{port}/token",service="registry",'
+                'scope="repository:org/image:pull"',
+            )
+        else:
+            self.send_response(200)
+            self.send_header("Docker-Content-Digest", DIGEST)
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def registry() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Registry)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_resolve_digest(registry: str):
+    assert resolve_digest(f"{registry}/org/image:v1") == DIGEST
+    assert resolve_digest(f"{registry}/org/image:v2") is None
+
+
+def test_pin_digest(registry: str):
+    assert pin_digest(f"{registry}/org/image:v1") == f"{registry}/org/image:v1@{DIGEST}"
+    # Pinned images are not resolved again
+    assert pin_digest(f"{registry}/org/image:v2@{DIGEST}") == (
+        f"{registry}/org/image:v2@{DIGEST}"
+    )
+    # Unresolvable images keep their tag
+    assert pin_digest(f"{registry}/org/image:v2") == f"{registry}/org/image:v2"
+
+    # Digests (and failures) are cached
+    _Registry.manifest_requests.clear()
+    assert pin_digest(f"{registry}/org/image:v1") == f"{registry}/org/image:v1@{DIGEST}"
+    assert pin_digest(f"{registry}/org/image:v2") == f"{registry}/org/image:v2"
+    assert _Registry.manifest_requests == []
+
+
+OWNER = {
+    "apiVersion": "batch/v1",
+    "kind": "Job",
+    "metadata": {"name": "train-abc12", "namespace": "default", "uid": "uid-1"},
+}
+POD_SPEC = {
+    "containers": [{"name": "workload", "image": f"ghcr.io/org/image:v1@{DIGEST}"}],
+    "nodeSelector": {"cloud.example.com/gpu": "a100"},
+    "restartPolicy": "Never",
+}
+
+
+def _pod(pulled: float | None) -> client.V1Pod:
+    init_status = None
+    if pulled is not None:
+        started = T0 + datetime.timedelta(seconds=pulled)
+        init_status = [
+            client.V1ContainerStatus(
+                name="prepull",
+                image="",
+                image_id="",
+                ready=False,
+                restart_count=0,
+                state=client.V1ContainerState(
+                    terminated=client.V1ContainerStateTerminated(
+                        exit_code=0, started_at=started
+                    )
+                ),
+            )
+        ]
+    return client.V1Pod(
+        status=client.V1PodStatus(start_time=T0, init_container_statuses=init_status)
+    )
+
+
+def _daemonset(desired: int) -> client.V1DaemonSet:
+    return client.V1DaemonSet(
+        metadata=client.V1ObjectMeta(generation=1),
+        status=client.V1DaemonSetStatus(
+            observed_generation=1,
+            desired_number_scheduled=desired,
+            current_number_scheduled=desired,
+            number_misscheduled=0,
+            number_ready=0,
+        ),
+    )
+
+
+def test_prepull():
+    k8s = MagicMock()
+    now = 0.0
+    prepuller = ImagePrePuller(timeout=600, clock=lambda: now)
+
+    prepuller.prepull(k8s, OWNER, POD_SPEC)
+    namespace, manifest = k8s.apps_v1.create_namespaced_daemon_set.call_args.args
+    assert namespace == "default"
+    assert manifest["metadata"]["ownerReferences"][0]["uid"] == "uid-1"
+    spec = manifest["spec"]["template"]["spec"]
+    # The image is pulled on the nodes the job can be placed on
+    assert spec["nodeSelector"] == POD_SPEC["nodeSelector"]
+    assert spec["initContainers"][0]["image"] == POD_SPEC["containers"][0]["image"]
+    assert "restartPolicy" not in spec
+
+    # Not pulled on all nodes yet
+    k8s.apps_v1.read_namespaced_daemon_set.return_value = _daemonset(desired=2)
+    k8s.core_v1.list_namespaced_pod.return_value.items = [_pod(12.5), _pod(None)]
+    assert prepuller.sweep() == 0
+    assert k8s.core_v1.list_namespaced_pod.call_args.kwargs == {
+        "label_selector": f"{PREPULL_LABEL}=uid-1"
+    }
+    k8s.annotate_resource.assert_not_called()
+
+    k8s.core_v1.list_namespaced_pod.return_value.items = [_pod(12.5), _pod(80.25)]
+    assert prepuller.sweep() == 1
+    (_, name, namespace, annotations) = k8s.annotate_resource.call_args.args
+    assert (name, namespace) == ("train-abc12", "default")
+    assert annotations[PULL_SECONDS_ANNOTATION] == "80.2"
+    assert k8s.delete_resource.call_args.args[1] == "train-abc12-prepull"
+    assert prepuller.sweep() == 0
+
+
+def test_prepull_timeout():
+    k8s = MagicMock()
+    now = 0.0
+    prepuller = ImagePrePuller(timeout=600, clock=lambda: now)
+    prepuller.prepull(k8s, OWNER, POD_SPEC)
+
+    k8s.apps_v1.read_namespaced_daemon_set.return_value = _daemonset(desired=2)
+    k8s.core_v1.list_namespaced_pod.return_value.items = [_pod(None), _pod(None)]
+    assert prepuller.sweep() == 0
+
+    now = 601.0
+    assert prepuller.sweep() == 1
+    # Nothing has been pulled, there is nothing to record
+    k8s.annotate_resource.assert_not_called()
+    k8s.delete_resource.assert_called_once()
@@ -1,7 +1,7 @@
 import pytest
 from kubernetes import client
 
-from jobq_server.utils.k8s import build_metadata
+from jobq_server.utils.k8s import ConditionIndex, build_metadata, filter_conditions
 
 
 @pytest.mark.parametrize(
@@ -60,3 +60,68 @@ from jobq_server.utils.k8s import build_metadata
 def test_instantiate_metadata(data, expected_metadata):
     result = build_metadata(data)
     assert result == expected_metadata  # V1ObjectMeta.__eq__ does deep comparison
+
+
+def test_instantiate_metadata_without_managed_fields():
+    data = {
+        "name": "test-pod",
+        "managedFields": [{"manager": "kubelet", "operation": "Update"}],
+    }
+    result = build_metadata(data, include_managed_fields=False)
+    assert result == client.V1ObjectMeta(name="test-pod")
+    # The input must not be modified
+    assert "managedFields" in data
+
+
+def test_instantiate_metadata_unknown_attributes():
+    result = build_metadata({"name": "test-pod", "someNewField": "value"})
+    assert result == client.V1ObjectMeta(name="test-pod")
+
+
+CONDITIONS = [
+    {
+        "type": "QuotaReserved",
+        "status": "True",
+        "reason": "QuotaReserved",
+        "message": "",
+    },
+    {"type": "Admitted", "status": "True", "reason": "Admitted", "message": ""},
+    {"type": "Evicted", "status": "True", "reason": "Preempted", "message": "x"},
+    {"type": "QuotaReserved", "status": "False", "reason": "Pending", "message": ""},
+]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"typ": "QuotaReserved"},
+        {"reason": "Preempted"},
+        {"typ": "QuotaReserved", "reason": "Pending"},
+        {"typ": "QuotaReserved", "status": True},
+        {"typ": "Admitted", "reason": "Preempted"},
+        {"reason": "Preempted", "message": "x"},
+        {"reason": "Preempted", "message": "y"},
+        {"typ": "Missing"},
+    ],
+)
+def test_condition_index(filters):
+    """The index yields the same results as filtering the conditions directly."""
+    index = ConditionIndex(CONDITIONS)
+    expected = filter_conditions({"status": {"conditions": CONDITIONS}}, **filters)
+    assert index.filter(**filters) == expected
+
+
+def test_condition_index_first():
+    index = ConditionIndex(CONDITIONS)
+    assert index.first(typ="QuotaReserved") is CONDITIONS[0]
+    assert index.first(typ="QuotaReserved", status=False) is CONDITIONS[3]
+    assert index.first(reason="Failed") is None
+
+
+def test_condition_index_unknown_status():
+    conditions = [{"type": "Finished", "status": "Unknown", "reason": "Succeeded"}]
+    index = ConditionIndex(conditions)
+    assert index.filter(typ="Finished") == conditions
+    assert index.filter(typ="Finished", status=True) == []
+    assert index.filter(typ="Finished", status=False) == []
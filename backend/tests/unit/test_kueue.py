@@ -0,0 +1,163 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from jobq_server.models import JobStatus, WorkloadMetadata
+from jobq_server.utils.kueue import KueueWorkload, cluster_queue_headroom
+
+
+@pytest.fixture
+def workload_obj() -> dict[str, Any]:
+    """A Kueue workload, as returned by the API server."""
+    return {
+        "apiVersion": "kueue.x-k8s.io/v1beta1",
+        "kind": "Workload",
+        "metadata": {
+            "name": "job-test-job-1a2b3",
+            "namespace": "default",
+            "uid": "2f6f6b4e-5b8e-4d4f-9d6c-2a1c8e7f0b3a",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": {
+                "kueue.x-k8s.io/job-uid": "6b1e0c2a-9f5d-4d8e-8f3a-0c9e7d6b5a41"
+            },
+            "ownerReferences": [
+                {
+                    "apiVersion": "batch/v1",
+                    "kind": "Job",
+                    "name": "test-job",
+                    "uid": "6b1e0c2a-9f5d-4d8e-8f3a-0c9e7d6b5a41",
+                    "controller": True,
+                    "blockOwnerDeletion": True,
+                }
+            ],
+            "managedFields": [
+                {
+                    "apiVersion": "kueue.x-k8s.io/v1beta1",
+                    "fieldsType": "FieldsV1",
+                    "fieldsV1": {"f:spec": {}},
+                    "manager": "kueue",
+                    "operation": "Update",
+                    "time": "2024-01-01T00:00:00Z",
+                }
+            ],
+        },
+        "spec": {
+            "active": True,
+            "podSets": [{"count": 1, "name": "main", "template": {}}],
+            "queueName": "user-queue",
+            "priority": 0,
+        },
+        "status": {
+            "admission": {
+                "clusterQueue": "cluster-queue",
+                "podSetAssignments": [{"count": 1, "name": "main"}],
+            },
+            "conditions": [
+                {
+                    "type": "QuotaReserved",
+                    "status": "True",
+                    "reason": "QuotaReserved",
+                    "message": "Quota reserved in ClusterQueue cluster-queue",
+                    "lastTransitionTime": "2024-01-01T00:05:00Z",
+                },
+                {
+                    "type": "Admitted",
+                    "status": "True",
+                    "reason": "Admitted",
+                    "message": "The workload is admitted",
+                    "lastTransitionTime": "2024-01-01T00:05:00Z",
+                },
+            ],
+        },
+    }
+
+
+def test_from_api_object(workload_obj: dict[str, Any]) -> None:
+    """The fast path yields the same workload as full validation, minus managed fields."""
+    validated = KueueWorkload.model_validate(workload_obj)
+    constructed = KueueWorkload.from_api_object(workload_obj)
+
+    assert constructed.metadata.managed_fields is None
+    validated.metadata.managed_fields = None
+    assert constructed.metadata == validated.metadata
+    assert constructed.spec == validated.spec
+    assert constructed.status == validated.status
+
+    assert constructed.execution_status == JobStatus.EXECUTING
+    assert WorkloadMetadata.from_kueue_workload(
+        constructed, fields=["spec", "kueue_status", "last_admission_timestamp"]
+    ) == WorkloadMetadata.from_kueue_workload(
+        validated, fields=["spec", "kueue_status", "last_admission_timestamp"]
+    )
+
+
+def test_equality(workload_obj: dict[str, Any]) -> None:
+    workload = KueueWorkload.from_api_object(workload_obj)
+    other = KueueWorkload.from_api_object(workload_obj)
+
+    # Cached status properties do not take part in equality
+    assert workload.execution_status == JobStatus.EXECUTING
+    assert workload == other
+    # The Kubernetes service does, workloads of different clusters are different
+    assert KueueWorkload.from_api_object(workload_obj, k8s=MagicMock()) != other
+
+
+def test_from_api_object_managed_fields(workload_obj: dict[str, Any]) -> None:
+    workload = KueueWorkload.from_api_object(workload_obj, include_managed_fields=True)
+    [entry] = workload.metadata.managed_fields
+    assert entry.manager == "kueue"
+
+
+@pytest.mark.parametrize(
+    "requests, expected",
+    [
+        ({"cpu": "2"}, 0.25),
+        ({"cpu": "500m", "memory": "20Gi"}, 0.125),
+        ({"memory": "24Gi"}, 0.0),
+        ({"cpu": "8"}, -0.5),
+        ({"nvidia.com/gpu": 1}, None),
+        ({}, 1.0),
+    ],
+)
+def test_cluster_queue_headroom(
+    requests: dict[str, str], expected: float | None
+) -> None:
+    cluster_queue = {
+        "spec": {
+            "resourceGroups": [
+                {
+                    "coveredResources": ["cpu", "memory"],
+                    "flavors": [
+                        {
+                            "name": "on-demand",
+                            "resources": [
+                                {"name": "cpu", "nominalQuota": "4"},
+                                {"name": "memory", "nominalQuota": "16Gi"},
+                            ],
+                        },
+                        {
+                            "name": "spot",
+                            "resources": [
+                                {"name": "cpu", "nominalQuota": "4"},
+                                {"name": "memory", "nominalQuota": "16Gi"},
+                            ],
+                        },
+                    ],
+                }
+            ]
+        },
+        "status": {
+            "flavorsReservation": [
+                {
+                    "name": "on-demand",
+                    "resources": [
+                        {"name": "cpu", "total": "4"},
+                        {"name": "memory", "total": "8Gi"},
+                    ],
+                }
+            ]
+        },
+    }
+
+    assert cluster_queue_headroom(cluster_queue, requests) == expected
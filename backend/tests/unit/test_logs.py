@@ -0,0 +1,58 @@
+import re
+
+import pytest
+
+from jobq_server.utils.logs import LineMatch, grep, has_nested_quantifier
+
+LINES = ["alpha", "beta", "gamma", "delta", "epsilon"]
+
+
+@pytest.mark.parametrize(
+    "pattern, context, expected",
+    [
+        (r"^zeta$", 0, []),
+        (r"^beta$", 0, [LineMatch(2, "beta")]),
+        (r"ta$", 0, [LineMatch(2, "beta"), LineMatch(4, "delta")]),
+        (r"^gamma$", 1, [LineMatch(3, "gamma", ["beta"], ["delta"])]),
+        # Context is truncated at the start and end of the input
+        (r"^alpha$", 2, [LineMatch(1, "alpha", [], ["beta", "gamma"])]),
+        (r"^epsilon$", 2, [LineMatch(5, "epsilon", ["gamma", "delta"], [])]),
+        # Overlapping context windows
+        (
+            r"ta$",
+            1,
+            [
+                LineMatch(2, "beta", ["alpha"], ["gamma"]),
+                LineMatch(4, "delta", ["gamma"], ["epsilon"]),
+            ],
+        ),
+    ],
+)
+def test_grep(pattern: str, context: int, expected: list[LineMatch]) -> None:
+    actual = list(grep(LINES, re.compile(pattern), context=context))
+    assert actual == expected
+
+
+def test_grep_is_lazy() -> None:
+    def lines():
+        yield "match"
+        raise AssertionError("input consumed beyond first match")
+
+    assert next(grep(lines(), re.compile("match"))) == LineMatch(1, "match")
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        (r"error", False),
+        (r"(ab)+c*", False),
+        (r"(?:x{2})*", False),
+        (r"(a?){3}", False),
+        (r"(a+)+$", True),
+        (r"(a|b*)*", True),
+        (r"((a+)b)*?", True),
+        (r"(?:(?=a+))+", True),
+    ],
+)
+def test_has_nested_quantifier(pattern: str, expected: bool) -> None:
+    assert has_nested_quantifier(pattern) == expected
@@ -0,0 +1,40 @@
+from datetime import UTC, datetime
+
+from jobq_server.profiling import ProfileStore, RequestProfile
+
+
+def _profile(i: int, duration: float, requested: bool = False) -> RequestProfile:
+    return RequestProfile(
+        id=str(i),
+        method="GET",
+        path="/jobs",
+        route="/jobs",
+        status=200,
+        started_at=datetime.now(UTC),
+        duration=duration,
+        requested=requested,
+        session=None,  # type: ignore[arg-type]
+    )
+
+
+def test_store_keeps_slowest() -> None:
+    store = ProfileStore(slowest=3)
+    for i, duration in enumerate([0.5, 0.1, 0.9, 0.3, 0.7, 0.2]):
+        store.add(_profile(i, duration))
+
+    assert [p.duration for p in store.list()] == [0.9, 0.7, 0.5]
+    assert store.get("2") is not None
+    assert store.get("1") is None
+
+
+def test_store_keeps_recent_requested() -> None:
+    store = ProfileStore(slowest=0, requested=2)
+    for i in range(3):
+        store.add(_profile(i, 0.1, requested=True))
+    # Not retained, since the slowest requests are not tracked
+    store.add(_profile(3, 1.0))
+
+    assert {p.id for p in store.list()} == {"1", "2"}
+
+    store.clear()
+    assert store.list() == []
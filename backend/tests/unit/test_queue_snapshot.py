@@ -0,0 +1,140 @@
+from typing import Any
+
+from jobq_server.models import QueueKind
+from jobq_server.services.queue_snapshot import QueueSnapshot, cluster_queue_snapshot
+
+
+def _cluster_queue(name: str, **status: Any) -> dict[str, Any]:
+    return {
+        "metadata": {"name": name},
+        "spec": {
+            "cohort": "team",
+            "resourceGroups": [
+                {
+                    "coveredResources": ["cpu", "nvidia.com/gpu"],
+                    "flavors": [
+                        {
+                            "name": "a100",
+                            "resources": [
+                                {"name": "cpu", "nominalQuota": 32},
+                                {
+                                    "name": "nvidia.com/gpu",
+                                    "nominalQuota": "4",
+                                    "borrowingLimit": "2",
+                                },
+                            ],
+                        }
+                    ],
+                }
+            ],
+        },
+        "status": status,
+    }
+
+
+def _local_queue(name: str, namespace: str, cluster_queue: str) -> dict[str, Any]:
+    return {
+        "metadata": {"name": name, "namespace": namespace},
+        "spec": {"clusterQueue": cluster_queue},
+        "status": {"pendingWorkloads": 2, "admittedWorkloads": 1},
+    }
+
+
+def test_cluster_queue_snapshot():
+    queue = cluster_queue_snapshot(
+        _cluster_queue(
+            "gpu-queue",
+            pendingWorkloads=3,
+            admittedWorkloads=1,
+            flavorsReservation=[
+                {
+                    "name": "a100",
+                    "resources": [
+                        {"name": "cpu", "total": "8", "borrowed": "0"},
+                        {"name": "nvidia.com/gpu", "total": "5", "borrowed": "1"},
+                    ],
+                }
+            ],
+            flavorsUsage=[
+                {"name": "a100", "resources": [{"name": "cpu", "total": "4"}]}
+            ],
+        ),
+        cluster="gpu-cluster",
+    )
+
+    assert (queue.name, queue.cluster, queue.cohort) == (
+        "gpu-queue",
+        "gpu-cluster",
+        "team",
+    )
+    assert (queue.pending_workloads, queue.admitted_workloads) == (3, 1)
+    (flavor,) = queue.flavors
+    assert flavor.name == "a100"
+    cpu, gpu = flavor.resources
+    assert (cpu.nominal_quota, cpu.reserved, cpu.usage, cpu.borrowing_limit) == (
+        "32",
+        "8",
+        "4",
+        None,
+    )
+    assert (gpu.nominal_quota, gpu.borrowing_limit, gpu.reserved, gpu.borrowed) == (
+        "4",
+        "2",
+        "5",
+        "1",
+    )
+
+
+def test_cluster_queue_snapshot_without_status():
+    queue = cluster_queue_snapshot(_cluster_queue("gpu-queue"))
+
+    assert queue.pending_workloads == 0
+    assert {r.reserved for r in queue.flavors[0].resources} == {"0"}
+
+
+def test_queue_snapshot():
+    snapshot = QueueSnapshot()
+    assert not snapshot.synced(None)
+
+    snapshot.replace(QueueKind.CLUSTER, None, [_cluster_queue("gpu-queue")])
+    snapshot.replace(
+        QueueKind.LOCAL,
+        None,
+        [
+            _local_queue("user-queue", "ml", "gpu-queue"),
+            _local_queue("user-queue", "default", "gpu-queue"),
+        ],
+    )
+    assert snapshot.synced(None)
+
+    (queue,) = snapshot.cluster_queues([None])
+    assert [(lq.namespace, lq.name) for lq in queue.local_queues] == [
+        ("default", "user-queue"),
+        ("ml", "user-queue"),
+    ]
+    assert queue.local_queues[0].pending_workloads == 2
+
+    # Watch events update the snapshot
+    snapshot.update(
+        QueueKind.CLUSTER,
+        None,
+        "MODIFIED",
+        _cluster_queue("gpu-queue", pendingWorkloads=4),
+    )
+    snapshot.update(QueueKind.CLUSTER, None, "ADDED", _cluster_queue("cpu-queue"))
+    snapshot.update(
+        QueueKind.LOCAL,
+        None,
+        "DELETED",
+        _local_queue("user-queue", "ml", "gpu-queue"),
+    )
+    cpu_queue, gpu_queue = snapshot.cluster_queues([None])
+    assert cpu_queue.name == "cpu-queue"
+    assert cpu_queue.local_queues == []
+    assert gpu_queue.pending_workloads == 4
+    assert [lq.namespace for lq in gpu_queue.local_queues] == ["default"]
+
+    # Relisting replaces the queues
+    snapshot.replace(QueueKind.CLUSTER, None, [_cluster_queue("cpu-queue")])
+    assert [q.name for q in snapshot.cluster_queues([None])] == ["cpu-queue"]
+    assert snapshot.cluster_queues(["other-cluster"]) == []
@@ -0,0 +1,169 @@
+import datetime
+from typing import Any
+
+import pytest
+
+from jobq_server.models import QueueKind
+from jobq_server.services.queue_stats import QueueStatsCollector
+from jobq_server.services.watcher import WorkloadEvent
+from jobq_server.utils.kueue import KueueWorkload
+
+NOW = datetime.datetime(2024, 1, 2, tzinfo=datetime.UTC)
+HOUR = 3600
+
+
+def _time(minutes: float) -> str:
+    """A timestamp some minutes before now."""
+    return (NOW - datetime.timedelta(minutes=minutes)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _condition(typ: str, reason: str, minutes_ago: float, status: str = "True"):
+    return {
+        "type": typ,
+        "status": status,
+        "reason": reason,
+        "lastTransitionTime": _time(minutes_ago),
+    }
+
+
+def _event(
+    name: str,
+    submitted: float,
+    conditions: list[dict[str, Any]],
+    admitted_to: str | None = "cluster-queue",
+    type: str = "MODIFIED",
+) -> WorkloadEvent:
+    """The watch event of a workload submitted some minutes ago."""
+    status: dict[str, Any] = {"conditions": conditions}
+    if admitted_to is not None:
+        status["admission"] = {"clusterQueue": admitted_to, "podSetAssignments": []}
+    workload = KueueWorkload.from_api_object({
+        "metadata": {
+            "name": name,
+            "namespace": "default",
+            "creationTimestamp": _time(submitted),
+        },
+        "spec": {"podSets": [], "queueName": "user-queue", "active": True},
+        "status": status,
+    })
+    return WorkloadEvent(type, workload)
+
+
+@pytest.fixture
+def collector() -> QueueStatsCollector:
+    return QueueStatsCollector(window=24 * HOUR, clock=NOW.timestamp)
+
+
+def test_lifecycle(collector: QueueStatsCollector):
+    collector.record([_event("wl-0", 60, [], admitted_to=None)])
+    stats = collector.stats(QueueKind.LOCAL, "user-queue", "default")
+    assert stats is not None
+    assert (stats.admitted, stats.finished, stats.wait_time.count) == (0, 0, 0)
+    # Not admitted to a cluster queue yet
+    assert collector.stats(QueueKind.CLUSTER, "cluster-queue") is None
+
+    admitted = [_condition("Admitted", "Admitted", 50)]
+    finished = admitted + [_condition("Finished", "Succeeded", 20)]
+    # Repeated events (e.g., after relisting) are only counted once
+    collector.record([_event("wl-0", 60, admitted)] * 2)
+    collector.record([_event("wl-0", 60, finished)] * 2)
+
+    for stats in (
+        collector.stats(QueueKind.LOCAL, "user-queue", "default"),
+        collector.stats(QueueKind.CLUSTER, "cluster-queue"),
+    ):
+        assert stats is not None
+        assert (stats.admitted, stats.evicted, stats.finished) == (1, 0, 1)
+        assert stats.wait_time.percentiles["p50"] == pytest.approx(600, rel=0.01)
+        assert stats.runtime.percentiles["p50"] == pytest.approx(1800, rel=0.01)
+        # Averaged over the first hour, not over the whole window
+        assert stats.jobs_per_hour == pytest.approx(1)
+        assert stats.eviction_rate == 0
+
+    assert collector.stats(QueueKind.LOCAL, "user-queue", "other") is None
+
+
+def test_eviction(collector: QueueStatsCollector):
+    collector.record([_event("wl-0", 60, [_condition("Admitted", "Admitted", 55)])])
+    # Evicted workloads lose their admission, and wait again until readmitted
+    evicted = [
+        _condition("Admitted", "Evicted", 40, status="False"),
+        _condition("Evicted", "Preempted", 40),
+    ]
+    collector.record([_event("wl-0", 60, evicted, admitted_to=None)])
+    readmitted = [
+        _condition("Admitted", "Admitted", 10),
+        _condition("Evicted", "Preempted", 40),
+    ]
+    collector.record([_event("wl-0", 60, readmitted)])
+
+    stats = collector.stats(QueueKind.CLUSTER, "cluster-queue")
+    assert stats is not None
+    assert (stats.admitted, stats.evicted) == (2, 1)
+    assert stats.eviction_rate == 0.5
+    # 5 minutes until the first admission, 30 minutes from the eviction to the second
+    assert stats.wait_time.percentiles["p50"] == pytest.approx(300, rel=0.01)
+    assert stats.wait_time.mean == pytest.approx((300 + 1800) / 2)
+
+
+def test_window(collector: QueueStatsCollector):
+    day = 24 * 60
+    collector.record([
+        # Admitted before the window, finished within it
+        _event(
+            "wl-0",
+            day + 60,
+            [
+                _condition("Admitted", "Admitted", day + 30),
+                _condition("Finished", "Succeeded", 60),
+            ],
+        ),
+        _event("wl-1", 120, [_condition("Admitted", "Admitted", 90)]),
+    ])
+
+    stats = collector.stats(QueueKind.LOCAL, "user-queue", "default")
+    assert stats is not None
+    assert (stats.admitted, stats.finished) == (1, 1)
+    assert stats.runtime.percentiles["p50"] == pytest.approx(day * 60 - 1800, rel=0.01)
+
+    # Events expire with the window
+    collector.clock = lambda: NOW.timestamp() + 23 * HOUR
+    stats = collector.stats(QueueKind.LOCAL, "user-queue", "default")
+    assert stats is not None
+    assert (stats.admitted, stats.finished) == (0, 0)
+
+
+def test_jobs_per_hour(collector: QueueStatsCollector):
+    finished = [
+        _condition("Admitted", "Admitted", 150),
+        _condition("Finished", "Succeeded", 30),
+    ]
+    collector.record([_event(f"wl-{i}", 180, finished) for i in range(6)])
+
+    # The statistics cover the time since the earliest event
+    stats = collector.stats(QueueKind.LOCAL, "user-queue", "default")
+    assert stats is not None
+    assert stats.jobs_per_hour == pytest.approx(6 / 2.5)
+
+    collector.clock = lambda: NOW.timestamp() + 9.5 * HOUR
+    stats = collector.stats(QueueKind.LOCAL, "user-queue", "default")
+    assert stats is not None
+    assert stats.jobs_per_hour == pytest.approx(6 / 12)
+
+    # And at most the window
+    collector.clock = lambda: NOW.timestamp() + 22 * HOUR
+    stats = collector.stats(QueueKind.LOCAL, "user-queue", "default")
+    assert stats is not None
+    assert stats.jobs_per_hour == pytest.approx(6 / 24)
+
+
+def test_deleted(collector: QueueStatsCollector):
+    admitted = [_condition("Admitted", "Admitted", 50)]
+    collector.record([_event("wl-0", 60, admitted)])
+    collector.record([_event("wl-0", 60, admitted, type="DELETED")])
+    # A new workload of the same name is counted again
+    collector.record([_event("wl-0", 60, admitted, type="ADDED")])
+
+    stats = collector.stats(QueueKind.LOCAL, "user-queue", "default")
+    assert stats is not None
+    assert stats.admitted == 2
@@ -0,0 +1,185 @@
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+from pytest_mock import MockFixture
+
+from jobq_server.config import RateLimit
+from jobq_server.exceptions import KubernetesUnavailableError
+from jobq_server.services.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RateLimiter,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+def test_token_bucket_burst(mocker: MockFixture):
+    clock = mocker.patch("time.monotonic", return_value=100.0)
+    bucket = TokenBucket(qps=10, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Further calls have to wait for the bucket to refill, in order
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    # Refilled, but never beyond the burst size
+    clock.return_value = 200.0
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_rate_limiter_per_verb():
+    limiter = RateLimiter(
+        RateLimit(qps=0, burst=1),
+        {"list": RateLimit(qps=0.01, burst=1)},
+        timeout=1.0,
+    )
+
+    # The default limit is disabled
+    for _ in range(10):
+        limiter.acquire("get")
+
+    limiter.acquire("list")
+    with pytest.raises(KubernetesUnavailableError) as exc_info:
+        limiter.acquire("list")
+    assert exc_info.value.retry_after == pytest.approx(100, rel=0.01)
+
+
+def test_rate_limiter_waits():
+    limiter = RateLimiter(RateLimit(qps=100, burst=1))
+
+    start = time.perf_counter()
+    for _ in range(3):
+        limiter.acquire("get")
+
+    assert time.perf_counter() - start >= 0.015
+
+
+def test_circuit_breaker(mocker: MockFixture):
+    clock = mocker.patch("time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.before_call()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(KubernetesUnavailableError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after == 10
+
+    # A single trial call is let through after the reset timeout
+    clock.return_value = 110.0
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(KubernetesUnavailableError):
+        breaker.before_call()
+
+    # A failed trial call opens the circuit again, a successful one closes it
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    clock.return_value = 120.0
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.before_call()
+
+
+def test_circuit_breaker_trial_timeout(mocker: MockFixture):
+    clock = mocker.patch("time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+
+    clock.return_value = 110.0
+    breaker.before_call()
+    with pytest.raises(KubernetesUnavailableError):
+        breaker.before_call()
+
+    # The outcome of the trial call is never recorded, another one is let through
+    clock.return_value = 120.0
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    # Released trial calls are replaced right away
+    breaker.release()
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_circuit_breaker_state_metric():
+    # Every cluster has its own breaker, whose state is labelled with the cluster
+    breakers = {
+        cluster: CircuitBreaker(failure_threshold=1, reset_timeout=10, cluster=cluster)
+        for cluster in ("metrics-a", "metrics-b")
+    }
+
+    breakers["metrics-a"].record_failure()
+
+    def state(cluster: str) -> float | None:
+        return REGISTRY.get_sample_value(
+            "jobq_kubernetes_api_circuit_state", {"cluster": cluster}
+        )
+
+    assert state("metrics-a") == CircuitState.OPEN
+    assert state("metrics-b") == CircuitState.CLOSED
+
+
+def test_circuit_breaker_disabled():
+    breaker = CircuitBreaker(failure_threshold=0)
+
+    for _ in range(10):
+        breaker.record_failure()
+
+    breaker.before_call()
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.parametrize(
+    "verb, status, attempt, retry_after, retried",
+    [
+        ("list", 429, 0, None, True),
+        ("create", 429, 0, None, True),
+        ("list", 503, 0, None, True),
+        # Non-idempotent calls are only retried if throttled or asked to
+        ("create", 503, 0, None, False),
+        ("create", 503, 0, 1.0, True),
+        ("list", 404, 0, None, False),
+        ("list", 429, 3, None, False),
+        # Retry-After beyond the maximum backoff
+        ("list", 429, 0, 60.0, False),
+    ],
+)
+def test_retry_policy(
+    verb: str, status: int, attempt: int, retry_after: float | None, retried: bool
+):
+    policy = RetryPolicy(max_retries=3, backoff=0.1, max_backoff=10.0)
+
+    delay = policy.delay(verb, status, attempt, retry_after)
+
+    assert (delay is not None) == retried
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(max_retries=10, backoff=0.1, max_backoff=1.0)
+
+    for attempt in range(10):
+        delay = policy.delay("get", 503, attempt)
+        assert delay is not None
+        assert 0 <= delay <= min(1.0, 0.1 * 2**attempt)
+
+    assert policy.delay("get", 429, 0, retry_after=0.5) >= 0.5
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1", 1.0), ("0.5", 0.5), ("-1", 0.0), (None, None), ("soon", None)],
+)
+def test_parse_retry_after(value: str | None, expected: float | None):
+    assert parse_retry_after(value) == expected
@@ -0,0 +1,31 @@
+import pytest
+
+from jobq_server.config import RetentionRule, Settings
+from jobq_server.services.retention import retention_ttl
+
+SETTINGS = Settings(
+    job_retention=86400,
+    job_retention_rules=[
+        RetentionRule(queue="gpu-queue", labels={"keep": "true"}, ttl=None),
+        RetentionRule(queue="gpu-queue", ttl=600),
+        RetentionRule(labels={"team": "ml"}, ttl=3600),
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    "queue, labels, expected",
+    [
+        ("gpu-queue", {"keep": "true"}, None),
+        ("gpu-queue", {"team": "ml"}, 600),
+        ("user-queue", {"team": "ml"}, 3600),
+        ("user-queue", {"team": "infra"}, 86400),
+        (None, {}, 86400),
+    ],
+)
+def test_retention_ttl(queue: str | None, labels: dict[str, str], expected: int | None):
+    assert retention_ttl(queue, labels, SETTINGS) == expected
+
+
+def test_retention_ttl_default():
+    assert retention_ttl("user-queue", {}, Settings()) is None
@@ -0,0 +1,332 @@
+import json
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from jobq import (
+    CacheVolume,
+    CheckpointOptions,
+    Image,
+    Job,
+    JobOptions,
+    NodeRequirement,
+    PlacementOptions,
+    ResourceOptions,
+    RetryOptions,
+    SchedulingOptions,
+    Toleration,
+    TopologySpread,
+)
+from kubernetes import client
+from pytest_mock import MockerFixture
+
+from jobq_server.config import get_settings
+from jobq_server.runner import KueueRunner, RayJobRunner
+
+LABELS = {"kueue.x-k8s.io/queue-name": "user-queue"}
+
+
+def _job(**options) -> Job:
+    def job_fn(): ...
+
+    return Job(
+        job_fn,
+        options=JobOptions(
+            scheduling=SchedulingOptions(queue_name="user-queue"), **options
+        ),
+    )
+
+
+def _k8s() -> MagicMock:
+    return MagicMock(namespace="default", api_client=client.ApiClient())
+
+
+@pytest.fixture(autouse=True)
+def scheduling_labels(mocker: MockerFixture) -> None:
+    # The local queue is looked up in the cluster
+    for module in ("kueue", "ray"):
+        mocker.patch(
+            f"jobq_server.runner.{module}.kueue_scheduling_labels", return_value=LABELS
+        )
+
+
+def test_job_defaults():
+    runner = KueueRunner(_k8s())
+    spec = runner._make_job_crd(_job(), Image("test:latest"), {}).spec
+
+    assert spec.backoff_limit is None
+    assert spec.pod_failure_policy is None
+    assert spec.active_deadline_seconds is None
+
+
+def test_job_failure_policy():
+    runner = KueueRunner(_k8s())
+    job = _job(
+        retries=RetryOptions(max_retries=2, fail_on_exit_codes=[1, 2]),
+        deadline_seconds=3600,
+    )
+    spec = runner._make_job_crd(job, Image("test:latest"), {}).spec
+
+    assert spec.backoff_limit == 2
+    assert spec.active_deadline_seconds == 3600
+    fail, ignore = client.ApiClient().sanitize_for_serialization(
+        spec.pod_failure_policy
+    )["rules"]
+    assert fail == {
+        "action": "FailJob",
+        "onExitCodes": {
+            "containerName": "workload",
+            "operator": "In",
+            "values": [1, 2],
+        },
+    }
+    assert ignore == {
+        "action": "Ignore",
+        "onPodConditions": [{"type": "DisruptionTarget", "status": "True"}],
+    }
+
+
+def test_job_checkpoint():
+    runner = KueueRunner(_k8s())
+    job = _job(
+        checkpoint=CheckpointOptions(volume_claim="ckpt", grace_period_seconds=120)
+    )
+    pod_spec = runner._make_job_crd(job, Image("test:latest"), {}).spec.template.spec
+
+    assert pod_spec.termination_grace_period_seconds == 120
+    (volume,) = pod_spec.volumes
+    assert volume.persistent_volume_claim.claim_name == "ckpt"
+    (container,) = pod_spec.containers
+    (mount,) = container.volume_mounts
+    assert (mount.name, mount.mount_path) == (volume.name, "/checkpoints")
+    # Every job has its own checkpoint directory
+    assert mount.sub_path_expr == "$(JOBQ_JOB_NAME)"
+    env = {var.name: var for var in container.env}
+    assert env["JOBQ_CHECKPOINT_DIR"].value == "/checkpoints"
+    assert env["JOBQ_JOB_NAME"].value_from.field_ref.field_path == (
+        "metadata.labels['job-name']"
+    )
+
+
+@pytest.fixture
+def host_cache_root(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("JOBQ_SERVER_HOST_CACHE_ROOT", "/var/cache/jobq")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.mark.usefixtures("host_cache_root")
+def test_job_caches():
+    runner = KueueRunner(_k8s())
+    job = _job(
+        caches=[
+            CacheVolume(name="data", volume_claim="datasets"),
+            CacheVolume(name="models", host_path="models/v1", mount_path="/m"),
+        ],
+        checkpoint=CheckpointOptions(volume_claim="ckpt"),
+    )
+    pod_spec = runner._make_job_crd(job, Image("test:latest"), {}).spec.template.spec
+
+    data, models, _ = pod_spec.volumes
+    assert data.persistent_volume_claim.claim_name == "datasets"
+    # Node-local caches are confined to the host cache root
+    assert (models.host_path.path, models.host_path.type) == (
+        "/var/cache/jobq/models/v1",
+        "DirectoryOrCreate",
+    )
+    (container,) = pod_spec.containers
+    mounts = {mount.name: mount.mount_path for mount in container.volume_mounts}
+    assert mounts == {
+        data.name: "/cache/data",
+        models.name: "/m",
+        "checkpoints": "/checkpoints",
+    }
+    env = {var.name: var.value for var in container.env}
+    assert json.loads(env["JOBQ_CACHES"]) == {"data": "/cache/data", "models": "/m"}
+    assert env["JOBQ_CHECKPOINT_DIR"] == "/checkpoints"
+
+
+def test_job_host_caches_disabled():
+    runner = KueueRunner(_k8s())
+    job = _job(caches=[CacheVolume(name="models", host_path="models")])
+    with pytest.raises(ValueError, match="node-local caches are not enabled"):
+        runner._make_job_crd(job, Image("test:latest"), {})
+
+
+def test_job_resource_volumes():
+    runner = KueueRunner(_k8s())
+    job = _job(
+        resources=ResourceOptions(
+            memory="4Gi",
+            shm_size="1Gi",
+            scratch_size="100Gi",
+            scratch_storage_class="local-nvme",
+        ),
+        caches=[CacheVolume(name="data", volume_claim="datasets")],
+    )
+    pod_spec = runner._make_job_crd(job, Image("test:latest"), {}).spec.template.spec
+
+    shm, scratch, _ = pod_spec.volumes
+    assert (shm.empty_dir.medium, shm.empty_dir.size_limit) == ("Memory", "1Gi")
+    claim = scratch.ephemeral.volume_claim_template.spec
+    assert claim.storage_class_name == "local-nvme"
+    assert claim.resources.requests == {"storage": "100Gi"}
+    (container,) = pod_spec.containers
+    mounts = {mount.name: mount.mount_path for mount in container.volume_mounts}
+    assert mounts == {
+        "shm": "/dev/shm",
+        "scratch": "/scratch",
+        "cache-data": "/cache/data",
+    }
+    assert container.resources["limits"]["memory"] == str(5 * 2**30)
+
+
+def test_rayjob_resource_volumes():
+    runner = RayJobRunner(_k8s())
+    job = _job(resources=ResourceOptions(cpu="1", shm_size="1Gi", scratch_size="10Gi"))
+    spec = runner._create_ray_job(job, Image("test:latest"), {})["spec"]
+
+    head = spec["rayClusterSpec"]["headGroupSpec"]["template"]["spec"]
+    assert head["volumes"] == [
+        {"name": "shm", "emptyDir": {"medium": "Memory", "sizeLimit": "1Gi"}},
+        {"name": "scratch", "emptyDir": {"sizeLimit": "10Gi"}},
+    ]
+    (container,) = head["containers"]
+    assert container["volumeMounts"] == [
+        {"name": "shm", "mountPath": "/dev/shm"},
+        {"name": "scratch", "mountPath": "/scratch"},
+    ]
+    assert container["resources"]["requests"]["ephemeral-storage"] == "10Gi"
+    assert "env" not in container
+
+
+@pytest.mark.usefixtures("host_cache_root")
+def test_rayjob_caches():
+    runner = RayJobRunner(_k8s())
+    job = _job(resources={"cpu": "1"}, caches=[CacheVolume(name="data", host_path="d")])
+    spec = runner._create_ray_job(job, Image("test:latest"), {})["spec"]
+
+    head = spec["rayClusterSpec"]["headGroupSpec"]["template"]["spec"]
+    assert head["volumes"] == [
+        {
+            "name": "cache-data",
+            "hostPath": {"path": "/var/cache/jobq/d", "type": "DirectoryOrCreate"},
+        }
+    ]
+    (container,) = head["containers"]
+    assert container["volumeMounts"] == [
+        {"name": "cache-data", "mountPath": "/cache/data"}
+    ]
+    assert container["env"] == [
+        {"name": "JOBQ_CACHES", "value": json.dumps({"data": "/cache/data"})}
+    ]
+
+
+def test_rayjob_failure_policy():
+    runner = RayJobRunner(_k8s())
+    job = _job(
+        resources={"cpu": "1"},
+        retries=RetryOptions(max_retries=2),
+        deadline_seconds=3600,
+    )
+    spec = runner._create_ray_job(job, Image("test:latest"), {})["spec"]
+
+    assert (spec["backoffLimit"], spec["activeDeadlineSeconds"]) == (2, 3600)
+
+    job.options.retries = RetryOptions(fail_on_exit_codes=[1])
+    with pytest.raises(ValueError, match="not supported for RayJobs"):
+        runner._create_ray_job(job, Image("test:latest"), {})
+
+
+A100_FLAVOR = {
+    "metadata": {"name": "a100"},
+    "spec": {
+        "nodeLabels": {"cloud.example.com/gpu": "a100"},
+        "nodeTaints": [{"key": "gpu", "value": "a100", "effect": "NoSchedule"}],
+    },
+}
+
+
+def test_job_placement(mocker: MockerFixture):
+    flavor = mocker.patch(
+        "jobq_server.runner.base.kueue_resource_flavor", return_value=A100_FLAVOR
+    )
+    runner = KueueRunner(_k8s())
+    job = _job(
+        resources=ResourceOptions(gpu=1),
+        placement=PlacementOptions(
+            accelerator="a100",
+            node_selector={"kubernetes.io/arch": "amd64"},
+            node_affinity=[
+                NodeRequirement(key="zone", values=["a", "b"]),
+                NodeRequirement(key="spot", operator="DoesNotExist", weight=10),
+            ],
+            tolerations=[Toleration(key="dedicated", operator="Exists")],
+            topology_spread=[TopologySpread(topology_key="kubernetes.io/hostname")],
+        ),
+    )
+    template = runner._make_job_crd(job, Image("test:latest"), {}).spec.template
+    pod_spec = client.ApiClient().sanitize_for_serialization(template.spec)
+
+    flavor.assert_called_once_with(runner._k8s, "a100")
+    # The job is restricted to the nodes of the flavor, and tolerates their taints
+    assert pod_spec["nodeSelector"] == {
+        "kubernetes.io/arch": "amd64",
+        "cloud.example.com/gpu": "a100",
+    }
+    assert pod_spec["tolerations"] == [
+        {"key": "dedicated", "operator": "Exists"},
+        {"key": "gpu", "operator": "Equal", "value": "a100", "effect": "NoSchedule"},
+    ]
+    node_affinity = pod_spec["affinity"]["nodeAffinity"]
+    assert node_affinity["requiredDuringSchedulingIgnoredDuringExecution"] == {
+        "nodeSelectorTerms": [
+            {
+                "matchExpressions": [
+                    {"key": "zone", "operator": "In", "values": ["a", "b"]}
+                ]
+            }
+        ]
+    }
+    assert node_affinity["preferredDuringSchedulingIgnoredDuringExecution"] == [
+        {
+            "weight": 10,
+            "preference": {
+                "matchExpressions": [{"key": "spot", "operator": "DoesNotExist"}]
+            },
+        }
+    ]
+    # The pods of the job are spread
+    assert template.metadata.labels == {"x-jobq.io/job": "job_fn"}
+    assert pod_spec["topologySpreadConstraints"] == [
+        {
+            "topologyKey": "kubernetes.io/hostname",
+            "maxSkew": 1,
+            "whenUnsatisfiable": "ScheduleAnyway",
+            "labelSelector": {"matchLabels": {"x-jobq.io/job": "job_fn"}},
+        }
+    ]
+
+    job.options.placement.node_selector = {"cloud.example.com/gpu": "t4"}
+    with pytest.raises(ValueError, match="conflicts with accelerator type"):
+        runner._make_job_crd(job, Image("test:latest"), {})
+
+
+def test_rayjob_placement(mocker: MockerFixture):
+    mocker.patch("jobq_server.runner.base.kueue_resource_flavor", return_value=None)
+    runner = RayJobRunner(_k8s())
+    job = _job(
+        resources=ResourceOptions(cpu="1", gpu=1),
+        placement=PlacementOptions(accelerator="NVIDIA-A100-SXM4-80GB"),
+    )
+    spec = runner._create_ray_job(job, Image("test:latest"), {})["spec"]
+
+    # Without a flavor of the same name, the accelerator label of the nodes is used
+    head = spec["rayClusterSpec"]["headGroupSpec"]["template"]
+    assert head["spec"]["nodeSelector"] == {
+        "nvidia.com/gpu.product": "NVIDIA-A100-SXM4-80GB"
+    }
+    assert "tolerations" not in head["spec"]
+    assert "metadata" not in head
+    assert "nodeSelector" not in spec["submitterPodTemplate"]["spec"]
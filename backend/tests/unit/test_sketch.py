@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from jobq_server.utils.sketch import QuantileSketch
+
+
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.5, 0.9, 0.99, 1.0])
+def test_quantile_accuracy(q: float):
+    rng = random.Random(42)
+    values = sorted(rng.lognormvariate(5, 2) for _ in range(10000))
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    expected = values[int(q * (len(values) - 1))]
+    assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+    assert sketch.count == len(values)
+    assert sketch.mean == pytest.approx(sum(values) / len(values))
+
+
+def test_merge():
+    rng = random.Random(0)
+    values = [rng.expovariate(0.01) for _ in range(1000)]
+    left, right, combined = (QuantileSketch() for _ in range(3))
+    for i, value in enumerate(values):
+        (left if i % 2 else right).add(value)
+        combined.add(value)
+
+    left.merge(right)
+
+    assert left.count == combined.count
+    for q in (0.5, 0.9, 0.99):
+        assert left.quantile(q) == combined.quantile(q)
+    with pytest.raises(ValueError):
+        left.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_empty_and_zeros():
+    sketch = QuantileSketch()
+    assert sketch.quantile(0.5) is None
+    assert sketch.mean is None
+
+    for value in (0.0, -1.0, 0.0, 10.0):
+        sketch.add(value)
+
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == pytest.approx(10.0, rel=0.01)
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
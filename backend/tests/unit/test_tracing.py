@@ -0,0 +1,107 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from pytest_mock import MockFixture
+
+from jobq_server import tracing
+from jobq_server.config import Settings
+
+
+@pytest.fixture
+def spans(mocker: MockFixture) -> InMemorySpanExporter:
+    """Enable tracing, recording spans in memory."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    mocker.patch.object(tracing.trace, "get_tracer", provider.get_tracer)
+    mocker.patch.object(tracing, "_enabled", True)
+    return exporter
+
+
+@tracing.traced()
+def sync_fn(x: int) -> int:
+    return x + 1
+
+
+@tracing.traced("custom-name")
+async def async_fn(x: int) -> int:
+    return x * 2
+
+
+@tracing.traced()
+def failing_fn() -> None:
+    raise ValueError("boom")
+
+
+def test_traced(spans: InMemorySpanExporter) -> None:
+    assert sync_fn(1) == 2
+    assert asyncio.run(async_fn(2)) == 4
+
+    assert [s.name for s in spans.get_finished_spans()] == ["sync_fn", "custom-name"]
+
+
+def test_traced_exception(spans: InMemorySpanExporter) -> None:
+    with pytest.raises(ValueError):
+        failing_fn()
+
+    [span] = spans.get_finished_spans()
+    assert span.status.status_code == trace.StatusCode.ERROR
+    assert span.events[0].name == "exception"
+
+
+def test_traced_disabled(mocker: MockFixture) -> None:
+    get_tracer = mocker.patch.object(tracing.trace, "get_tracer")
+
+    assert sync_fn(1) == 2
+    get_tracer.assert_not_called()
+
+
+def test_middleware(spans: InMemorySpanExporter) -> None:
+    app = FastAPI()
+    app.add_middleware(tracing.TracingMiddleware)
+
+    @app.get("/items/{item_id}")
+    @tracing.traced()
+    async def get_item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    response = TestClient(app).get(
+        "/items/42",
+        headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"},
+    )
+    assert response.json() == {"item_id": 42}
+
+    handler_span, server_span = spans.get_finished_spans()
+    assert handler_span.name.endswith("get_item")
+    assert handler_span.parent.span_id == server_span.context.span_id
+    assert server_span.name == "GET /items/{item_id}"
+    assert server_span.kind == trace.SpanKind.SERVER
+    assert server_span.attributes["http.response.status_code"] == 200
+    # The trace is continued from the request headers
+    assert format(server_span.context.trace_id, "032x") == trace_id
+
+
+def test_file_exporter(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    settings = Settings(tracing_exporter="file", tracing_file=path)
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(tracing._make_exporter(settings)))
+
+    with provider.get_tracer(__name__).start_as_current_span("outer"):
+        with provider.get_tracer(__name__).start_as_current_span("inner"):
+            pass
+    provider.shutdown()
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["inner", "outer"]
@@ -13,6 +13,18 @@ from cli.types import Settings
 from cli.util import with_job_mgmt_api
 from openapi_client.models import JobStatus
 
+# Workload metadata shown in the listing, which leaves out the fields that are
+# expensive to compute on the server (i.e., `has_failed_pods`, which needs a pod lookup
+# per job)
+LIST_FIELDS = [
+    "spec",
+    "kueue_status",
+    "last_admission_timestamp",
+    "termination_timestamp",
+    "was_evicted",
+    "was_inadmissible",
+]
+
 
 @with_job_mgmt_api
 def list_workloads(
@@ -33,15 +45,40 @@ def list_workloads(
         if wl.was_evicted or wl.was_inadmissible:
             return "[bright_yellow] [!][/]"
         # if the job is already failed, we don't really need to warn anymore.
+        # (failed pods are only known if requested, see `LIST_FIELDS`)
         elif wl.has_failed_pods and wl.execution_status != JobStatus.FAILED:
             return "[bright_red] [!][/]"
         else:
             return ""
 
-    resp = client.list_jobs_jobs_get(include_metadata=True)
+    namespaces = ["*"] if args.all_namespaces else args.namespace
+    resp = client.list_jobs_jobs_get_with_http_info(
+        cluster=args.cluster,
+        namespace=namespaces,
+        include_metadata=True,
+        fields=LIST_FIELDS,
+    )
+    if forbidden := resp.headers.get("X-Jobq-Forbidden-Namespaces"):
+        Console(stderr=True).print(
+            f"[bright_yellow]Not allowed to list jobs in namespaces: {forbidden}[/]"
+        )
+    if unavailable := resp.headers.get("X-Jobq-Unavailable-Clusters"):
+        Console(stderr=True).print(
+            f"[bright_yellow]Could not list jobs in clusters: {unavailable}[/]"
+        )
 
+    # Show the namespace if jobs from more than one namespace can be listed
+    show_namespace = namespaces is not None and (
+        len(namespaces) > 1 or "," in namespaces[0] or namespaces == ["*"]
+    )
     t = Table(box=box.MINIMAL, show_lines=True, pad_edge=False)
     t.add_column("Name", min_width=36)  # accommodate for the workload UUID
+    if show_namespace:
+        t.add_column("Namespace")
+    # Jobs are tagged with their cluster if the server manages several clusters
+    show_cluster = any(wl.id.cluster for wl in resp.data)
+    if show_cluster:
+        t.add_column("Cluster")
     t.add_column("Type")
     t.add_column("Status")
     t.add_column("Queue name")
@@ -50,7 +87,9 @@ def list_workloads(
     t.add_column("Execution time")
     now = datetime.now(tz=timezone.utc).replace(microsecond=0)
     for wl in sorted(
-        resp, key=operator.attrgetter("metadata.submission_timestamp"), reverse=True
+        resp.data,
+        key=operator.attrgetter("metadata.submission_timestamp"),
+        reverse=True,
     ):
         meta = wl.metadata
         cluster_queue = (
@@ -60,6 +99,8 @@ def list_workloads(
         )
         t.add_row(
             f"{wl.name}{status_flags(meta)}\n[bright_black]{wl.id.uid}[/]",
+            *([wl.id.namespace] if show_namespace else []),
+            *([wl.id.cluster] if show_cluster else []),
             f"[bright_black]{wl.id.group}/{wl.id.version}/[/]{wl.id.kind}",
             f"{format_status(meta.execution_status)}",
             f"{meta.spec.queue_name}\n[bright_black]↳ {cluster_queue}[/]",
@@ -87,6 +128,29 @@ def add_parser(subparsers: Any, parent: argparse.ArgumentParser) -> None:
         help="Limit the listing to only a number of the most recent workloads.",
     )
 
+    parser.add_argument(
+        "-n",
+        "--namespace",
+        metavar="<namespace>",
+        action="append",
+        help="List the jobs in a namespace instead of the default namespace of the "
+        "server. Can be supplied multiple times for multiple namespaces.",
+    )
+    parser.add_argument(
+        "-A",
+        "--all-namespaces",
+        action="store_true",
+        help="List the jobs in all namespaces.",
+    )
+
+    parser.add_argument(
+        "--cluster",
+        metavar="<cluster>",
+        action="append",
+        help="List the jobs in a cluster, if the server manages several clusters "
+        "(by default, all clusters). Can be supplied multiple times.",
+    )
+
     # TODO: This is not yet implemented
     parser.add_argument(
         "--filter",
@@ -9,6 +9,7 @@ from cli.util import with_job_mgmt_api
 
 class LogCommands(Enum):
     UID = "uid"
+    CLUSTER = "cluster"
     TAIL = "tail"
     FOLLOW = "follow"
 
@@ -96,4 +97,10 @@ def add_parser(subparsers: Any, parent: argparse.ArgumentParser) -> None:
         type=int,
         help="Lines of recent logs to display (default: -1, all lines)",
     )
+    parser.add_argument(
+        *LogCommands.CLUSTER.to_argparse(),
+        metavar="<cluster>",
+        help="Cluster of the job, if the server manages several clusters. "
+        "Defaults to the cluster the job is found in.",
+    )
     parser.set_defaults(func=handle_logs_cmd)
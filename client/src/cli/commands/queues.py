@@ -0,0 +1,93 @@
+import argparse
+import json
+from typing import Any
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+import openapi_client
+from cli.types import Settings
+from cli.util import with_queues_api
+
+
+def format_resources(flavor: openapi_client.FlavorQuota) -> list[str]:
+    def limit(quota: openapi_client.ResourceQuota) -> str:
+        if quota.borrowing_limit is None:
+            return ""
+        return f" [bright_black](+{quota.borrowing_limit})[/]"
+
+    return [
+        f"{quota.name}: {quota.reserved} / {quota.nominal_quota}{limit(quota)}"
+        for quota in flavor.resources
+    ]
+
+
+@with_queues_api
+def list_queues(
+    client: openapi_client.QueuesApi,
+    args: argparse.Namespace,
+    settings: Settings,
+) -> None:
+    try:
+        resp = client.list_queues_queues_get(cluster=args.cluster)
+    except openapi_client.ApiException as e:
+        # Queue snapshots are disabled, or the cluster is unknown
+        if e.status == 404 and e.body:
+            raise ValueError(json.loads(e.body)["detail"]) from e
+        raise
+
+    if args.queue:
+        resp = [cq for cq in resp if cq.name in args.queue]
+
+    show_cluster = any(cq.cluster for cq in resp)
+    t = Table(box=box.MINIMAL, show_lines=True, pad_edge=False)
+    t.add_column("Cluster queue", no_wrap=True)
+    if show_cluster:
+        t.add_column("Cluster")
+    t.add_column("Local queues", no_wrap=True)
+    t.add_column("Pending")
+    t.add_column("Admitted")
+    t.add_column("Flavor", no_wrap=True)
+    t.add_column("Reserved / nominal quota (+borrowing limit)", no_wrap=True)
+    for cq in resp:
+        flavors = cq.flavors or []
+        t.add_row(
+            cq.name + (f"\n[bright_black]cohort: {cq.cohort}[/]" if cq.cohort else ""),
+            *([cq.cluster] if show_cluster else []),
+            "\n".join(f"{lq.namespace}/{lq.name}" for lq in cq.local_queues or []),
+            str(cq.pending_workloads),
+            str(cq.admitted_workloads),
+            # Align the flavor names with their first resource
+            "\n".join(
+                "\n".join([f.name] + [""] * (len(f.resources) - 1)) for f in flavors
+            ),
+            "\n".join(line for f in flavors for line in format_resources(f)),
+        )
+    Console().print(t)
+
+
+def add_parser(subparsers: Any, parent: argparse.ArgumentParser) -> None:
+    # jobq queues, the queue capacity command
+    help = "Show the quota, usage and pending jobs of the Kueue cluster queues"
+    parser: argparse.ArgumentParser = subparsers.add_parser(
+        "queues",
+        parents=[parent],
+        help=help,
+        description=help,
+    )
+
+    parser.add_argument(
+        "queue",
+        metavar="<queue>",
+        nargs="*",
+        help="Cluster queues to show (by default, all cluster queues).",
+    )
+    parser.add_argument(
+        "--cluster",
+        metavar="<cluster>",
+        action="append",
+        help="Show the queues of a cluster, if the server manages several clusters "
+        "(by default, all clusters). Can be supplied multiple times.",
+    )
+    parser.set_defaults(func=list_queues)
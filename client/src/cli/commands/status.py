@@ -14,7 +14,10 @@ def status(
     args: argparse.Namespace,
     settings: Settings,
 ) -> None:
-    resp = client.status_jobs_uid_status_get(uid=args.uid)
+    namespace = "*" if args.all_namespaces else args.namespace
+    resp = client.status_jobs_uid_status_get(
+        uid=args.uid, namespace=namespace, cluster=args.cluster
+    )
     print(format_dict(resp.to_dict()))
 
 
@@ -30,5 +33,24 @@ def add_parser(subparsers: Any, parent: ArgumentParser) -> None:
 
     # unique identifier of the job
     parser.add_argument("uid", metavar="<ID>")
+    parser.add_argument(
+        "-n",
+        "--namespace",
+        metavar="<namespace>",
+        help="Namespace of the job (or a comma-separated list of namespaces to "
+        "search). Defaults to the namespace of the server.",
+    )
+    parser.add_argument(
+        "-A",
+        "--all-namespaces",
+        action="store_true",
+        help="Search the job in all namespaces.",
+    )
+    parser.add_argument(
+        "--cluster",
+        metavar="<cluster>",
+        help="Cluster of the job, if the server manages several clusters. "
+        "Defaults to the cluster the job is found in.",
+    )
     # TODO: Factor out into command class
     parser.set_defaults(func=status)
@@ -13,7 +13,7 @@ def stop(
     args: argparse.Namespace,
     settings: Settings,
 ) -> None:
-    resp = client.stop_workload_jobs_uid_stop_post(uid=args.uid)
+    resp = client.stop_workload_jobs_uid_stop_post(uid=args.uid, cluster=args.cluster)
     pp(resp)
 
 
@@ -27,4 +27,10 @@ def add_parser(subparsers: Any, parent: argparse.ArgumentParser) -> None:
         description=help,
     )
     parser.add_argument("uid", metavar="<ID>")
+    parser.add_argument(
+        "--cluster",
+        metavar="<cluster>",
+        help="Cluster of the job, if the server manages several clusters. "
+        "Defaults to the cluster the job is found in.",
+    )
     parser.set_defaults(func=stop)
@@ -33,6 +33,7 @@ def _submit_remote_job(
     job: Job,
     mode: ExecutionMode,
     settings: Settings,
+    cluster: str | None = None,
 ) -> None:
     # Job options sent to server do not need image options
     if job.options is None:
@@ -47,8 +48,8 @@ def _submit_remote_job(
         options=openapi_client.JobOptions.model_validate(job.options.model_dump()),
         submission_context=SubmissionContext().to_dict(),
     )
-    resp = client.submit_job_jobs_post(opts)
-    pp(resp)
+    resp = client.submit_job_jobs_post(opts, cluster=cluster)
+    pp(resp.actual_instance)
 
 
 def submit_job(
@@ -63,7 +64,7 @@ def submit_job(
             # Run the job locally
             job()
         case _:
-            _submit_remote_job(job, mode, settings=settings)
+            _submit_remote_job(job, mode, settings=settings, cluster=args.cluster)
 
 
 def discover_job(args: argparse.Namespace) -> Job:
@@ -121,6 +122,13 @@ def add_parser(subparsers: Any, parent: argparse.ArgumentParser) -> None:
         type=ExecutionMode,
     )
 
+    parser.add_argument(
+        "--cluster",
+        metavar="<cluster>",
+        help="Cluster to submit the job to, if the server manages several clusters. "
+        "By default, the cluster with the most free quota for the job is chosen.",
+    )
+
     parser.add_argument("entrypoint")
     # TODO: Factor out into command class
     parser.set_defaults(func=submit)
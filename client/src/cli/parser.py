@@ -4,7 +4,7 @@ from importlib.metadata import PackageNotFoundError, version
 from cli.util import CustomFormatter
 
 from .commands import list as _list
-from .commands import logs, status, stop, submit
+from .commands import logs, queues, status, stop, submit
 
 try:
     __version__ = version("aai-jobq")
@@ -12,7 +12,7 @@ except PackageNotFoundError:
     pass
 
 # alphabetically sorted
-COMMANDS = [_list, logs, status, stop, submit]
+COMMANDS = [_list, logs, queues, status, stop, submit]
 
 
 # Add a base parser that all subcommand parsers can "inherit" from.
@@ -1,4 +1,5 @@
 import argparse
+import os
 from collections.abc import Callable
 from functools import wraps
 from typing import Concatenate, ParamSpec, TypeVar, cast
@@ -8,22 +9,44 @@ from cli.types import Settings
 from openapi_client.exceptions import ApiException
 
 T = TypeVar("T")
+A = TypeVar("A")
 P = ParamSpec("P")
 
 
+def _trace_context_headers() -> dict[str, str]:
+    """Determine the W3C trace context headers to propagate to the API server.
+
+    The current OpenTelemetry context is used if OpenTelemetry is installed and a trace
+    is active, otherwise a trace context passed in the `TRACEPARENT` environment variable.
+    """
+    headers: dict[str, str] = {}
+    try:
+        from opentelemetry import propagate
+
+        propagate.inject(headers)
+    except ImportError:
+        pass
+    if "traceparent" not in headers and (traceparent := os.getenv("TRACEPARENT")):
+        headers["traceparent"] = traceparent
+    return headers
+
+
 def _make_api_client(api_base_url: str) -> openapi_client.ApiClient:
     api_config = openapi_client.Configuration(host=api_base_url.removesuffix("/"))
-    return openapi_client.ApiClient(api_config)
+    client = openapi_client.ApiClient(api_config)
+    for name, value in _trace_context_headers().items():
+        client.set_default_header(name, value)
+    return client
 
 
-def with_job_mgmt_api(
-    func: Callable[Concatenate[openapi_client.JobManagementApi, P], T],
+def _with_api(
+    api_class: type[A], func: Callable[Concatenate[A, P], T]
 ) -> Callable[P, T]:
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         settings = cast(Settings, kwargs["settings"])
         with _make_api_client(str(settings.api_base_url)) as api:
-            client = openapi_client.JobManagementApi(api)
+            client = api_class(api)
             try:
                 return func(client, *args, **kwargs)
             except openapi_client.ApiException as e:
@@ -33,6 +56,18 @@ def with_job_mgmt_api(
     return wrapper
 
 
+def with_job_mgmt_api(
+    func: Callable[Concatenate[openapi_client.JobManagementApi, P], T],
+) -> Callable[P, T]:
+    return _with_api(openapi_client.JobManagementApi, func)
+
+
+def with_queues_api(
+    func: Callable[Concatenate[openapi_client.QueuesApi, P], T],
+) -> Callable[P, T]:
+    return _with_api(openapi_client.QueuesApi, func)
+
+
 def handle_api_exception(e: ApiException, op: str) -> None:
     print(f"Error executing {op}:")
     if e.status == 404:
@@ -1,21 +1,37 @@
-from jobq import assembler
+from jobq import assembler, cache, checkpoint
 from jobq.image import Image
 from jobq.job import (
+    CacheVolume,
+    CheckpointOptions,
     ImageOptions,
     Job,
     JobOptions,
+    NodeRequirement,
+    PlacementOptions,
     ResourceOptions,
+    RetryOptions,
     SchedulingOptions,
+    Toleration,
+    TopologySpread,
     job,
 )
 
 __all__ = [
+    "CacheVolume",
+    "CheckpointOptions",
     "Image",
     "Job",
     "JobOptions",
     "ImageOptions",
+    "NodeRequirement",
+    "PlacementOptions",
     "ResourceOptions",
+    "RetryOptions",
     "SchedulingOptions",
+    "Toleration",
+    "TopologySpread",
     "job",
     "assembler",
+    "cache",
+    "checkpoint",
 ]
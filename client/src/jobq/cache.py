@@ -0,0 +1,161 @@
+"""
+Caching of downloads (e.g., datasets and model weights) in shared cache volumes.
+
+Jobs with cache volumes (see :class:`jobq.job.CacheVolume`) can share downloaded files
+between each other, so that a file is only downloaded once per cache, instead of once
+per job::
+
+    from jobq import cache
+
+    @job(options=JobOptions(..., caches=[CacheVolume(name="data", volume_claim="data")]))
+    def train():
+        path = cache.fetch("https://example.com/dataset.tar", sha256="...")
+        ...
+
+Downloads are stored by the SHA-256 hash of their content, and indexed by their URL.
+Files with a known hash are only downloaded if they are not in the cache yet, other
+files are downloaded once, and looked up by their URL afterwards. Files are written to a
+temporary file first and moved into place once complete, so that concurrent jobs never
+see a partial download (at worst, they download the same file at the same time).
+
+Outside of a job (e.g., when running locally), the user cache directory is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+CACHES_ENV = "JOBQ_CACHES"
+"""Environment variable with the cache volumes of a job, as a JSON object of their names
+and mount paths."""
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _caches() -> dict[str, str]:
+    if not (caches := os.environ.get(CACHES_ENV)):
+        return {}
+    return json.loads(caches)
+
+
+def directory(name: str | None = None) -> Path:
+    """
+    The directory of a cache.
+
+    Parameters
+    ----------
+    name : str | None, optional
+        The name of the cache volume. Can be omitted if the job has a single cache.
+
+    Returns
+    -------
+    Path
+        The mount path of the cache volume, or a directory in the user cache directory
+        if the job has no cache volumes (e.g., when running locally).
+
+    Raises
+    ------
+    ValueError
+        If the job has no cache volume of the given name, or no name is given for a job
+        with several cache volumes.
+    """
+    if not (caches := _caches()):
+        root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        return root / "jobq" / (name or "default")
+    if name is None:
+        if len(caches) > 1:
+            raise ValueError(f"Job has several caches, choose one of {sorted(caches)}")
+        (path,) = caches.values()
+        return Path(path)
+    if name not in caches:
+        raise ValueError(f"Job has no cache {name!r}, choose one of {sorted(caches)}")
+    return Path(caches[name])
+
+
+def _url_index(root: Path, url: str) -> Path:
+    return root / "urls" / hashlib.sha256(url.encode()).hexdigest()
+
+
+def _blob(root: Path, digest: str, url: str) -> Path:
+    filename = Path(urllib.parse.urlsplit(url).path).name or "download"
+    return root / "blobs" / digest / filename
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique name, since jobs in different containers may well share their PID
+    fd, tmpname = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    tmp = Path(tmpname)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def fetch(url: str, sha256: str | None = None, cache: str | None = None) -> Path:
+    """
+    Download a file into a cache, unless it has been downloaded before.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    sha256 : str | None, optional
+        The expected SHA-256 hash of the file (hex-encoded). If given, the file is
+        looked up by its hash, and verified after the download.
+    cache : str | None, optional
+        The name of the cache volume (see :func:`directory`).
+
+    Returns
+    -------
+    Path
+        The path of the cached file. Cached files must not be modified.
+
+    Raises
+    ------
+    ValueError
+        If the downloaded file does not match the expected hash.
+    """
+    root = directory(cache)
+    index = _url_index(root, url)
+    digest = sha256.lower() if sha256 else None
+    if digest is None:
+        try:
+            digest = index.read_text()
+        except FileNotFoundError:
+            pass
+    if digest is not None and (path := _blob(root, digest, url)).exists():
+        return path
+
+    tmpdir = root / "tmp"
+    tmpdir.mkdir(parents=True, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(dir=tmpdir)
+    tmp = Path(tmpname)
+    try:
+        hasher = hashlib.sha256()
+        with os.fdopen(fd, "wb") as f, urllib.request.urlopen(url) as response:  # noqa: S310
+            while chunk := response.read(_CHUNK_SIZE):
+                hasher.update(chunk)
+                f.write(chunk)
+        actual = hasher.hexdigest()
+        if sha256 is not None and actual != sha256.lower():
+            raise ValueError(
+                f"SHA-256 mismatch for {url}: expected {sha256}, got {actual}"
+            )
+        path = _blob(root, actual, url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    _write_atomic(index, actual)
+    return path
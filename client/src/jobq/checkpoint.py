@@ -0,0 +1,117 @@
+"""
+Checkpointing of jobs, to resume them after a preemption.
+
+Jobs with checkpoint options (see :class:`jobq.job.CheckpointOptions`) get a checkpoint
+directory on a persistent volume, which outlives their pods. When a job is preempted
+(e.g., by Kueue, in favor of a job with a higher priority), its pods are asked to stop
+with ``SIGTERM``, and killed after a grace period. The job function can save a
+checkpoint in the meantime, and resume from it once the job has been readmitted::
+
+    from jobq import checkpoint
+
+    @job(options=JobOptions(..., checkpoint=CheckpointOptions(volume_claim="ckpt")))
+    def train():
+        start = load(latest) if (latest := checkpoint.latest()) else 0
+        for step in range(start, 10_000):
+            ...
+            if step % 100 == 0 or checkpoint.stop_requested():
+                path = checkpoint.directory() / f"step-{step}"
+                save(path)
+                checkpoint.register(path)
+            if checkpoint.stop_requested():
+                return
+
+Checkpoints only become the latest checkpoint once registered, so that checkpoints that
+are cut short by the end of the grace period are not resumed from. The path of the
+latest checkpoint is also exported as ``JOBQ_LATEST_CHECKPOINT`` to the job, e.g., for
+training frameworks that resume from a path given in the environment.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import FrameType
+
+from jobq.types import AnyPath
+
+CHECKPOINT_DIR_ENV = "JOBQ_CHECKPOINT_DIR"
+"""Environment variable with the checkpoint directory of a job."""
+LATEST_CHECKPOINT_ENV = "JOBQ_LATEST_CHECKPOINT"
+"""Environment variable with the latest checkpoint of a job, when it is resumed."""
+
+# Marker file in the checkpoint directory, with the path of the latest checkpoint
+_LATEST_FILE = ".latest"
+
+_stop_requested = threading.Event()
+
+
+def directory() -> Path | None:
+    """The checkpoint directory of the job, or ``None`` if the job has no checkpoint
+    options (e.g., when running locally)."""
+    if not (path := os.environ.get(CHECKPOINT_DIR_ENV)):
+        return None
+    return Path(path)
+
+
+def register(path: AnyPath) -> None:
+    """
+    Register a completely written checkpoint as the latest checkpoint of the job.
+
+    Parameters
+    ----------
+    path : AnyPath
+        The checkpoint, a file or directory in the checkpoint directory.
+
+    Raises
+    ------
+    RuntimeError
+        If the job has no checkpoint directory.
+    ValueError
+        If the checkpoint does not exist, or is not in the checkpoint directory.
+    """
+    if (root := directory()) is None:
+        raise RuntimeError("Job has no checkpoint directory")
+    path = Path(path).absolute()
+    if not path.exists():
+        raise ValueError(f"Checkpoint does not exist: {path}")
+    if not path.is_relative_to(root.absolute()):
+        raise ValueError(
+            f"Checkpoint is not in the checkpoint directory {root}: {path}"
+        )
+
+    # Replace the marker atomically, so that it never refers to a partial checkpoint
+    # (under a unique name, since the PID is not unique across containers)
+    marker = root / _LATEST_FILE
+    fd, tmpname = tempfile.mkstemp(dir=root, prefix=f"{_LATEST_FILE}.", suffix=".tmp")
+    tmp = Path(tmpname)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(str(path.relative_to(root.absolute())))
+        tmp.replace(marker)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def latest() -> Path | None:
+    """The latest registered checkpoint of the job, or ``None`` if there is none."""
+    if (root := directory()) is None:
+        return None
+    try:
+        path = root / (root / _LATEST_FILE).read_text()
+    except FileNotFoundError:
+        return None
+    return path if path.exists() else None
+
+
+def stop_requested() -> bool:
+    """Whether the job has been asked to stop (e.g., on preemption), and should save a
+    checkpoint and return."""
+    return _stop_requested.is_set()
+
+
+def request_stop(signum: int | None = None, frame: FrameType | None = None) -> None:
+    """Ask the job to stop. Installed as the ``SIGTERM`` handler by ``jobs_execute``."""
+    _stop_requested.set()
@@ -1,6 +1,10 @@
 import importlib.util
+import os
+import signal
 import sys
 
+from jobq import checkpoint
+
 
 def execute() -> None:
     module_file = sys.argv[1]
@@ -20,5 +24,16 @@ def execute() -> None:
 
     func = getattr(module, func_name)
 
+    if checkpoint.directory() is not None:
+        # Let the job save a checkpoint when it is stopped (e.g., on preemption),
+        # until it is killed after the termination grace period of its pod
+        signal.signal(signal.SIGTERM, checkpoint.request_stop)
+        if (latest := checkpoint.latest()) is not None:
+            os.environ[checkpoint.LATEST_CHECKPOINT_ENV] = str(latest)
+
     # Go go go!
     func()
+
+    if checkpoint.stop_requested():
+        # A stopped job has not completed, and must not succeed
+        sys.exit(128 + signal.SIGTERM)
@@ -11,10 +11,18 @@ import re
 import shlex
 from collections.abc import Callable
 from collections.abc import Set as AbstractSet
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, ParamSpec, TypedDict, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictBool,
+    StrictInt,
+    StrictStr,
+    field_validator,
+)
 from typing_extensions import Self
 
 from jobq.assembler import config
@@ -83,6 +91,7 @@ class DockerResourceOptions(TypedDict):
     mem_limit: str | None
     nano_cpus: float | None
     device_requests: list[DeviceRequest] | None
+    shm_size: str | None
 
 
 # Functional definition of TypedDict to enable special characters in dict keys
@@ -92,6 +101,7 @@ K8sResourceOptions = TypedDict(
         "cpu": str | None,
         "memory": str | None,
         "nvidia.com/gpu": int | None,
+        "ephemeral-storage": str | None,
     },
     total=False,
 )
@@ -120,7 +130,25 @@ class ResourceOptions(JsonSerializable, DictSerializable, BaseModel):
     """CPUs to request for pods hosting the job."""
     gpu: StrictInt | None = None
     """GPUs to request for pods hosting the job."""
-    __properties: ClassVar[list[str]] = ["memory", "cpu", "gpu"]
+    shm_size: StrictStr | None = None
+    """Size of the shared memory (``/dev/shm``) of the job, e.g., for the workers of
+    PyTorch data loaders. Shared memory is backed by memory, and counts towards the
+    memory of the job."""
+    scratch_size: StrictStr | None = None
+    """Size of an ephemeral scratch volume mounted at ``/scratch``, which is deleted
+    with the pods of the job."""
+    scratch_storage_class: StrictStr | None = None
+    """Storage class to provision the scratch volume from (e.g., for local NVMe
+    drives). By default, the scratch volume is on the ephemeral storage of the node,
+    and counts towards the ``ephemeral-storage`` requests of the job."""
+    __properties: ClassVar[list[str]] = [
+        "memory",
+        "cpu",
+        "gpu",
+        "shm_size",
+        "scratch_size",
+        "scratch_storage_class",
+    ]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -128,6 +156,17 @@ class ResourceOptions(JsonSerializable, DictSerializable, BaseModel):
         protected_namespaces=(),
     )
 
+    @field_validator("shm_size", "scratch_size")
+    @classmethod
+    def _validate_size(cls, size: str | None) -> str | None:
+        if size is not None:
+            to_rational(size)
+        return size
+
+    def model_post_init(self, /, __context: Any) -> None:
+        if self.scratch_storage_class is not None and self.scratch_size is None:
+            raise ValueError("A scratch storage class requires a scratch size")
+
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
         return pprint.pformat(self.model_dump(by_alias=True))
@@ -148,20 +187,33 @@ class ResourceOptions(JsonSerializable, DictSerializable, BaseModel):
                 if self.gpu
                 else None
             ),
+            "shm_size": str(int(to_rational(self.shm_size))) if self.shm_size else None,
         }
         return remove_none_values(options)
 
     def to_kubernetes(
         self, kind: K8sResourceKind = K8sResourceKind.REQUESTS
     ) -> K8sResourceOptions:
-        # TODO: Currently kind is not accessed and the logic for "request" and "limit" is the same.
-        # Down the road we have to decide if we want to keep it that way (and get rid of the distinction and arguments),
+        # TODO: Apart from the scratch volume, the logic for "request" and "limit" is the same.
+        # Down the road we have to decide if we want to keep it that way,
         # or if it makes sense for us to distinguish both cases.
+        memory = self.memory or None
+        if memory and self.shm_size:
+            # Shared memory counts towards the memory limit of the container
+            memory = str(int(to_rational(memory) + to_rational(self.shm_size)))
         options: K8sResourceOptions = {
             "cpu": self.cpu or None,
-            "memory": self.memory or None,
+            "memory": memory,
             "nvidia.com/gpu": self.gpu or None,
         }
+        if (
+            kind == K8sResourceKind.REQUESTS
+            and self.scratch_size
+            and not self.scratch_storage_class
+        ):
+            # Requested (for the quota), but not limited, since the ephemeral storage
+            # of the container also includes its logs and writable layer
+            options["ephemeral-storage"] = self.scratch_size
         return remove_none_values(options)
 
     def to_ray(self) -> RayResourceOptions:
@@ -251,6 +303,308 @@ class SchedulingOptions(BaseModel):
         return _obj
 
 
+class RetryOptions(JsonSerializable, DictSerializable, BaseModel):
+    """
+    Options limiting the retries of a failed ``jobq.Job`` in the cluster.
+
+    Pods that exit with one of the ``fail_on_exit_codes`` (e.g., due to an error in the
+    job code, which retrying does not fix) fail the job immediately, while pods that fail
+    due to a disruption of their node (e.g., preemption or a node drain) are retried
+    without counting towards the retry budget.
+    """
+
+    max_retries: StrictInt | None = Field(default=None, ge=0)
+    """Number of retries of a failed job before it is marked as failed.
+    Defaults to the Kubernetes default of 6 retries."""
+    fail_on_exit_codes: list[StrictInt] = Field(default_factory=list)
+    """Exit codes of the job that fail it without retries. Only supported for Kueue jobs."""
+    retry_on_disruption: StrictBool = True
+    """Retry pods that fail due to a disruption of their node, without counting them
+    towards the retry budget. Only supported for Kueue jobs."""
+    __properties: ClassVar[list[str]] = [
+        "max_retries",
+        "fail_on_exit_codes",
+        "retry_on_disruption",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    @field_validator("fail_on_exit_codes")
+    @classmethod
+    def _validate_exit_codes(cls, codes: list[int]) -> list[int]:
+        if invalid := [code for code in codes if not 0 < code < 256]:
+            raise ValueError(f"exit codes must be between 1 and 255, got {invalid}")
+        return codes
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+
+class CheckpointOptions(JsonSerializable, DictSerializable, BaseModel):
+    """
+    Options for checkpointing a ``jobq.Job`` on a persistent volume, to resume it after
+    a preemption (see :mod:`jobq.checkpoint`).
+
+    Each job gets its own checkpoint directory on the volume.
+    """
+
+    volume_claim: StrictStr
+    """Name of the persistent volume claim to store the checkpoints on, which must exist
+    in the namespace of the job."""
+    mount_path: StrictStr = "/checkpoints"
+    """Path of the checkpoint directory in the job container."""
+    grace_period_seconds: StrictInt = Field(default=30, ge=0)
+    """Time for the job to save a checkpoint after it has been asked to stop (e.g., on
+    preemption), before it is killed."""
+    __properties: ClassVar[list[str]] = [
+        "volume_claim",
+        "mount_path",
+        "grace_period_seconds",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+
+def _overlaps(path: PurePosixPath, other: PurePosixPath) -> bool:
+    """Whether mounting at one of two paths would hide the other."""
+    return path == other or path in other.parents or other in path.parents
+
+
+class CacheVolume(JsonSerializable, DictSerializable, BaseModel):
+    """
+    A named cache volume of a ``jobq.Job``, to share downloads such as datasets and
+    model weights between jobs (see :mod:`jobq.cache`).
+
+    The cache is either backed by a persistent volume claim (which should support the
+    ``ReadWriteMany`` access mode, to be shared by jobs on several nodes), or by a
+    directory on the node, which is shared by the jobs running on that node. Node-local
+    caches are created under the host cache root configured by the administrator of the
+    backend, and are only available if it is set.
+    Exactly one of ``volume_claim`` and ``host_path`` must be given.
+    """
+
+    name: StrictStr
+    """Name of the cache, a lowercase RFC 1123 label (e.g., ``datasets``)."""
+    volume_claim: StrictStr | None = None
+    """Name of the persistent volume claim of the cache, which must exist in the
+    namespace of the job."""
+    host_path: StrictStr | None = None
+    """Directory of the cache on the node, relative to the host cache root of the
+    backend (e.g., ``datasets``), created if it does not exist."""
+    mount_path: StrictStr | None = None
+    """Absolute path of the cache in the job container. Defaults to ``/cache/<name>``."""
+    __properties: ClassVar[list[str]] = [
+        "name",
+        "volume_claim",
+        "host_path",
+        "mount_path",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def model_post_init(self, /, __context: Any) -> None:
+        if not re.fullmatch(r"[a-z0-9]([-a-z0-9]{0,48}[a-z0-9])?", self.name):
+            raise ValueError(f"Invalid cache name: {self.name!r}")
+        if (self.volume_claim is None) == (self.host_path is None):
+            raise ValueError(
+                f"Cache {self.name!r} needs either a volume claim or a host path"
+            )
+        if self.host_path is not None:
+            path = PurePosixPath(self.host_path)
+            if path.is_absolute() or ".." in path.parts or not path.name:
+                raise ValueError(
+                    f"Host path of cache {self.name!r} must be a relative path "
+                    f"without '..': {self.host_path!r}"
+                )
+        if self.mount_path is None:
+            self.mount_path = f"/cache/{self.name}"
+        elif not PurePosixPath(self.mount_path).is_absolute():
+            raise ValueError(
+                f"Mount path of cache {self.name!r} must be absolute: "
+                f"{self.mount_path!r}"
+            )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+
+class Toleration(JsonSerializable, DictSerializable, BaseModel):
+    """A toleration of the pods of a ``jobq.Job`` for a node taint."""
+
+    key: StrictStr | None = None
+    """Key of the taint, or ``None`` to tolerate all taints (with ``Exists``)."""
+    operator: StrictStr = "Equal"
+    """``Equal`` to tolerate the taint with the given value, ``Exists`` for any value."""
+    value: StrictStr | None = None
+    """Value of the taint."""
+    effect: StrictStr | None = None
+    """Effect of the taint (``NoSchedule``, ``PreferNoSchedule`` or ``NoExecute``), or
+    ``None`` for all effects."""
+    __properties: ClassVar[list[str]] = ["key", "operator", "value", "effect"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    @field_validator("operator")
+    @classmethod
+    def _validate_operator(cls, operator: str) -> str:
+        if operator not in ("Equal", "Exists"):
+            raise ValueError(f"Invalid toleration operator: {operator!r}")
+        return operator
+
+    @field_validator("effect")
+    @classmethod
+    def _validate_effect(cls, effect: str | None) -> str | None:
+        if effect not in (None, "NoSchedule", "PreferNoSchedule", "NoExecute"):
+            raise ValueError(f"Invalid taint effect: {effect!r}")
+        return effect
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+
+class NodeRequirement(JsonSerializable, DictSerializable, BaseModel):
+    """
+    A node affinity of the pods of a ``jobq.Job``, as a requirement on a node label.
+
+    Requirements without a weight must be met by the nodes of the job, the others are
+    preferred, by their weight.
+    """
+
+    key: StrictStr
+    """The node label."""
+    operator: StrictStr = "In"
+    """One of ``In``, ``NotIn``, ``Exists``, ``DoesNotExist``, ``Gt`` and ``Lt``."""
+    values: list[StrictStr] = Field(default_factory=list)
+    """Values of the label, a single integer for ``Gt`` and ``Lt``."""
+    weight: StrictInt | None = Field(default=None, ge=1, le=100)
+    """Weight of a preferred requirement, ``None`` for a required one."""
+    __properties: ClassVar[list[str]] = ["key", "operator", "values", "weight"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def model_post_init(self, /, __context: Any) -> None:
+        if self.operator in ("In", "NotIn"):
+            if not self.values:
+                raise ValueError(f"Operator {self.operator!r} requires values")
+        elif self.operator in ("Exists", "DoesNotExist"):
+            if self.values:
+                raise ValueError(f"Operator {self.operator!r} takes no values")
+        elif self.operator in ("Gt", "Lt"):
+            if len(self.values) != 1 or not self.values[0].lstrip("-").isdigit():
+                raise ValueError(f"Operator {self.operator!r} requires an integer")
+        else:
+            raise ValueError(f"Invalid node requirement operator: {self.operator!r}")
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+
+class TopologySpread(JsonSerializable, DictSerializable, BaseModel):
+    """
+    A topology spread constraint of a ``jobq.Job``, which spreads its pods, and those of
+    other submissions of the same job, across the nodes (or zones) of the cluster.
+    """
+
+    topology_key: StrictStr
+    """Node label of the topology domains, e.g., ``kubernetes.io/hostname`` or
+    ``topology.kubernetes.io/zone``."""
+    max_skew: StrictInt = Field(default=1, ge=1)
+    """Maximum difference of the number of pods between two topology domains."""
+    when_unsatisfiable: StrictStr = "ScheduleAnyway"
+    """``DoNotSchedule`` to keep the pods pending while the constraint cannot be
+    satisfied, or ``ScheduleAnyway`` to only prefer the least loaded domains."""
+    __properties: ClassVar[list[str]] = [
+        "topology_key",
+        "max_skew",
+        "when_unsatisfiable",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    @field_validator("when_unsatisfiable")
+    @classmethod
+    def _validate_when_unsatisfiable(cls, value: str) -> str:
+        if value not in ("DoNotSchedule", "ScheduleAnyway"):
+            raise ValueError(f"Invalid topology spread action: {value!r}")
+        return value
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+
+class PlacementOptions(JsonSerializable, DictSerializable, BaseModel):
+    """
+    Options for placing the pods of a ``jobq.Job`` on the nodes of the cluster.
+
+    The accelerator type is mapped onto the Kueue ``ResourceFlavor`` of the same name,
+    if it exists: the job is then restricted to the nodes of the flavor (and tolerates
+    their taints), so that Kueue assigns its quota from that flavor. Otherwise, it
+    selects the nodes with the accelerator type as their accelerator label (by default,
+    ``nvidia.com/gpu.product``, as set by the NVIDIA GPU feature discovery).
+    """
+
+    accelerator: StrictStr | None = None
+    """Accelerator type (e.g., the GPU model) of the nodes of the job."""
+    node_selector: dict[str, StrictStr] = Field(default_factory=dict)
+    """Node labels the nodes of the job must have."""
+    node_affinity: list[NodeRequirement] = Field(default_factory=list)
+    """Required and preferred node label requirements of the job."""
+    tolerations: list[Toleration] = Field(default_factory=list)
+    """Node taints tolerated by the pods of the job."""
+    topology_spread: list[TopologySpread] = Field(default_factory=list)
+    """Topology spread constraints of the job."""
+    __properties: ClassVar[list[str]] = [
+        "accelerator",
+        "node_selector",
+        "node_affinity",
+        "tolerations",
+        "topology_spread",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+
 class JobOptions(JsonSerializable, DictSerializable, BaseModel):
     """
     Options for customizing a Kubernetes job definition from a Python function.
@@ -262,7 +616,28 @@ class JobOptions(JsonSerializable, DictSerializable, BaseModel):
     """Information about the Kueue cluster queue, and job priority."""
     labels: dict[str, StrictStr] = Field(default_factory=dict)
     """Kubernetes labels to attach to the resulting Kueue workload."""
-    __properties: ClassVar[list[str]] = ["resources", "scheduling", "labels"]
+    retries: RetryOptions | None = None
+    """Retry budget and failure policy of the job."""
+    deadline_seconds: StrictInt | None = Field(default=None, gt=0)
+    """Maximum runtime of the job in seconds (not counting the time spent waiting in
+    the queue), after which it is terminated and marked as failed."""
+    checkpoint: CheckpointOptions | None = None
+    """Checkpointing of the job, to resume it after a preemption. Only supported for
+    Kueue jobs."""
+    caches: list[CacheVolume] = Field(default_factory=list)
+    """Cache volumes to mount into the job, e.g., for datasets and model weights."""
+    placement: PlacementOptions | None = None
+    """Accelerator type, node selection and spreading of the job."""
+    __properties: ClassVar[list[str]] = [
+        "resources",
+        "scheduling",
+        "labels",
+        "retries",
+        "deadline_seconds",
+        "checkpoint",
+        "caches",
+        "placement",
+    ]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -270,6 +645,30 @@ class JobOptions(JsonSerializable, DictSerializable, BaseModel):
         protected_namespaces=(),
     )
 
+    @field_validator("caches")
+    @classmethod
+    def _validate_caches(cls, caches: list[CacheVolume]) -> list[CacheVolume]:
+        names = [cache.name for cache in caches]
+        if duplicates := sorted({name for name in names if names.count(name) > 1}):
+            raise ValueError(f"Duplicate cache names: {duplicates}")
+        return caches
+
+    def model_post_init(self, /, __context: Any) -> None:
+        # The shared memory and scratch volumes are mounted if requested, and hiding
+        # them (or the checkpoint directory, or another cache) would break the job
+        mounts = {"/dev/shm": "shared memory", "/scratch": "scratch volume"}
+        if self.checkpoint is not None:
+            mounts[self.checkpoint.mount_path] = "checkpoint directory"
+        for cache in self.caches:
+            path = PurePosixPath(cache.mount_path or "")
+            for other, owner in mounts.items():
+                if _overlaps(path, PurePosixPath(other)):
+                    raise ValueError(
+                        f"Mount path {cache.mount_path!r} of cache {cache.name!r} "
+                        f"overlaps with the {owner} at {other!r}"
+                    )
+            mounts[str(path)] = f"cache {cache.name!r}"
+
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
         return pprint.pformat(self.model_dump(by_alias=True))
@@ -424,12 +823,30 @@ class Job(Generic[P, T]):
                 )
                 if exit_code != 0:
                     return None
+                # Submit the pushed image by digest, tags are mutable
+                if digest := _repo_digest(tag):
+                    return Image(f"{tag}@{digest}")
 
             return Image(tag)
         else:
             return None
 
 
+def _repo_digest(tag: str) -> str | None:
+    """The digest of a pushed image in its repository, or ``None`` if it is unknown."""
+    exit_code, stdout, _, _ = run_command(
+        f"docker image inspect --format '{{{{json .RepoDigests}}}}' {tag}"
+    )
+    if exit_code != 0:
+        return None
+    repository = tag.rpartition(":")[0]
+    for repo_digest in json.loads("".join(stdout) or "null") or []:
+        name, _, digest = repo_digest.partition("@")
+        if name == repository:
+            return digest
+    return None
+
+
 def job(
     *,
     options: JobOptions | None = None,
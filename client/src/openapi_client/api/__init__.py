@@ -2,3 +2,4 @@
 
 # import apis into api package
 from openapi_client.api.job_management_api import JobManagementApi
+from openapi_client.api.queues_api import QueuesApi
@@ -9,6 +9,7 @@ Generated by OpenAPI Generator (https://openapi-generator.tech)
 Do not edit the class manually.
 """  # noqa: E501
 
+from datetime import datetime
 from typing import Annotated, Any
 
 from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, validate_call
@@ -16,8 +17,12 @@ from pydantic import Field, StrictBool, StrictFloat, StrictInt, StrictStr, valid
 from openapi_client.api_client import ApiClient, RequestSerialized
 from openapi_client.api_response import ApiResponse
 from openapi_client.models.create_job_model import CreateJobModel
+from openapi_client.models.job_history_entry import JobHistoryEntry
+from openapi_client.models.job_status import JobStatus
 from openapi_client.models.list_workload_model import ListWorkloadModel
-from openapi_client.models.workload_identifier import WorkloadIdentifier
+from openapi_client.models.response_submit_job_jobs_post import (
+    ResponseSubmitJobJobsPost,
+)
 from openapi_client.models.workload_metadata import WorkloadMetadata
 from openapi_client.rest import RESTResponseType
 
@@ -34,10 +39,1334 @@ class JobManagementApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
+    @validate_call
+    def archived_logs_jobs_history_uid_logs_get(
+        self,
+        uid: StrictStr,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> None:
+        """Archived Logs
+
+        Get the archived logs of a finished job, which are kept after the job has been deleted from the cluster.  The logs of all pods are concatenated, similarly to the logs of a running job.
+
+        :param uid: (required)
+        :type uid: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._archived_logs_jobs_history_uid_logs_get_serialize(
+            uid=uid,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": None,
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+    @validate_call
+    def archived_logs_jobs_history_uid_logs_get_with_http_info(
+        self,
+        uid: StrictStr,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[None]:
+        """Archived Logs
+
+        Get the archived logs of a finished job, which are kept after the job has been deleted from the cluster.  The logs of all pods are concatenated, similarly to the logs of a running job.
+
+        :param uid: (required)
+        :type uid: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._archived_logs_jobs_history_uid_logs_get_serialize(
+            uid=uid,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": None,
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+    @validate_call
+    def archived_logs_jobs_history_uid_logs_get_without_preload_content(
+        self,
+        uid: StrictStr,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Archived Logs
+
+        Get the archived logs of a finished job, which are kept after the job has been deleted from the cluster.  The logs of all pods are concatenated, similarly to the logs of a running job.
+
+        :param uid: (required)
+        :type uid: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._archived_logs_jobs_history_uid_logs_get_serialize(
+            uid=uid,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": None,
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+    def _archived_logs_jobs_history_uid_logs_get_serialize(
+        self,
+        uid,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+        _host = None
+
+        _collection_formats: dict[str, str] = {}
+
+        _path_params: dict[str, str] = {}
+        _query_params: list[tuple[str, str]] = []
+        _header_params: dict[str, str | None] = _headers or {}
+        _form_params: list[tuple[str, str]] = []
+        _files: dict[
+            str, str | bytes | list[str] | list[bytes] | list[tuple[str, bytes]]
+        ] = {}
+        _body_params: bytes | None = None
+
+        # process the path parameters
+        if uid is not None:
+            _path_params["uid"] = uid
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+        # set the HTTP header `Accept`
+        if "Accept" not in _header_params:
+            _header_params["Accept"] = self.api_client.select_header_accept([
+                "text/plain",
+                "application/json",
+            ])
+
+        # authentication setting
+        _auth_settings: list[str] = []
+
+        return self.api_client.param_serialize(
+            method="GET",
+            resource_path="/jobs/history/{uid}/logs",
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
+
+    @validate_call
+    def job_history_jobs_history_get(
+        self,
+        status: Annotated[
+            list[JobStatus] | None,
+            Field(description="Execution statuses of the jobs, as repeated values"),
+        ] = None,
+        queue: Annotated[
+            StrictStr | None, Field(description="Kueue local queue of the jobs")
+        ] = None,
+        submitter: Annotated[
+            StrictStr | None,
+            Field(description="Submitter of the jobs (email, or username if unknown)"),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None, Field(description="Cluster of the jobs")
+        ] = None,
+        namespace: Annotated[
+            StrictStr | None, Field(description="Namespace of the jobs")
+        ] = None,
+        since: Annotated[
+            datetime | None,
+            Field(description="Only jobs submitted at or after this time"),
+        ] = None,
+        until: Annotated[
+            datetime | None, Field(description="Only jobs submitted before this time")
+        ] = None,
+        limit: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> list[JobHistoryEntry]:
+        """Job History
+
+        Query the recorded job history, most recently submitted jobs first.  The history includes jobs that no longer exist in the cluster.
+
+        :param status: Execution statuses of the jobs, as repeated values
+        :type status: List[JobStatus]
+        :param queue: Kueue local queue of the jobs
+        :type queue: str
+        :param submitter: Submitter of the jobs (email, or username if unknown)
+        :type submitter: str
+        :param cluster: Cluster of the jobs
+        :type cluster: str
+        :param namespace: Namespace of the jobs
+        :type namespace: str
+        :param since: Only jobs submitted at or after this time
+        :type since: datetime
+        :param until: Only jobs submitted before this time
+        :type until: datetime
+        :param limit:
+        :type limit: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._job_history_jobs_history_get_serialize(
+            status=status,
+            queue=queue,
+            submitter=submitter,
+            cluster=cluster,
+            namespace=namespace,
+            since=since,
+            until=until,
+            limit=limit,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[JobHistoryEntry]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+    @validate_call
+    def job_history_jobs_history_get_with_http_info(
+        self,
+        status: Annotated[
+            list[JobStatus] | None,
+            Field(description="Execution statuses of the jobs, as repeated values"),
+        ] = None,
+        queue: Annotated[
+            StrictStr | None, Field(description="Kueue local queue of the jobs")
+        ] = None,
+        submitter: Annotated[
+            StrictStr | None,
+            Field(description="Submitter of the jobs (email, or username if unknown)"),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None, Field(description="Cluster of the jobs")
+        ] = None,
+        namespace: Annotated[
+            StrictStr | None, Field(description="Namespace of the jobs")
+        ] = None,
+        since: Annotated[
+            datetime | None,
+            Field(description="Only jobs submitted at or after this time"),
+        ] = None,
+        until: Annotated[
+            datetime | None, Field(description="Only jobs submitted before this time")
+        ] = None,
+        limit: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[list[JobHistoryEntry]]:
+        """Job History
+
+        Query the recorded job history, most recently submitted jobs first.  The history includes jobs that no longer exist in the cluster.
+
+        :param status: Execution statuses of the jobs, as repeated values
+        :type status: List[JobStatus]
+        :param queue: Kueue local queue of the jobs
+        :type queue: str
+        :param submitter: Submitter of the jobs (email, or username if unknown)
+        :type submitter: str
+        :param cluster: Cluster of the jobs
+        :type cluster: str
+        :param namespace: Namespace of the jobs
+        :type namespace: str
+        :param since: Only jobs submitted at or after this time
+        :type since: datetime
+        :param until: Only jobs submitted before this time
+        :type until: datetime
+        :param limit:
+        :type limit: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._job_history_jobs_history_get_serialize(
+            status=status,
+            queue=queue,
+            submitter=submitter,
+            cluster=cluster,
+            namespace=namespace,
+            since=since,
+            until=until,
+            limit=limit,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[JobHistoryEntry]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+    @validate_call
+    def job_history_jobs_history_get_without_preload_content(
+        self,
+        status: Annotated[
+            list[JobStatus] | None,
+            Field(description="Execution statuses of the jobs, as repeated values"),
+        ] = None,
+        queue: Annotated[
+            StrictStr | None, Field(description="Kueue local queue of the jobs")
+        ] = None,
+        submitter: Annotated[
+            StrictStr | None,
+            Field(description="Submitter of the jobs (email, or username if unknown)"),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None, Field(description="Cluster of the jobs")
+        ] = None,
+        namespace: Annotated[
+            StrictStr | None, Field(description="Namespace of the jobs")
+        ] = None,
+        since: Annotated[
+            datetime | None,
+            Field(description="Only jobs submitted at or after this time"),
+        ] = None,
+        until: Annotated[
+            datetime | None, Field(description="Only jobs submitted before this time")
+        ] = None,
+        limit: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Job History
+
+        Query the recorded job history, most recently submitted jobs first.  The history includes jobs that no longer exist in the cluster.
+
+        :param status: Execution statuses of the jobs, as repeated values
+        :type status: List[JobStatus]
+        :param queue: Kueue local queue of the jobs
+        :type queue: str
+        :param submitter: Submitter of the jobs (email, or username if unknown)
+        :type submitter: str
+        :param cluster: Cluster of the jobs
+        :type cluster: str
+        :param namespace: Namespace of the jobs
+        :type namespace: str
+        :param since: Only jobs submitted at or after this time
+        :type since: datetime
+        :param until: Only jobs submitted before this time
+        :type until: datetime
+        :param limit:
+        :type limit: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._job_history_jobs_history_get_serialize(
+            status=status,
+            queue=queue,
+            submitter=submitter,
+            cluster=cluster,
+            namespace=namespace,
+            since=since,
+            until=until,
+            limit=limit,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[JobHistoryEntry]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+    def _job_history_jobs_history_get_serialize(
+        self,
+        status,
+        queue,
+        submitter,
+        cluster,
+        namespace,
+        since,
+        until,
+        limit,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+        _host = None
+
+        _collection_formats: dict[str, str] = {
+            "status": "multi",
+        }
+
+        _path_params: dict[str, str] = {}
+        _query_params: list[tuple[str, str]] = []
+        _header_params: dict[str, str | None] = _headers or {}
+        _form_params: list[tuple[str, str]] = []
+        _files: dict[
+            str, str | bytes | list[str] | list[bytes] | list[tuple[str, bytes]]
+        ] = {}
+        _body_params: bytes | None = None
+
+        # process the path parameters
+        # process the query parameters
+        if status is not None:
+            _query_params.append(("status", status))
+
+        if queue is not None:
+            _query_params.append(("queue", queue))
+
+        if submitter is not None:
+            _query_params.append(("submitter", submitter))
+
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
+        if namespace is not None:
+            _query_params.append(("namespace", namespace))
+
+        if since is not None:
+            if isinstance(since, datetime):
+                _query_params.append((
+                    "since",
+                    since.strftime(self.api_client.configuration.datetime_format),
+                ))
+            else:
+                _query_params.append(("since", since))
+
+        if until is not None:
+            if isinstance(until, datetime):
+                _query_params.append((
+                    "until",
+                    until.strftime(self.api_client.configuration.datetime_format),
+                ))
+            else:
+                _query_params.append(("until", until))
+
+        if limit is not None:
+            _query_params.append(("limit", limit))
+
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+        # set the HTTP header `Accept`
+        if "Accept" not in _header_params:
+            _header_params["Accept"] = self.api_client.select_header_accept([
+                "application/json"
+            ])
+
+        # authentication setting
+        _auth_settings: list[str] = []
+
+        return self.api_client.param_serialize(
+            method="GET",
+            resource_path="/jobs/history",
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
+
     @validate_call
     def list_jobs_jobs_get(
         self,
-        include_metadata: StrictBool | None = None,
+        include_metadata: StrictBool | None = None,
+        cluster: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters."
+            ),
+        ] = None,
+        fields: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> list[ListWorkloadModel]:
+        """List Jobs
+
+
+        :param include_metadata:
+        :type include_metadata: bool
+        :param cluster: Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters.
+        :type cluster: List[str]
+        :param fields: Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default.
+        :type fields: List[str]
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._list_jobs_jobs_get_serialize(
+            include_metadata=include_metadata,
+            cluster=cluster,
+            fields=fields,
+            namespace=namespace,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[ListWorkloadModel]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+    @validate_call
+    def list_jobs_jobs_get_with_http_info(
+        self,
+        include_metadata: StrictBool | None = None,
+        cluster: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters."
+            ),
+        ] = None,
+        fields: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[list[ListWorkloadModel]]:
+        """List Jobs
+
+
+        :param include_metadata:
+        :type include_metadata: bool
+        :param cluster: Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters.
+        :type cluster: List[str]
+        :param fields: Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default.
+        :type fields: List[str]
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._list_jobs_jobs_get_serialize(
+            include_metadata=include_metadata,
+            cluster=cluster,
+            fields=fields,
+            namespace=namespace,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[ListWorkloadModel]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+    @validate_call
+    def list_jobs_jobs_get_without_preload_content(
+        self,
+        include_metadata: StrictBool | None = None,
+        cluster: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters."
+            ),
+        ] = None,
+        fields: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """List Jobs
+
+
+        :param include_metadata:
+        :type include_metadata: bool
+        :param cluster: Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters.
+        :type cluster: List[str]
+        :param fields: Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default.
+        :type fields: List[str]
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._list_jobs_jobs_get_serialize(
+            include_metadata=include_metadata,
+            cluster=cluster,
+            fields=fields,
+            namespace=namespace,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[ListWorkloadModel]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+    def _list_jobs_jobs_get_serialize(
+        self,
+        include_metadata,
+        cluster,
+        fields,
+        namespace,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+        _host = None
+
+        _collection_formats: dict[str, str] = {
+            "cluster": "multi",
+            "fields": "multi",
+            "namespace": "multi",
+        }
+
+        _path_params: dict[str, str] = {}
+        _query_params: list[tuple[str, str]] = []
+        _header_params: dict[str, str | None] = _headers or {}
+        _form_params: list[tuple[str, str]] = []
+        _files: dict[
+            str, str | bytes | list[str] | list[bytes] | list[tuple[str, bytes]]
+        ] = {}
+        _body_params: bytes | None = None
+
+        # process the path parameters
+        # process the query parameters
+        if include_metadata is not None:
+            _query_params.append(("include_metadata", include_metadata))
+
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
+        if fields is not None:
+            _query_params.append(("fields", fields))
+
+        if namespace is not None:
+            _query_params.append(("namespace", namespace))
+
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+        # set the HTTP header `Accept`
+        if "Accept" not in _header_params:
+            _header_params["Accept"] = self.api_client.select_header_accept([
+                "application/json"
+            ])
+
+        # authentication setting
+        _auth_settings: list[str] = []
+
+        return self.api_client.param_serialize(
+            method="GET",
+            resource_path="/jobs",
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
+
+    @validate_call
+    def logs_jobs_uid_logs_get(
+        self,
+        uid: StrictStr,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        stream: StrictBool | None = None,
+        tail: Annotated[int, Field(strict=True, ge=-1)] | None = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> object:
+        """Logs
+
+
+        :param uid: (required)
+        :type uid: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param stream:
+        :type stream: bool
+        :param tail:
+        :type tail: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._logs_jobs_uid_logs_get_serialize(
+            uid=uid,
+            cluster=cluster,
+            namespace=namespace,
+            stream=stream,
+            tail=tail,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "object",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+    @validate_call
+    def logs_jobs_uid_logs_get_with_http_info(
+        self,
+        uid: StrictStr,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        stream: StrictBool | None = None,
+        tail: Annotated[int, Field(strict=True, ge=-1)] | None = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[object]:
+        """Logs
+
+
+        :param uid: (required)
+        :type uid: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param stream:
+        :type stream: bool
+        :param tail:
+        :type tail: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._logs_jobs_uid_logs_get_serialize(
+            uid=uid,
+            cluster=cluster,
+            namespace=namespace,
+            stream=stream,
+            tail=tail,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "object",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+    @validate_call
+    def logs_jobs_uid_logs_get_without_preload_content(
+        self,
+        uid: StrictStr,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        stream: StrictBool | None = None,
+        tail: Annotated[int, Field(strict=True, ge=-1)] | None = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Logs
+
+
+        :param uid: (required)
+        :type uid: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param stream:
+        :type stream: bool
+        :param tail:
+        :type tail: int
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._logs_jobs_uid_logs_get_serialize(
+            uid=uid,
+            cluster=cluster,
+            namespace=namespace,
+            stream=stream,
+            tail=tail,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "object",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+    def _logs_jobs_uid_logs_get_serialize(
+        self,
+        uid,
+        cluster,
+        namespace,
+        stream,
+        tail,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+        _host = None
+
+        _collection_formats: dict[str, str] = {
+            "namespace": "multi",
+        }
+
+        _path_params: dict[str, str] = {}
+        _query_params: list[tuple[str, str]] = []
+        _header_params: dict[str, str | None] = _headers or {}
+        _form_params: list[tuple[str, str]] = []
+        _files: dict[
+            str, str | bytes | list[str] | list[bytes] | list[tuple[str, bytes]]
+        ] = {}
+        _body_params: bytes | None = None
+
+        # process the path parameters
+        if uid is not None:
+            _path_params["uid"] = uid
+        # process the query parameters
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
+        if namespace is not None:
+            _query_params.append(("namespace", namespace))
+
+        if stream is not None:
+            _query_params.append(("stream", stream))
+
+        if tail is not None:
+            _query_params.append(("tail", tail))
+
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+        # set the HTTP header `Accept`
+        if "Accept" not in _header_params:
+            _header_params["Accept"] = self.api_client.select_header_accept([
+                "application/json"
+            ])
+
+        # authentication setting
+        _auth_settings: list[str] = []
+
+        return self.api_client.param_serialize(
+            method="GET",
+            resource_path="/jobs/{uid}/logs",
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
+
+    @validate_call
+    def search_archived_logs_jobs_history_uid_logs_search_get(
+        self,
+        uid: StrictStr,
+        pattern: Annotated[str, Field(min_length=1, strict=True, max_length=1024)],
+        ignore_case: StrictBool | None = None,
+        context: Annotated[int, Field(le=100, strict=True, ge=0)] | None = None,
+        max_matches: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        max_bytes: Annotated[int, Field(le=16777216, strict=True, ge=1)] | None = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -47,12 +1376,23 @@ class JobManagementApi:
         _content_type: StrictStr | None = None,
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> list[ListWorkloadModel]:
-        """List Jobs
+    ) -> None:
+        """Search Archived Logs
 
+        Search the archived logs of a finished job for a regular expression, like the logs of a running job.
 
-        :param include_metadata:
-        :type include_metadata: bool
+        :param uid: (required)
+        :type uid: str
+        :param pattern: (required)
+        :type pattern: str
+        :param ignore_case:
+        :type ignore_case: bool
+        :param context:
+        :type context: int
+        :param max_matches:
+        :type max_matches: int
+        :param max_bytes:
+        :type max_bytes: int
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -75,8 +1415,13 @@ class JobManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._list_jobs_jobs_get_serialize(
-            include_metadata=include_metadata,
+        _param = self._search_archived_logs_jobs_history_uid_logs_search_get_serialize(
+            uid=uid,
+            pattern=pattern,
+            ignore_case=ignore_case,
+            context=context,
+            max_matches=max_matches,
+            max_bytes=max_bytes,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -84,7 +1429,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "List[ListWorkloadModel]",
+            "200": None,
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -97,9 +1442,14 @@ class JobManagementApi:
         ).data
 
     @validate_call
-    def list_jobs_jobs_get_with_http_info(
+    def search_archived_logs_jobs_history_uid_logs_search_get_with_http_info(
         self,
-        include_metadata: StrictBool | None = None,
+        uid: StrictStr,
+        pattern: Annotated[str, Field(min_length=1, strict=True, max_length=1024)],
+        ignore_case: StrictBool | None = None,
+        context: Annotated[int, Field(le=100, strict=True, ge=0)] | None = None,
+        max_matches: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        max_bytes: Annotated[int, Field(le=16777216, strict=True, ge=1)] | None = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -109,12 +1459,23 @@ class JobManagementApi:
         _content_type: StrictStr | None = None,
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[list[ListWorkloadModel]]:
-        """List Jobs
+    ) -> ApiResponse[None]:
+        """Search Archived Logs
 
+        Search the archived logs of a finished job for a regular expression, like the logs of a running job.
 
-        :param include_metadata:
-        :type include_metadata: bool
+        :param uid: (required)
+        :type uid: str
+        :param pattern: (required)
+        :type pattern: str
+        :param ignore_case:
+        :type ignore_case: bool
+        :param context:
+        :type context: int
+        :param max_matches:
+        :type max_matches: int
+        :param max_bytes:
+        :type max_bytes: int
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -137,8 +1498,13 @@ class JobManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._list_jobs_jobs_get_serialize(
-            include_metadata=include_metadata,
+        _param = self._search_archived_logs_jobs_history_uid_logs_search_get_serialize(
+            uid=uid,
+            pattern=pattern,
+            ignore_case=ignore_case,
+            context=context,
+            max_matches=max_matches,
+            max_bytes=max_bytes,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -146,7 +1512,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "List[ListWorkloadModel]",
+            "200": None,
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -159,9 +1525,14 @@ class JobManagementApi:
         )
 
     @validate_call
-    def list_jobs_jobs_get_without_preload_content(
+    def search_archived_logs_jobs_history_uid_logs_search_get_without_preload_content(
         self,
-        include_metadata: StrictBool | None = None,
+        uid: StrictStr,
+        pattern: Annotated[str, Field(min_length=1, strict=True, max_length=1024)],
+        ignore_case: StrictBool | None = None,
+        context: Annotated[int, Field(le=100, strict=True, ge=0)] | None = None,
+        max_matches: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        max_bytes: Annotated[int, Field(le=16777216, strict=True, ge=1)] | None = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -172,11 +1543,22 @@ class JobManagementApi:
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """List Jobs
+        """Search Archived Logs
 
+        Search the archived logs of a finished job for a regular expression, like the logs of a running job.
 
-        :param include_metadata:
-        :type include_metadata: bool
+        :param uid: (required)
+        :type uid: str
+        :param pattern: (required)
+        :type pattern: str
+        :param ignore_case:
+        :type ignore_case: bool
+        :param context:
+        :type context: int
+        :param max_matches:
+        :type max_matches: int
+        :param max_bytes:
+        :type max_bytes: int
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -199,8 +1581,13 @@ class JobManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._list_jobs_jobs_get_serialize(
-            include_metadata=include_metadata,
+        _param = self._search_archived_logs_jobs_history_uid_logs_search_get_serialize(
+            uid=uid,
+            pattern=pattern,
+            ignore_case=ignore_case,
+            context=context,
+            max_matches=max_matches,
+            max_bytes=max_bytes,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -208,7 +1595,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "List[ListWorkloadModel]",
+            "200": None,
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -216,9 +1603,14 @@ class JobManagementApi:
         )
         return response_data.response
 
-    def _list_jobs_jobs_get_serialize(
+    def _search_archived_logs_jobs_history_uid_logs_search_get_serialize(
         self,
-        include_metadata,
+        uid,
+        pattern,
+        ignore_case,
+        context,
+        max_matches,
+        max_bytes,
         _request_auth,
         _content_type,
         _headers,
@@ -238,9 +1630,23 @@ class JobManagementApi:
         _body_params: bytes | None = None
 
         # process the path parameters
+        if uid is not None:
+            _path_params["uid"] = uid
         # process the query parameters
-        if include_metadata is not None:
-            _query_params.append(("include_metadata", include_metadata))
+        if pattern is not None:
+            _query_params.append(("pattern", pattern))
+
+        if ignore_case is not None:
+            _query_params.append(("ignore_case", ignore_case))
+
+        if context is not None:
+            _query_params.append(("context", context))
+
+        if max_matches is not None:
+            _query_params.append(("max_matches", max_matches))
+
+        if max_bytes is not None:
+            _query_params.append(("max_bytes", max_bytes))
 
         # process the header parameters
         # process the form parameters
@@ -249,7 +1655,8 @@ class JobManagementApi:
         # set the HTTP header `Accept`
         if "Accept" not in _header_params:
             _header_params["Accept"] = self.api_client.select_header_accept([
-                "application/json"
+                "application/x-ndjson",
+                "application/json",
             ])
 
         # authentication setting
@@ -257,7 +1664,7 @@ class JobManagementApi:
 
         return self.api_client.param_serialize(
             method="GET",
-            resource_path="/jobs",
+            resource_path="/jobs/history/{uid}/logs/search",
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -271,12 +1678,26 @@ class JobManagementApi:
         )
 
     @validate_call
-    def logs_jobs_uid_logs_get(
+    def search_logs_jobs_uid_logs_search_get(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
-        stream: StrictBool | None = None,
-        tail: Annotated[int, Field(strict=True, ge=-1)] | None = None,
+        pattern: Annotated[str, Field(min_length=1, strict=True, max_length=1024)],
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        ignore_case: StrictBool | None = None,
+        context: Annotated[int, Field(le=100, strict=True, ge=0)] | None = None,
+        max_matches: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        max_bytes: Annotated[int, Field(le=16777216, strict=True, ge=1)] | None = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -286,18 +1707,27 @@ class JobManagementApi:
         _content_type: StrictStr | None = None,
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> object:
-        """Logs
+    ) -> None:
+        """Search Logs
 
+        Search the logs of a workload's pods for a regular expression.  The logs are scanned on the server, and only the matching lines (along with the requested context) are sent back, one `LogSearchMatch` JSON object per line. The response is truncated once `max_matches` matches or `max_bytes` bytes are reached.
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
-        :param stream:
-        :type stream: bool
-        :param tail:
-        :type tail: int
+        :param pattern: (required)
+        :type pattern: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param ignore_case:
+        :type ignore_case: bool
+        :param context:
+        :type context: int
+        :param max_matches:
+        :type max_matches: int
+        :param max_bytes:
+        :type max_bytes: int
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -320,11 +1750,15 @@ class JobManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._logs_jobs_uid_logs_get_serialize(
+        _param = self._search_logs_jobs_uid_logs_search_get_serialize(
             uid=uid,
+            pattern=pattern,
+            cluster=cluster,
             namespace=namespace,
-            stream=stream,
-            tail=tail,
+            ignore_case=ignore_case,
+            context=context,
+            max_matches=max_matches,
+            max_bytes=max_bytes,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -332,7 +1766,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "object",
+            "200": None,
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -345,12 +1779,26 @@ class JobManagementApi:
         ).data
 
     @validate_call
-    def logs_jobs_uid_logs_get_with_http_info(
+    def search_logs_jobs_uid_logs_search_get_with_http_info(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
-        stream: StrictBool | None = None,
-        tail: Annotated[int, Field(strict=True, ge=-1)] | None = None,
+        pattern: Annotated[str, Field(min_length=1, strict=True, max_length=1024)],
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        ignore_case: StrictBool | None = None,
+        context: Annotated[int, Field(le=100, strict=True, ge=0)] | None = None,
+        max_matches: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        max_bytes: Annotated[int, Field(le=16777216, strict=True, ge=1)] | None = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -360,18 +1808,27 @@ class JobManagementApi:
         _content_type: StrictStr | None = None,
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[object]:
-        """Logs
+    ) -> ApiResponse[None]:
+        """Search Logs
 
+        Search the logs of a workload's pods for a regular expression.  The logs are scanned on the server, and only the matching lines (along with the requested context) are sent back, one `LogSearchMatch` JSON object per line. The response is truncated once `max_matches` matches or `max_bytes` bytes are reached.
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
-        :param stream:
-        :type stream: bool
-        :param tail:
-        :type tail: int
+        :param pattern: (required)
+        :type pattern: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param ignore_case:
+        :type ignore_case: bool
+        :param context:
+        :type context: int
+        :param max_matches:
+        :type max_matches: int
+        :param max_bytes:
+        :type max_bytes: int
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -394,11 +1851,15 @@ class JobManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._logs_jobs_uid_logs_get_serialize(
+        _param = self._search_logs_jobs_uid_logs_search_get_serialize(
             uid=uid,
+            pattern=pattern,
+            cluster=cluster,
             namespace=namespace,
-            stream=stream,
-            tail=tail,
+            ignore_case=ignore_case,
+            context=context,
+            max_matches=max_matches,
+            max_bytes=max_bytes,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -406,7 +1867,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "object",
+            "200": None,
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -419,12 +1880,26 @@ class JobManagementApi:
         )
 
     @validate_call
-    def logs_jobs_uid_logs_get_without_preload_content(
+    def search_logs_jobs_uid_logs_search_get_without_preload_content(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
-        stream: StrictBool | None = None,
-        tail: Annotated[int, Field(strict=True, ge=-1)] | None = None,
+        pattern: Annotated[str, Field(min_length=1, strict=True, max_length=1024)],
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        ignore_case: StrictBool | None = None,
+        context: Annotated[int, Field(le=100, strict=True, ge=0)] | None = None,
+        max_matches: Annotated[int, Field(le=10000, strict=True, ge=1)] | None = None,
+        max_bytes: Annotated[int, Field(le=16777216, strict=True, ge=1)] | None = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -435,17 +1910,26 @@ class JobManagementApi:
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Logs
+        """Search Logs
 
+        Search the logs of a workload's pods for a regular expression.  The logs are scanned on the server, and only the matching lines (along with the requested context) are sent back, one `LogSearchMatch` JSON object per line. The response is truncated once `max_matches` matches or `max_bytes` bytes are reached.
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
-        :param stream:
-        :type stream: bool
-        :param tail:
-        :type tail: int
+        :param pattern: (required)
+        :type pattern: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param ignore_case:
+        :type ignore_case: bool
+        :param context:
+        :type context: int
+        :param max_matches:
+        :type max_matches: int
+        :param max_bytes:
+        :type max_bytes: int
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -468,11 +1952,15 @@ class JobManagementApi:
         :return: Returns the result object.
         """  # noqa: E501
 
-        _param = self._logs_jobs_uid_logs_get_serialize(
+        _param = self._search_logs_jobs_uid_logs_search_get_serialize(
             uid=uid,
+            pattern=pattern,
+            cluster=cluster,
             namespace=namespace,
-            stream=stream,
-            tail=tail,
+            ignore_case=ignore_case,
+            context=context,
+            max_matches=max_matches,
+            max_bytes=max_bytes,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -480,7 +1968,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "object",
+            "200": None,
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -488,12 +1976,16 @@ class JobManagementApi:
         )
         return response_data.response
 
-    def _logs_jobs_uid_logs_get_serialize(
+    def _search_logs_jobs_uid_logs_search_get_serialize(
         self,
         uid,
+        pattern,
+        cluster,
         namespace,
-        stream,
-        tail,
+        ignore_case,
+        context,
+        max_matches,
+        max_bytes,
         _request_auth,
         _content_type,
         _headers,
@@ -501,7 +1993,9 @@ class JobManagementApi:
     ) -> RequestSerialized:
         _host = None
 
-        _collection_formats: dict[str, str] = {}
+        _collection_formats: dict[str, str] = {
+            "namespace": "multi",
+        }
 
         _path_params: dict[str, str] = {}
         _query_params: list[tuple[str, str]] = []
@@ -516,14 +2010,26 @@ class JobManagementApi:
         if uid is not None:
             _path_params["uid"] = uid
         # process the query parameters
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
         if namespace is not None:
             _query_params.append(("namespace", namespace))
 
-        if stream is not None:
-            _query_params.append(("stream", stream))
+        if pattern is not None:
+            _query_params.append(("pattern", pattern))
 
-        if tail is not None:
-            _query_params.append(("tail", tail))
+        if ignore_case is not None:
+            _query_params.append(("ignore_case", ignore_case))
+
+        if context is not None:
+            _query_params.append(("context", context))
+
+        if max_matches is not None:
+            _query_params.append(("max_matches", max_matches))
+
+        if max_bytes is not None:
+            _query_params.append(("max_bytes", max_bytes))
 
         # process the header parameters
         # process the form parameters
@@ -532,7 +2038,8 @@ class JobManagementApi:
         # set the HTTP header `Accept`
         if "Accept" not in _header_params:
             _header_params["Accept"] = self.api_client.select_header_accept([
-                "application/json"
+                "application/x-ndjson",
+                "application/json",
             ])
 
         # authentication setting
@@ -540,7 +2047,7 @@ class JobManagementApi:
 
         return self.api_client.param_serialize(
             method="GET",
-            resource_path="/jobs/{uid}/logs",
+            resource_path="/jobs/{uid}/logs/search",
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -557,7 +2064,24 @@ class JobManagementApi:
     def status_jobs_uid_status_get(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        fields: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -573,8 +2097,12 @@ class JobManagementApi:
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param fields: Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default.
+        :type fields: List[str]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -599,7 +2127,9 @@ class JobManagementApi:
 
         _param = self._status_jobs_uid_status_get_serialize(
             uid=uid,
+            cluster=cluster,
             namespace=namespace,
+            fields=fields,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -623,7 +2153,24 @@ class JobManagementApi:
     def status_jobs_uid_status_get_with_http_info(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        fields: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -639,8 +2186,12 @@ class JobManagementApi:
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param fields: Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default.
+        :type fields: List[str]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -665,7 +2216,9 @@ class JobManagementApi:
 
         _param = self._status_jobs_uid_status_get_serialize(
             uid=uid,
+            cluster=cluster,
             namespace=namespace,
+            fields=fields,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -689,7 +2242,24 @@ class JobManagementApi:
     def status_jobs_uid_status_get_without_preload_content(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
+        fields: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -705,8 +2275,12 @@ class JobManagementApi:
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
+        :param fields: Workload metadata fields to include in the response, either as repeated or comma-separated values. Expensive fields (e.g., `has_failed_pods`) are only computed if requested. All fields are included by default.
+        :type fields: List[str]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -731,7 +2305,9 @@ class JobManagementApi:
 
         _param = self._status_jobs_uid_status_get_serialize(
             uid=uid,
+            cluster=cluster,
             namespace=namespace,
+            fields=fields,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -750,7 +2326,9 @@ class JobManagementApi:
     def _status_jobs_uid_status_get_serialize(
         self,
         uid,
+        cluster,
         namespace,
+        fields,
         _request_auth,
         _content_type,
         _headers,
@@ -758,7 +2336,10 @@ class JobManagementApi:
     ) -> RequestSerialized:
         _host = None
 
-        _collection_formats: dict[str, str] = {}
+        _collection_formats: dict[str, str] = {
+            "namespace": "multi",
+            "fields": "multi",
+        }
 
         _path_params: dict[str, str] = {}
         _query_params: list[tuple[str, str]] = []
@@ -773,9 +2354,15 @@ class JobManagementApi:
         if uid is not None:
             _path_params["uid"] = uid
         # process the query parameters
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
         if namespace is not None:
             _query_params.append(("namespace", namespace))
 
+        if fields is not None:
+            _query_params.append(("fields", fields))
+
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -808,7 +2395,18 @@ class JobManagementApi:
     def stop_workload_jobs_uid_stop_post(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -824,8 +2422,10 @@ class JobManagementApi:
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -850,6 +2450,7 @@ class JobManagementApi:
 
         _param = self._stop_workload_jobs_uid_stop_post_serialize(
             uid=uid,
+            cluster=cluster,
             namespace=namespace,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -874,7 +2475,18 @@ class JobManagementApi:
     def stop_workload_jobs_uid_stop_post_with_http_info(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -890,8 +2502,10 @@ class JobManagementApi:
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -916,6 +2530,7 @@ class JobManagementApi:
 
         _param = self._stop_workload_jobs_uid_stop_post_serialize(
             uid=uid,
+            cluster=cluster,
             namespace=namespace,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -940,7 +2555,18 @@ class JobManagementApi:
     def stop_workload_jobs_uid_stop_post_without_preload_content(
         self,
         uid: StrictStr,
-        namespace: StrictStr | None = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        namespace: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -956,8 +2582,10 @@ class JobManagementApi:
 
         :param uid: (required)
         :type uid: str
-        :param namespace:
-        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param namespace: Namespaces to query, either as repeated or comma-separated values. `*` queries all namespaces. Defaults to the namespace of the server.
+        :type namespace: List[str]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -982,6 +2610,7 @@ class JobManagementApi:
 
         _param = self._stop_workload_jobs_uid_stop_post_serialize(
             uid=uid,
+            cluster=cluster,
             namespace=namespace,
             _request_auth=_request_auth,
             _content_type=_content_type,
@@ -1001,6 +2630,7 @@ class JobManagementApi:
     def _stop_workload_jobs_uid_stop_post_serialize(
         self,
         uid,
+        cluster,
         namespace,
         _request_auth,
         _content_type,
@@ -1009,7 +2639,9 @@ class JobManagementApi:
     ) -> RequestSerialized:
         _host = None
 
-        _collection_formats: dict[str, str] = {}
+        _collection_formats: dict[str, str] = {
+            "namespace": "multi",
+        }
 
         _path_params: dict[str, str] = {}
         _query_params: list[tuple[str, str]] = []
@@ -1024,6 +2656,9 @@ class JobManagementApi:
         if uid is not None:
             _path_params["uid"] = uid
         # process the query parameters
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
         if namespace is not None:
             _query_params.append(("namespace", namespace))
 
@@ -1059,6 +2694,18 @@ class JobManagementApi:
     def submit_job_jobs_post(
         self,
         create_job_model: CreateJobModel,
+        dry_run: Annotated[
+            StrictBool | None,
+            Field(
+                description="Only estimate whether and when the job would be admitted by its Kueue queue, from the cached queue quotas, without submitting it."
+            ),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -1068,12 +2715,16 @@ class JobManagementApi:
         _content_type: StrictStr | None = None,
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> WorkloadIdentifier:
+    ) -> ResponseSubmitJobJobsPost:
         """Submit Job
 
 
         :param create_job_model: (required)
         :type create_job_model: CreateJobModel
+        :param dry_run: Only estimate whether and when the job would be admitted by its Kueue queue, from the cached queue quotas, without submitting it.
+        :type dry_run: bool
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1098,6 +2749,8 @@ class JobManagementApi:
 
         _param = self._submit_job_jobs_post_serialize(
             create_job_model=create_job_model,
+            dry_run=dry_run,
+            cluster=cluster,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1105,7 +2758,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "WorkloadIdentifier",
+            "200": "ResponseSubmitJobJobsPost",
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1121,6 +2774,18 @@ class JobManagementApi:
     def submit_job_jobs_post_with_http_info(
         self,
         create_job_model: CreateJobModel,
+        dry_run: Annotated[
+            StrictBool | None,
+            Field(
+                description="Only estimate whether and when the job would be admitted by its Kueue queue, from the cached queue quotas, without submitting it."
+            ),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -1130,12 +2795,16 @@ class JobManagementApi:
         _content_type: StrictStr | None = None,
         _headers: dict[StrictStr, Any] | None = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[WorkloadIdentifier]:
+    ) -> ApiResponse[ResponseSubmitJobJobsPost]:
         """Submit Job
 
 
         :param create_job_model: (required)
         :type create_job_model: CreateJobModel
+        :param dry_run: Only estimate whether and when the job would be admitted by its Kueue queue, from the cached queue quotas, without submitting it.
+        :type dry_run: bool
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1160,6 +2829,8 @@ class JobManagementApi:
 
         _param = self._submit_job_jobs_post_serialize(
             create_job_model=create_job_model,
+            dry_run=dry_run,
+            cluster=cluster,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1167,7 +2838,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "WorkloadIdentifier",
+            "200": "ResponseSubmitJobJobsPost",
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1183,6 +2854,18 @@ class JobManagementApi:
     def submit_job_jobs_post_without_preload_content(
         self,
         create_job_model: CreateJobModel,
+        dry_run: Annotated[
+            StrictBool | None,
+            Field(
+                description="Only estimate whether and when the job would be admitted by its Kueue queue, from the cached queue quotas, without submitting it."
+            ),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
         _request_timeout: None
         | Annotated[StrictFloat, Field(gt=0)]
         | tuple[
@@ -1198,6 +2881,10 @@ class JobManagementApi:
 
         :param create_job_model: (required)
         :type create_job_model: CreateJobModel
+        :param dry_run: Only estimate whether and when the job would be admitted by its Kueue queue, from the cached queue quotas, without submitting it.
+        :type dry_run: bool
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1222,6 +2909,8 @@ class JobManagementApi:
 
         _param = self._submit_job_jobs_post_serialize(
             create_job_model=create_job_model,
+            dry_run=dry_run,
+            cluster=cluster,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1229,7 +2918,7 @@ class JobManagementApi:
         )
 
         _response_types_map: dict[str, str | None] = {
-            "200": "WorkloadIdentifier",
+            "200": "ResponseSubmitJobJobsPost",
             "422": "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1240,6 +2929,8 @@ class JobManagementApi:
     def _submit_job_jobs_post_serialize(
         self,
         create_job_model,
+        dry_run,
+        cluster,
         _request_auth,
         _content_type,
         _headers,
@@ -1260,6 +2951,12 @@ class JobManagementApi:
 
         # process the path parameters
         # process the query parameters
+        if dry_run is not None:
+            _query_params.append(("dry_run", dry_run))
+
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -0,0 +1,615 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Annotated, Any
+
+from pydantic import Field, StrictFloat, StrictInt, StrictStr, validate_call
+
+from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.api_response import ApiResponse
+from openapi_client.models.cluster_queue_snapshot import ClusterQueueSnapshot
+from openapi_client.models.queue_kind import QueueKind
+from openapi_client.models.queue_statistics import QueueStatistics
+from openapi_client.rest import RESTResponseType
+
+
+class QueuesApi:
+    """NOTE: This class is auto generated by OpenAPI Generator
+    Ref: https://openapi-generator.tech
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = ApiClient.get_default()
+        self.api_client = api_client
+
+    @validate_call
+    def list_queues_queues_get(
+        self,
+        cluster: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> list[ClusterQueueSnapshot]:
+        """List Queues
+
+        The Kueue ClusterQueues, with their quota, usage, workload counts and LocalQueues.  The queues are served from a snapshot that is kept up to date by watching them, and the LocalQueues are limited to the namespaces watched by the server.
+
+        :param cluster: Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters.
+        :type cluster: List[str]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._list_queues_queues_get_serialize(
+            cluster=cluster,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[ClusterQueueSnapshot]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+    @validate_call
+    def list_queues_queues_get_with_http_info(
+        self,
+        cluster: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[list[ClusterQueueSnapshot]]:
+        """List Queues
+
+        The Kueue ClusterQueues, with their quota, usage, workload counts and LocalQueues.  The queues are served from a snapshot that is kept up to date by watching them, and the LocalQueues are limited to the namespaces watched by the server.
+
+        :param cluster: Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters.
+        :type cluster: List[str]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._list_queues_queues_get_serialize(
+            cluster=cluster,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[ClusterQueueSnapshot]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+    @validate_call
+    def list_queues_queues_get_without_preload_content(
+        self,
+        cluster: Annotated[
+            list[StrictStr] | None,
+            Field(
+                description="Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """List Queues
+
+        The Kueue ClusterQueues, with their quota, usage, workload counts and LocalQueues.  The queues are served from a snapshot that is kept up to date by watching them, and the LocalQueues are limited to the namespaces watched by the server.
+
+        :param cluster: Clusters to query, either as repeated or comma-separated values, if the server manages several clusters. `*` (the default) queries all clusters.
+        :type cluster: List[str]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._list_queues_queues_get_serialize(
+            cluster=cluster,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "List[ClusterQueueSnapshot]",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+    def _list_queues_queues_get_serialize(
+        self,
+        cluster,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+        _host = None
+
+        _collection_formats: dict[str, str] = {
+            "cluster": "multi",
+        }
+
+        _path_params: dict[str, str] = {}
+        _query_params: list[tuple[str, str]] = []
+        _header_params: dict[str, str | None] = _headers or {}
+        _form_params: list[tuple[str, str]] = []
+        _files: dict[
+            str, str | bytes | list[str] | list[bytes] | list[tuple[str, bytes]]
+        ] = {}
+        _body_params: bytes | None = None
+
+        # process the path parameters
+        # process the query parameters
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+        # set the HTTP header `Accept`
+        if "Accept" not in _header_params:
+            _header_params["Accept"] = self.api_client.select_header_accept([
+                "application/json"
+            ])
+
+        # authentication setting
+        _auth_settings: list[str] = []
+
+        return self.api_client.param_serialize(
+            method="GET",
+            resource_path="/queues",
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
+
+    @validate_call
+    def queue_stats_queues_name_stats_get(
+        self,
+        name: StrictStr,
+        kind: Annotated[
+            QueueKind | None,
+            Field(description="Whether the queue is a LocalQueue or ClusterQueue"),
+        ] = None,
+        namespace: Annotated[
+            StrictStr | None,
+            Field(
+                description="Namespace of a LocalQueue. Defaults to the server's namespace."
+            ),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> QueueStatistics:
+        """Queue Stats
+
+        Rolling wait time, runtime, eviction and throughput statistics of a Kueue queue.  The statistics are maintained from the workload watch events of the server, and cover the workloads admitted, evicted or terminated in the rolling time window.
+
+        :param name: (required)
+        :type name: str
+        :param kind: Whether the queue is a LocalQueue or ClusterQueue
+        :type kind: QueueKind
+        :param namespace: Namespace of a LocalQueue. Defaults to the server's namespace.
+        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._queue_stats_queues_name_stats_get_serialize(
+            name=name,
+            kind=kind,
+            namespace=namespace,
+            cluster=cluster,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "QueueStatistics",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+    @validate_call
+    def queue_stats_queues_name_stats_get_with_http_info(
+        self,
+        name: StrictStr,
+        kind: Annotated[
+            QueueKind | None,
+            Field(description="Whether the queue is a LocalQueue or ClusterQueue"),
+        ] = None,
+        namespace: Annotated[
+            StrictStr | None,
+            Field(
+                description="Namespace of a LocalQueue. Defaults to the server's namespace."
+            ),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[QueueStatistics]:
+        """Queue Stats
+
+        Rolling wait time, runtime, eviction and throughput statistics of a Kueue queue.  The statistics are maintained from the workload watch events of the server, and cover the workloads admitted, evicted or terminated in the rolling time window.
+
+        :param name: (required)
+        :type name: str
+        :param kind: Whether the queue is a LocalQueue or ClusterQueue
+        :type kind: QueueKind
+        :param namespace: Namespace of a LocalQueue. Defaults to the server's namespace.
+        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._queue_stats_queues_name_stats_get_serialize(
+            name=name,
+            kind=kind,
+            namespace=namespace,
+            cluster=cluster,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "QueueStatistics",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+    @validate_call
+    def queue_stats_queues_name_stats_get_without_preload_content(
+        self,
+        name: StrictStr,
+        kind: Annotated[
+            QueueKind | None,
+            Field(description="Whether the queue is a LocalQueue or ClusterQueue"),
+        ] = None,
+        namespace: Annotated[
+            StrictStr | None,
+            Field(
+                description="Namespace of a LocalQueue. Defaults to the server's namespace."
+            ),
+        ] = None,
+        cluster: Annotated[
+            StrictStr | None,
+            Field(
+                description="Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota)."
+            ),
+        ] = None,
+        _request_timeout: None
+        | Annotated[StrictFloat, Field(gt=0)]
+        | tuple[
+            Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]
+        ] = None,
+        _request_auth: dict[StrictStr, Any] | None = None,
+        _content_type: StrictStr | None = None,
+        _headers: dict[StrictStr, Any] | None = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Queue Stats
+
+        Rolling wait time, runtime, eviction and throughput statistics of a Kueue queue.  The statistics are maintained from the workload watch events of the server, and cover the workloads admitted, evicted or terminated in the rolling time window.
+
+        :param name: (required)
+        :type name: str
+        :param kind: Whether the queue is a LocalQueue or ClusterQueue
+        :type kind: QueueKind
+        :param namespace: Namespace of a LocalQueue. Defaults to the server's namespace.
+        :type namespace: str
+        :param cluster: Cluster of the job, if the server manages several clusters. Defaults to the cluster the job is found in (or, for submissions, the cluster with the most free quota).
+        :type cluster: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """  # noqa: E501
+
+        _param = self._queue_stats_queues_name_stats_get_serialize(
+            name=name,
+            kind=kind,
+            namespace=namespace,
+            cluster=cluster,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index,
+        )
+
+        _response_types_map: dict[str, str | None] = {
+            "200": "QueueStatistics",
+            "422": "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param, _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+    def _queue_stats_queues_name_stats_get_serialize(
+        self,
+        name,
+        kind,
+        namespace,
+        cluster,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+        _host = None
+
+        _collection_formats: dict[str, str] = {}
+
+        _path_params: dict[str, str] = {}
+        _query_params: list[tuple[str, str]] = []
+        _header_params: dict[str, str | None] = _headers or {}
+        _form_params: list[tuple[str, str]] = []
+        _files: dict[
+            str, str | bytes | list[str] | list[bytes] | list[tuple[str, bytes]]
+        ] = {}
+        _body_params: bytes | None = None
+
+        # process the path parameters
+        if name is not None:
+            _path_params["name"] = name
+        # process the query parameters
+        if kind is not None:
+            _query_params.append(("kind", kind.value))
+
+        if namespace is not None:
+            _query_params.append(("namespace", namespace))
+
+        if cluster is not None:
+            _query_params.append(("cluster", cluster))
+
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+        # set the HTTP header `Accept`
+        if "Accept" not in _header_params:
+            _header_params["Accept"] = self.api_client.select_header_accept([
+                "application/json"
+            ])
+
+        # authentication setting
+        _auth_settings: list[str] = []
+
+        return self.api_client.param_serialize(
+            method="GET",
+            resource_path="/queues/{name}/stats",
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth,
+        )
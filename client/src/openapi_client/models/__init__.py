@@ -13,14 +13,34 @@ Do not edit the class manually.
 """  # noqa: E501
 
 # import models into model package
+from openapi_client.models.admission_estimate import AdmissionEstimate
+from openapi_client.models.admission_verdict import AdmissionVerdict
+from openapi_client.models.cache_volume import CacheVolume
+from openapi_client.models.checkpoint_options import CheckpointOptions
+from openapi_client.models.cluster_queue_snapshot import ClusterQueueSnapshot
 from openapi_client.models.create_job_model import CreateJobModel
+from openapi_client.models.duration_statistics import DurationStatistics
 from openapi_client.models.execution_mode import ExecutionMode
+from openapi_client.models.flavor_quota import FlavorQuota
 from openapi_client.models.http_validation_error import HTTPValidationError
+from openapi_client.models.job_history_entry import JobHistoryEntry
 from openapi_client.models.job_options import JobOptions
 from openapi_client.models.job_status import JobStatus
 from openapi_client.models.list_workload_model import ListWorkloadModel
+from openapi_client.models.local_queue_snapshot import LocalQueueSnapshot
+from openapi_client.models.node_requirement import NodeRequirement
+from openapi_client.models.placement_options import PlacementOptions
+from openapi_client.models.queue_kind import QueueKind
+from openapi_client.models.queue_statistics import QueueStatistics
 from openapi_client.models.resource_options import ResourceOptions
+from openapi_client.models.resource_quota import ResourceQuota
+from openapi_client.models.response_submit_job_jobs_post import (
+    ResponseSubmitJobJobsPost,
+)
+from openapi_client.models.retry_options import RetryOptions
 from openapi_client.models.scheduling_options import SchedulingOptions
+from openapi_client.models.toleration import Toleration
+from openapi_client.models.topology_spread import TopologySpread
 from openapi_client.models.validation_error import ValidationError
 from openapi_client.models.validation_error_loc_inner import ValidationErrorLocInner
 from openapi_client.models.workload_admission import WorkloadAdmission
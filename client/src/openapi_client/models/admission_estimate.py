@@ -0,0 +1,127 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from datetime import datetime
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
+from typing_extensions import Self
+
+from openapi_client.models.admission_verdict import AdmissionVerdict
+
+
+class AdmissionEstimate(BaseModel):
+    """
+    Whether a job would be admitted by its Kueue ClusterQueue, without submitting it.
+    """  # noqa: E501
+
+    verdict: AdmissionVerdict
+    cluster: StrictStr | None = None
+    cluster_queue: StrictStr
+    flavors: dict[str, StrictStr] | None = Field(
+        default=None,
+        description="The flavor each requested resource would be assigned, if it fits",
+    )
+    queued_ahead: StrictInt | None = Field(
+        default=0, description="Pending workloads in the ClusterQueue ahead of the job"
+    )
+    estimated_start: datetime | None = None
+    reason: StrictStr | None = None
+    __properties: ClassVar[list[str]] = [
+        "verdict",
+        "cluster",
+        "cluster_queue",
+        "flavors",
+        "queued_ahead",
+        "estimated_start",
+        "reason",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of AdmissionEstimate from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if cluster (nullable) is None
+        # and model_fields_set contains the field
+        if self.cluster is None and "cluster" in self.model_fields_set:
+            _dict["cluster"] = None
+
+        # set to None if estimated_start (nullable) is None
+        # and model_fields_set contains the field
+        if self.estimated_start is None and "estimated_start" in self.model_fields_set:
+            _dict["estimated_start"] = None
+
+        # set to None if reason (nullable) is None
+        # and model_fields_set contains the field
+        if self.reason is None and "reason" in self.model_fields_set:
+            _dict["reason"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of AdmissionEstimate from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "verdict": obj.get("verdict"),
+            "cluster": obj.get("cluster"),
+            "cluster_queue": obj.get("cluster_queue"),
+            "flavors": obj.get("flavors"),
+            "queued_ahead": obj.get("queued_ahead")
+            if obj.get("queued_ahead") is not None
+            else 0,
+            "estimated_start": obj.get("estimated_start"),
+            "reason": obj.get("reason"),
+        })
+        return _obj
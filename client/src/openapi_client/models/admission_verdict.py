@@ -0,0 +1,35 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+
+from typing_extensions import Self
+
+
+class AdmissionVerdict(str, Enum):
+    """
+    AdmissionVerdict
+    """
+
+    """
+    allowed enum values
+    """
+    FITS_NOW = "fits_now"
+    FITS_LATER = "fits_later"
+    NEVER_FITS = "never_fits"
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of AdmissionVerdict from a JSON string"""
+        return cls(json.loads(json_str))
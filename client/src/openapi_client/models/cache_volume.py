@@ -0,0 +1,108 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, StrictStr
+from typing_extensions import Self
+
+
+class CacheVolume(BaseModel):
+    """
+    A named cache volume of a ``jobq.Job``, to share downloads such as datasets and model weights between jobs (see :mod:`jobq.cache`).  The cache is either backed by a persistent volume claim (which should support the ``ReadWriteMany`` access mode, to be shared by jobs on several nodes), or by a directory on the node, which is shared by the jobs running on that node. Node-local caches are created under the host cache root configured by the administrator of the backend, and are only available if it is set. Exactly one of ``volume_claim`` and ``host_path`` must be given.
+    """  # noqa: E501
+
+    name: StrictStr
+    volume_claim: StrictStr | None = None
+    host_path: StrictStr | None = None
+    mount_path: StrictStr | None = None
+    __properties: ClassVar[list[str]] = [
+        "name",
+        "volume_claim",
+        "host_path",
+        "mount_path",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of CacheVolume from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if volume_claim (nullable) is None
+        # and model_fields_set contains the field
+        if self.volume_claim is None and "volume_claim" in self.model_fields_set:
+            _dict["volume_claim"] = None
+
+        # set to None if host_path (nullable) is None
+        # and model_fields_set contains the field
+        if self.host_path is None and "host_path" in self.model_fields_set:
+            _dict["host_path"] = None
+
+        # set to None if mount_path (nullable) is None
+        # and model_fields_set contains the field
+        if self.mount_path is None and "mount_path" in self.model_fields_set:
+            _dict["mount_path"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of CacheVolume from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "name": obj.get("name"),
+            "volume_claim": obj.get("volume_claim"),
+            "host_path": obj.get("host_path"),
+            "mount_path": obj.get("mount_path"),
+        })
+        return _obj
@@ -0,0 +1,94 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Annotated, Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
+from typing_extensions import Self
+
+
+class CheckpointOptions(BaseModel):
+    """
+    Options for checkpointing a ``jobq.Job`` on a persistent volume, to resume it after a preemption (see :mod:`jobq.checkpoint`).  Each job gets its own checkpoint directory on the volume.
+    """  # noqa: E501
+
+    volume_claim: StrictStr
+    mount_path: StrictStr | None = "/checkpoints"
+    grace_period_seconds: Annotated[int, Field(strict=True, ge=0)] | None = 30
+    __properties: ClassVar[list[str]] = [
+        "volume_claim",
+        "mount_path",
+        "grace_period_seconds",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of CheckpointOptions from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of CheckpointOptions from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "volume_claim": obj.get("volume_claim"),
+            "mount_path": obj.get("mount_path")
+            if obj.get("mount_path") is not None
+            else "/checkpoints",
+            "grace_period_seconds": obj.get("grace_period_seconds")
+            if obj.get("grace_period_seconds") is not None
+            else 30,
+        })
+        return _obj
@@ -0,0 +1,146 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
+from typing_extensions import Self
+
+from openapi_client.models.flavor_quota import FlavorQuota
+from openapi_client.models.local_queue_snapshot import LocalQueueSnapshot
+
+
+class ClusterQueueSnapshot(BaseModel):
+    """
+    Snapshot of the quota, usage and workloads of a Kueue ClusterQueue.
+    """  # noqa: E501
+
+    name: StrictStr
+    cluster: StrictStr | None = None
+    cohort: StrictStr | None = None
+    flavors: list[FlavorQuota] | None = None
+    pending_workloads: StrictInt | None = 0
+    reserving_workloads: StrictInt | None = 0
+    admitted_workloads: StrictInt | None = 0
+    local_queues: list[LocalQueueSnapshot] | None = Field(
+        default=None, description="The LocalQueues submitting to the queue"
+    )
+    __properties: ClassVar[list[str]] = [
+        "name",
+        "cluster",
+        "cohort",
+        "flavors",
+        "pending_workloads",
+        "reserving_workloads",
+        "admitted_workloads",
+        "local_queues",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of ClusterQueueSnapshot from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of each item in flavors (list)
+        _items = []
+        if self.flavors:
+            for _item_flavors in self.flavors:
+                if _item_flavors:
+                    _items.append(_item_flavors.to_dict())
+            _dict["flavors"] = _items
+        # override the default output from pydantic by calling `to_dict()` of each item in local_queues (list)
+        _items = []
+        if self.local_queues:
+            for _item_local_queues in self.local_queues:
+                if _item_local_queues:
+                    _items.append(_item_local_queues.to_dict())
+            _dict["local_queues"] = _items
+        # set to None if cluster (nullable) is None
+        # and model_fields_set contains the field
+        if self.cluster is None and "cluster" in self.model_fields_set:
+            _dict["cluster"] = None
+
+        # set to None if cohort (nullable) is None
+        # and model_fields_set contains the field
+        if self.cohort is None and "cohort" in self.model_fields_set:
+            _dict["cohort"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of ClusterQueueSnapshot from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "name": obj.get("name"),
+            "cluster": obj.get("cluster"),
+            "cohort": obj.get("cohort"),
+            "flavors": [FlavorQuota.from_dict(_item) for _item in obj["flavors"]]
+            if obj.get("flavors") is not None
+            else None,
+            "pending_workloads": obj.get("pending_workloads")
+            if obj.get("pending_workloads") is not None
+            else 0,
+            "reserving_workloads": obj.get("reserving_workloads")
+            if obj.get("reserving_workloads") is not None
+            else 0,
+            "admitted_workloads": obj.get("admitted_workloads")
+            if obj.get("admitted_workloads") is not None
+            else 0,
+            "local_queues": [
+                LocalQueueSnapshot.from_dict(_item) for _item in obj["local_queues"]
+            ]
+            if obj.get("local_queues") is not None
+            else None,
+        })
+        return _obj
@@ -0,0 +1,93 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt
+from typing_extensions import Self
+
+
+class DurationStatistics(BaseModel):
+    """
+    DurationStatistics
+    """  # noqa: E501
+
+    count: StrictInt
+    mean: StrictFloat | StrictInt | None = None
+    percentiles: dict[str, StrictFloat | StrictInt] | None = Field(
+        default=None, description="Estimated percentiles, e.g. `p50`"
+    )
+    __properties: ClassVar[list[str]] = ["count", "mean", "percentiles"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of DurationStatistics from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if mean (nullable) is None
+        # and model_fields_set contains the field
+        if self.mean is None and "mean" in self.model_fields_set:
+            _dict["mean"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of DurationStatistics from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "count": obj.get("count"),
+            "mean": obj.get("mean"),
+            "percentiles": obj.get("percentiles"),
+        })
+        return _obj
@@ -0,0 +1,217 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from datetime import datetime
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
+from typing_extensions import Self
+
+from openapi_client.models.job_status import JobStatus
+
+
+class JobHistoryEntry(BaseModel):
+    """
+    The recorded lifecycle of a job, which outlives the job in the cluster.
+    """  # noqa: E501
+
+    uid: StrictStr
+    cluster: StrictStr | None = None
+    namespace: StrictStr | None = None
+    name: StrictStr | None = None
+    kind: StrictStr | None = None
+    queue_name: StrictStr | None = None
+    cluster_queue: StrictStr | None = None
+    priority_class: StrictStr | None = None
+    priority: StrictInt | None = None
+    labels: dict[str, StrictStr] | None = None
+    submitter: StrictStr | None = None
+    execution_status: JobStatus | None = None
+    submission_timestamp: datetime | None = None
+    last_admission_timestamp: datetime | None = None
+    eviction_timestamp: datetime | None = None
+    termination_timestamp: datetime | None = None
+    __properties: ClassVar[list[str]] = [
+        "uid",
+        "cluster",
+        "namespace",
+        "name",
+        "kind",
+        "queue_name",
+        "cluster_queue",
+        "priority_class",
+        "priority",
+        "labels",
+        "submitter",
+        "execution_status",
+        "submission_timestamp",
+        "last_admission_timestamp",
+        "eviction_timestamp",
+        "termination_timestamp",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of JobHistoryEntry from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if cluster (nullable) is None
+        # and model_fields_set contains the field
+        if self.cluster is None and "cluster" in self.model_fields_set:
+            _dict["cluster"] = None
+
+        # set to None if namespace (nullable) is None
+        # and model_fields_set contains the field
+        if self.namespace is None and "namespace" in self.model_fields_set:
+            _dict["namespace"] = None
+
+        # set to None if name (nullable) is None
+        # and model_fields_set contains the field
+        if self.name is None and "name" in self.model_fields_set:
+            _dict["name"] = None
+
+        # set to None if kind (nullable) is None
+        # and model_fields_set contains the field
+        if self.kind is None and "kind" in self.model_fields_set:
+            _dict["kind"] = None
+
+        # set to None if queue_name (nullable) is None
+        # and model_fields_set contains the field
+        if self.queue_name is None and "queue_name" in self.model_fields_set:
+            _dict["queue_name"] = None
+
+        # set to None if cluster_queue (nullable) is None
+        # and model_fields_set contains the field
+        if self.cluster_queue is None and "cluster_queue" in self.model_fields_set:
+            _dict["cluster_queue"] = None
+
+        # set to None if priority_class (nullable) is None
+        # and model_fields_set contains the field
+        if self.priority_class is None and "priority_class" in self.model_fields_set:
+            _dict["priority_class"] = None
+
+        # set to None if priority (nullable) is None
+        # and model_fields_set contains the field
+        if self.priority is None and "priority" in self.model_fields_set:
+            _dict["priority"] = None
+
+        # set to None if submitter (nullable) is None
+        # and model_fields_set contains the field
+        if self.submitter is None and "submitter" in self.model_fields_set:
+            _dict["submitter"] = None
+
+        # set to None if execution_status (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.execution_status is None
+            and "execution_status" in self.model_fields_set
+        ):
+            _dict["execution_status"] = None
+
+        # set to None if submission_timestamp (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.submission_timestamp is None
+            and "submission_timestamp" in self.model_fields_set
+        ):
+            _dict["submission_timestamp"] = None
+
+        # set to None if last_admission_timestamp (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.last_admission_timestamp is None
+            and "last_admission_timestamp" in self.model_fields_set
+        ):
+            _dict["last_admission_timestamp"] = None
+
+        # set to None if eviction_timestamp (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.eviction_timestamp is None
+            and "eviction_timestamp" in self.model_fields_set
+        ):
+            _dict["eviction_timestamp"] = None
+
+        # set to None if termination_timestamp (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.termination_timestamp is None
+            and "termination_timestamp" in self.model_fields_set
+        ):
+            _dict["termination_timestamp"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of JobHistoryEntry from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "uid": obj.get("uid"),
+            "cluster": obj.get("cluster"),
+            "namespace": obj.get("namespace"),
+            "name": obj.get("name"),
+            "kind": obj.get("kind"),
+            "queue_name": obj.get("queue_name"),
+            "cluster_queue": obj.get("cluster_queue"),
+            "priority_class": obj.get("priority_class"),
+            "priority": obj.get("priority"),
+            "labels": obj.get("labels"),
+            "submitter": obj.get("submitter"),
+            "execution_status": obj.get("execution_status"),
+            "submission_timestamp": obj.get("submission_timestamp"),
+            "last_admission_timestamp": obj.get("last_admission_timestamp"),
+            "eviction_timestamp": obj.get("eviction_timestamp"),
+            "termination_timestamp": obj.get("termination_timestamp"),
+        })
+        return _obj
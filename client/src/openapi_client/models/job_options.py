@@ -16,10 +16,14 @@ import pprint
 import re  # noqa: F401
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
 from typing_extensions import Self
 
+from openapi_client.models.cache_volume import CacheVolume
+from openapi_client.models.checkpoint_options import CheckpointOptions
+from openapi_client.models.placement_options import PlacementOptions
 from openapi_client.models.resource_options import ResourceOptions
+from openapi_client.models.retry_options import RetryOptions
 from openapi_client.models.scheduling_options import SchedulingOptions
 
 
@@ -31,7 +35,21 @@ class JobOptions(BaseModel):
     resources: ResourceOptions | None = None
     scheduling: SchedulingOptions
     labels: dict[str, StrictStr] | None = None
-    __properties: ClassVar[list[str]] = ["resources", "scheduling", "labels"]
+    retries: RetryOptions | None = None
+    deadline_seconds: StrictInt | None = None
+    checkpoint: CheckpointOptions | None = None
+    caches: list[CacheVolume] | None = None
+    placement: PlacementOptions | None = None
+    __properties: ClassVar[list[str]] = [
+        "resources",
+        "scheduling",
+        "labels",
+        "retries",
+        "deadline_seconds",
+        "checkpoint",
+        "caches",
+        "placement",
+    ]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -76,11 +94,50 @@ class JobOptions(BaseModel):
         # override the default output from pydantic by calling `to_dict()` of scheduling
         if self.scheduling:
             _dict["scheduling"] = self.scheduling.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of retries
+        if self.retries:
+            _dict["retries"] = self.retries.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of checkpoint
+        if self.checkpoint:
+            _dict["checkpoint"] = self.checkpoint.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of each item in caches (list)
+        _items = []
+        if self.caches:
+            for _item_caches in self.caches:
+                if _item_caches:
+                    _items.append(_item_caches.to_dict())
+            _dict["caches"] = _items
+        # override the default output from pydantic by calling `to_dict()` of placement
+        if self.placement:
+            _dict["placement"] = self.placement.to_dict()
         # set to None if resources (nullable) is None
         # and model_fields_set contains the field
         if self.resources is None and "resources" in self.model_fields_set:
             _dict["resources"] = None
 
+        # set to None if retries (nullable) is None
+        # and model_fields_set contains the field
+        if self.retries is None and "retries" in self.model_fields_set:
+            _dict["retries"] = None
+
+        # set to None if deadline_seconds (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.deadline_seconds is None
+            and "deadline_seconds" in self.model_fields_set
+        ):
+            _dict["deadline_seconds"] = None
+
+        # set to None if checkpoint (nullable) is None
+        # and model_fields_set contains the field
+        if self.checkpoint is None and "checkpoint" in self.model_fields_set:
+            _dict["checkpoint"] = None
+
+        # set to None if placement (nullable) is None
+        # and model_fields_set contains the field
+        if self.placement is None and "placement" in self.model_fields_set:
+            _dict["placement"] = None
+
         return _dict
 
     @classmethod
@@ -100,5 +157,18 @@ class JobOptions(BaseModel):
             if obj.get("scheduling") is not None
             else None,
             "labels": obj.get("labels"),
+            "retries": RetryOptions.from_dict(obj["retries"])
+            if obj.get("retries") is not None
+            else None,
+            "deadline_seconds": obj.get("deadline_seconds"),
+            "checkpoint": CheckpointOptions.from_dict(obj["checkpoint"])
+            if obj.get("checkpoint") is not None
+            else None,
+            "caches": [CacheVolume.from_dict(_item) for _item in obj["caches"]]
+            if obj.get("caches") is not None
+            else None,
+            "placement": PlacementOptions.from_dict(obj["placement"])
+            if obj.get("placement") is not None
+            else None,
         })
         return _obj
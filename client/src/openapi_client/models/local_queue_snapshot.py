@@ -0,0 +1,102 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
+from typing_extensions import Self
+
+
+class LocalQueueSnapshot(BaseModel):
+    """
+    LocalQueueSnapshot
+    """  # noqa: E501
+
+    name: StrictStr
+    namespace: StrictStr
+    pending_workloads: StrictInt | None = 0
+    reserving_workloads: StrictInt | None = 0
+    admitted_workloads: StrictInt | None = 0
+    __properties: ClassVar[list[str]] = [
+        "name",
+        "namespace",
+        "pending_workloads",
+        "reserving_workloads",
+        "admitted_workloads",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of LocalQueueSnapshot from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of LocalQueueSnapshot from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "name": obj.get("name"),
+            "namespace": obj.get("namespace"),
+            "pending_workloads": obj.get("pending_workloads")
+            if obj.get("pending_workloads") is not None
+            else 0,
+            "reserving_workloads": obj.get("reserving_workloads")
+            if obj.get("reserving_workloads") is not None
+            else 0,
+            "admitted_workloads": obj.get("admitted_workloads")
+            if obj.get("admitted_workloads") is not None
+            else 0,
+        })
+        return _obj
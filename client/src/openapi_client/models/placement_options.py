@@ -0,0 +1,136 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, StrictStr
+from typing_extensions import Self
+
+from openapi_client.models.node_requirement import NodeRequirement
+from openapi_client.models.toleration import Toleration
+from openapi_client.models.topology_spread import TopologySpread
+
+
+class PlacementOptions(BaseModel):
+    """
+    Options for placing the pods of a ``jobq.Job`` on the nodes of the cluster.  The accelerator type is mapped onto the Kueue ``ResourceFlavor`` of the same name, if it exists: the job is then restricted to the nodes of the flavor (and tolerates their taints), so that Kueue assigns its quota from that flavor. Otherwise, it selects the nodes with the accelerator type as their accelerator label (by default, ``nvidia.com/gpu.product``, as set by the NVIDIA GPU feature discovery).
+    """  # noqa: E501
+
+    accelerator: StrictStr | None = None
+    node_selector: dict[str, StrictStr] | None = None
+    node_affinity: list[NodeRequirement] | None = None
+    tolerations: list[Toleration] | None = None
+    topology_spread: list[TopologySpread] | None = None
+    __properties: ClassVar[list[str]] = [
+        "accelerator",
+        "node_selector",
+        "node_affinity",
+        "tolerations",
+        "topology_spread",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of PlacementOptions from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of each item in node_affinity (list)
+        _items = []
+        if self.node_affinity:
+            for _item_node_affinity in self.node_affinity:
+                if _item_node_affinity:
+                    _items.append(_item_node_affinity.to_dict())
+            _dict["node_affinity"] = _items
+        # override the default output from pydantic by calling `to_dict()` of each item in tolerations (list)
+        _items = []
+        if self.tolerations:
+            for _item_tolerations in self.tolerations:
+                if _item_tolerations:
+                    _items.append(_item_tolerations.to_dict())
+            _dict["tolerations"] = _items
+        # override the default output from pydantic by calling `to_dict()` of each item in topology_spread (list)
+        _items = []
+        if self.topology_spread:
+            for _item_topology_spread in self.topology_spread:
+                if _item_topology_spread:
+                    _items.append(_item_topology_spread.to_dict())
+            _dict["topology_spread"] = _items
+        # set to None if accelerator (nullable) is None
+        # and model_fields_set contains the field
+        if self.accelerator is None and "accelerator" in self.model_fields_set:
+            _dict["accelerator"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of PlacementOptions from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "accelerator": obj.get("accelerator"),
+            "node_selector": obj.get("node_selector"),
+            "node_affinity": [
+                NodeRequirement.from_dict(_item) for _item in obj["node_affinity"]
+            ]
+            if obj.get("node_affinity") is not None
+            else None,
+            "tolerations": [Toleration.from_dict(_item) for _item in obj["tolerations"]]
+            if obj.get("tolerations") is not None
+            else None,
+            "topology_spread": [
+                TopologySpread.from_dict(_item) for _item in obj["topology_spread"]
+            ]
+            if obj.get("topology_spread") is not None
+            else None,
+        })
+        return _obj
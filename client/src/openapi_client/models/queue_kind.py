@@ -0,0 +1,34 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+
+from typing_extensions import Self
+
+
+class QueueKind(str, Enum):
+    """
+    QueueKind
+    """
+
+    """
+    allowed enum values
+    """
+    LOCAL = "local"
+    CLUSTER = "cluster"
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Create an instance of QueueKind from a JSON string"""
+        return cls(json.loads(json_str))
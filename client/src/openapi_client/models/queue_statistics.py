@@ -0,0 +1,151 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, StrictStr
+from typing_extensions import Self
+
+from openapi_client.models.duration_statistics import DurationStatistics
+from openapi_client.models.queue_kind import QueueKind
+
+
+class QueueStatistics(BaseModel):
+    """
+    Rolling statistics of a Kueue LocalQueue or ClusterQueue.  Durations are in seconds, and the percentiles are accurate up to 1%.
+    """  # noqa: E501
+
+    name: StrictStr
+    kind: QueueKind
+    namespace: StrictStr | None = None
+    cluster: StrictStr | None = None
+    window_seconds: StrictFloat | StrictInt
+    admitted: StrictInt
+    evicted: StrictInt
+    finished: StrictInt
+    wait_time: DurationStatistics = Field(
+        description="Time from submission (or eviction) to admission"
+    )
+    runtime: DurationStatistics = Field(
+        description="Time from admission to termination"
+    )
+    eviction_rate: StrictFloat | StrictInt | None = None
+    jobs_per_hour: StrictFloat | StrictInt = Field(
+        description="Terminated jobs per hour"
+    )
+    __properties: ClassVar[list[str]] = [
+        "name",
+        "kind",
+        "namespace",
+        "cluster",
+        "window_seconds",
+        "admitted",
+        "evicted",
+        "finished",
+        "wait_time",
+        "runtime",
+        "eviction_rate",
+        "jobs_per_hour",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of QueueStatistics from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # override the default output from pydantic by calling `to_dict()` of wait_time
+        if self.wait_time:
+            _dict["wait_time"] = self.wait_time.to_dict()
+        # override the default output from pydantic by calling `to_dict()` of runtime
+        if self.runtime:
+            _dict["runtime"] = self.runtime.to_dict()
+        # set to None if namespace (nullable) is None
+        # and model_fields_set contains the field
+        if self.namespace is None and "namespace" in self.model_fields_set:
+            _dict["namespace"] = None
+
+        # set to None if cluster (nullable) is None
+        # and model_fields_set contains the field
+        if self.cluster is None and "cluster" in self.model_fields_set:
+            _dict["cluster"] = None
+
+        # set to None if eviction_rate (nullable) is None
+        # and model_fields_set contains the field
+        if self.eviction_rate is None and "eviction_rate" in self.model_fields_set:
+            _dict["eviction_rate"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of QueueStatistics from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "name": obj.get("name"),
+            "kind": obj.get("kind"),
+            "namespace": obj.get("namespace"),
+            "cluster": obj.get("cluster"),
+            "window_seconds": obj.get("window_seconds"),
+            "admitted": obj.get("admitted"),
+            "evicted": obj.get("evicted"),
+            "finished": obj.get("finished"),
+            "wait_time": DurationStatistics.from_dict(obj["wait_time"])
+            if obj.get("wait_time") is not None
+            else None,
+            "runtime": DurationStatistics.from_dict(obj["runtime"])
+            if obj.get("runtime") is not None
+            else None,
+            "eviction_rate": obj.get("eviction_rate"),
+            "jobs_per_hour": obj.get("jobs_per_hour"),
+        })
+        return _obj
@@ -28,7 +28,17 @@ class ResourceOptions(BaseModel):
     memory: StrictStr | None = None
     cpu: StrictStr | None = None
     gpu: StrictInt | None = None
-    __properties: ClassVar[list[str]] = ["memory", "cpu", "gpu"]
+    shm_size: StrictStr | None = None
+    scratch_size: StrictStr | None = None
+    scratch_storage_class: StrictStr | None = None
+    __properties: ClassVar[list[str]] = [
+        "memory",
+        "cpu",
+        "gpu",
+        "shm_size",
+        "scratch_size",
+        "scratch_storage_class",
+    ]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -82,6 +92,24 @@ class ResourceOptions(BaseModel):
         if self.gpu is None and "gpu" in self.model_fields_set:
             _dict["gpu"] = None
 
+        # set to None if shm_size (nullable) is None
+        # and model_fields_set contains the field
+        if self.shm_size is None and "shm_size" in self.model_fields_set:
+            _dict["shm_size"] = None
+
+        # set to None if scratch_size (nullable) is None
+        # and model_fields_set contains the field
+        if self.scratch_size is None and "scratch_size" in self.model_fields_set:
+            _dict["scratch_size"] = None
+
+        # set to None if scratch_storage_class (nullable) is None
+        # and model_fields_set contains the field
+        if (
+            self.scratch_storage_class is None
+            and "scratch_storage_class" in self.model_fields_set
+        ):
+            _dict["scratch_storage_class"] = None
+
         return _dict
 
     @classmethod
@@ -97,5 +125,8 @@ class ResourceOptions(BaseModel):
             "memory": obj.get("memory"),
             "cpu": obj.get("cpu"),
             "gpu": obj.get("gpu"),
+            "shm_size": obj.get("shm_size"),
+            "scratch_size": obj.get("scratch_size"),
+            "scratch_storage_class": obj.get("scratch_storage_class"),
         })
         return _obj
@@ -0,0 +1,118 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
+from typing_extensions import Self
+
+
+class ResourceQuota(BaseModel):
+    """
+    Quota and usage of a resource in a flavor of a Kueue ClusterQueue.  Quantities are Kubernetes quantities, e.g. `500m` or `16Gi`.
+    """  # noqa: E501
+
+    name: StrictStr
+    nominal_quota: StrictStr
+    borrowing_limit: StrictStr | None = None
+    lending_limit: StrictStr | None = None
+    reserved: StrictStr | None = Field(
+        default="0", description="Quota reserved by admitted workloads"
+    )
+    usage: StrictStr | None = Field(
+        default="0", description="Quota used by running workloads"
+    )
+    borrowed: StrictStr | None = Field(
+        default="0", description="Reserved quota borrowed from the cohort"
+    )
+    __properties: ClassVar[list[str]] = [
+        "name",
+        "nominal_quota",
+        "borrowing_limit",
+        "lending_limit",
+        "reserved",
+        "usage",
+        "borrowed",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of ResourceQuota from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if borrowing_limit (nullable) is None
+        # and model_fields_set contains the field
+        if self.borrowing_limit is None and "borrowing_limit" in self.model_fields_set:
+            _dict["borrowing_limit"] = None
+
+        # set to None if lending_limit (nullable) is None
+        # and model_fields_set contains the field
+        if self.lending_limit is None and "lending_limit" in self.model_fields_set:
+            _dict["lending_limit"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of ResourceQuota from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "name": obj.get("name"),
+            "nominal_quota": obj.get("nominal_quota"),
+            "borrowing_limit": obj.get("borrowing_limit"),
+            "lending_limit": obj.get("lending_limit"),
+            "reserved": obj.get("reserved") if obj.get("reserved") is not None else "0",
+            "usage": obj.get("usage") if obj.get("usage") is not None else "0",
+            "borrowed": obj.get("borrowed") if obj.get("borrowed") is not None else "0",
+        })
+        return _obj
@@ -0,0 +1,152 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import TYPE_CHECKING, Any
+
+from pydantic import (
+    BaseModel,
+    ValidationError,
+    field_validator,
+)
+from typing_extensions import Self
+
+from openapi_client.models.admission_estimate import AdmissionEstimate
+from openapi_client.models.workload_identifier import WorkloadIdentifier
+
+RESPONSESUBMITJOBJOBSPOST_ANY_OF_SCHEMAS = ["AdmissionEstimate", "WorkloadIdentifier"]
+
+
+class ResponseSubmitJobJobsPost(BaseModel):
+    """
+    ResponseSubmitJobJobsPost
+    """
+
+    # data type: WorkloadIdentifier
+    anyof_schema_1_validator: WorkloadIdentifier | None = None
+    # data type: AdmissionEstimate
+    anyof_schema_2_validator: AdmissionEstimate | None = None
+    if TYPE_CHECKING:
+        actual_instance: AdmissionEstimate | WorkloadIdentifier | None = None
+    else:
+        actual_instance: Any = None
+    any_of_schemas: set[str] = {"AdmissionEstimate", "WorkloadIdentifier"}
+
+    model_config = {
+        "validate_assignment": True,
+        "protected_namespaces": (),
+    }
+
+    def __init__(self, *args, **kwargs) -> None:
+        if args:
+            if len(args) > 1:
+                raise ValueError(
+                    "If a position argument is used, only 1 is allowed to set `actual_instance`"
+                )
+            if kwargs:
+                raise ValueError(
+                    "If a position argument is used, keyword arguments cannot be used."
+                )
+            super().__init__(actual_instance=args[0])
+        else:
+            super().__init__(**kwargs)
+
+    @field_validator("actual_instance")
+    def actual_instance_must_validate_anyof(cls, v):
+        ResponseSubmitJobJobsPost.model_construct()
+        error_messages = []
+        # validate data type: WorkloadIdentifier
+        if not isinstance(v, WorkloadIdentifier):
+            error_messages.append(
+                f"Error! Input type `{type(v)}` is not `WorkloadIdentifier`"
+            )
+        else:
+            return v
+
+        # validate data type: AdmissionEstimate
+        if not isinstance(v, AdmissionEstimate):
+            error_messages.append(
+                f"Error! Input type `{type(v)}` is not `AdmissionEstimate`"
+            )
+        else:
+            return v
+
+        if error_messages:
+            # no match
+            raise ValueError(
+                "No match found when setting the actual_instance in ResponseSubmitJobJobsPost with anyOf schemas: AdmissionEstimate, WorkloadIdentifier. Details: "
+                + ", ".join(error_messages)
+            )
+        else:
+            return v
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any]) -> Self:
+        return cls.from_json(json.dumps(obj))
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self:
+        """Returns the object represented by the json string"""
+        instance = cls.model_construct()
+        error_messages = []
+        # anyof_schema_1_validator: Optional[WorkloadIdentifier] = None
+        try:
+            instance.actual_instance = WorkloadIdentifier.from_json(json_str)
+            return instance
+        except (ValidationError, ValueError) as e:
+            error_messages.append(str(e))
+        # anyof_schema_2_validator: Optional[AdmissionEstimate] = None
+        try:
+            instance.actual_instance = AdmissionEstimate.from_json(json_str)
+            return instance
+        except (ValidationError, ValueError) as e:
+            error_messages.append(str(e))
+
+        if error_messages:
+            # no match
+            raise ValueError(
+                "No match found when deserializing the JSON string into ResponseSubmitJobJobsPost with anyOf schemas: AdmissionEstimate, WorkloadIdentifier. Details: "
+                + ", ".join(error_messages)
+            )
+        else:
+            return instance
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the actual instance"""
+        if self.actual_instance is None:
+            return "null"
+
+        if hasattr(self.actual_instance, "to_json") and callable(
+            self.actual_instance.to_json
+        ):
+            return self.actual_instance.to_json()
+        else:
+            return json.dumps(self.actual_instance)
+
+    def to_dict(self) -> dict[str, Any] | AdmissionEstimate | WorkloadIdentifier | None:
+        """Returns the dict representation of the actual instance"""
+        if self.actual_instance is None:
+            return None
+
+        if hasattr(self.actual_instance, "to_dict") and callable(
+            self.actual_instance.to_dict
+        ):
+            return self.actual_instance.to_dict()
+        else:
+            return self.actual_instance
+
+    def to_str(self) -> str:
+        """Returns the string representation of the actual instance"""
+        return pprint.pformat(self.model_dump())
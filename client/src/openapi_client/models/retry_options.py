@@ -0,0 +1,97 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Annotated, Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt
+from typing_extensions import Self
+
+
+class RetryOptions(BaseModel):
+    """
+    Options limiting the retries of a failed ``jobq.Job`` in the cluster.  Pods that exit with one of the ``fail_on_exit_codes`` (e.g., due to an error in the job code, which retrying does not fix) fail the job immediately, while pods that fail due to a disruption of their node (e.g., preemption or a node drain) are retried without counting towards the retry budget.
+    """  # noqa: E501
+
+    max_retries: Annotated[int, Field(strict=True, ge=0)] | None = None
+    fail_on_exit_codes: list[StrictInt] | None = None
+    retry_on_disruption: StrictBool | None = True
+    __properties: ClassVar[list[str]] = [
+        "max_retries",
+        "fail_on_exit_codes",
+        "retry_on_disruption",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of RetryOptions from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if max_retries (nullable) is None
+        # and model_fields_set contains the field
+        if self.max_retries is None and "max_retries" in self.model_fields_set:
+            _dict["max_retries"] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of RetryOptions from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "max_retries": obj.get("max_retries"),
+            "fail_on_exit_codes": obj.get("fail_on_exit_codes"),
+            "retry_on_disruption": obj.get("retry_on_disruption")
+            if obj.get("retry_on_disruption") is not None
+            else True,
+        })
+        return _obj
@@ -0,0 +1,92 @@
+"""
+the jobq cluster workflow management tool backend
+
+Backend service for the appliedAI infrastructure product
+
+The version of the OpenAPI document: 0.1.0
+Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import json
+import pprint
+import re  # noqa: F401
+from typing import Annotated, Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
+from typing_extensions import Self
+
+
+class TopologySpread(BaseModel):
+    """
+    A topology spread constraint of a ``jobq.Job``, which spreads its pods, and those of other submissions of the same job, across the nodes (or zones) of the cluster.
+    """  # noqa: E501
+
+    topology_key: StrictStr
+    max_skew: Annotated[int, Field(strict=True, ge=1)] | None = 1
+    when_unsatisfiable: StrictStr | None = "ScheduleAnyway"
+    __properties: ClassVar[list[str]] = [
+        "topology_key",
+        "max_skew",
+        "when_unsatisfiable",
+    ]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Self | None:
+        """Create an instance of TopologySpread from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: set[str] = set()
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: dict[str, Any] | None) -> Self | None:
+        """Create an instance of TopologySpread from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "topology_key": obj.get("topology_key"),
+            "max_skew": obj.get("max_skew") if obj.get("max_skew") is not None else 1,
+            "when_unsatisfiable": obj.get("when_unsatisfiable")
+            if obj.get("when_unsatisfiable") is not None
+            else "ScheduleAnyway",
+        })
+        return _obj
@@ -30,7 +30,15 @@ class WorkloadIdentifier(BaseModel):
     kind: StrictStr
     namespace: StrictStr
     uid: StrictStr
-    __properties: ClassVar[list[str]] = ["group", "version", "kind", "namespace", "uid"]
+    cluster: StrictStr | None = None
+    __properties: ClassVar[list[str]] = [
+        "group",
+        "version",
+        "kind",
+        "namespace",
+        "uid",
+        "cluster",
+    ]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -69,6 +77,11 @@ class WorkloadIdentifier(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
+        # set to None if cluster (nullable) is None
+        # and model_fields_set contains the field
+        if self.cluster is None and "cluster" in self.model_fields_set:
+            _dict["cluster"] = None
+
         return _dict
 
     @classmethod
@@ -86,5 +99,6 @@ class WorkloadIdentifier(BaseModel):
             "kind": obj.get("kind"),
             "namespace": obj.get("namespace"),
             "uid": obj.get("uid"),
+            "cluster": obj.get("cluster"),
         })
         return _obj
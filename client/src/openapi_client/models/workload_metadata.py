@@ -32,8 +32,8 @@ class WorkloadMetadata(BaseModel):
 
     managed_resource_id: StrictStr
     execution_status: JobStatus
-    spec: WorkloadSpec
-    kueue_status: WorkloadStatus
+    spec: WorkloadSpec | None = None
+    kueue_status: WorkloadStatus | None = None
     submission_timestamp: datetime
     last_admission_timestamp: datetime | None = None
     termination_timestamp: datetime | None = None
@@ -96,6 +96,16 @@ class WorkloadMetadata(BaseModel):
         # override the default output from pydantic by calling `to_dict()` of kueue_status
         if self.kueue_status:
             _dict["kueue_status"] = self.kueue_status.to_dict()
+        # set to None if spec (nullable) is None
+        # and model_fields_set contains the field
+        if self.spec is None and "spec" in self.model_fields_set:
+            _dict["spec"] = None
+
+        # set to None if kueue_status (nullable) is None
+        # and model_fields_set contains the field
+        if self.kueue_status is None and "kueue_status" in self.model_fields_set:
+            _dict["kueue_status"] = None
+
         # set to None if last_admission_timestamp (nullable) is None
         # and model_fields_set contains the field
         if (
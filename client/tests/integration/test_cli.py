@@ -9,7 +9,9 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
-@pytest.mark.parametrize("command", ["", "list", "logs", "status", "stop", "submit"])
+@pytest.mark.parametrize(
+    "command", ["", "list", "logs", "queues", "status", "stop", "submit"]
+)
 @pytest.mark.parametrize("flag", ["-h", "--help"])
 def test_help(runner: CliRunner, command: str, flag: str) -> None:
     """Test that the help message is displayed correctly for all commands."""
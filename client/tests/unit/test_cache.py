@@ -0,0 +1,81 @@
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from jobq import cache
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "source" / "data.csv"
+    path.parent.mkdir()
+    path.write_text("a,b\n1,2\n")
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "cache"
+    monkeypatch.setenv(cache.CACHES_ENV, json.dumps({"data": str(path)}))
+    return path
+
+
+def test_fetch(source: Path, cache_dir: Path):
+    digest = hashlib.sha256(source.read_bytes()).hexdigest()
+
+    path = cache.fetch(source.as_uri())
+    assert path == cache_dir / "blobs" / digest / "data.csv"
+    assert path.read_bytes() == source.read_bytes()
+
+    # Cached by URL and by content hash
+    source.unlink()
+    assert cache.fetch(source.as_uri()) == path
+    assert cache.fetch(source.as_uri(), sha256=digest.upper()) == path
+    assert not any((cache_dir / "tmp").iterdir())
+
+
+def test_fetch_hash_mismatch(source: Path, cache_dir: Path):
+    with pytest.raises(ValueError, match="SHA-256 mismatch"):
+        cache.fetch(source.as_uri(), sha256="0" * 64)
+    assert not (cache_dir / "blobs").exists()
+    assert not any((cache_dir / "tmp").iterdir())
+
+
+def test_write_atomic_concurrent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    index = tmp_path / "urls" / "index"
+    replace = Path.replace
+
+    def interleaved_replace(self: Path, target: Path) -> Path:
+        # Another writer (e.g., in a container with the same PID) writes the same file
+        # between the first writer's temporary file and its rename
+        monkeypatch.setattr(Path, "replace", replace)
+        cache._write_atomic(index, "second")
+        return replace(self, target)
+
+    monkeypatch.setattr(Path, "replace", interleaved_replace)
+    cache._write_atomic(index, "first")
+
+    assert index.read_text() == "first"
+    assert list(index.parent.iterdir()) == [index]
+
+
+def test_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(cache.CACHES_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert cache.directory() == tmp_path / "jobq" / "default"
+    assert cache.directory("data") == tmp_path / "jobq" / "data"
+
+    monkeypatch.setenv(cache.CACHES_ENV, json.dumps({"data": "/cache/data"}))
+    assert cache.directory() == cache.directory("data") == Path("/cache/data")
+    with pytest.raises(ValueError, match="no cache 'models'"):
+        cache.directory("models")
+
+    monkeypatch.setenv(
+        cache.CACHES_ENV,
+        json.dumps({"data": "/cache/data", "models": "/cache/models"}),
+    )
+    assert cache.directory("models") == Path("/cache/models")
+    with pytest.raises(ValueError, match="several caches"):
+        cache.directory()
@@ -0,0 +1,93 @@
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from jobq import checkpoint
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv(checkpoint.CHECKPOINT_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+def test_no_checkpoint_dir(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(checkpoint.CHECKPOINT_DIR_ENV, raising=False)
+    assert checkpoint.directory() is None
+    assert checkpoint.latest() is None
+    with pytest.raises(RuntimeError):
+        checkpoint.register("step-1")
+
+
+def test_register(checkpoint_dir: Path):
+    assert checkpoint.latest() is None
+
+    for step in (1, 2):
+        (checkpoint_dir / f"step-{step}").mkdir()
+        checkpoint.register(checkpoint_dir / f"step-{step}")
+        assert checkpoint.latest() == checkpoint_dir / f"step-{step}"
+
+    # Partially written checkpoints are not resumed from
+    (checkpoint_dir / "step-3").mkdir()
+    assert checkpoint.latest() == checkpoint_dir / "step-2"
+    assert not list(checkpoint_dir.glob("*.tmp"))
+
+
+def test_register_invalid(
+    checkpoint_dir: Path, tmp_path_factory: pytest.TempPathFactory
+):
+    with pytest.raises(ValueError, match="does not exist"):
+        checkpoint.register(checkpoint_dir / "missing")
+    with pytest.raises(ValueError, match="not in the checkpoint directory"):
+        checkpoint.register(tmp_path_factory.mktemp("other"))
+
+
+JOB = """
+import os
+import signal
+import time
+from pathlib import Path
+
+from jobq import checkpoint
+
+
+def train():
+    Path("resumed").write_text(os.environ.get("JOBQ_LATEST_CHECKPOINT", ""))
+    os.kill(os.getpid(), signal.SIGTERM)
+    while not checkpoint.stop_requested():
+        time.sleep(0.01)
+    path = checkpoint.directory() / "step-1"
+    path.write_text("state")
+    checkpoint.register(path)
+"""
+
+
+def test_execute_stopped(
+    checkpoint_dir: Path, tmp_path_factory: pytest.TempPathFactory
+):
+    workdir = tmp_path_factory.mktemp("job")
+    (workdir / "train.py").write_text(JOB)
+
+    def run() -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from jobq.execute import execute; execute()",
+                "train.py",
+                "train",
+            ],
+            cwd=workdir,
+            timeout=30,
+        )
+
+    # A stopped job exits as if it was terminated, so that it does not succeed
+    assert run().returncode == 128 + signal.SIGTERM
+    assert (workdir / "resumed").read_text() == ""
+
+    # The restarted job gets the latest checkpoint
+    run()
+    assert (workdir / "resumed").read_text() == str(checkpoint_dir / "step-1")
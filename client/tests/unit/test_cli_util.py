@@ -0,0 +1,34 @@
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+
+from cli.util import _make_api_client
+
+
+def test_trace_context_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    monkeypatch.setenv("TRACEPARENT", traceparent)
+
+    client = _make_api_client("http://localhost:8000/")
+
+    assert client.default_headers["traceparent"] == traceparent
+
+
+def test_trace_context_from_active_span(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TRACEPARENT", raising=False)
+    tracer = TracerProvider().get_tracer(__name__)
+
+    with tracer.start_as_current_span("cli") as span:
+        client = _make_api_client("http://localhost:8000/")
+
+    trace_id = format(span.get_span_context().trace_id, "032x")
+    assert trace_id in client.default_headers["traceparent"]
+
+
+def test_no_trace_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TRACEPARENT", raising=False)
+
+    client = _make_api_client("http://localhost:8000/")
+
+    assert "traceparent" not in client.default_headers
+    assert trace.get_current_span() is trace.INVALID_SPAN
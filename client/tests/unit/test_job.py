@@ -1,14 +1,23 @@
 import contextlib
+import sys
 
 import pytest
 
 from jobq.job import (
+    CacheVolume,
+    CheckpointOptions,
     Job,
     JobOptions,
+    NodeRequirement,
     ResourceOptions,
+    RetryOptions,
     SchedulingOptions,
+    Toleration,
+    TopologySpread,
+    _repo_digest,
     validate_labels,
 )
+from jobq.types import K8sResourceKind
 
 
 @pytest.mark.parametrize(
@@ -43,6 +52,99 @@ def test_job_validation(
         _ = Job(lambda: ..., options=opts)
 
 
+@pytest.mark.parametrize("codes", [[0], [1, 256]])
+def test_retry_options_exit_codes(codes: list[int]):
+    with pytest.raises(ValueError, match="exit codes must be between 1 and 255"):
+        RetryOptions(fail_on_exit_codes=codes)
+
+
+def test_cache_volume():
+    cache = CacheVolume(name="datasets", volume_claim="datasets")
+    assert cache.mount_path == "/cache/datasets"
+
+    with pytest.raises(ValueError, match="either a volume claim or a host path"):
+        CacheVolume(name="datasets")
+    with pytest.raises(ValueError, match="either a volume claim or a host path"):
+        CacheVolume(name="datasets", volume_claim="datasets", host_path="data")
+    with pytest.raises(ValueError, match="Invalid cache name"):
+        CacheVolume(name="Datasets", host_path="data")
+    with pytest.raises(ValueError, match="Duplicate cache names"):
+        JobOptions(
+            scheduling=SchedulingOptions(queue_name="q"),
+            caches=[cache, CacheVolume(name="datasets", host_path="data")],
+        )
+
+
+@pytest.mark.parametrize("host_path", ["/var/lib/kubelet", "../etc", "a/../../b", "."])
+def test_cache_volume_host_path(host_path: str):
+    with pytest.raises(ValueError, match="must be a relative path without '..'"):
+        CacheVolume(name="data", host_path=host_path)
+
+
+@pytest.mark.parametrize(
+    "mount_path, checkpoint, expected_error",
+    [
+        ("/data", False, None),
+        ("data", False, "must be absolute"),
+        ("/dev/shm", False, "overlaps with the shared memory"),
+        ("/dev", False, "overlaps with the shared memory"),
+        ("/scratch/data", False, "overlaps with the scratch volume"),
+        ("/checkpoints", False, None),
+        ("/checkpoints", True, "overlaps with the checkpoint directory"),
+        ("/cache", False, "overlaps with the cache 'models'"),
+    ],
+)
+def test_cache_volume_mount_path(
+    mount_path: str, checkpoint: bool, expected_error: str | None
+):
+    exc_ctx = (
+        pytest.raises(ValueError, match=expected_error)
+        if expected_error
+        else contextlib.nullcontext()
+    )
+    with exc_ctx:
+        JobOptions(
+            scheduling=SchedulingOptions(queue_name="q"),
+            checkpoint=CheckpointOptions(volume_claim="ckpt") if checkpoint else None,
+            caches=[
+                CacheVolume(name="models", volume_claim="models"),
+                CacheVolume(name="data", volume_claim="data", mount_path=mount_path),
+            ],
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_error",
+    [
+        ({"key": "zone", "values": ["a"]}, None),
+        ({"key": "zone"}, "requires values"),
+        ({"key": "spot", "operator": "Exists", "values": ["true"]}, "takes no values"),
+        ({"key": "gpus", "operator": "Gt", "values": ["2"], "weight": 50}, None),
+        ({"key": "gpus", "operator": "Gt", "values": ["two"]}, "requires an integer"),
+        ({"key": "zone", "operator": "Near", "values": ["a"]}, "Invalid node"),
+    ],
+)
+def test_node_requirement(kwargs: dict, expected_error: str | None):
+    exc_ctx = (
+        pytest.raises(ValueError, match=expected_error)
+        if expected_error
+        else contextlib.nullcontext()
+    )
+    with exc_ctx:
+        NodeRequirement(**kwargs)
+
+
+def test_placement_options_validation():
+    with pytest.raises(ValueError, match="Invalid toleration operator"):
+        Toleration(key="gpu", operator="In")
+    with pytest.raises(ValueError, match="Invalid taint effect"):
+        Toleration(key="gpu", effect="NoExecution")
+    with pytest.raises(ValueError, match="Invalid topology spread action"):
+        TopologySpread(topology_key="zone", when_unsatisfiable="Never")
+    with pytest.raises(ValueError):
+        NodeRequirement(key="zone", values=["a"], weight=0)
+
+
 def test_resource_options_docker():
     opts = ResourceOptions(memory="1024Mi", cpu="200m")
     actual = opts.to_docker()
@@ -59,6 +161,29 @@ def test_resource_options_k8s():
     assert actual["cpu"] == opts.cpu
 
 
+def test_resource_options_k8s_volumes():
+    opts = ResourceOptions(memory="1Gi", shm_size="512Mi", scratch_size="100Gi")
+    requests = opts.to_kubernetes(kind=K8sResourceKind.REQUESTS)
+    limits = opts.to_kubernetes(kind=K8sResourceKind.LIMITS)
+
+    # Shared memory counts towards the memory of the job
+    assert requests["memory"] == limits["memory"] == str(1536 * 2**20)
+    assert requests["ephemeral-storage"] == "100Gi"
+    assert "ephemeral-storage" not in limits
+    assert opts.to_docker()["shm_size"] == str(512 * 2**20)
+
+    # Scratch volumes from a storage class are not ephemeral storage of the node
+    opts.scratch_storage_class = "local-nvme"
+    assert "ephemeral-storage" not in opts.to_kubernetes()
+
+
+def test_resource_options_volumes_validation():
+    with pytest.raises(ValueError, match="unknown unit suffix"):
+        ResourceOptions(shm_size="1GB")
+    with pytest.raises(ValueError, match="requires a scratch size"):
+        ResourceOptions(scratch_storage_class="local-nvme")
+
+
 def test_resource_options_ray():
     opts = ResourceOptions(memory="1024Mi", cpu="2000m", gpu=1)
     actual = opts.to_ray()
@@ -98,3 +223,23 @@ def test_validate_labels(labels, expected_error):
         with pytest.raises(ValueError) as exc_info:
             validate_labels(labels)
         assert str(exc_info.value) == expected_error
+
+
+@pytest.mark.parametrize(
+    "stdout, expected",
+    [
+        (
+            ['["other/image@sha256:aaa","localhost:5000/image@sha256:bbb"]\n'],
+            "sha256:bbb",
+        ),
+        (["[]\n"], None),
+        (["null\n"], None),
+    ],
+)
+def test_repo_digest(
+    monkeypatch: pytest.MonkeyPatch, stdout: list[str], expected: str | None
+):
+    # `jobq.job` is shadowed by the `job` decorator in the `jobq` package
+    module = sys.modules[_repo_digest.__module__]
+    monkeypatch.setattr(module, "run_command", lambda command: (0, stdout, [], stdout))
+    assert _repo_digest("localhost:5000/image:latest") == expected